@@ -16,6 +16,7 @@ import json
 import logging
 import os
 import sys
+import threading
 import traceback
 from datetime import datetime
 from pathlib import Path
@@ -127,6 +128,11 @@ class FFTRequest(BaseModel):
     sampling_rate: float
     normalize: bool = False
 
+class AnalysisFileRequest(BaseModel):
+    """Requête d'analyse d'un fichier de données (CSV, JSON, HDF5)"""
+    file_path: str
+    sampling_rate: Optional[float] = Field(default=None, gt=0.0)
+
 # =============================================================================
 # GESTIONNAIRE D'ÉTAT GLOBAL
 # =============================================================================
@@ -144,6 +150,7 @@ class CHNeoWaveState:
         self.performance_monitor = None
         self.error_handler = None
         self.post_processor = None
+        self.analysis_lock = threading.Lock()
         
         # État des WebSockets
         self.websocket_connections: List[WebSocket] = []
@@ -509,6 +516,43 @@ async def compute_fft(request: FFTRequest):
             error={"code": "FFT_ERROR", "message": str(e)}
         )
 
+def _analyze_file(file_path: str, sampling_rate: Optional[float]) -> Optional[Dict]:
+    """Charge et analyse un fichier avec le PostProcessor (résultats du cache partagé si inchangé)"""
+    processor = chneowave_state.post_processor
+    # Un seul PostProcessor avec état : analyses sérialisées
+    with chneowave_state.analysis_lock:
+        if sampling_rate:
+            processor.sample_rate = sampling_rate
+        if not (processor.load_data_file(file_path) and processor.run_analysis()):
+            return None
+        return processor._prepare_json_data(processor.current_analysis)
+
+@app.post("/processing/analysis", response_model=APIResponse)
+async def analyze_file(request: AnalysisFileRequest):
+    """Analyse complète d'un fichier de session (statistiques, spectre, Goda)"""
+    if chneowave_state.post_processor is None:
+        return APIResponse(
+            success=False,
+            error={"code": "POST_PROCESSOR_UNAVAILABLE", "message": "PostProcessor non initialisé"}
+        )
+        
+    try:
+        # Calcul hors de la boucle d'événements
+        results = await asyncio.to_thread(_analyze_file, request.file_path, request.sampling_rate)
+        if results is None:
+            return APIResponse(
+                success=False,
+                error={"code": "ANALYSIS_ERROR", "message": f"Analyse impossible: {request.file_path}"}
+            )
+        return APIResponse(success=True, data=results)
+        
+    except Exception as e:
+        logger.error(f"Erreur analyze_file: {e}")
+        return APIResponse(
+            success=False,
+            error={"code": "ANALYSIS_ERROR", "message": str(e)}
+        )
+
 # =============================================================================
 # WEBSOCKET TEMPS RÉEL
 # =============================================================================
@@ -16,6 +16,9 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime, date
 import json
 import os
+import re
+import sqlite3
+import threading
 
 # =============================================================================
 # CONFIGURATION DE L'APPLICATION
@@ -198,6 +201,38 @@ equipements_data = [
     }
 ]
 
+# =============================================================================
+# INDEX PLEIN TEXTE (FTS5 EN MÉMOIRE)
+# =============================================================================
+
+# Même index que l'API locale : préfixes, accents ignorés, classement bm25
+# pondéré comme l'ancien score (numero 10, inventaire 8, description 5, marque 3)
+search_index = sqlite3.connect(":memory:", check_same_thread=False)
+search_index.execute("""
+    CREATE VIRTUAL TABLE equipements_fts USING fts5(
+        numero, n_inventaire, description, marque_type,
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+""")
+search_index_lock = threading.Lock()
+
+def index_equipement(eq: Dict[str, Any]):
+    """Indexer (ou réindexer) un équipement"""
+    with search_index_lock, search_index:
+        search_index.execute("DELETE FROM equipements_fts WHERE rowid = ?", (eq["id_equipement"],))
+        search_index.execute(
+            "INSERT INTO equipements_fts(rowid, numero, n_inventaire, description, marque_type) VALUES (?, ?, ?, ?, ?)",
+            (eq["id_equipement"], eq["numero"], eq["n_inventaire"], eq["description"], eq["marque_type"])
+        )
+
+def unindex_equipement(equipement_id: int):
+    """Retirer un équipement de l'index"""
+    with search_index_lock, search_index:
+        search_index.execute("DELETE FROM equipements_fts WHERE rowid = ?", (equipement_id,))
+
+for eq in equipements_data:
+    index_equipement(eq)
+
 # =============================================================================
 # ENDPOINTS DE L'API
 # =============================================================================
@@ -288,9 +323,41 @@ async def update_equipement(equipement_id: int, equipement_data: dict):
     for key, value in equipement_data.items():
         if key in equipement:
             equipement[key] = value
+    index_equipement(equipement)
     
     return {"message": "Équipement mis à jour avec succès", "equipement": equipement}
 
+@app.post("/api/equipements", status_code=status.HTTP_201_CREATED)
+async def create_equipement(equipement_data: dict):
+    """Créer un équipement"""
+    if not equipement_data.get("numero") or not equipement_data.get("description"):
+        raise HTTPException(status_code=422, detail="Numéro et description requis")
+    service = next((s for s in services_data if s["id"] == equipement_data.get("service_id")), None)
+    if not service:
+        raise HTTPException(status_code=422, detail="Service inconnu")
+    
+    equipement = {field: None for field in EquipementModel.model_fields}
+    equipement.update(etat="OK", statut_metrologique="CONFORME", criticite=1)
+    equipement.update({key: value for key, value in equipement_data.items() if key in equipement})
+    equipement["service"] = service
+    equipement["id_equipement"] = max((eq["id_equipement"] for eq in equipements_data), default=0) + 1
+    equipements_data.append(equipement)
+    index_equipement(equipement)
+    
+    return {"message": "Équipement créé avec succès", "equipement": equipement}
+
+@app.delete("/api/equipements/{equipement_id}")
+async def delete_equipement(equipement_id: int):
+    """Supprimer un équipement"""
+    equipement = next((eq for eq in equipements_data if eq["id_equipement"] == equipement_id), None)
+    if not equipement:
+        raise HTTPException(status_code=404, detail="Équipement non trouvé")
+    
+    equipements_data.remove(equipement)
+    unindex_equipement(equipement_id)
+    
+    return {"message": "Équipement supprimé avec succès"}
+
 # =============================================================================
 # ENDPOINTS DASHBOARD ET ANALYTICS
 # =============================================================================
@@ -369,33 +436,31 @@ async def search_equipements(
     q: str = Query(..., min_length=2, description="Terme de recherche"),
     limit: int = Query(20, ge=1, le=100, description="Nombre de résultats")
 ):
-    """Recherche full-text dans les équipements"""
+    """Recherche full-text dans les équipements (préfixes, sans accents, classement bm25)"""
     
-    search_term = q.lower()
-    results = []
+    # Chaque mot devient un préfixe requis : « gene tek » -> "gene"* "tek"*
+    tokens = re.findall(r"\w+", q.lower())
+    if not tokens:
+        return []
+    match = " ".join(f'"{token}"*' for token in tokens)
     
-    for eq in equipements_data:
-        score = 0
-        
-        # Calcul du score de pertinence
-        if search_term in eq["numero"].lower():
-            score += 10
-        if search_term in eq["description"].lower():
-            score += 5
-        if eq["marque_type"] and search_term in eq["marque_type"].lower():
-            score += 3
-        if eq["n_inventaire"] and search_term in eq["n_inventaire"].lower():
-            score += 8
-        
-        if score > 0:
-            result = eq.copy()
-            result["search_score"] = score
-            results.append(result)
+    with search_index_lock:
+        rows = search_index.execute("""
+            SELECT rowid, -bm25(equipements_fts, 10.0, 8.0, 5.0, 3.0) AS score
+            FROM equipements_fts
+            WHERE equipements_fts MATCH ?
+            ORDER BY score DESC, rowid
+            LIMIT ?
+        """, (match, limit)).fetchall()
     
-    # Tri par score décroissant
-    results.sort(key=lambda x: x["search_score"], reverse=True)
+    by_id = {eq["id_equipement"]: eq for eq in equipements_data}
+    results = []
+    for rowid, score in rows:
+        result = by_id[rowid].copy()
+        result["search_score"] = round(score, 3)
+        results.append(result)
     
-    return results[:limit]
+    return results
 
 # =============================================================================
 # ENDPOINTS EXPORT
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de l'API locale sur un inventaire volumineux
+
+Crée une base temporaire (même schéma que create_local_database.py), y insère
+100 000 équipements avec interventions et licences, puis mesure la latence
+des requêtes du tableau de bord d'inventaire.
+
+Usage:
+    python benchmark_local_api.py [--equipements 100000] [--repetitions 20]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import date, timedelta
+from io import StringIO
+
+from create_local_database import create_local_database
+from local_api import LocalDatabaseAPI
+
+ETATS = ["OK"] * 14 + ["EN_PANNE", "MAINTENANCE", "REBUT", "REFORME"]
+MARQUES = ["Kistler 9257B", "HBM U9C", "Druck PTX 1830", "Nortek Vector", "RBR concerto", "Keller PAA-21Y"]
+TYPES = ["Capteur de pression", "Sonde houlomètre", "Jauge de déformation", "Courantomètre", "Centrale d'acquisition"]
+
+
+def populate(db_file: str, n_equipements: int, seed: int = 0):
+    """Insérer les équipements, interventions et licences de test"""
+    import sqlite3
+
+    rng = random.Random(seed)
+    today = date.today()
+    conn = sqlite3.connect(db_file)
+    service_ids = [row[0] for row in conn.execute("SELECT id FROM services")]
+
+    def equipements():
+        for i in range(n_equipements):
+            verification = today + timedelta(days=rng.randint(-200, 500))
+            yield (
+                f"BENCH-{i:07d}", f"{rng.choice(TYPES)} n°{i}", rng.choice(MARQUES), f"SN{rng.getrandbits(32):08X}",
+                f"INV-B{i:07d}", rng.choice(service_ids), rng.choice(ETATS), rng.randint(1995, 2024),
+                round(rng.uniform(500, 80000), 2), verification.isoformat(), rng.randint(1, 5),
+            )
+
+    def interventions(first_id):
+        for i in range(n_equipements // 2):
+            jour = today - timedelta(days=rng.randint(0, 720))
+            yield (first_id + rng.randrange(n_equipements), "MAINTENANCE", jour.isoformat(),
+                   "Intervention de test", round(rng.uniform(50, 5000), 2))
+
+    with conn:
+        conn.executemany("""
+            INSERT INTO equipements (numero, description, marque_type, numero_serie, n_inventaire,
+                service_id, etat, annee_acquisition, valeur_acquisition, prochaine_verification, criticite)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, equipements())
+        first_id = conn.execute("SELECT MIN(id_equipement) FROM equipements WHERE numero LIKE 'BENCH-%'").fetchone()[0]
+        conn.executemany("""
+            INSERT INTO interventions (equipement_id, type_intervention, date_intervention, description, cout)
+            VALUES (?, ?, ?, ?, ?)
+        """, interventions(first_id))
+        conn.executemany("""
+            INSERT INTO licences (nom, type_licence, date_expiration, statut) VALUES (?, ?, ?, ?)
+        """, ((f"Licence {i}", "ANNUELLE", (today + timedelta(days=rng.randint(-30, 400))).isoformat(),
+               rng.choice(["ACTIVE", "ACTIVE", "EXPIREE"])) for i in range(500)))
+    conn.close()
+    return first_id
+
+
+def measure(func, repetitions: int) -> float:
+    """Latence médiane en millisecondes (après un appel de chauffe)"""
+    func()
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'API locale")
+    parser.add_argument("--equipements", type=int, default=100_000)
+    parser.add_argument("--repetitions", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = os.path.join(tmp, "benchmark.db")
+        with redirect_stdout(StringIO()):
+            create_local_database(db_file)
+        print(f"📦 Insertion de {args.equipements} équipements...")
+        start = time.perf_counter()
+        first_id = populate(db_file, args.equipements)
+        print(f"   {time.perf_counter() - start:.1f} s")
+
+        api = LocalDatabaseAPI(db_file)
+        deep_cursor = f"BENCH-{args.equipements * 9 // 10:07d}"
+        middle_id = first_id + args.equipements // 2
+        first_service = api.get_services()[0]["id"]
+
+        def cold(func):
+            # Synthèse recalculée : cache vidé avant chaque appel
+            return lambda: (api.invalidate_summaries(), func())
+
+        cases = [
+            ("Statistiques du tableau de bord (calcul)", cold(api.get_dashboard_stats)),
+            ("KPI par service (calcul)", cold(api.get_kpi_services)),
+            ("Alertes métrologiques (calcul)", cold(api.get_alertes_metrologie)),
+            ("Statistiques du tableau de bord (cache)", api.get_dashboard_stats),
+            ("KPI par service (cache)", api.get_kpi_services),
+            ("Alertes métrologiques (cache)", api.get_alertes_metrologie),
+            ("Première page (100)", lambda: api.get_equipements_page(limit=100)),
+            ("Page profonde (100, curseur à 90 %)", lambda: api.get_equipements_page(limit=100, after=deep_cursor)),
+            ("Page filtrée service + état", lambda: api.get_equipements_page(first_service, "EN_PANNE", limit=100)),
+            ("Équipement par id", lambda: api.get_equipement(middle_id)),
+            ("Recherche 'pression'", lambda: api.search_equipements("pression")),
+            ("Recherche préfixe sans accents 'jauge defor'", lambda: api.search_equipements("jauge defor")),
+            ("Recherche numéro 'BENCH-00123'", lambda: api.search_equipements("BENCH-00123")),
+        ]
+
+        print(f"\n⏱️  Latence médiane sur {args.repetitions} appels")
+        print("-" * 60)
+        for label, func in cases:
+            print(f"{label:<46} {measure(func, args.repetitions):>10.2f} ms")
+        api.close()
+
+
+if __name__ == "__main__":
+    main()
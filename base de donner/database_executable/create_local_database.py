@@ -9,12 +9,9 @@ import json
 import os
 from datetime import datetime, date
 
-def create_local_database():
+def create_local_database(db_file="instrumentation_maritime.db"):
     """Créer la base de données SQLite locale"""
     
-    # Nom du fichier de base de données
-    db_file = "instrumentation_maritime.db"
-    
     # Supprimer l'ancienne base si elle existe
     if os.path.exists(db_file):
         os.remove(db_file)
@@ -271,12 +268,14 @@ def create_local_database():
     # =============================================================================
     
     indexes = [
-        "CREATE INDEX idx_equipements_service ON equipements(service_id)",
-        "CREATE INDEX idx_equipements_etat ON equipements(etat)",
-        "CREATE INDEX idx_equipements_prochaine_verif ON equipements(prochaine_verification)",
+        "CREATE INDEX idx_equipements_service_numero ON equipements(service_id, numero)",
+        "CREATE INDEX idx_equipements_etat_numero ON equipements(etat, numero)",
+        "CREATE INDEX idx_equipements_verif_etat ON equipements(prochaine_verification, etat)",
+        "CREATE INDEX idx_equipements_service_etat_verif ON equipements(service_id, etat, prochaine_verification)",
         "CREATE INDEX idx_metrologie_equipement ON metrologie(equipement_id)",
         "CREATE INDEX idx_metrologie_date ON metrologie(date_verification)",
         "CREATE INDEX idx_interventions_equipement ON interventions(equipement_id)",
+        "CREATE INDEX idx_interventions_date_cout ON interventions(date_intervention, cout)",
         "CREATE INDEX idx_projets_service ON projets(service_id)"
     ]
     
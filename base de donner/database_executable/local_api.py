@@ -4,16 +4,228 @@ API Locale SQLite pour la Base de Données d'Instrumentation Maritime
 Version simplifiée pour usage local sans serveur PostgreSQL
 """
 
+import copy
 import sqlite3
 import json
+import re
+import threading
+import uuid
 from datetime import datetime, date
 from typing import List, Dict, Any, Optional
 import os
 
+# Réglages appliqués à chaque connexion du pool
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",       # lectures concurrentes pendant les écritures
+    "PRAGMA synchronous=NORMAL",     # sûr en WAL, évite un fsync par transaction
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-32000",      # 32 Mo de cache de pages
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",    # 256 Mo projetés en mémoire
+)
+
+# Index composites : filtres du tableau de bord et pagination par numéro.
+# Ils remplacent les index simples sur service_id, etat et prochaine_verification,
+# qui en sont des préfixes.
+READ_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_equipements_service_numero ON equipements(service_id, numero)",
+    "CREATE INDEX IF NOT EXISTS idx_equipements_etat_numero ON equipements(etat, numero)",
+    "CREATE INDEX IF NOT EXISTS idx_equipements_verif_etat ON equipements(prochaine_verification, etat)",
+    "CREATE INDEX IF NOT EXISTS idx_equipements_service_etat_verif ON equipements(service_id, etat, prochaine_verification)",
+    # Interventions du mois et coût de l'année lus dans l'index seul
+    "CREATE INDEX IF NOT EXISTS idx_interventions_date_cout ON interventions(date_intervention, cout)",
+)
+REDUNDANT_INDEXES = ("idx_equipements_service", "idx_equipements_etat", "idx_equipements_prochaine_verif")
+
+# Requêtes réutilisées : texte constant, donc préparées une seule fois par
+# connexion grâce au cache d'instructions de sqlite3
+EQUIPEMENT_SELECT = """
+    SELECT 
+        e.*,
+        s.nom as service_nom,
+        s.code as service_code
+    FROM equipements e
+    LEFT JOIN services s ON e.service_id = s.id
+"""
+EQUIPEMENT_BY_ID = EQUIPEMENT_SELECT + " WHERE e.id_equipement = ?"
+
+# Synthèses du tableau de bord : une requête groupée chacune, résultat gardé
+# en mémoire. dashboard_cache ne contient qu'un jeton par synthèse valide :
+# les triggers le suppriment à chaque écriture (quel que soit le processus)
+# et il expire en fin de journée, les requêtes dépendant de date('now').
+SUMMARY_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS dashboard_cache (
+        nom TEXT PRIMARY KEY,
+        jour TEXT NOT NULL,
+        jeton TEXT NOT NULL
+    )
+"""
+# Synthèses à invalider lors d'une écriture dans chaque table
+SUMMARY_DEPENDENCIES = {
+    "equipements": ("stats", "kpi_services", "alertes_metrologie"),
+    "interventions": ("stats",),
+    "licences": ("stats",),
+    "projets": ("stats",),
+    "services": ("kpi_services", "alertes_metrologie"),
+}
+SUMMARY_GET = "SELECT jeton FROM dashboard_cache WHERE nom = ? AND jour = date('now')"
+SUMMARY_PUT = "INSERT OR REPLACE INTO dashboard_cache (nom, jour, jeton) VALUES (?, date('now'), ?)"
+
+DASHBOARD_STATS_QUERY = """
+    WITH eq AS (
+        SELECT 
+            SUM(CASE WHEN etat NOT IN ('REBUT', 'REFORME') THEN 1 ELSE 0 END) as total_equipements,
+            SUM(CASE WHEN etat = 'OK' THEN 1 ELSE 0 END) as equipements_ok,
+            SUM(CASE WHEN etat = 'EN_PANNE' THEN 1 ELSE 0 END) as equipements_panne,
+            SUM(CASE WHEN prochaine_verification < date('now') THEN 1 ELSE 0 END) as verifications_expirees
+        FROM equipements
+    ),
+    it AS (
+        SELECT 
+            SUM(CASE WHEN date_intervention >= date('now', 'start of month') THEN 1 ELSE 0 END) as interventions_mois,
+            COALESCE(SUM(cout), 0) as cout_maintenance_annee
+        FROM interventions
+        WHERE date_intervention >= date('now', 'start of year')
+            AND date_intervention < date('now', 'start of year', '+1 year')
+    )
+    SELECT 
+        COALESCE(eq.total_equipements, 0) as total_equipements,
+        COALESCE(eq.equipements_ok, 0) as equipements_ok,
+        COALESCE(eq.equipements_panne, 0) as equipements_panne,
+        COALESCE(eq.verifications_expirees, 0) as verifications_expirees,
+        COALESCE(it.interventions_mois, 0) as interventions_mois,
+        it.cout_maintenance_annee,
+        (SELECT COUNT(*) FROM projets WHERE statut = 'ACTIF') as projets_actifs,
+        (SELECT COUNT(*) FROM licences 
+            WHERE date_expiration < date('now', '+60 days') AND statut = 'ACTIVE') as licences_expire_bientot
+    FROM eq, it
+"""
+
+# Agrégation par service_id dans l'index (service_id, etat, prochaine_verification),
+# puis jointure sur la petite table des services
+KPI_SERVICES_QUERY = """
+    WITH par_service AS (
+        SELECT 
+            service_id,
+            COUNT(*) as total_equipements,
+            SUM(CASE WHEN etat = 'OK' THEN 1 ELSE 0 END) as equipements_ok,
+            SUM(CASE WHEN etat = 'EN_PANNE' THEN 1 ELSE 0 END) as equipements_panne,
+            SUM(CASE WHEN etat = 'MAINTENANCE' THEN 1 ELSE 0 END) as equipements_maintenance,
+            SUM(CASE WHEN prochaine_verification < date('now') THEN 1 ELSE 0 END) as verifications_expirees
+        FROM equipements
+        WHERE etat IS NULL OR etat NOT IN ('REBUT', 'REFORME')
+        GROUP BY service_id
+    )
+    SELECT 
+        s.id as service_id,
+        s.code,
+        s.nom as service,
+        COALESCE(k.total_equipements, 0) as total_equipements,
+        COALESCE(k.equipements_ok, 0) as equipements_ok,
+        COALESCE(k.equipements_panne, 0) as equipements_panne,
+        COALESCE(k.equipements_maintenance, 0) as equipements_maintenance,
+        ROUND(CAST(k.equipements_ok AS FLOAT) / NULLIF(k.total_equipements, 0) * 100, 2) as taux_disponibilite,
+        COALESCE(k.verifications_expirees, 0) as verifications_expirees
+    FROM services s
+    LEFT JOIN par_service k ON k.service_id = s.id
+    ORDER BY s.nom
+"""
+
+ALERTES_METROLOGIE_QUERY = """
+    SELECT 
+        e.id_equipement,
+        e.numero,
+        e.description,
+        s.nom as service,
+        e.prochaine_verification,
+        CASE 
+            WHEN e.prochaine_verification < date('now') THEN 'EXPIRE'
+            WHEN e.prochaine_verification < date('now', '+30 days') THEN 'ALERTE'
+            WHEN e.prochaine_verification < date('now', '+60 days') THEN 'ATTENTION'
+            ELSE 'OK'
+        END as statut_alerte,
+        julianday('now') - julianday(e.prochaine_verification) as jours_retard
+    FROM equipements e
+    LEFT JOIN services s ON e.service_id = s.id
+    WHERE e.prochaine_verification IS NOT NULL
+        AND e.etat NOT IN ('REBUT', 'REFORME')
+        AND e.prochaine_verification < date('now', '+60 days')
+    ORDER BY e.prochaine_verification
+"""
+
+# Index plein texte des équipements (table FTS5 à contenu externe).
+# Les accents sont ignorés (« generateur » trouve « Générateur ») et les
+# préfixes de 2 et 3 caractères sont indexés pour la recherche à la frappe.
+SEARCH_SCHEMA = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS equipements_fts USING fts5(
+        numero, n_inventaire, description, marque_type,
+        content='equipements', content_rowid='id_equipement',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    # Synchronisation par triggers : toute écriture sur equipements met l'index à jour
+    """CREATE TRIGGER IF NOT EXISTS equipements_fts_ai AFTER INSERT ON equipements BEGIN
+        INSERT INTO equipements_fts(rowid, numero, n_inventaire, description, marque_type)
+        VALUES (new.id_equipement, new.numero, new.n_inventaire, new.description, new.marque_type);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS equipements_fts_ad AFTER DELETE ON equipements BEGIN
+        INSERT INTO equipements_fts(equipements_fts, rowid, numero, n_inventaire, description, marque_type)
+        VALUES ('delete', old.id_equipement, old.numero, old.n_inventaire, old.description, old.marque_type);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS equipements_fts_au
+    AFTER UPDATE OF numero, n_inventaire, description, marque_type ON equipements BEGIN
+        INSERT INTO equipements_fts(equipements_fts, rowid, numero, n_inventaire, description, marque_type)
+        VALUES ('delete', old.id_equipement, old.numero, old.n_inventaire, old.description, old.marque_type);
+        INSERT INTO equipements_fts(rowid, numero, n_inventaire, description, marque_type)
+        VALUES (new.id_equipement, new.numero, new.n_inventaire, new.description, new.marque_type);
+    END""",
+)
+# Poids bm25 des colonnes (numero, n_inventaire, description, marque_type),
+# dans l'esprit de l'ancien score 10/8/5/3
+SEARCH_QUERY = """
+    SELECT 
+        e.id_equipement,
+        e.numero,
+        e.description,
+        e.marque_type,
+        s.nom as service_nom,
+        -bm25(equipements_fts, 10.0, 8.0, 5.0, 3.0) as search_score
+    FROM equipements_fts
+    JOIN equipements e ON e.id_equipement = equipements_fts.rowid
+    LEFT JOIN services s ON e.service_id = s.id
+    WHERE equipements_fts MATCH ?
+    ORDER BY search_score DESC, e.numero
+    LIMIT ?
+"""
+
+
+def build_match_query(search_term: str) -> Optional[str]:
+    """
+    Convertir une saisie libre en requête FTS5 : chaque mot devient un
+    préfixe, tous les mots sont requis (« gene tek » -> "gene"* "tek"*)
+    
+    Retourne None si la saisie ne contient aucun mot.
+    """
+    tokens = re.findall(r"\w+", search_term.lower())
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
 class LocalDatabaseAPI:
     def __init__(self, db_file="instrumentation_maritime.db"):
         self.db_file = db_file
-        self.ensure_database_exists()
+        # Une connexion par thread (serveur HTTP multi-thread), réutilisée entre les requêtes
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self.fts_enabled = False
+        # Synthèses calculées : nom -> (jeton, valeur)
+        self._summaries: Dict[str, Any] = {}
+        self._summaries_lock = threading.Lock()
+        if self.ensure_database_exists():
+            self.ensure_indexes()
+            self.ensure_search_index()
+            self.ensure_summary_cache()
     
     def ensure_database_exists(self):
         """Vérifier que la base de données existe"""
@@ -24,166 +236,183 @@ class LocalDatabaseAPI:
         return True
     
     def get_connection(self):
-        """Obtenir une connexion à la base de données"""
-        conn = sqlite3.connect(self.db_file)
-        conn.row_factory = sqlite3.Row  # Pour accéder aux colonnes par nom
+        """Obtenir la connexion du thread courant (créée à la première utilisation)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, check_same_thread=False, cached_statements=256)
+            conn.row_factory = sqlite3.Row  # Pour accéder aux colonnes par nom
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._pool_lock:
+                self._connections.append(conn)
         return conn
     
+    def close(self):
+        """Fermer toutes les connexions du pool"""
+        with self._pool_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+    
+    def ensure_indexes(self):
+        """Créer les index de lecture s'ils manquent (idempotent)"""
+        conn = self.get_connection()
+        existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        wanted = [sql for sql in READ_INDEXES if sql.split()[5] not in existing]
+        if not wanted:
+            return
+        with conn:
+            for index_sql in wanted:
+                conn.execute(index_sql)
+            for name in REDUNDANT_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+        # Statistiques du planificateur pour les nouveaux index
+        conn.execute("ANALYZE")
+        print(f"✅ {len(wanted)} index de lecture créés")
+    
+    def ensure_search_index(self):
+        """Créer l'index plein texte et ses triggers, puis l'alimenter s'il est nouveau"""
+        conn = self.get_connection()
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'equipements_fts'"
+        ).fetchone()
+        try:
+            with conn:
+                for statement in SEARCH_SCHEMA:
+                    conn.execute(statement)
+                if not exists:
+                    conn.execute("INSERT INTO equipements_fts(equipements_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError as e:
+            # SQLite compilé sans FTS5 : la recherche reste en LIKE
+            print(f"⚠️ Index plein texte indisponible ({e}), recherche simple utilisée")
+            return
+        self.fts_enabled = True
+        if not exists:
+            print("✅ Index plein texte des équipements créé")
+    
+    def ensure_summary_cache(self):
+        """Créer la table des synthèses et les triggers qui l'invalident"""
+        conn = self.get_connection()
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        try:
+            with conn:
+                conn.execute(SUMMARY_SCHEMA)
+                for table, names in SUMMARY_DEPENDENCIES.items():
+                    if table not in tables:
+                        continue
+                    noms = ", ".join(f"'{name}'" for name in names)
+                    for operation in ("INSERT", "UPDATE", "DELETE"):
+                        conn.execute(f"""
+                            CREATE TRIGGER IF NOT EXISTS dashboard_cache_{table}_{operation.lower()}
+                            AFTER {operation} ON {table} BEGIN
+                                DELETE FROM dashboard_cache WHERE nom IN ({noms});
+                            END
+                        """)
+        except sqlite3.OperationalError as e:
+            # Base en lecture seule : synthèses recalculées à chaque appel
+            print(f"⚠️ Cache des synthèses indisponible ({e})")
+    
+    def invalidate_summaries(self):
+        """Vider le cache des synthèses (les triggers le font lors des écritures)"""
+        conn = self.get_connection()
+        with conn:
+            conn.execute("DELETE FROM dashboard_cache")
+        with self._summaries_lock:
+            self._summaries.clear()
+    
+    def _cached_summary(self, name: str, compute):
+        """
+        Retourner une synthèse encore valide ou la calculer avec compute(conn)
+        
+        Le calcul et l'enregistrement du jeton se font dans une transaction
+        d'écriture : aucune écriture concurrente ne peut invalider le résultat
+        entre les deux. Si la base refuse l'écriture (lecture seule), la
+        synthèse est calculée sans être gardée. L'appelant reçoit une copie.
+        """
+        conn = self.get_connection()
+        with self._summaries_lock:
+            cached = self._summaries.get(name)
+        if cached:
+            row = conn.execute(SUMMARY_GET, (name,)).fetchone()
+            if row and cached[0] == row[0]:
+                return copy.deepcopy(cached[1])
+        
+        token = uuid.uuid4().hex
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                value = compute(conn)
+                conn.execute(SUMMARY_PUT, (name, token))
+        except sqlite3.OperationalError as e:
+            print(f"⚠️ Synthèse '{name}' non mise en cache ({e})")
+            return compute(conn)
+        with self._summaries_lock:
+            self._summaries[name] = (token, value)
+        return copy.deepcopy(value)
+    
     # =============================================================================
     # STATISTIQUES DASHBOARD
     # =============================================================================
     
     def get_dashboard_stats(self) -> Dict[str, Any]:
         """Obtenir les statistiques pour le dashboard"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            # Total équipements
-            cursor.execute("SELECT COUNT(*) FROM equipements WHERE etat NOT IN ('REBUT', 'REFORME')")
-            total_equipements = cursor.fetchone()[0]
-            
-            # Équipements OK
-            cursor.execute("SELECT COUNT(*) FROM equipements WHERE etat = 'OK'")
-            equipements_ok = cursor.fetchone()[0]
-            
-            # Équipements en panne
-            cursor.execute("SELECT COUNT(*) FROM equipements WHERE etat = 'EN_PANNE'")
-            equipements_panne = cursor.fetchone()[0]
-            
-            # Vérifications expirées
-            cursor.execute("SELECT COUNT(*) FROM equipements WHERE prochaine_verification < date('now')")
-            verifications_expirees = cursor.fetchone()[0]
-            
-            # Interventions du mois
-            cursor.execute("""
-                SELECT COUNT(*) FROM interventions 
-                WHERE date_intervention >= date('now', 'start of month')
-            """)
-            interventions_mois = cursor.fetchone()[0]
-            
-            # Coût maintenance année
-            cursor.execute("""
-                SELECT COALESCE(SUM(cout), 0) FROM interventions 
-                WHERE strftime('%Y', date_intervention) = strftime('%Y', 'now')
-            """)
-            cout_maintenance_annee = cursor.fetchone()[0]
-            
-            # Projets actifs
-            cursor.execute("SELECT COUNT(*) FROM projets WHERE statut = 'ACTIF'")
-            projets_actifs = cursor.fetchone()[0]
-            
-            # Licences expirant bientôt
-            cursor.execute("""
-                SELECT COUNT(*) FROM licences 
-                WHERE date_expiration < date('now', '+60 days') AND statut = 'ACTIVE'
-            """)
-            licences_expire_bientot = cursor.fetchone()[0]
-            
-            return {
-                "total_equipements": total_equipements,
-                "equipements_ok": equipements_ok,
-                "equipements_panne": equipements_panne,
-                "verifications_expirees": verifications_expirees,
-                "interventions_mois": interventions_mois,
-                "cout_maintenance_annee": float(cout_maintenance_annee),
-                "projets_actifs": projets_actifs,
-                "licences_expire_bientot": licences_expire_bientot
-            }
-        
-        finally:
-            conn.close()
+        return self._cached_summary("stats", self._query_dashboard_stats)
     
     def get_alertes_metrologie(self) -> List[Dict[str, Any]]:
         """Obtenir les alertes métrologiques"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                SELECT 
-                    e.id_equipement,
-                    e.numero,
-                    e.description,
-                    s.nom as service,
-                    e.prochaine_verification,
-                    CASE 
-                        WHEN e.prochaine_verification < date('now') THEN 'EXPIRE'
-                        WHEN e.prochaine_verification < date('now', '+30 days') THEN 'ALERTE'
-                        WHEN e.prochaine_verification < date('now', '+60 days') THEN 'ATTENTION'
-                        ELSE 'OK'
-                    END as statut_alerte,
-                    julianday('now') - julianday(e.prochaine_verification) as jours_retard
-                FROM equipements e
-                LEFT JOIN services s ON e.service_id = s.id
-                WHERE e.prochaine_verification IS NOT NULL
-                    AND e.etat NOT IN ('REBUT', 'REFORME')
-                    AND e.prochaine_verification < date('now', '+60 days')
-                ORDER BY e.prochaine_verification
-            """)
-            
-            alertes = []
-            for row in cursor.fetchall():
-                alertes.append({
-                    "id_equipement": row["id_equipement"],
-                    "numero": row["numero"],
-                    "description": row["description"],
-                    "service": row["service"],
-                    "prochaine_verification": row["prochaine_verification"],
-                    "statut_alerte": row["statut_alerte"],
-                    "jours_retard": int(row["jours_retard"]) if row["jours_retard"] > 0 else None
-                })
-            
-            return alertes
-        
-        finally:
-            conn.close()
+        return self._cached_summary("alertes_metrologie", self._query_alertes_metrologie)
     
     def get_kpi_services(self) -> List[Dict[str, Any]]:
         """Obtenir les KPI par service"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                SELECT 
-                    s.id as service_id,
-                    s.code,
-                    s.nom as service,
-                    COUNT(e.id_equipement) as total_equipements,
-                    SUM(CASE WHEN e.etat = 'OK' THEN 1 ELSE 0 END) as equipements_ok,
-                    SUM(CASE WHEN e.etat = 'EN_PANNE' THEN 1 ELSE 0 END) as equipements_panne,
-                    SUM(CASE WHEN e.etat = 'MAINTENANCE' THEN 1 ELSE 0 END) as equipements_maintenance,
-                    ROUND(
-                        CAST(SUM(CASE WHEN e.etat = 'OK' THEN 1 ELSE 0 END) AS FLOAT) / 
-                        NULLIF(COUNT(e.id_equipement), 0) * 100, 2
-                    ) as taux_disponibilite,
-                    SUM(CASE WHEN e.prochaine_verification < date('now') THEN 1 ELSE 0 END) as verifications_expirees
-                FROM services s
-                LEFT JOIN equipements e ON s.id = e.service_id
-                WHERE e.etat IS NULL OR e.etat NOT IN ('REBUT', 'REFORME')
-                GROUP BY s.id, s.code, s.nom
-                ORDER BY s.nom
-            """)
-            
-            kpis = []
-            for row in cursor.fetchall():
-                kpis.append({
-                    "service_id": row["service_id"],
-                    "code": row["code"],
-                    "service": row["service"],
-                    "total_equipements": row["total_equipements"],
-                    "equipements_ok": row["equipements_ok"],
-                    "equipements_panne": row["equipements_panne"],
-                    "equipements_maintenance": row["equipements_maintenance"],
-                    "taux_disponibilite": float(row["taux_disponibilite"] or 0),
-                    "verifications_expirees": row["verifications_expirees"]
-                })
-            
-            return kpis
-        
-        finally:
-            conn.close()
+        return self._cached_summary("kpi_services", self._query_kpi_services)
+    
+    @staticmethod
+    def _query_dashboard_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
+        row = conn.execute(DASHBOARD_STATS_QUERY).fetchone()
+        return {
+            "total_equipements": row["total_equipements"],
+            "equipements_ok": row["equipements_ok"],
+            "equipements_panne": row["equipements_panne"],
+            "verifications_expirees": row["verifications_expirees"],
+            "interventions_mois": row["interventions_mois"],
+            "cout_maintenance_annee": float(row["cout_maintenance_annee"]),
+            "projets_actifs": row["projets_actifs"],
+            "licences_expire_bientot": row["licences_expire_bientot"]
+        }
+    
+    @staticmethod
+    def _query_alertes_metrologie(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id_equipement": row["id_equipement"],
+                "numero": row["numero"],
+                "description": row["description"],
+                "service": row["service"],
+                "prochaine_verification": row["prochaine_verification"],
+                "statut_alerte": row["statut_alerte"],
+                "jours_retard": int(row["jours_retard"]) if row["jours_retard"] > 0 else None
+            }
+            for row in conn.execute(ALERTES_METROLOGIE_QUERY)
+        ]
+    
+    @staticmethod
+    def _query_kpi_services(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+        return [
+            {
+                "service_id": row["service_id"],
+                "code": row["code"],
+                "service": row["service"],
+                "total_equipements": row["total_equipements"],
+                "equipements_ok": row["equipements_ok"],
+                "equipements_panne": row["equipements_panne"],
+                "equipements_maintenance": row["equipements_maintenance"],
+                "taux_disponibilite": float(row["taux_disponibilite"] or 0),
+                "verifications_expirees": row["verifications_expirees"]
+            }
+            for row in conn.execute(KPI_SERVICES_QUERY)
+        ]
     
     # =============================================================================
     # GESTION DES ÉQUIPEMENTS
@@ -208,26 +437,26 @@ class LocalDatabaseAPI:
             return services
         
         finally:
-            conn.close()
+            cursor.close()
     
     def get_equipements(self, service_id: Optional[int] = None, 
                        etat: Optional[str] = None,
-                       search: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Obtenir les équipements avec filtres"""
+                       search: Optional[str] = None,
+                       limit: Optional[int] = None,
+                       after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Obtenir les équipements avec filtres
+        
+        Pagination par clé : `after` est le dernier numéro de la page précédente,
+        la page suivante se lit directement dans l'index (service/état, numéro)
+        sans OFFSET.
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
             # Construction de la requête avec filtres
-            query = """
-                SELECT 
-                    e.*,
-                    s.nom as service_nom,
-                    s.code as service_code
-                FROM equipements e
-                LEFT JOIN services s ON e.service_id = s.id
-                WHERE 1=1
-            """
+            query = EQUIPEMENT_SELECT + " WHERE 1=1"
             params = []
             
             if service_id:
@@ -243,57 +472,104 @@ class LocalDatabaseAPI:
                 search_param = f"%{search}%"
                 params.extend([search_param, search_param, search_param])
             
-            query += " ORDER BY e.numero"
+            if after is not None:
+                query += " AND e.numero > ?"
+                params.append(after)
             
-            cursor.execute(query, params)
+            query += " ORDER BY e.numero"
             
-            equipements = []
-            for row in cursor.fetchall():
-                equipement = {
-                    "id_equipement": row["id_equipement"],
-                    "numero": row["numero"],
-                    "description": row["description"],
-                    "marque_type": row["marque_type"],
-                    "numero_serie": row["numero_serie"],
-                    "n_inventaire": row["n_inventaire"],
-                    "utilisateur": row["utilisateur"],
-                    "localisation": row["localisation"],
-                    "etat": row["etat"],
-                    "annee_acquisition": row["annee_acquisition"],
-                    "valeur_acquisition": float(row["valeur_acquisition"]) if row["valeur_acquisition"] else None,
-                    "statut_metrologique": row["statut_metrologique"],
-                    "date_derniere_verification": row["date_derniere_verification"],
-                    "prochaine_verification": row["prochaine_verification"],
-                    "frequence_verification_mois": row["frequence_verification_mois"],
-                    "criticite": row["criticite"],
-                    "commentaires": row["commentaires"],
-                    "service": {
-                        "id": row["service_id"],
-                        "nom": row["service_nom"],
-                        "code": row["service_code"]
-                    } if row["service_id"] else None
-                }
-                equipements.append(equipement)
+            if limit is not None:
+                query += " LIMIT ?"
+                params.append(limit)
             
-            return equipements
+            cursor.execute(query, params)
+            return [self._equipement_from_row(row) for row in cursor.fetchall()]
         
         finally:
-            conn.close()
+            cursor.close()
+    
+    def get_equipements_page(self, service_id: Optional[int] = None,
+                             etat: Optional[str] = None,
+                             search: Optional[str] = None,
+                             limit: int = 100,
+                             after: Optional[str] = None) -> Dict[str, Any]:
+        """Obtenir une page d'équipements et le curseur de la page suivante"""
+        items = self.get_equipements(service_id, etat, search, limit=limit, after=after)
+        return {
+            "items": items,
+            "limit": limit,
+            "next_cursor": items[-1]["numero"] if len(items) == limit else None
+        }
     
     def get_equipement(self, equipement_id: int) -> Optional[Dict[str, Any]]:
         """Obtenir un équipement par ID"""
-        equipements = self.get_equipements()
-        for eq in equipements:
-            if eq["id_equipement"] == equipement_id:
-                return eq
-        return None
+        row = self.get_connection().execute(EQUIPEMENT_BY_ID, (equipement_id,)).fetchone()
+        return self._equipement_from_row(row) if row else None
+    
+    @staticmethod
+    def _equipement_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convertir une ligne (équipement + service) en dictionnaire"""
+        return {
+            "id_equipement": row["id_equipement"],
+            "numero": row["numero"],
+            "description": row["description"],
+            "marque_type": row["marque_type"],
+            "numero_serie": row["numero_serie"],
+            "n_inventaire": row["n_inventaire"],
+            "utilisateur": row["utilisateur"],
+            "localisation": row["localisation"],
+            "etat": row["etat"],
+            "annee_acquisition": row["annee_acquisition"],
+            "valeur_acquisition": float(row["valeur_acquisition"]) if row["valeur_acquisition"] else None,
+            "statut_metrologique": row["statut_metrologique"],
+            "date_derniere_verification": row["date_derniere_verification"],
+            "prochaine_verification": row["prochaine_verification"],
+            "frequence_verification_mois": row["frequence_verification_mois"],
+            "criticite": row["criticite"],
+            "commentaires": row["commentaires"],
+            "service": {
+                "id": row["service_id"],
+                "nom": row["service_nom"],
+                "code": row["service_code"]
+            } if row["service_id"] else None
+        }
     
     # =============================================================================
     # RECHERCHE
     # =============================================================================
     
     def search_equipements(self, search_term: str, limit: int = 20) -> List[Dict[str, Any]]:
-        """Recherche full-text dans les équipements"""
+        """
+        Recherche full-text dans les équipements
+        
+        Recherche par préfixe, insensible aux accents et à la casse, classée
+        par pertinence (bm25).
+        """
+        if not self.fts_enabled:
+            return self._search_equipements_like(search_term, limit)
+        
+        match = build_match_query(search_term)
+        if match is None:
+            return []
+        
+        cursor = self.get_connection().execute(SEARCH_QUERY, (match, limit))
+        try:
+            return [
+                {
+                    "id_equipement": row["id_equipement"],
+                    "numero": row["numero"],
+                    "description": row["description"],
+                    "marque_type": row["marque_type"],
+                    "service_nom": row["service_nom"],
+                    "search_score": round(row["search_score"], 3)
+                }
+                for row in cursor.fetchall()
+            ]
+        finally:
+            cursor.close()
+    
+    def _search_equipements_like(self, search_term: str, limit: int) -> List[Dict[str, Any]]:
+        """Recherche par LIKE (SQLite sans FTS5)"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
@@ -335,7 +611,7 @@ class LocalDatabaseAPI:
             return results
         
         finally:
-            conn.close()
+            cursor.close()
     
     # =============================================================================
     # EXPORT
@@ -408,7 +684,12 @@ def create_simple_web_server():
                     service_id = int(query_params.get('service_id', [None])[0]) if query_params.get('service_id', [None])[0] else None
                     etat = query_params.get('etat', [None])[0]
                     search = query_params.get('search', [None])[0]
-                    data = api.get_equipements(service_id, etat, search)
+                    if 'limit' in query_params or 'after' in query_params:
+                        limit = int(query_params.get('limit', [100])[0])
+                        after = query_params.get('after', [None])[0]
+                        data = api.get_equipements_page(service_id, etat, search, limit, after)
+                    else:
+                        data = api.get_equipements(service_id, etat, search)
                 
                 elif path.startswith('/api/equipements/'):
                     equipement_id = int(path.split('/')[-1])
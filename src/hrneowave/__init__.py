@@ -1,7 +1,38 @@
-"""CHNeoWave - Logiciel d'acquisition houle laboratoire maritime"""
+"""CHNeoWave - Logiciel d'acquisition houle laboratoire maritime
+
+Les sous-paquets et leurs symboles sont chargés à la première utilisation
+(PEP 562) : `import hrneowave` ne charge ni numpy, ni scipy, ni Qt.
+"""
 
 __version__ = "0.3.0"
 
+import importlib
+
+# Symbole -> module qui le définit (anciennement `from .tools import *`)
+_LAZY_ATTRIBUTES = {
+    'MediterraneanLabConfigurator': 'tools.lab_config',
+    'LabConfiguration': 'tools.lab_config',
+    'HardwareConfig': 'tools.lab_config',
+    'ProcessingConfig': 'tools.lab_config',
+    'EnvironmentConfig': 'tools.lab_config',
+    'CalibrationConfig': 'tools.lab_config',
+}
+
+_SUBPACKAGES = (
+    'acquisition', 'benchmarks', 'config', 'core', 'gui', 'hardware', 'headless', 'tools', 'utils'
+)
+
+
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f".{name}", __name__)
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
-from .hardware import *
-from .tools import *
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_SUBPACKAGES))
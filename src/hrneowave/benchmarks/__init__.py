@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Suite de benchmarks CHNeoWave
+
+Usage:
+    chneowave bench                              # exécute la suite
+    chneowave bench --output resultats.json      # enregistre les résultats
+    chneowave bench --compare benchmarks/baseline.json --threshold 0.15
+"""
+
+from .runner import (
+    BENCHMARKS,
+    BenchmarkCase,
+    BenchmarkContext,
+    BenchmarkResult,
+    BenchmarkSkipped,
+    DEFAULT_REGRESSION_THRESHOLD,
+    benchmark,
+    compare_results,
+    format_comparison,
+    format_results,
+    load_results,
+    machine_info,
+    run_benchmarks,
+    save_results,
+)
+
+__all__ = [
+    'BENCHMARKS',
+    'BenchmarkCase',
+    'BenchmarkContext',
+    'BenchmarkResult',
+    'BenchmarkSkipped',
+    'DEFAULT_REGRESSION_THRESHOLD',
+    'benchmark',
+    'compare_results',
+    'format_comparison',
+    'format_results',
+    'load_results',
+    'machine_info',
+    'run_benchmarks',
+    'save_results',
+]
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+Exécution des benchmarks CHNeoWave, résultats JSON et comparaison à une référence
+
+Chaque benchmark est une fonction enregistrée par `@benchmark` qui prépare ses
+données et retourne (fonction mesurée, éléments traités par appel). Le runner
+répète la fonction jusqu'à un budget de temps ou un nombre d'itérations et
+retient la médiane, plus robuste que la moyenne aux interruptions du système.
+"""
+
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Version du format des fichiers de résultats
+RESULTS_FORMAT_VERSION = 1
+
+# Seuil de régression par défaut (médiane 10 % plus lente que la référence)
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+BenchmarkSetup = Callable[['BenchmarkContext'], Tuple[Callable[[], Any], int]]
+
+
+class BenchmarkSkipped(Exception):
+    """Levée par un benchmark dont une dépendance optionnelle manque"""
+
+
+@dataclass
+class BenchmarkCase:
+    """Benchmark enregistré"""
+    name: str
+    setup: BenchmarkSetup
+    unit: str = "échantillons"
+    group: str = "core"
+    description: str = ""
+
+
+@dataclass
+class BenchmarkResult:
+    """Mesures d'un benchmark"""
+    name: str
+    group: str
+    unit: str
+    iterations: int = 0
+    items_per_call: int = 0
+    median_s: float = 0.0
+    min_s: float = 0.0
+    p90_s: float = 0.0
+    throughput: float = 0.0  # unités par seconde (médiane)
+    skipped: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Conversion en dictionnaire"""
+        return asdict(self)
+
+
+@dataclass
+class BenchmarkContext:
+    """Contexte transmis aux benchmarks : répertoire temporaire et taille des données"""
+    workdir: Path
+    scale: float = 1.0
+    seed: int = 42
+    _rng: Optional[np.random.Generator] = field(default=None, repr=False)
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """Générateur aléatoire déterministe"""
+        if self._rng is None:
+            self._rng = np.random.default_rng(self.seed)
+        return self._rng
+
+    def size(self, n: int) -> int:
+        """Taille de données mise à l'échelle (au moins 1)"""
+        return max(1, int(n * self.scale))
+
+
+# Registre des benchmarks, dans l'ordre d'enregistrement
+BENCHMARKS: Dict[str, BenchmarkCase] = {}
+
+
+def benchmark(name: str, unit: str = "échantillons", group: str = "core"):
+    """
+    Décorateur d'enregistrement d'un benchmark
+
+    La fonction décorée reçoit un BenchmarkContext et retourne la fonction à
+    mesurer et le nombre d'unités qu'elle traite par appel.
+    """
+    def decorator(setup: BenchmarkSetup) -> BenchmarkSetup:
+        BENCHMARKS[name] = BenchmarkCase(
+            name=name, setup=setup, unit=unit, group=group,
+            description=(setup.__doc__ or "").strip().splitlines()[0] if setup.__doc__ else ""
+        )
+        return setup
+    return decorator
+
+
+def machine_info() -> Dict[str, Any]:
+    """Description de la machine et des versions pour contextualiser les résultats"""
+    info = {
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'cpu_count': os.cpu_count()
+    }
+    try:
+        import psutil
+        info['memory_total_gb'] = round(psutil.virtual_memory().total / 1024 ** 3, 1)
+        frequency = psutil.cpu_freq()
+        if frequency:
+            info['cpu_freq_mhz'] = round(frequency.max or frequency.current)
+    except Exception:
+        pass
+    return info
+
+
+def _measure(func: Callable[[], Any], max_iterations: int, min_time: float) -> List[float]:
+    """Chronomètre func (après un appel de chauffe) jusqu'au budget de temps"""
+    func()
+    timings = []
+    budget_start = time.perf_counter()
+    while len(timings) < max_iterations:
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+        if time.perf_counter() - budget_start >= min_time and len(timings) >= 3:
+            break
+    return timings
+
+
+def run_benchmark(case: BenchmarkCase, context: BenchmarkContext,
+                  max_iterations: int = 100, min_time: float = 0.5) -> BenchmarkResult:
+    """Exécute un benchmark"""
+    result = BenchmarkResult(name=case.name, group=case.group, unit=case.unit)
+    try:
+        func, items = case.setup(context)
+    except BenchmarkSkipped as e:
+        result.skipped = str(e)
+        return result
+
+    timings = _measure(func, max_iterations, min_time)
+    ordered = sorted(timings)
+    result.iterations = len(timings)
+    result.items_per_call = items
+    result.median_s = statistics.median(timings)
+    result.min_s = ordered[0]
+    result.p90_s = ordered[min(len(ordered) - 1, int(0.9 * len(ordered)))]
+    result.throughput = items / result.median_s if result.median_s > 0 else 0.0
+    return result
+
+
+def run_benchmarks(names: Optional[List[str]] = None, scale: float = 1.0,
+                   max_iterations: Optional[int] = None, min_time: float = 0.5,
+                   performance_config: Optional[Any] = None,
+                   progress: Optional[Callable[[BenchmarkResult], None]] = None) -> Dict[str, Any]:
+    """
+    Exécute la suite de benchmarks
+
+    Args:
+        names: Benchmarks (ou groupes) à exécuter, tous par défaut
+        scale: Facteur de taille des données
+        max_iterations: Itérations maximales (PerformanceConfig.benchmark_iterations par défaut)
+        min_time: Budget de temps minimal par benchmark [s]
+        performance_config: PerformanceConfig de l'application
+        progress: Rappel après chaque benchmark
+
+    Returns:
+        Document de résultats (machine, date, résultats par benchmark)
+    """
+    from . import suite  # noqa: F401  (enregistre les benchmarks)
+
+    if performance_config is None:
+        from ..config.optimization_config import PerformanceConfig
+        performance_config = PerformanceConfig()
+    if not performance_config.enable_benchmarking:
+        raise RuntimeError("Benchmarks désactivés (PerformanceConfig.enable_benchmarking)")
+    if max_iterations is None:
+        max_iterations = performance_config.benchmark_iterations
+
+    selected = [
+        case for case in BENCHMARKS.values()
+        if not names or case.name in names or case.group in names
+    ]
+    unknown = set(names or []) - {c.name for c in BENCHMARKS.values()} - {c.group for c in BENCHMARKS.values()}
+    if unknown:
+        raise ValueError(f"Benchmarks inconnus: {', '.join(sorted(unknown))}")
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="chneowave_bench_") as workdir:
+        context = BenchmarkContext(workdir=Path(workdir), scale=scale)
+        for case in selected:
+            result = run_benchmark(case, context, max_iterations, min_time)
+            results[case.name] = result.to_dict()
+            if progress:
+                progress(result)
+
+    return {
+        'version': RESULTS_FORMAT_VERSION,
+        'created_at': datetime.now().isoformat(),
+        'scale': scale,
+        'machine': machine_info(),
+        'results': results
+    }
+
+
+def save_results(results: Dict[str, Any], filepath: Path) -> Path:
+    """Écrit les résultats en JSON"""
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    return filepath
+
+
+def load_results(filepath: Path) -> Dict[str, Any]:
+    """Lit un fichier de résultats"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compare des résultats à une référence
+
+    Args:
+        current: Résultats courants
+        baseline: Résultats de référence
+        threshold: Ralentissement relatif toléré de la médiane (0.10 = 10 %)
+
+    Returns:
+        Une entrée par benchmark exécuté : ratio des médianes et régression
+        éventuelle, ou missing=True s'il n'a pas de mesure de référence
+        (référence à régénérer)
+    """
+    if current.get('scale') != baseline.get('scale'):
+        logger.warning(
+            f"Échelles différentes (courante {current.get('scale')}, référence {baseline.get('scale')})"
+        )
+
+    comparison = []
+    for name, result in current['results'].items():
+        if result.get('skipped'):
+            continue
+        reference = baseline['results'].get(name)
+        if reference is None or reference.get('skipped') or not reference.get('median_s'):
+            comparison.append({
+                'name': name,
+                'baseline_s': None,
+                'current_s': result['median_s'],
+                'ratio': None,
+                'regression': False,
+                'missing': True
+            })
+            continue
+        ratio = result['median_s'] / reference['median_s']
+        comparison.append({
+            'name': name,
+            'baseline_s': reference['median_s'],
+            'current_s': result['median_s'],
+            'ratio': ratio,
+            'regression': ratio > 1.0 + threshold,
+            'missing': False
+        })
+    return comparison
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    """Tableau texte des résultats"""
+    lines = [f"{'benchmark':<28} {'médiane':>12} {'p90':>12} {'débit':>22}"]
+    for name, result in results['results'].items():
+        if result.get('skipped'):
+            lines.append(f"{name:<28} {'ignoré: ' + result['skipped']}")
+            continue
+        lines.append(
+            f"{name:<28} {result['median_s'] * 1e3:>9.3f} ms {result['p90_s'] * 1e3:>9.3f} ms "
+            f"{result['throughput']:>12.4g} {result['unit']}/s"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(comparison: List[Dict[str, Any]], threshold: float) -> str:
+    """Tableau texte de la comparaison à la référence"""
+    lines = [f"{'benchmark':<28} {'référence':>12} {'courant':>12} {'ratio':>8}"]
+    for entry in comparison:
+        if entry.get('missing'):
+            lines.append(
+                f"{entry['name']:<28} {'absent':>12} {entry['current_s'] * 1e3:>9.3f} ms {'-':>8}"
+            )
+            continue
+        flag = "  RÉGRESSION" if entry['regression'] else ""
+        lines.append(
+            f"{entry['name']:<28} {entry['baseline_s'] * 1e3:>9.3f} ms {entry['current_s'] * 1e3:>9.3f} ms "
+            f"{entry['ratio']:>7.2f}x{flag}"
+        )
+    n_regressions = sum(entry['regression'] for entry in comparison)
+    lines.append(f"{n_regressions} régression(s) au-delà de {threshold:.0%}")
+    missing = [entry['name'] for entry in comparison if entry.get('missing')]
+    if missing:
+        lines.append(f"{len(missing)} benchmark(s) absent(s) de la référence: {', '.join(missing)}")
+    return "\n".join(lines)
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+Profil du temps de démarrage (commande `chneowave --profile-startup`)
+
+Chaque module cible est importé dans un interpréteur neuf lancé avec
+`-X importtime` ; la sortie est relevée module par module (temps propre et
+cumulé) et regroupée par paquet de premier niveau. Le démarrage de
+l'interpréteur lui-même (site, encodings) est séparé de l'import mesuré par
+un marqueur écrit sur stderr.
+"""
+
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Modules profilés par défaut et budget d'import associé [ms]
+DEFAULT_TARGETS = (
+    'hrneowave',
+    'hrneowave.cli',
+    'hrneowave.headless',
+    'hrneowave.gui.main_window',
+)
+DEFAULT_BUDGETS_MS = {
+    'hrneowave.cli': 200.0,
+    'hrneowave.headless': 200.0,
+}
+
+_MARKER = '-- chneowave startup marker --'
+_PREFIX = 'import time:'
+
+
+@dataclass
+class ModuleImport:
+    """Une ligne de `-X importtime`"""
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    """Profil d'import d'un module cible"""
+    target: str
+    modules: List[ModuleImport] = field(default_factory=list)
+    interpreter_us: int = 0
+    budget_ms: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def total_us(self) -> int:
+        """Durée de l'instruction `import target` (imports de premier niveau)"""
+        return sum(module.cumulative_us for module in self.modules if module.depth == 0)
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_us / 1e3
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget_ms is not None and (self.error is not None or self.total_ms > self.budget_ms)
+
+    def by_package(self) -> List[Tuple[str, int]]:
+        """Temps propre cumulé par paquet de premier niveau, décroissant"""
+        totals: Dict[str, int] = defaultdict(int)
+        for module in self.modules:
+            totals[module.name.split('.', 1)[0]] += module.self_us
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+    def top_modules(self, count: int = 15) -> List[ModuleImport]:
+        """Modules au temps propre le plus élevé"""
+        return sorted(self.modules, key=lambda module: module.self_us, reverse=True)[:count]
+
+
+def parse_importtime(text: str) -> List[ModuleImport]:
+    """
+    Lignes 'import time: self [us] | cumulative | imported package'
+
+    La profondeur d'imbrication est donnée par l'indentation du nom (deux
+    espaces par niveau).
+    """
+    modules = []
+    for line in text.splitlines():
+        if not line.startswith(_PREFIX):
+            continue
+        parts = line[len(_PREFIX):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # en-tête
+        raw_name = parts[2][1:] if parts[2].startswith(' ') else parts[2]
+        name = raw_name.lstrip(' ')
+        modules.append(ModuleImport(name, self_us, cumulative_us, (len(raw_name) - len(name)) // 2))
+    return modules
+
+
+def profile_import(target: str, python: Optional[str] = None, repeat: int = 3,
+                   budget_ms: Optional[float] = None, timeout: float = 120.0) -> StartupProfile:
+    """
+    Profile `import target` dans un interpréteur neuf
+
+    Le meilleur des `repeat` lancements est retenu : le premier peut inclure
+    la compilation des .pyc et le cache disque froid.
+    """
+    code = f"import sys; sys.stderr.write({_MARKER!r} + '\\n'); sys.stderr.flush(); import {target}"
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    best = None
+    for _ in range(max(1, repeat)):
+        completed = subprocess.run(
+            [python or sys.executable, '-X', 'importtime', '-c', code],
+            capture_output=True, text=True, env=env, timeout=timeout
+        )
+        startup, _, measured = completed.stderr.partition(_MARKER)
+        profile = StartupProfile(
+            target=target,
+            modules=parse_importtime(measured),
+            interpreter_us=sum(m.cumulative_us for m in parse_importtime(startup) if m.depth == 0),
+            budget_ms=budget_ms
+        )
+        if completed.returncode != 0:
+            lines = [line for line in measured.splitlines() if not line.startswith(_PREFIX)]
+            profile.error = lines[-1] if lines else f"code de sortie {completed.returncode}"
+            return profile
+        if best is None or profile.total_us < best.total_us:
+            best = profile
+    return best
+
+
+def profile_startup(targets: Optional[Sequence[str]] = None, python: Optional[str] = None,
+                    repeat: int = 3, budgets: Optional[Dict[str, float]] = None) -> List[StartupProfile]:
+    """Profile chaque module cible (DEFAULT_TARGETS par défaut)"""
+    budgets = DEFAULT_BUDGETS_MS if budgets is None else budgets
+    return [
+        profile_import(target, python=python, repeat=repeat, budget_ms=budgets.get(target))
+        for target in (targets or DEFAULT_TARGETS)
+    ]
+
+
+def format_startup_profile(profiles: List[StartupProfile], top: int = 15) -> str:
+    """Rapport texte : total par cible, répartition par paquet, modules les plus coûteux"""
+    lines = []
+    for profile in profiles:
+        header = f"{profile.target}: "
+        if profile.error:
+            lines.append(header + f"échec de l'import ({profile.error})")
+            continue
+        header += f"{profile.total_ms:.1f} ms, {len(profile.modules)} modules"
+        header += f" (interpréteur {profile.interpreter_us / 1e3:.1f} ms)"
+        if profile.budget_ms is not None:
+            verdict = "DÉPASSÉ" if profile.over_budget else "ok"
+            header += f" - budget {profile.budget_ms:.0f} ms {verdict}"
+        lines.append(header)
+
+        lines.append("  Par paquet (temps propre):")
+        for package, self_us in profile.by_package()[:top]:
+            share = 100.0 * self_us / profile.total_us if profile.total_us else 0.0
+            lines.append(f"    {package:<32} {self_us / 1e3:>9.1f} ms {share:>5.1f} %")
+
+        lines.append("  Modules (propre / cumulé):")
+        for module in profile.top_modules(top):
+            lines.append(
+                f"    {module.name:<48} {module.self_us / 1e3:>8.1f} ms {module.cumulative_us / 1e3:>9.1f} ms"
+            )
+        lines.append("")
+    return "\n".join(lines).rstrip()
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks du pipeline CHNeoWave
+
+Tailles de référence (scale=1) : 16 canaux, blocs de 0,5 s à 2 kHz, sessions
+de 60 s à 100 Hz pour l'export et le rechargement.
+"""
+
+from datetime import datetime
+
+import numpy as np
+
+from .runner import BenchmarkContext, BenchmarkSkipped, benchmark
+
+N_CHANNELS = 16
+SAMPLE_RATE = 2000.0
+
+
+def _wave_block(context: BenchmarkContext, n_channels: int, n_samples: int,
+                sample_rate: float = SAMPLE_RATE) -> np.ndarray:
+    """Bloc de houle synthétique (canaux x échantillons)"""
+    t = np.arange(n_samples) / sample_rate
+    phases = context.rng.uniform(0, 2 * np.pi, (n_channels, 1))
+    noise = 0.01 * context.rng.standard_normal((n_channels, n_samples))
+    return 0.05 * np.sin(2 * np.pi * 0.8 * t + phases) + noise
+
+
+@benchmark("ring_write", group="buffer")
+def bench_ring_write(context: BenchmarkContext):
+    """Écriture de blocs dans l'anneau circulaire"""
+    from ..core.circular_buffer import BufferConfig, create_circular_buffer
+
+    block = _wave_block(context, N_CHANNELS, context.size(1000))
+    ring = create_circular_buffer(BufferConfig(
+        n_channels=N_CHANNELS, buffer_size=context.size(1000) * 64,
+        sample_rate=SAMPLE_RATE, enable_overflow_detection=False
+    ))
+    n_blocks = 32
+
+    def run():
+        for _ in range(n_blocks):
+            ring.write(block)
+
+    return run, n_blocks * block.shape[1]
+
+
+@benchmark("ring_read", group="buffer")
+def bench_ring_read(context: BenchmarkContext):
+    """Lecture des vues publiées de l'anneau circulaire"""
+    from ..core.circular_buffer import BufferConfig, create_circular_buffer
+
+    n_samples = context.size(1000)
+    ring = create_circular_buffer(BufferConfig(
+        n_channels=N_CHANNELS, buffer_size=n_samples * 64,
+        sample_rate=SAMPLE_RATE, enable_overflow_detection=False
+    ))
+    ring.write(_wave_block(context, N_CHANNELS, n_samples * 64))
+    start = ring.total_written - n_samples * 32
+
+    def run():
+        for i in range(32):
+            ring.get_views(start + i * n_samples, n_samples)
+
+    return run, 32 * n_samples
+
+
+@benchmark("calibration", group="acquisition")
+def bench_calibration(context: BenchmarkContext):
+    """Conversion en unités physiques d'un bloc multi-canaux"""
+    from ..acquisition.acquisition_controller import (
+        AcquisitionController, AcquisitionSession, MaritimeChannelConfig
+    )
+    from ..acquisition.mcc_daq_wrapper import MCCRanges
+
+    controller = AcquisitionController()
+    controller.current_session = AcquisitionSession(
+        session_id="bench", project_name="bench", start_time=datetime.now(),
+        channels=[
+            MaritimeChannelConfig(
+                channel=i, sensor_type='wave_height', label=f"WP{i}", units='V',
+                range_type=list(MCCRanges)[0], calibration_offset=0.01, calibration_scale=2.0
+            )
+            for i in range(N_CHANNELS)
+        ]
+    )
+    raw = _wave_block(context, N_CHANNELS, context.size(1000)).T.copy()
+
+    def run():
+        controller._convert_to_physical_units(raw)
+
+    return run, raw.shape[0]
+
+
+@benchmark("synthetic_stream", group="acquisition")
+def bench_synthetic_stream(context: BenchmarkContext):
+    """Diffusion de blocs du backend synthétique JONSWAP, 32 canaux à 5 kHz"""
+    from ..hardware.backends.synthetic import SyntheticSeaBackend
+
+    backend = SyntheticSeaBackend({
+        'sample_rate': 5000.0, 'channels': 32, 'num_samples': context.size(2500),
+        'record_samples': 2 ** 16, 'realtime_factor': 0.0
+    })
+    backend.open()
+
+    def run():
+        for _ in range(8):
+            backend.read()
+
+    return run, 8 * backend.num_samples
+
+
+@benchmark("validate_block", group="acquisition")
+def bench_validate_block(context: BenchmarkContext):
+    """Validation vectorisée d'un bloc de 0,5 s"""
+    from ..core.data_validator import DataValidator, ValidationConfig
+
+    validator = DataValidator(SAMPLE_RATE)
+    for channel in range(N_CHANNELS):
+        validator.add_channel(ValidationConfig(
+            channel=channel, sensor_type='wave_probe', min_value=-1.0, max_value=1.0,
+            max_rate_of_change=500.0, max_drift_rate=0.01
+        ))
+    block = _wave_block(context, N_CHANNELS, context.size(1000))
+    state = {'t0': 0.0}
+
+    def run():
+        validator.validate_block(block, state['t0'])
+        state['t0'] += block.shape[1] / SAMPLE_RATE
+
+    return run, block.size
+
+
+@benchmark("fft_psd", group="processing")
+def bench_fft_psd(context: BenchmarkContext):
+    """Spectre de puissance d'un signal de 8192 points"""
+    from ..core.optimized_fft_processor import OptimizedFFTProcessor
+
+    processor = OptimizedFFTProcessor(enable_wisdom=False)
+    signal = _wave_block(context, 1, context.size(8192))[0]
+
+    def run():
+        processor.compute_power_spectrum(signal, SAMPLE_RATE)
+
+    return run, signal.size
+
+
+@benchmark("goda_separation", unit="fréquences", group="processing")
+def bench_goda(context: BenchmarkContext):
+    """Séparation incident/réfléchi de Goda sur 64 fréquences, 8 sondes"""
+    from ..core.optimized_goda_analyzer import ProbeGeometry, OptimizedGodaAnalyzer
+
+    positions = [0.5, 0.8, 1.1, 1.4, 1.7, 2.0, 2.3, 2.6]
+    analyzer = OptimizedGodaAnalyzer(ProbeGeometry(
+        positions=positions, water_depth=0.5, frequency_range=(0.1, 1.5)
+    ))
+    frequencies = np.linspace(0.1, 1.5, 64)
+    measurements = (context.rng.standard_normal((64, len(positions)))
+                    + 1j * context.rng.standard_normal((64, len(positions))))
+    spectrum = dict(zip(frequencies, measurements))
+
+    def run():
+        analyzer.analyze_spectrum(spectrum)
+
+    return run, len(spectrum)
+
+
+@benchmark("lttb_decimation", group="display")
+def bench_lttb(context: BenchmarkContext):
+    """Décimation MinMaxLTTB d'un million de points vers 2000 pixels"""
+    try:
+        from ..gui.components.graph_manager import DownsamplingEngine
+    except ImportError as e:
+        raise BenchmarkSkipped(f"graph_manager indisponible ({e})")
+
+    n_points = context.size(1_000_000)
+    x = np.arange(n_points, dtype=float)
+    y = np.cumsum(context.rng.standard_normal(n_points))
+
+    def run():
+        DownsamplingEngine.downsample(x, y, 2000, "lttb", 2000)
+
+    return run, n_points
+
+
+def _session(context: BenchmarkContext) -> np.ndarray:
+    """Session de 60 s à 100 Hz (échantillons x canaux)"""
+    return _wave_block(context, N_CHANNELS, context.size(6000), 100.0).T.copy()
+
+
+@benchmark("export_hdf5", group="export")
+def bench_export_hdf5(context: BenchmarkContext):
+    """Export HDF5 d'une session (hash et pyramide compris)"""
+    try:
+        from ..utils.hdf_writer import HDF5Writer
+    except ImportError as e:
+        raise BenchmarkSkipped(f"h5py indisponible ({e})")
+
+    data = _session(context)
+    path = context.workdir / "bench_export.h5"
+    names = [f"WP{i}" for i in range(N_CHANNELS)]
+
+    def run():
+        with HDF5Writer(path) as writer:
+            writer.write_acquisition_data(data, 100.0, names)
+
+    return run, data.size
+
+
+@benchmark("export_tdms", group="export")
+def bench_export_tdms(context: BenchmarkContext):
+    """Export TDMS d'une session"""
+    from ..core.export_manager import TDMS_AVAILABLE, ExportManager, create_export_config
+
+    if not TDMS_AVAILABLE:
+        raise BenchmarkSkipped("nptdms indisponible")
+    manager = ExportManager()
+    data = _session(context).T.copy()
+    config = create_export_config('tdms', str(context.workdir / "bench_export.tdms"))
+
+    def run():
+        manager.export_session_data(data, config)
+
+    return run, data.size
+
+
+@benchmark("export_csv", group="export")
+def bench_export_csv(context: BenchmarkContext):
+    """Export CSV d'une session"""
+    from ..acquisition.acquisition_controller import AcquisitionController, AcquisitionSession
+
+    controller = AcquisitionController()
+    controller.current_session = AcquisitionSession(
+        session_id="bench", project_name="bench", start_time=datetime.now()
+    )
+    data = _session(context)
+    controller.data_buffer = [
+        {'timestamp': datetime.now(), 'processed_data': chunk}
+        for chunk in np.array_split(data, 60)
+    ]
+    path = str(context.workdir / "bench_export.csv")
+
+    def run():
+        controller.export_session_data(path, 'csv')
+
+    return run, data.size
+
+
+@benchmark("session_load", group="export")
+def bench_session_load(context: BenchmarkContext):
+    """Rechargement d'une session HDF5"""
+    try:
+        from ..utils.hdf_writer import HDF5Writer
+    except ImportError as e:
+        raise BenchmarkSkipped(f"h5py indisponible ({e})")
+
+    data = _session(context)
+    path = context.workdir / "bench_load.h5"
+    with HDF5Writer(path) as writer:
+        writer.write_acquisition_data(data, 100.0, [f"WP{i}" for i in range(N_CHANNELS)])
+
+    def run():
+        HDF5Writer.read_acquisition_data(path)
+
+    return run, data.size
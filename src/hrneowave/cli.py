@@ -5,6 +5,10 @@ Interface en ligne de commande pour CHNeoWave
 """
 
 
+# Backends de `chneowave acquire` : liste statique pour ne pas importer numpy
+# et les pilotes à la construction du parseur (--help, --version) ; elle
+# est confrontée à hrneowave.hardware.manager.AVAILABLE_BACKENDS à l'exécution
+ACQUIRE_BACKENDS = ('demo', 'iotech', 'mcc', 'ni-daqmx', 'replay', 'synthetic')
 
 # Import conditionnel des modules Qt
 def _ensure_qt_imports():
@@ -22,9 +26,46 @@ def _ensure_qt_imports():
         except ImportError:
             return False
 
-def run_gui():
+def _setup_tracing(trace_file=None):
+    """
+    Active le traçage selon la CLI, l'environnement ou les préférences
+
+    Doit être appelé après la création de la QApplication. Retourne la sonde
+    de boucle d'événements et une fonction d'export à appeler en sortie.
+    """
+    import os
+    from hrneowave.core.tracing import (
+        TRACE_ENV_VAR, enable_tracing, disable_tracing, is_tracing_enabled, export_chrome_trace
+    )
+    from hrneowave.gui.controllers.event_loop_probe import EventLoopProbe
+    from hrneowave.gui.preferences.user_preferences import get_user_preferences
+
+    preferences = get_user_preferences()
+    trace_file = trace_file or os.environ.get(TRACE_ENV_VAR)
+    probe = EventLoopProbe()
+
+    def set_tracing(enabled):
+        if enabled:
+            enable_tracing(int(preferences.get_preference("diagnostics", "trace_capacity") or 200000))
+        else:
+            disable_tracing()
+        probe.set_active(enabled)
+
+    set_tracing(bool(trace_file) or preferences.is_tracing_enabled())
+    preferences.tracing_changed.connect(set_tracing)
+
+    def export_on_exit():
+        if trace_file or is_tracing_enabled():
+            export_chrome_trace(trace_file or preferences.get_preference("diagnostics", "trace_file"))
+
+    return probe, export_on_exit
+
+def run_gui(trace_file=None):
     """
     Lance l'interface graphique CHNeoWave
+
+    Args:
+        trace_file: Fichier Chrome trace à écrire en sortie (active le traçage)
     """
     import sys
     import os
@@ -53,6 +94,9 @@ def run_gui():
         app.setApplicationVersion("1.0.0")
         app.setOrganizationName("Laboratoire Maritime")
         
+        # Traçage des performances (CLI --trace ou préférences)
+        probe, export_trace = _setup_tracing(trace_file)
+        
         # Gestionnaire de thèmes
         from hrneowave.gui.styles.theme_manager import ThemeManager
         theme_manager = ThemeManager(app)
@@ -70,6 +114,7 @@ def run_gui():
         logger.info("Starting event loop...")
         exit_code = app.exec_()
         logger.info(f"Event loop finished with exit code {exit_code}")
+        export_trace()
         sys.exit(exit_code)
         
     except ImportError as e:
@@ -80,6 +125,177 @@ def run_gui():
         logger.critical(f"Erreur lors du lancement: {e}", exc_info=True)
         sys.exit(1)
 
+def _run_bench(args) -> int:
+    """
+    Exécute la suite de benchmarks (commande `chneowave bench`)
+
+    Returns:
+        Code de sortie : 1 si une régression dépasse le seuil, 0 sinon
+    """
+    from pathlib import Path
+    from hrneowave.benchmarks import (
+        BENCHMARKS, run_benchmarks, save_results, load_results,
+        compare_results, format_results, format_comparison
+    )
+
+    if args.list:
+        from hrneowave.benchmarks import suite  # noqa: F401
+        for case in BENCHMARKS.values():
+            print(f"{case.group:<12} {case.name:<20} {case.description}")
+        return 0
+
+    def progress(result):
+        status = f"ignoré ({result.skipped})" if result.skipped else f"{result.median_s * 1e3:.3f} ms"
+        print(f"  {result.name:<20} {status}", flush=True)
+
+    results = run_benchmarks(
+        names=args.names or None, scale=args.scale,
+        max_iterations=args.iterations, min_time=args.min_time, progress=progress
+    )
+    print(format_results(results))
+
+    if args.output:
+        print(f"Résultats enregistrés: {save_results(results, Path(args.output))}")
+
+    if args.compare:
+        comparison = compare_results(results, load_results(Path(args.compare)), args.threshold)
+        print(format_comparison(comparison, args.threshold))
+        if any(entry['regression'] for entry in comparison):
+            return 1
+    return 0
+
+def _run_profile_startup(args) -> int:
+    """
+    Profile le temps d'import des modules (option `chneowave --profile-startup`)
+
+    Returns:
+        Code de sortie : 1 si un module dépasse son budget de démarrage, 0 sinon
+    """
+    from hrneowave.benchmarks.startup import format_startup_profile, profile_startup
+
+    profiles = profile_startup(args.profile_startup or None)
+    print(format_startup_profile(profiles))
+    return 1 if any(profile.over_budget for profile in profiles) else 0
+
+def _parse_floats(text):
+    """Liste de nombres séparés par des virgules"""
+    return [float(value) for value in text.split(',') if value.strip()]
+
+def _cutoff(text):
+    """Fréquence de coupure, ou couple FMIN,FMAX pour un passe-bande"""
+    if not text:
+        return None
+    values = _parse_floats(text)
+    return values[0] if len(values) == 1 else tuple(values)
+
+def _run_analyze(args) -> int:
+    """
+    Analyse par lots de sessions, sans Qt (commande `chneowave analyze`)
+
+    Returns:
+        Code de sortie : 1 si une session n'a pas pu être analysée, 0 sinon
+    """
+    from hrneowave.headless import AnalysisOptions, run_batch_analysis
+
+    options = AnalysisOptions(
+        sample_rate=args.fs,
+        segment_length=args.segment,
+        probe_positions=_parse_floats(args.positions) if args.positions else None,
+        water_depth=args.depth,
+        frequency_band=tuple(_parse_floats(args.band)) if args.band else None,
+        detrend=None if args.detrend == 'none' else args.detrend,
+        filter_type=args.filter,
+        cutoff=_cutoff(args.cutoff),
+        spectral_band=tuple(_parse_floats(args.spectral_band)) if args.spectral_band else None
+    )
+
+    def progress(done, total, path, error):
+        status = f"ÉCHEC ({error})" if error else "ok"
+        print(f"[{done}/{total}] {path} {status}", flush=True)
+
+    cache = None
+    if not args.no_cache:
+        from hrneowave.core.result_cache import AnalysisResultCache
+        cache = AnalysisResultCache(args.cache_dir)
+
+    summary = run_batch_analysis(args.inputs, args.out, jobs=args.jobs, options=options,
+                                 progress=progress, cache=cache)
+    print(
+        f"{summary['sessions']} session(s) dont {summary['cached']} depuis le cache, "
+        f"{summary['rows']} ligne(s) dans {summary['output']} "
+        f"en {summary['elapsed_s']:.1f} s ({summary['jobs']} processus)"
+    )
+    if summary['failed']:
+        print(f"{len(summary['failed'])} session(s) en échec")
+        return 1
+    return 0
+
+def _run_acquire(args) -> int:
+    """
+    Acquisition headless avec enregistrement direct sur disque (commande `chneowave acquire`)
+
+    Returns:
+        Code de sortie : 1 si des échantillons ont été perdus, 0 sinon
+    """
+    import signal
+    import threading
+    from hrneowave.hardware.manager import AVAILABLE_BACKENDS
+    from hrneowave.headless import load_calibration, parse_channels, run_headless_acquisition
+
+    if args.backend not in AVAILABLE_BACKENDS:
+        print(f"Backend non disponible: {args.backend} (disponibles: {', '.join(sorted(AVAILABLE_BACKENDS))})")
+        return 2
+
+    channels = parse_channels(args.channels)
+    calibration = load_calibration(args.calibration, channels) if args.calibration else None
+    backend_config = {}
+    for option in args.option or []:
+        key, _, value = option.partition('=')
+        try:
+            backend_config[key] = float(value) if '.' in value else int(value)
+        except ValueError:
+            backend_config[key] = value
+
+    stop_event = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop_event.set())
+
+    def report(stats):
+        print(
+            f"{stats.elapsed_s:8.1f} s  {stats.samples:>12d} éch.  {stats.sample_rate:9.1f} éch./s  "
+            f"anneau {stats.ring_fill:5.1%}  perdus {stats.lost_samples}  "
+            f"erreurs {stats.backend_errors}  disque {stats.bytes_written / 1e6:.1f} Mo",
+            flush=True
+        )
+
+    stats = run_headless_acquisition(
+        args.out, backend=args.backend, sample_rate=args.fs, channels=channels,
+        duration=args.duration, backend_config=backend_config, calibration=calibration,
+        block_duration=args.block, buffer_duration=args.buffer, stats_interval=args.stats_interval,
+        stop_event=stop_event, report=report
+    )
+    report(stats)
+    print(f"Enregistrement: {args.out}")
+    return 1 if stats.lost_samples else 0
+
+def _run_rescan(args) -> int:
+    """
+    Reconstruit le catalogue de l'espace de travail (commande `chneowave rescan`)
+
+    Returns:
+        Code de sortie : 0
+    """
+    from hrneowave.core.project_manager import ProjectManager
+
+    manager = ProjectManager(args.workspace)
+    counts = manager.rescan_workspace()
+    info = manager.get_workspace_info()
+    print(
+        f"Catalogue {manager.catalog.db_path}: {counts['projects']} projets, "
+        f"{counts['sessions']} sessions, {counts['files']} fichiers ({info['total_size_mb']} Mo)"
+    )
+    return 0
+
 def run_cli():
     """
     Point d'entrée principal de l'interface en ligne de commande
@@ -127,6 +343,144 @@ def run_cli():
         help="Active le mode debug"
     )
     
+    parser.add_argument(
+        "--trace",
+        metavar="FICHIER",
+        nargs="?",
+        const="chneowave_trace.json",
+        default=None,
+        help="Trace l'acquisition et le traitement, export Chrome trace en sortie"
+    )
+    
+    parser.add_argument(
+        "--profile-startup",
+        metavar="MODULE",
+        nargs="*",
+        default=None,
+        help="Profile le temps d'import (-X importtime) des modules indiqués ou des points d'entrée"
+    )
+    
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMANDE")
+    
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Exécute les benchmarks et compare à une référence"
+    )
+    bench_parser.add_argument(
+        "names", nargs="*", metavar="BENCHMARK",
+        help="Benchmarks ou groupes à exécuter (tous par défaut)"
+    )
+    bench_parser.add_argument("--list", action="store_true", help="Liste les benchmarks")
+    bench_parser.add_argument("--output", "-o", metavar="FICHIER", help="Enregistre les résultats JSON")
+    bench_parser.add_argument(
+        "--compare", metavar="REFERENCE",
+        help="Compare à des résultats de référence ; code de sortie 1 en cas de régression"
+    )
+    bench_parser.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="Ralentissement relatif toléré (défaut: 0.10)"
+    )
+    bench_parser.add_argument("--scale", type=float, default=1.0, help="Facteur de taille des données")
+    bench_parser.add_argument(
+        "--iterations", type=int, default=None,
+        help="Itérations maximales (défaut: PerformanceConfig.benchmark_iterations)"
+    )
+    bench_parser.add_argument(
+        "--min-time", type=float, default=0.5,
+        help="Budget de temps minimal par benchmark en secondes"
+    )
+    
+    analyze_parser = subparsers.add_parser(
+        "analyze",
+        help="Analyse par lots de sessions (statistiques, spectres, vagues, réflexion), sans Qt"
+    )
+    analyze_parser.add_argument(
+        "inputs", nargs="+", metavar="SESSIONS",
+        help="Répertoires, motifs glob ou fichiers (HDF5, TDMS, CSV)"
+    )
+    analyze_parser.add_argument(
+        "--out", "-o", default="resultats.h5", metavar="FICHIER",
+        help="Table de résultats .h5 ou .csv (défaut: resultats.h5)"
+    )
+    analyze_parser.add_argument(
+        "--jobs", "-j", type=int, default=None,
+        help="Processus de calcul (défaut: nombre de cœurs)"
+    )
+    analyze_parser.add_argument(
+        "--fs", type=float, default=None,
+        help="Fréquence d'échantillonnage des sessions qui ne l'enregistrent pas (CSV)"
+    )
+    analyze_parser.add_argument("--segment", type=int, default=1024, help="Longueur des segments de Welch")
+    analyze_parser.add_argument(
+        "--positions", metavar="X1,X2,...",
+        help="Positions des sondes [m] pour la réflexion (métadonnées de la session sinon)"
+    )
+    analyze_parser.add_argument("--depth", type=float, default=None, help="Profondeur d'eau [m]")
+    analyze_parser.add_argument(
+        "--band", metavar="FMIN,FMAX",
+        help="Bande de fréquences de l'analyse de réflexion [Hz] (bande énergétique par défaut)"
+    )
+    analyze_parser.add_argument(
+        "--detrend", choices=["constant", "linear", "none"], default="constant",
+        help="Détendance des signaux avant filtrage (défaut: constant)"
+    )
+    analyze_parser.add_argument(
+        "--filter", choices=["lowpass", "highpass", "bandpass"], default=None,
+        help="Filtre de Butterworth à phase nulle (aucun par défaut)"
+    )
+    analyze_parser.add_argument("--cutoff", metavar="F[,F2]", help="Fréquence(s) de coupure du filtre [Hz]")
+    analyze_parser.add_argument(
+        "--spectral-band", metavar="FMIN,FMAX",
+        help="Bande d'intégration des moments spectraux (Hm0, Tm01, Tm02) [Hz]"
+    )
+    analyze_parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Réanalyser toutes les sessions sans utiliser le cache des résultats"
+    )
+    analyze_parser.add_argument(
+        "--cache-dir", default=None, metavar="REPERTOIRE",
+        help="Répertoire du cache des résultats (défaut: ~/.chneowave/cache/analysis)"
+    )
+    
+    acquire_parser = subparsers.add_parser(
+        "acquire",
+        help="Acquisition headless avec enregistrement HDF5 direct, sans Qt"
+    )
+    acquire_parser.add_argument(
+        "--backend", default="demo", choices=ACQUIRE_BACKENDS,
+        help="Backend matériel (défaut: demo)"
+    )
+    acquire_parser.add_argument("--fs", type=float, default=1000.0, help="Fréquence d'échantillonnage [Hz]")
+    acquire_parser.add_argument("--channels", default="0-7", help="Canaux acquis, ex. 0-15 ou 0,2,4-7")
+    acquire_parser.add_argument(
+        "--duration", type=float, default=None,
+        help="Durée [s] (jusqu'à Ctrl+C par défaut)"
+    )
+    acquire_parser.add_argument("--out", "-o", required=True, metavar="FICHIER", help="Fichier HDF5 de sortie")
+    acquire_parser.add_argument(
+        "--calibration", metavar="JSON",
+        help="Pentes et ordonnées par canal (volts enregistrés sinon)"
+    )
+    acquire_parser.add_argument(
+        "--option", action="append", metavar="CLE=VALEUR",
+        help="Réglage du backend (device=Dev1, board_num=0, ...), répétable"
+    )
+    acquire_parser.add_argument("--block", type=float, default=0.1, help="Durée d'un bloc lu sur la carte [s]")
+    acquire_parser.add_argument("--buffer", type=float, default=10.0, help="Profondeur de l'anneau partagé [s]")
+    acquire_parser.add_argument(
+        "--stats-interval", type=float, default=5.0,
+        help="Période des rapports de débit [s]"
+    )
+    
+    rescan_parser = subparsers.add_parser(
+        "rescan",
+        help="Reconstruit le catalogue des projets depuis le disque"
+    )
+    rescan_parser.add_argument(
+        "--workspace", metavar="REPERTOIRE", default=None,
+        help="Espace de travail (par défaut: ~/CHNeoWave_Projects)"
+    )
+    
     args = parser.parse_args()
 
     # La configuration du logging est maintenant faite au début de la fonction.
@@ -136,9 +490,24 @@ def run_cli():
         # Si le mode debug n'est pas activé, on remet le niveau à INFO
         logging.getLogger().setLevel(logging.INFO)
 
-    if args.gui:
+    if args.profile_startup is not None:
+        import sys
+        sys.exit(_run_profile_startup(args))
+    elif args.command == "bench":
+        import sys
+        sys.exit(_run_bench(args))
+    elif args.command == "analyze":
+        import sys
+        sys.exit(_run_analyze(args))
+    elif args.command == "acquire":
+        import sys
+        sys.exit(_run_acquire(args))
+    elif args.command == "rescan":
+        import sys
+        sys.exit(_run_rescan(args))
+    elif args.gui:
         logger.info("--gui flag is set, calling run_gui()")
-        run_gui()
+        run_gui(trace_file=args.trace)
     else:
         logger.info("Aucun argument spécifié, fin du programme.")
         # Comportement par défaut si --gui n'est pas spécifié
@@ -1,23 +1,58 @@
-"""Modules d'optimisation et traitement signal CHNeoWave"""
-
-try:
-    from .optimized_goda_analyzer import *
-except ImportError:
-    pass
-try:
-    from .optimized_fft_processor import *
-except ImportError:
-    pass
-try:
-    from .circular_buffer import *
-except ImportError:
-    pass
-try:
-    from .async_acquisition import *
-except ImportError:
-    pass
-
-try:
-    from .signal_bus import SignalBus, ErrorBus, get_signal_bus, get_error_bus
-except ImportError:
-    pass
+"""Modules d'optimisation et traitement signal CHNeoWave
+
+Les symboles du paquet sont chargés à la première utilisation (PEP 562) :
+importer un sous-module (`hrneowave.core.tracing`, ...) ne charge ni scipy
+(analyseur de Goda), ni pyFFTW, ni Qt (bus de signaux).
+"""
+
+import importlib
+
+# Symbole -> sous-module qui le définit
+_LAZY_ATTRIBUTES = {
+    # Analyse de Goda (scipy)
+    'OptimizedGodaAnalyzer': 'optimized_goda_analyzer',
+    'ProbeGeometry': 'optimized_goda_analyzer',
+    'WaveComponents': 'optimized_goda_analyzer',
+    'create_analyzer_from_positions': 'optimized_goda_analyzer',
+    'reflection_coefficient': 'optimized_goda_analyzer',
+    # Noyaux d'analyse de houle (numpy)
+    'channel_statistics': 'wave_analysis',
+    'spectral_moments': 'wave_analysis',
+    'wave_by_wave': 'wave_analysis',
+    'welch_psd': 'wave_analysis',
+    'zero_up_crossing': 'wave_analysis',
+    # FFT (pyFFTW optionnel)
+    'OptimizedFFTProcessor': 'optimized_fft_processor',
+    'PYFFTW_AVAILABLE': 'optimized_fft_processor',
+    'get_global_processor': 'optimized_fft_processor',
+    'optimized_fft': 'optimized_fft_processor',
+    'optimized_ifft': 'optimized_fft_processor',
+    # Buffers circulaires
+    'BufferConfig': 'circular_buffer',
+    'BufferStats': 'circular_buffer',
+    'CircularBufferBase': 'circular_buffer',
+    'ThreadSafeCircularBuffer': 'circular_buffer',
+    'MemoryMappedCircularBuffer': 'circular_buffer',
+    'CircularBuffer': 'circular_buffer',
+    'create_circular_buffer': 'circular_buffer',
+    # Bus de signaux (Qt)
+    'SignalBus': 'signal_bus',
+    'ErrorBus': 'signal_bus',
+    'get_signal_bus': 'signal_bus',
+    'get_error_bus': 'signal_bus',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # les accès suivants ne repassent plus par __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Graphe d'étapes d'analyse mémoïsées
+
+Une analyse est décrite comme un graphe orienté acyclique d'étapes (chargement,
+détendance, filtrage, segmentation, DSP, moments, Goda, tables de rapport).
+Chaque résultat est rangé sous une clé dérivée du nom et de la version de
+l'étape, des paramètres qu'elle utilise et des clés de ses entrées : modifier
+un paramètre ne recalcule que les étapes situées en aval.
+
+Les paramètres désignant des fichiers sont identifiés par leur contenu. Avec
+un `store` (AnalysisResultCache), les étapes marquées `persist` sont
+conservées sur disque : un retraitement par lots saute toute étape dont les
+entrées n'ont pas changé, sans même relire les données si ses résultats
+amont sont disponibles.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .tracing import trace_span
+
+logger = logging.getLogger(__name__)
+
+# Absence de résultat (un résultat d'étape peut valoir None)
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    Étape du graphe
+
+    Attributes:
+        name: Nom unique de l'étape
+        func: Calcul, appelé avec les résultats des entrées (dans l'ordre)
+            puis les paramètres en arguments nommés
+        inputs: Étapes amont
+        params: Paramètres utilisés par l'étape
+        files: Paramètres désignant un fichier (clé : empreinte du contenu)
+        version: À incrémenter si le calcul change
+        persist: Résultat conservé dans le store (résultats compacts)
+    """
+    name: str
+    func: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+    params: Tuple[str, ...] = ()
+    files: Tuple[str, ...] = ()
+    version: int = 1
+    persist: bool = False
+
+
+class AnalysisGraph:
+    """
+    Graphe d'étapes mémoïsées
+
+    Args:
+        stages: Étapes, chaque étape après ses entrées
+        params: Valeurs initiales des paramètres
+        store: Cache persistant (AnalysisResultCache) des étapes `persist`
+        max_entries: Résultats conservés en mémoire (les moins récents sont libérés)
+    """
+
+    def __init__(self, stages: Sequence[Stage] = (), params: Optional[Dict[str, Any]] = None,
+                 store=None, max_entries: int = 32):
+        self._stages: Dict[str, Stage] = {}
+        self._params: Dict[str, Any] = {}
+        self._keys: Dict[str, str] = {}
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._depth = 0
+        self.store = store
+        self.max_entries = max_entries
+        self.stats = {'computed': 0, 'memory_hits': 0, 'store_hits': 0}
+        self.last_run: List[str] = []
+        for stage in stages:
+            self.add_stage(stage)
+        if params:
+            self.set_params(**params)
+
+    @property
+    def stages(self) -> List[str]:
+        """Noms des étapes dans l'ordre topologique"""
+        return list(self._stages)
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        return dict(self._params)
+
+    def add_stage(self, stage: Stage):
+        """Ajoute une étape ; ses entrées doivent déjà faire partie du graphe"""
+        if stage.name in self._stages:
+            raise ValueError(f"Étape déjà définie: {stage.name}")
+        missing = [name for name in stage.inputs if name not in self._stages]
+        if missing:
+            raise ValueError(f"Entrées inconnues pour {stage.name}: {', '.join(missing)}")
+        self._stages[stage.name] = stage
+
+    def set_params(self, **params) -> List[str]:
+        """
+        Modifie des paramètres
+
+        Returns:
+            Étapes à recalculer (celles qui utilisent un paramètre modifié et leur aval)
+        """
+        known = {name for stage in self._stages.values() for name in stage.params + stage.files}
+        unknown = set(params) - known
+        if unknown:
+            raise ValueError(f"Paramètres inconnus: {', '.join(sorted(unknown))}")
+        # Un fichier redonné est réexaminé : son contenu a pu changer
+        files = {name for stage in self._stages.values() for name in stage.files}
+        changed = {name for name, value in params.items()
+                   if name in files or name not in self._params or self._params[name] != value}
+        self._params.update(params)
+        if not changed:
+            return []
+        self._keys.clear()
+        return self.downstream(changed)
+
+    def downstream(self, params: Iterable[str]) -> List[str]:
+        """Étapes dépendant (directement ou non) des paramètres donnés"""
+        params = set(params)
+        affected: Set[str] = set()
+        for name, stage in self._stages.items():
+            if params & set(stage.params + stage.files) or affected & set(stage.inputs):
+                affected.add(name)
+        return [name for name in self._stages if name in affected]
+
+    def key(self, name: str) -> str:
+        """Clé du résultat de l'étape pour les paramètres courants"""
+        key = self._keys.get(name)
+        if key is not None:
+            return key
+        stage = self._stage(name)
+        parts = {
+            'stage': name,
+            'version': stage.version,
+            'params': {param: self._params.get(param) for param in stage.params},
+            'files': {param: self._file_fingerprint(self._params.get(param)) for param in stage.files},
+            'inputs': [self.key(upstream) for upstream in stage.inputs],
+        }
+        text = json.dumps(parts, sort_keys=True, separators=(',', ':'), default=str)
+        key = f"{name}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+        self._keys[name] = key
+        return key
+
+    def cached(self, name: str, default: Any = None) -> Any:
+        """
+        Résultat déjà disponible (mémoire ou store), sans calcul
+
+        Un résultat None calculé est bien un résultat : utiliser `default`
+        pour distinguer l'absence. L'objet retourné est partagé avec le
+        graphe (voir compute).
+        """
+        key = self.key(name)
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.stats['memory_hits'] += 1
+            return self._memory[key]
+        stage = self._stage(name)
+        if stage.persist and self.store is not None:
+            try:
+                value = self.store.get(self._store_key(stage, key))
+            except Exception as e:
+                logger.warning(f"Lecture du store impossible ({name}): {e}")
+                value = None
+            # Le store ne conserve pas les résultats None : None y signifie absent
+            if value is not None:
+                self.stats['store_hits'] += 1
+                self._remember(key, value)
+                return value
+        return default
+
+    def compute(self, name: str, copy: bool = False) -> Any:
+        """
+        Résultat de l'étape, en ne recalculant que les étapes dont la clé a changé
+
+        Les étapes calculées par l'appel sont listées dans `last_run`.
+
+        Le résultat est l'objet mémorisé, partagé avec les étapes aval et
+        les appels suivants : il ne doit pas être modifié. Avec copy=True,
+        une copie profonde est retournée (résultats transmis à du code
+        extérieur, à un autre thread).
+        """
+        value = self._compute(name)
+        return deepcopy(value) if copy else value
+
+    def _compute(self, name: str) -> Any:
+        if self._depth == 0:
+            self.last_run = []
+        value = self.cached(name, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        stage = self._stage(name)
+        key = self.key(name)
+        self._depth += 1
+        try:
+            inputs = [self._compute(upstream) for upstream in stage.inputs]
+        finally:
+            self._depth -= 1
+        kwargs = {param: self._params.get(param) for param in stage.params + stage.files}
+
+        start = time.perf_counter()
+        with trace_span(f'analysis_{name}'):
+            value = stage.func(*inputs, **kwargs)
+        logger.debug(f"Étape '{name}' calculée en {(time.perf_counter() - start) * 1000:.1f} ms")
+        self.stats['computed'] += 1
+        self.last_run.append(name)
+        self._remember(key, value)
+
+        if stage.persist and self.store is not None and value is not None:
+            try:
+                self.store.put(self._store_key(stage, key), value)
+            except Exception as e:
+                logger.warning(f"Résultat de l'étape {name} non conservé: {e}")
+        return value
+
+    def clear(self):
+        """Libère les résultats en mémoire"""
+        self._memory.clear()
+        self._keys.clear()
+
+    def _stage(self, name: str) -> Stage:
+        try:
+            return self._stages[name]
+        except KeyError:
+            raise KeyError(f"Étape inconnue: {name}") from None
+
+    def _remember(self, key: str, value: Any):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _store_key(self, stage: Stage, key: str) -> str:
+        return self.store.make_key('graph', key, stage.name, stage.version)
+
+    def _file_fingerprint(self, path: Any) -> Optional[str]:
+        """Empreinte du contenu (store) ou de la taille et de la date du fichier"""
+        if path is None:
+            return None
+        if self.store is not None:
+            return self.store.file_digest(path)
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        return f"{resolved}|{stat.st_size}|{stat.st_mtime_ns}"
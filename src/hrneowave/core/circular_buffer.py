@@ -139,6 +139,7 @@ class ThreadSafeCircularBuffer(CircularBufferBase):
         self._write_index = 0
         self._read_index = 0
         self._available_samples = 0
+        self._total_written = 0  # Indice absolu du prochain échantillon
         
         # Verrous légers pour les indices critiques
         self._write_lock = threading.Lock()
@@ -201,6 +202,7 @@ class ThreadSafeCircularBuffer(CircularBufferBase):
             
             # Mise à jour des indices
             self._write_index = (write_idx + n_samples) % self.config.buffer_size
+            self._total_written += n_samples
             self._available_samples = min(
                 self._available_samples + n_samples, 
                 self.config.buffer_size
@@ -323,6 +325,41 @@ class ThreadSafeCircularBuffer(CircularBufferBase):
         
         return result
     
+    @property
+    def total_written(self) -> int:
+        """Nombre total d'échantillons écrits depuis le dernier reset"""
+        return self._total_written
+    
+    def get_views(self, start_sample: int, n_samples: int) -> List[np.ndarray]:
+        """
+        Vues en lecture seule (sans copie) sur l'intervalle absolu
+        [start_sample, start_sample + n_samples)
+        
+        Une seule vue est retournée, ou deux si l'intervalle franchit la fin
+        de l'anneau. Les vues restent valides tant que l'anneau n'a pas été
+        réécrit par-dessus, soit pendant environ buffer_duration secondes.
+        
+        Raises:
+            ValueError: Si l'intervalle n'est plus (ou pas encore) dans l'anneau
+        """
+        size = self.config.buffer_size
+        end_sample = start_sample + n_samples
+        if n_samples <= 0 or start_sample < self._total_written - size or end_sample > self._total_written:
+            raise ValueError(
+                f"Intervalle [{start_sample}, {end_sample}) hors de l'anneau "
+                f"(écrits: {self._total_written}, capacité: {size})"
+            )
+        
+        start = start_sample % size
+        if start + n_samples <= size:
+            segments = [self.buffer[:, start:start + n_samples]]
+        else:
+            segments = [self.buffer[:, start:], self.buffer[:, :start + n_samples - size]]
+        
+        for view in segments:
+            view.flags.writeable = False
+        return segments
+    
     def _handle_overflow(self, n_new_samples: int) -> None:
         """
         Gère l'overflow en mode overwrite
@@ -354,6 +391,7 @@ class ThreadSafeCircularBuffer(CircularBufferBase):
             self._write_index = 0
             self._read_index = 0
             self._available_samples = 0
+            self._total_written = 0
             self.buffer.fill(0)
             self.stats = BufferStats()
     
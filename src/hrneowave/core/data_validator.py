@@ -11,6 +11,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
 from collections import deque
+import itertools
+import threading
 import warnings
 
 # Import conditionnel pour l'analyse spectrale
@@ -57,6 +59,17 @@ class ValidationResult:
     def __str__(self) -> str:
         return f"[{self.level.value.upper()}] Ch{self.channel}: {self.message}"
 
+@dataclass
+class BlockValidationResult(ValidationResult):
+    """Résultat agrégé d'une règle sur un bloc (un seul objet par règle et par bloc)"""
+    count: int = 0  # nombre d'échantillons en violation
+    first_index: int = 0  # indice du premier échantillon en violation dans le bloc
+    first_time: float = 0.0  # temps de flux du premier échantillon en violation [s]
+    
+    def __str__(self) -> str:
+        return (f"[{self.level.value.upper()}] Ch{self.channel}: {self.message} "
+                f"({self.count} éch. dès t={self.first_time:.3f}s)")
+
 @dataclass
 class ValidationConfig:
     """Configuration de validation pour un canal"""
@@ -83,8 +96,11 @@ class ValidationConfig:
     saturation_duration: float = 0.1  # secondes
     
     # Détection de dérive
-    drift_window_size: int = 1000  # échantillons
+    drift_window_size: int = 1000  # échantillons (fenêtre longue)
     max_drift_rate: Optional[float] = None  # unités/seconde
+    drift_short_window_size: Optional[int] = None  # fenêtre courte optionnelle (échantillons)
+    max_short_drift_rate: Optional[float] = None  # unités/seconde (max_drift_rate par défaut)
+    drift_min_correlation: float = 0.7  # |r| minimal pour confirmer une tendance
     
     # Connectivité
     connectivity_timeout: float = 5.0  # secondes
@@ -99,9 +115,307 @@ class ValidationConfig:
         ValidationRule.RATE_OF_CHANGE,
         ValidationRule.STATISTICAL_OUTLIER,
         ValidationRule.SATURATION_CHECK,
-        ValidationRule.CONNECTIVITY_CHECK
+        ValidationRule.CONNECTIVITY_CHECK,
+        ValidationRule.DRIFT_DETECTION
     ])
 
+class RollingStatistics:
+    """
+    Moyenne et variance glissantes sur les `window` derniers échantillons
+    
+    Mises à jour de type Welford (ajout/retrait) sur un anneau : O(1) par
+    échantillon, O(taille du bloc) par bloc.
+    """
+    
+    def __init__(self, window: int):
+        self.window = max(1, int(window))
+        self._ring = np.zeros(self.window)
+        self._pushed = 0  # nombre total d'échantillons ajoutés
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    @property
+    def variance(self) -> float:
+        """Variance (population) de la fenêtre courante"""
+        return max(self._m2 / self.count, 0.0) if self.count else 0.0
+    
+    @property
+    def std(self) -> float:
+        """Écart-type (population) de la fenêtre courante"""
+        return float(np.sqrt(self.variance))
+    
+    def reset(self):
+        """Vide la fenêtre"""
+        self._pushed = 0
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def values(self) -> np.ndarray:
+        """Contenu de la fenêtre, du plus ancien au plus récent"""
+        indices = np.arange(self._pushed - self.count, self._pushed) % self.window
+        return self._ring[indices]
+    
+    def push(self, value: float):
+        """Ajoute un échantillon (et retire le plus ancien si la fenêtre est pleine)"""
+        slot = self._pushed % self.window
+        if self.count < self.window:
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (value - self.mean)
+        else:
+            old = self._ring[slot]
+            new_mean = self.mean + (value - old) / self.window
+            self._m2 += (value - old) * (value - new_mean + old - self.mean)
+            self.mean = new_mean
+        self._ring[slot] = value
+        self._pushed += 1
+    
+    def push_block(self, values: np.ndarray):
+        """Ajoute un bloc (combinaison de Chan : retrait des plus anciens puis ajout)"""
+        values = np.asarray(values, dtype=float)
+        n_new = len(values)
+        if n_new == 0:
+            return
+        if n_new >= self.window:
+            tail = values[-self.window:]
+            self.count = self.window
+            self.mean = float(tail.mean())
+            self._m2 = float(((tail - self.mean) ** 2).sum())
+        else:
+            n_removed = max(0, self.count + n_new - self.window)
+            if n_removed:
+                removed = self.values()[:n_removed]
+                if n_removed == self.count:
+                    self.count, self.mean, self._m2 = 0, 0.0, 0.0
+                else:
+                    mean_r = float(removed.mean())
+                    m2_r = float(((removed - mean_r) ** 2).sum())
+                    n_kept = self.count - n_removed
+                    mean_kept = (self.count * self.mean - n_removed * mean_r) / n_kept
+                    delta = mean_r - mean_kept
+                    self._m2 -= m2_r + delta * delta * n_removed * n_kept / self.count
+                    self.count, self.mean = n_kept, mean_kept
+            
+            mean_n = float(values.mean())
+            m2_n = float(((values - mean_n) ** 2).sum())
+            total = self.count + n_new
+            delta = mean_n - self.mean
+            self._m2 += m2_n + delta * delta * self.count * n_new / total
+            self.mean += delta * n_new / total
+            self.count = total
+        
+        slots = np.arange(self._pushed, self._pushed + n_new)[-self.window:] % self.window
+        self._ring[slots] = values[-self.window:]
+        self._pushed += n_new
+    
+    def preceding_stats(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Statistiques de la fenêtre précédant chaque échantillon d'un bloc
+        (sans modifier l'état), par sommes cumulées centrées sur la moyenne courante
+        
+        Comme push_block, seuls les échantillons finis entrent dans la
+        fenêtre ; un échantillon non fini reçoit un effectif nul.
+        
+        Returns:
+            Tuple (moyennes, écarts-types, effectifs) de même longueur que values
+        """
+        values = np.asarray(values, dtype=float)
+        finite = np.isfinite(values)
+        if finite.all():
+            return self._preceding_finite(values)
+        
+        mean = np.full(len(values), np.nan)
+        std = np.full(len(values), np.nan)
+        n = np.zeros(len(values), dtype=np.int64)
+        mean[finite], std[finite], n[finite] = self._preceding_finite(values[finite])
+        return mean, std, n
+    
+    def _preceding_finite(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        extended = np.concatenate((self.values(), values)) - self.mean
+        c1 = np.concatenate(([0.0], np.cumsum(extended)))
+        c2 = np.concatenate(([0.0], np.cumsum(extended * extended)))
+        
+        end = np.arange(self.count, self.count + len(values))
+        start = np.maximum(end - self.window, 0)
+        n = end - start
+        safe_n = np.maximum(n, 1)
+        s1 = (c1[end] - c1[start]) / safe_n
+        variance = np.maximum((c2[end] - c2[start]) / safe_n - s1 * s1, 0.0)
+        return self.mean + s1, np.sqrt(variance), n
+
+class RollingRegression:
+    """
+    Régression linéaire glissante x(t) sur les `window` derniers points
+    
+    Les sommes Σt, Σx, Σt², Σtx, Σx² sont mises à jour par ajout/retrait :
+    pente et R² coûtent O(1) par échantillon (O(taille du bloc) par bloc).
+    Les temps sont relatifs à une origine recalée et les sommes recalculées
+    exactement une fois par fenêtre, ce qui borne l'erreur d'arrondi sur
+    des enregistrements de plusieurs heures.
+    """
+    
+    def __init__(self, window: int):
+        self.window = max(2, int(window))
+        self._t = np.zeros(self.window)
+        self._x = np.zeros(self.window)
+        self.reset()
+    
+    def reset(self):
+        """Vide la fenêtre"""
+        self._pushed = 0
+        self._since_refresh = 0
+        self.count = 0
+        self._origin = None
+        self._sums = np.zeros(5)  # Σt, Σx, Σt², Σtx, Σx²
+    
+    @staticmethod
+    def _moments(t: np.ndarray, x: np.ndarray) -> np.ndarray:
+        return np.array([t.sum(), x.sum(), np.dot(t, t), np.dot(t, x), np.dot(x, x)])
+    
+    def _ordered(self) -> Tuple[np.ndarray, np.ndarray]:
+        indices = np.arange(self._pushed - self.count, self._pushed) % self.window
+        return self._t[indices], self._x[indices]
+    
+    def _refresh(self):
+        """Recalage de l'origine sur le plus ancien point et recalcul exact des sommes"""
+        t, x = self._ordered()
+        shift = t[0] if self.count else 0.0
+        self._t -= shift
+        self._origin += shift
+        self._sums = self._moments(t - shift, x)
+        self._since_refresh = 0
+    
+    def push(self, t: float, x: float):
+        """Ajoute un point (t en secondes)"""
+        if self._origin is None:
+            self._origin = t
+        t -= self._origin
+        slot = self._pushed % self.window
+        if self.count == self.window:
+            old_t, old_x = self._t[slot], self._x[slot]
+            self._sums -= (old_t, old_x, old_t * old_t, old_t * old_x, old_x * old_x)
+        else:
+            self.count += 1
+        self._sums += (t, x, t * t, t * x, x * x)
+        self._t[slot], self._x[slot] = t, x
+        self._pushed += 1
+        self._since_refresh += 1
+        if self._since_refresh >= self.window:
+            self._refresh()
+    
+    def push_block(self, t: np.ndarray, x: np.ndarray):
+        """Ajoute un bloc de points"""
+        t = np.asarray(t, dtype=float)
+        x = np.asarray(x, dtype=float)
+        n_new = len(t)
+        if n_new == 0:
+            return
+        if self._origin is None:
+            self._origin = float(t[0])
+        t = t - self._origin
+        
+        if n_new < self.window:
+            n_removed = max(0, self.count + n_new - self.window)
+            if n_removed:
+                old_t, old_x = self._ordered()
+                self._sums -= self._moments(old_t[:n_removed], old_x[:n_removed])
+            self._sums += self._moments(t, x)
+        
+        slots = np.arange(self._pushed, self._pushed + n_new)[-self.window:] % self.window
+        self._t[slots], self._x[slots] = t[-self.window:], x[-self.window:]
+        self.count = min(self.count + n_new, self.window)
+        self._pushed += n_new
+        self._since_refresh += n_new
+        if n_new >= self.window or self._since_refresh >= self.window:
+            self._refresh()
+    
+    @property
+    def is_full(self) -> bool:
+        """Indique si la fenêtre est complète"""
+        return self.count == self.window
+    
+    def fit(self) -> Tuple[float, float]:
+        """
+        Pente et coefficient de corrélation de la fenêtre courante
+        
+        Returns:
+            Tuple (pente en unités/s, r)
+        """
+        if self.count < 2:
+            return 0.0, 0.0
+        n = self.count
+        sum_t, sum_x, sum_tt, sum_tx, sum_xx = self._sums
+        s_tt = sum_tt - sum_t * sum_t / n
+        s_tx = sum_tx - sum_t * sum_x / n
+        s_xx = sum_xx - sum_x * sum_x / n
+        if s_tt <= 0:
+            return 0.0, 0.0
+        slope = s_tx / s_tt
+        r_value = s_tx / np.sqrt(s_tt * s_xx) if s_xx > 0 else 0.0
+        return float(slope), float(np.clip(r_value, -1.0, 1.0))
+
+class DriftDetector:
+    """
+    Détection de dérive multi-fenêtres (longue et, optionnellement, courte)
+    
+    Une alarme est levée pour chaque fenêtre complète dont la pente dépasse
+    son seuil avec une corrélation suffisante.
+    """
+    
+    def __init__(self, config: ValidationConfig):
+        self.min_correlation = config.drift_min_correlation
+        self.windows: Dict[str, Tuple[RollingRegression, float]] = {}
+        if config.max_drift_rate is not None:
+            self.windows['long'] = (RollingRegression(config.drift_window_size), config.max_drift_rate)
+            if config.drift_short_window_size:
+                short_rate = config.max_short_drift_rate or config.max_drift_rate
+                self.windows['short'] = (RollingRegression(config.drift_short_window_size), short_rate)
+    
+    @property
+    def enabled(self) -> bool:
+        """Indique si au moins une fenêtre est configurée"""
+        return bool(self.windows)
+    
+    def reset(self):
+        """Vide toutes les fenêtres"""
+        for regression, _ in self.windows.values():
+            regression.reset()
+    
+    def push(self, t: float, x: float):
+        """Ajoute un point à toutes les fenêtres"""
+        for regression, _ in self.windows.values():
+            regression.push(t, x)
+    
+    def push_block(self, t: np.ndarray, x: np.ndarray):
+        """Ajoute un bloc à toutes les fenêtres"""
+        for regression, _ in self.windows.values():
+            regression.push_block(t, x)
+    
+    def check(self) -> List[Dict[str, Any]]:
+        """
+        Évalue les fenêtres complètes
+        
+        Returns:
+            Liste des alarmes {'window', 'window_size', 'drift_rate', 'correlation', 'max_rate'}
+        """
+        alarms = []
+        for name, (regression, max_rate) in self.windows.items():
+            if not regression.is_full:
+                continue
+            slope, r_value = regression.fit()
+            if abs(slope) > max_rate and abs(r_value) > self.min_correlation:
+                alarms.append({
+                    'window': name,
+                    'window_size': regression.window,
+                    'drift_rate': slope,
+                    'correlation': r_value,
+                    'max_rate': max_rate
+                })
+        return alarms
+
 class ChannelValidator:
     """Validateur pour un canal spécifique"""
     
@@ -118,6 +432,13 @@ class ChannelValidator:
         self.last_timestamp = None
         self.saturation_start = None
         self.baseline_stats = {'mean': 0.0, 'std': 1.0}
+        self.rolling_stats = RollingStatistics(config.outlier_window_size)
+        self.drift_detector = DriftDetector(config)
+        self._time_origin: Optional[datetime] = None
+        
+        # État du mode bloc (temps de flux en secondes)
+        self._saturation_run = 0  # échantillons saturés consécutifs en fin de bloc
+        self._next_block_time: Optional[float] = None
         
         # Compteurs
         self.total_samples = 0
@@ -147,10 +468,9 @@ class ChannelValidator:
                 elif rule == ValidationRule.CONNECTIVITY_CHECK:
                     result = self._check_connectivity(timestamp)
                 elif rule == ValidationRule.DRIFT_DETECTION:
-                    result = self._check_drift(timestamp)
-                elif rule == ValidationRule.SPECTRAL_ANALYSIS and SCIPY_AVAILABLE:
-                    result = self._check_spectral_quality(timestamp)
+                    result = self._check_drift(value, timestamp)
                 else:
+                    # SPECTRAL_ANALYSIS est planifiée par DataValidator (run_spectral_checks)
                     continue
                 
                 if result:
@@ -177,9 +497,148 @@ class ChannelValidator:
         self.last_timestamp = timestamp
         
         # Mettre à jour les statistiques de base
-        if len(self.data_history) >= 10:
-            self.baseline_stats['mean'] = np.mean(list(self.data_history)[-100:])
-            self.baseline_stats['std'] = np.std(list(self.data_history)[-100:])
+        if np.isfinite(value):
+            self.rolling_stats.push(value)
+        self._update_baseline()
+        
+        return results
+    
+    def _update_baseline(self):
+        """Statistiques de base tirées de la fenêtre glissante"""
+        if self.rolling_stats.count >= 10:
+            self.baseline_stats['mean'] = self.rolling_stats.mean
+            self.baseline_stats['std'] = self.rolling_stats.std
+    
+    def validate_block(self, values: np.ndarray, t0: float, fs: Optional[float] = None,
+                       timestamp: Optional[datetime] = None) -> List[BlockValidationResult]:
+        """
+        Valide un bloc d'échantillons contigus par masques vectorisés
+        
+        Les règles plage, taux de changement, outlier statistique, saturation
+        et connectivité produisent au plus un résultat agrégé par bloc
+        (nombre de violations et premier indice) au lieu d'un objet par
+        échantillon. L'historique horodaté (timestamp_history) n'est pas
+        alimenté dans ce mode.
+        
+        Args:
+            values: Échantillons du canal (1-D)
+            t0: Temps de flux du premier échantillon [s]
+            fs: Fréquence d'échantillonnage (sampling_rate par défaut)
+            timestamp: Horodatage des résultats (datetime.now() par défaut)
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        n_samples = len(values)
+        if n_samples == 0:
+            return []
+        fs = fs or self.sampling_rate
+        timestamp = timestamp or datetime.now()
+        config = self.config
+        results = []
+        
+        def emit(rule, level, mask, message, **metadata):
+            count = int(np.count_nonzero(mask))
+            if not count:
+                return
+            first = int(np.argmax(mask))
+            results.append(BlockValidationResult(
+                rule_type=rule,
+                level=level,
+                message=message,
+                channel=config.channel,
+                timestamp=timestamp,
+                value=float(values[first]),
+                expected_range=(config.min_value, config.max_value),
+                metadata=metadata,
+                count=count,
+                first_index=first,
+                first_time=t0 + first / fs
+            ))
+            if level in (ValidationLevel.ERROR, ValidationLevel.CRITICAL):
+                self.error_count += count
+            elif level == ValidationLevel.WARNING:
+                self.warning_count += count
+        
+        active = set(config.active_rules)
+        
+        if ValidationRule.RANGE_CHECK in active:
+            if config.min_value is not None:
+                emit(ValidationRule.RANGE_CHECK, ValidationLevel.ERROR, values < config.min_value,
+                     f"Valeurs sous la limite minimale {config.min_value:.3f}")
+            if config.max_value is not None:
+                emit(ValidationRule.RANGE_CHECK, ValidationLevel.ERROR, values > config.max_value,
+                     f"Valeurs au-dessus de la limite maximale {config.max_value:.3f}")
+        
+        if ValidationRule.RATE_OF_CHANGE in active and config.max_rate_of_change is not None:
+            previous = values[0] if self.last_value is None else self.last_value
+            rates = np.abs(np.diff(values, prepend=previous)) * fs
+            mask = rates > config.max_rate_of_change
+            if mask.any():
+                emit(ValidationRule.RATE_OF_CHANGE, ValidationLevel.WARNING, mask,
+                     f"Taux de changement élevé (max {rates.max():.3f} > "
+                     f"{config.max_rate_of_change:.3f} unités/s)",
+                     rate=float(rates.max()), max_rate=config.max_rate_of_change)
+        
+        if ValidationRule.STATISTICAL_OUTLIER in active:
+            mean, std, n = self.rolling_stats.preceding_stats(values)
+            valid = (n >= self.rolling_stats.window) & (std > 0)
+            z_scores = np.zeros(n_samples)
+            np.divide(np.abs(values - mean), std, out=z_scores, where=valid)
+            mask = z_scores > config.outlier_threshold
+            if mask.any():
+                z_max = float(z_scores.max())
+                level = ValidationLevel.WARNING if z_max < config.outlier_threshold * 1.5 else ValidationLevel.ERROR
+                emit(ValidationRule.STATISTICAL_OUTLIER, level, mask,
+                     f"Outliers statistiques détectés: z-score max = {z_max:.2f}",
+                     z_score=z_max, threshold=config.outlier_threshold)
+        
+        if (ValidationRule.SATURATION_CHECK in active and
+                config.min_value is not None and config.max_value is not None):
+            full_scale = config.max_value - config.min_value
+            margin = (1 - config.saturation_threshold) * full_scale
+            saturated = (values >= config.max_value - margin) | (values <= config.min_value + margin)
+            # Longueur de la série saturée en cours à chaque échantillon (report du bloc précédent)
+            index = np.arange(n_samples)
+            last_clear = np.maximum.accumulate(np.where(saturated, -1, index))
+            run = np.where(last_clear < 0, index + 1 + self._saturation_run, index - last_clear)
+            run[~saturated] = 0
+            self._saturation_run = int(run[-1])
+            mask = (run - 1) / fs > config.saturation_duration
+            if mask.any():
+                duration = float(run.max() - 1) / fs
+                emit(ValidationRule.SATURATION_CHECK, ValidationLevel.ERROR, mask,
+                     f"Saturation détectée pendant {duration:.2f}s",
+                     duration=duration, threshold=config.saturation_threshold)
+        
+        if ValidationRule.CONNECTIVITY_CHECK in active:
+            if self._next_block_time is not None:
+                gap = t0 - self._next_block_time
+                if gap > 1.0 / fs + config.connectivity_timeout:
+                    mask = np.zeros(n_samples, dtype=bool)
+                    mask[0] = True
+                    emit(ValidationRule.CONNECTIVITY_CHECK, ValidationLevel.ERROR, mask,
+                         f"Perte de connectivité détectée: {gap:.2f}s sans données",
+                         gap_duration=gap, expected_interval=1.0 / fs)
+            emit(ValidationRule.CONNECTIVITY_CHECK, ValidationLevel.ERROR, ~np.isfinite(values),
+                 "Échantillons invalides (NaN/Inf) : capteur déconnecté ?")
+        
+        finite_mask = np.isfinite(values)
+        if ValidationRule.DRIFT_DETECTION in active and self.drift_detector.enabled:
+            times = t0 + np.arange(n_samples) / fs
+            self.drift_detector.push_block(times[finite_mask], values[finite_mask])
+            last = np.zeros(n_samples, dtype=bool)
+            last[-1] = True
+            for alarm in self.drift_detector.check():
+                emit(ValidationRule.DRIFT_DETECTION, ValidationLevel.WARNING, last,
+                     self._drift_message(alarm), **alarm)
+        
+        # Mise à jour de l'état
+        finite = values[finite_mask]
+        self.rolling_stats.push_block(finite)
+        self._update_baseline()
+        self.data_history.extend(values[-self.data_history.maxlen:].tolist())
+        self.last_value = float(values[-1])
+        self._next_block_time = t0 + n_samples / fs
+        self.total_samples += n_samples
         
         return results
     
@@ -237,13 +696,12 @@ class ChannelValidator:
     
     def _check_statistical_outlier(self, value: float, timestamp: datetime) -> Optional[ValidationResult]:
         """Détecte les outliers statistiques"""
-        if len(self.data_history) < self.config.outlier_window_size:
+        # Fenêtre glissante des échantillons précédents (valeur actuelle exclue)
+        if self.rolling_stats.count < self.rolling_stats.window:
             return None
         
-        # Utiliser une fenêtre glissante
-        window_data = list(self.data_history)[-self.config.outlier_window_size:]
-        mean = np.mean(window_data[:-1])  # Exclure la valeur actuelle
-        std = np.std(window_data[:-1])
+        mean = self.rolling_stats.mean
+        std = self.rolling_stats.std
         
         if std == 0:
             return None
@@ -315,83 +773,43 @@ class ChannelValidator:
         
         return None
     
-    def _check_drift(self, timestamp: datetime) -> Optional[ValidationResult]:
-        """Détecte la dérive du signal"""
-        if (self.config.max_drift_rate is None or 
-            len(self.data_history) < self.config.drift_window_size):
+    def _check_drift(self, value: float, timestamp: datetime) -> Optional[ValidationResult]:
+        """Détecte la dérive du signal (régressions glissantes incrémentales)"""
+        if not self.drift_detector.enabled or not np.isfinite(value):
             return None
         
-        # Calculer la tendance sur la fenêtre
-        window_data = np.array(list(self.data_history)[-self.config.drift_window_size:])
-        window_times = np.array([(t - self.timestamp_history[0]).total_seconds() 
-                                for t in list(self.timestamp_history)[-self.config.drift_window_size:]])
+        if self._time_origin is None:
+            self._time_origin = timestamp
+        self.drift_detector.push((timestamp - self._time_origin).total_seconds(), value)
         
-        if len(window_times) < 2:
+        alarms = self.drift_detector.check()
+        if not alarms:
             return None
         
-        # Régression linéaire pour détecter la tendance
-        slope, _, r_value, _, _ = stats.linregress(window_times, window_data) if SCIPY_AVAILABLE else (0, 0, 0, 0, 0)
-        
-        if abs(slope) > self.config.max_drift_rate and abs(r_value) > 0.7:
-            return ValidationResult(
-                rule_type=ValidationRule.DRIFT_DETECTION,
-                level=ValidationLevel.WARNING,
-                message=f"Dérive détectée: {slope:.4f} unités/s (R² = {r_value**2:.3f})",
-                channel=self.config.channel,
-                timestamp=timestamp,
-                metadata={'drift_rate': slope, 'correlation': r_value}
-            )
-        
-        return None
+        alarm = max(alarms, key=lambda a: abs(a['drift_rate']) / a['max_rate'])
+        return ValidationResult(
+            rule_type=ValidationRule.DRIFT_DETECTION,
+            level=ValidationLevel.WARNING,
+            message=self._drift_message(alarm),
+            channel=self.config.channel,
+            timestamp=timestamp,
+            metadata=alarm
+        )
     
-    def _check_spectral_quality(self, timestamp: datetime) -> Optional[ValidationResult]:
-        """Analyse la qualité spectrale du signal"""
-        if (not SCIPY_AVAILABLE or 
-            not self.config.spectral_analysis_enabled or 
-            len(self.data_history) < 256):
-            return None
-        
-        # FFT sur une fenêtre récente
-        window_size = min(512, len(self.data_history))
-        data = np.array(list(self.data_history)[-window_size:])
-        
-        # Appliquer une fenêtre pour réduire les fuites spectrales
-        windowed_data = data * signal.windows.hann(len(data))
-        
-        # Calculer la FFT
-        fft_data = fft(windowed_data)
-        freqs = fftfreq(len(windowed_data), 1/self.sampling_rate)
-        
-        # Analyser le contenu spectral
-        power_spectrum = np.abs(fft_data)**2
-        positive_freqs = freqs[:len(freqs)//2]
-        positive_power = power_spectrum[:len(power_spectrum)//2]
-        
-        # Vérifier si l'énergie est dans la plage attendue
-        if self.config.expected_frequency_range:
-            freq_min, freq_max = self.config.expected_frequency_range
-            freq_mask = (positive_freqs >= freq_min) & (positive_freqs <= freq_max)
-            
-            if np.any(freq_mask):
-                energy_in_band = np.sum(positive_power[freq_mask])
-                total_energy = np.sum(positive_power)
-                
-                energy_ratio = energy_in_band / total_energy if total_energy > 0 else 0
-                
-                if energy_ratio < 0.1:  # Moins de 10% de l'énergie dans la bande attendue
-                    return ValidationResult(
-                        rule_type=ValidationRule.SPECTRAL_ANALYSIS,
-                        level=ValidationLevel.WARNING,
-                        message=f"Énergie spectrale faible dans la bande attendue: {energy_ratio:.1%}",
-                        channel=self.config.channel,
-                        timestamp=timestamp,
-                        metadata={
-                            'energy_ratio': energy_ratio,
-                            'frequency_range': self.config.expected_frequency_range
-                        }
-                    )
-        
-        return None
+    @staticmethod
+    def _drift_message(alarm: Dict[str, Any]) -> str:
+        return (f"Dérive détectée (fenêtre {alarm['window']}): {alarm['drift_rate']:.4f} unités/s "
+                f"(R² = {alarm['correlation'] ** 2:.3f})")
+    
+    @property
+    def spectral_check_enabled(self) -> bool:
+        """Indique si le canal participe au contrôle spectral planifié"""
+        return self.config.spectral_analysis_enabled and self.config.expected_frequency_range is not None
+    
+    def recent_data(self, n_samples: int) -> np.ndarray:
+        """Copie des n_samples derniers échantillons de l'historique"""
+        n_samples = min(n_samples, len(self.data_history))
+        return np.array(list(itertools.islice(self.data_history, len(self.data_history) - n_samples, None)))
     
     def get_statistics(self) -> Dict[str, Any]:
         """Retourne les statistiques de validation"""
@@ -405,6 +823,22 @@ class ChannelValidator:
             'current_std': self.baseline_stats['std'],
             'data_points': len(self.data_history)
         }
+    
+    def reset(self):
+        """Remet à zéro l'historique et les compteurs"""
+        self.data_history.clear()
+        self.timestamp_history.clear()
+        self.rolling_stats.reset()
+        self.drift_detector.reset()
+        self._time_origin = None
+        self.last_value = None
+        self.last_timestamp = None
+        self.saturation_start = None
+        self._saturation_run = 0
+        self._next_block_time = None
+        self.total_samples = 0
+        self.error_count = 0
+        self.warning_count = 0
 
 class DataValidator:
     """Validateur de données multi-canaux en temps réel"""
@@ -419,17 +853,36 @@ class DataValidator:
         self.max_results_history = 1000
         self.auto_cleanup_interval = 100  # échantillons
         self.sample_count = 0
+        
+        # Contrôle spectral planifié, exécuté par un thread dédié : le chemin
+        # par échantillon ne fait que compter et signaler l'échéance
+        self.spectral_interval = 2.0  # secondes de données entre deux contrôles
+        self.spectral_window_size = 512  # échantillons par FFT
+        self.spectral_min_samples = 256
+        self.spectral_min_energy_ratio = 0.1
+        self._samples_since_spectral = 0
+        self._live_spectrum: Optional[Tuple[np.ndarray, np.ndarray, List[int]]] = None
+        
+        # Historiques partagés avec le thread spectral
+        self._lock = threading.RLock()
+        self._spectral_condition = threading.Condition()
+        self._spectral_requested = 0
+        self._spectral_done = 0
+        self._spectral_thread: Optional[threading.Thread] = None
+        self._spectral_stop = False
     
     def add_channel(self, config: ValidationConfig):
         """Ajoute un canal à valider"""
         validator = ChannelValidator(config, self.sampling_rate)
-        self.channel_validators[config.channel] = validator
+        with self._lock:
+            self.channel_validators[config.channel] = validator
         print(f"Canal {config.channel} ajouté à la validation ({config.sensor_type})")
     
     def remove_channel(self, channel: int):
         """Supprime un canal de la validation"""
-        if channel in self.channel_validators:
-            del self.channel_validators[channel]
+        with self._lock:
+            removed = self.channel_validators.pop(channel, None)
+        if removed is not None:
             print(f"Canal {channel} supprimé de la validation")
     
     def validate_samples(self, samples: Dict[int, float], timestamp: Optional[datetime] = None) -> List[ValidationResult]:
@@ -439,31 +892,229 @@ class DataValidator:
         
         all_results = []
         
-        # Valider chaque canal
-        for channel, value in samples.items():
-            if channel in self.channel_validators:
-                results = self.channel_validators[channel].validate_sample(value, timestamp)
-                all_results.extend(results)
-        
-        # Ajouter à l'historique global
-        self.global_results.extend(all_results)
+        with self._lock:
+            # Valider chaque canal
+            for channel, value in samples.items():
+                if channel in self.channel_validators:
+                    results = self.channel_validators[channel].validate_sample(value, timestamp)
+                    all_results.extend(results)
+            
+            self.sample_count += 1
+            self._samples_since_spectral += 1
+            if self._spectral_due():
+                self._request_spectral_check()
         
-        # Nettoyer l'historique si nécessaire
-        if len(self.global_results) > self.max_results_history:
-            self.global_results = self.global_results[-self.max_results_history:]
+        self._dispatch(all_results)
+        return all_results
+    
+    def _dispatch(self, results: List[ValidationResult]):
+        """Ajoute les résultats à l'historique global et appelle les callbacks"""
+        if not results:
+            return
+        with self._lock:
+            self.global_results.extend(results)
+            
+            # Nettoyer l'historique si nécessaire
+            if len(self.global_results) > self.max_results_history:
+                self.global_results = self.global_results[-self.max_results_history:]
         
-        # Appeler les callbacks
-        for result in all_results:
+        for result in results:
             for callback in self.result_callbacks:
                 try:
                     callback(result)
                 except Exception as e:
                     print(f"Erreur callback validation: {e}")
+    
+    def validate_block(self, block: np.ndarray, t0: float, fs: Optional[float] = None) -> List[ValidationResult]:
+        """
+        Valide un bloc multi-canaux (n_channels, n_samples) par règles vectorisées
         
-        self.sample_count += 1
+        La ligne i du bloc est le canal i. Un résultat agrégé au plus est
+        produit par règle, canal et bloc. Le contrôle spectral dû est confié
+        au thread spectral : ses résultats arrivent par les callbacks et
+        l'historique global.
         
+        Args:
+            block: Données (n_channels, n_samples)
+            t0: Temps de flux du premier échantillon [s]
+            fs: Fréquence d'échantillonnage (sampling_rate par défaut)
+        """
+        block = np.atleast_2d(block)
+        fs = fs or self.sampling_rate
+        timestamp = datetime.now()
+        
+        all_results = []
+        with self._lock:
+            for channel, validator in self.channel_validators.items():
+                if channel < block.shape[0]:
+                    all_results.extend(validator.validate_block(block[channel], t0, fs, timestamp))
+            
+            self.sample_count += block.shape[1]
+            self._samples_since_spectral += block.shape[1]
+            if self._spectral_due():
+                self._request_spectral_check()
+        
+        self._dispatch(all_results)
         return all_results
     
+    def _spectral_due(self) -> bool:
+        return self._samples_since_spectral >= self.spectral_interval * self.sampling_rate
+    
+    def _request_spectral_check(self):
+        """Signale un contrôle spectral dû au thread spectral (démarré au besoin)"""
+        self._samples_since_spectral = 0
+        if self._spectral_thread is None or not self._spectral_thread.is_alive():
+            self.start_spectral_worker()
+        with self._spectral_condition:
+            self._spectral_requested += 1
+            self._spectral_condition.notify_all()
+    
+    def start_spectral_worker(self):
+        """Démarre le thread des contrôles spectraux planifiés"""
+        with self._spectral_condition:
+            if self._spectral_thread is not None and self._spectral_thread.is_alive():
+                return
+            self._spectral_stop = False
+            self._spectral_thread = threading.Thread(
+                target=self._spectral_loop, name="DataValidatorSpectral", daemon=True
+            )
+            self._spectral_thread.start()
+    
+    def stop_spectral_worker(self, timeout: float = 2.0):
+        """Arrête le thread spectral (les demandes en attente sont abandonnées)"""
+        with self._spectral_condition:
+            thread, self._spectral_thread = self._spectral_thread, None
+            self._spectral_stop = True
+            self._spectral_done = self._spectral_requested
+            self._spectral_condition.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+    
+    def wait_spectral_checks(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attend la fin des contrôles spectraux déjà demandés
+        
+        Returns:
+            True si tous ont été traités avant le délai
+        """
+        with self._spectral_condition:
+            target = self._spectral_requested
+            return self._spectral_condition.wait_for(lambda: self._spectral_done >= target, timeout)
+    
+    def _spectral_loop(self):
+        """Boucle du thread spectral : un lot par échéance, résultats diffusés"""
+        while True:
+            with self._spectral_condition:
+                self._spectral_condition.wait_for(
+                    lambda: self._spectral_stop or self._spectral_requested > self._spectral_done
+                )
+                if self._spectral_stop:
+                    return
+                target = self._spectral_requested
+            
+            try:
+                results = self.run_spectral_checks()
+                if results:
+                    self._dispatch(results)
+            except Exception as e:
+                print(f"Erreur contrôle spectral: {e}")
+            
+            with self._spectral_condition:
+                # Échéances accumulées pendant le calcul : un seul lot suffit
+                self._spectral_done = max(self._spectral_done, target)
+                self._spectral_condition.notify_all()
+    
+    def submit_spectrum(self, freqs: np.ndarray, power: np.ndarray, channels: Optional[List[int]] = None) -> bool:
+        """
+        Fournit le spectre déjà calculé pour l'affichage, réutilisé par le
+        prochain contrôle spectral planifié au lieu d'une nouvelle FFT
+        
+        Seul un spectre de même résolution que le contrôle planifié
+        (spectral_window_size échantillons) est retenu ; les autres sont
+        ignorés et la FFT par lot est calculée comme d'habitude.
+        
+        Args:
+            freqs: Fréquences [Hz] (sortie de fftfreq ou rfftfreq ; le bin
+                continu et les fréquences négatives sont ignorés)
+            power: Densité ou puissance (n_channels, n_freqs) ou (n_freqs,)
+            channels: Canal de chaque ligne de power (0..n-1 par défaut)
+        
+        Returns:
+            True si le spectre sera réutilisé
+        """
+        freqs = np.asarray(freqs)
+        resolution = self.sampling_rate / self.spectral_window_size
+        if len(freqs) < 2 or not np.isclose(freqs[1] - freqs[0], resolution):
+            return False
+        power = np.atleast_2d(power)
+        if channels is None:
+            channels = list(range(power.shape[0]))
+        self._live_spectrum = (freqs, power, list(channels))
+        return True
+    
+    def run_spectral_checks(self, timestamp: Optional[datetime] = None) -> List[ValidationResult]:
+        """
+        Contrôle spectral de tous les canaux concernés en un seul lot
+        
+        Réutilise le dernier spectre soumis par submit_spectrum s'il couvre
+        les canaux concernés, sinon calcule une FFT 2-D (canaux x fenêtre de
+        Hann) sur l'historique récent. Appelé par le thread spectral toutes
+        les spectral_interval secondes de données ; le résultat de la règle
+        SPECTRAL_ANALYSIS n'est produit que par ce chemin. Seule la copie de
+        l'historique se fait sous le verrou des canaux.
+        """
+        timestamp = timestamp or datetime.now()
+        with self._lock:
+            validators = [v for v in self.channel_validators.values() if v.spectral_check_enabled]
+            live, self._live_spectrum = self._live_spectrum, None
+            if not validators:
+                return []
+            
+            channels = [v.config.channel for v in validators]
+            data = None
+            if live is None or not set(channels) <= set(live[2]):
+                n_samples = min(self.spectral_window_size, min(len(v.data_history) for v in validators))
+                if n_samples < self.spectral_min_samples:
+                    return []
+                data = np.stack([v.recent_data(n_samples) for v in validators])
+        
+        if data is None:
+            freqs, power, live_channels = live
+            power = power[[live_channels.index(c) for c in channels]]
+        else:
+            n_samples = data.shape[1]
+            data = np.nan_to_num(data - data.mean(axis=1, keepdims=True))
+            power = np.abs(np.fft.rfft(data * np.hanning(n_samples), axis=1)) ** 2
+            freqs = np.fft.rfftfreq(n_samples, 1.0 / self.sampling_rate)
+        
+        # Bin continu exclu : un offset ne doit pas masquer l'énergie de la bande
+        positive = freqs > 0
+        freqs, power = freqs[positive], power[:, positive]
+        total_energy = power.sum(axis=1)
+        
+        results = []
+        for row, validator in enumerate(validators):
+            freq_min, freq_max = validator.config.expected_frequency_range
+            band = (freqs >= freq_min) & (freqs <= freq_max)
+            if not band.any():
+                continue
+            energy_ratio = power[row, band].sum() / total_energy[row] if total_energy[row] > 0 else 0.0
+            if energy_ratio < self.spectral_min_energy_ratio:
+                with self._lock:
+                    validator.warning_count += 1
+                results.append(ValidationResult(
+                    rule_type=ValidationRule.SPECTRAL_ANALYSIS,
+                    level=ValidationLevel.WARNING,
+                    message=f"Énergie spectrale faible dans la bande attendue: {energy_ratio:.1%}",
+                    channel=validator.config.channel,
+                    timestamp=timestamp,
+                    metadata={
+                        'energy_ratio': float(energy_ratio),
+                        'frequency_range': validator.config.expected_frequency_range
+                    }
+                ))
+        return results
+    
     def add_result_callback(self, callback: Callable[[ValidationResult], None]):
         """Ajoute un callback pour les résultats de validation"""
         self.result_callbacks.append(callback)
@@ -508,14 +1159,13 @@ class DataValidator:
     
     def clear_history(self):
         """Efface l'historique de validation"""
-        self.global_results.clear()
-        for validator in self.channel_validators.values():
-            validator.data_history.clear()
-            validator.timestamp_history.clear()
-            validator.total_samples = 0
-            validator.error_count = 0
-            validator.warning_count = 0
-        self.sample_count = 0
+        with self._lock:
+            self.global_results.clear()
+            for validator in self.channel_validators.values():
+                validator.reset()
+            self.sample_count = 0
+            self._samples_since_spectral = 0
+            self._live_spectrum = None
         print("Historique de validation effacé")
 
 # Factory functions
@@ -14,9 +14,12 @@ from dataclasses import dataclass
 from datetime import datetime
 import json
 
+from .performance_monitor import get_performance_monitor
+
 # Imports conditionnels pour les formats d'export
 try:
     import h5py
+    from ..utils.hdf_pyramid import MinMaxPyramid
     HDF5_AVAILABLE = True
 except ImportError:
     HDF5_AVAILABLE = False
@@ -37,6 +40,7 @@ class ExportConfig:
     metadata: Dict[str, Any]
     compression: bool = True
     chunk_size: int = 1000
+    build_pyramid: bool = True  # Pyramide min/max pour le zoom (HDF5)
     
     # Métadonnées spécifiques CHNeoWave
     session_info: Dict[str, Any] = None
@@ -76,12 +80,13 @@ class ExportManager:
             return False
         
         try:
-            if config.format == 'hdf5':
-                return self._export_hdf5(data, config)
-            elif config.format == 'tdms':
-                return self._export_tdms(data, config)
-            else:
-                return False
+            with get_performance_monitor().span('disk_write', items=data.size):
+                if config.format == 'hdf5':
+                    return self._export_hdf5(data, config)
+                elif config.format == 'tdms':
+                    return self._export_tdms(data, config)
+                else:
+                    return False
         except Exception as e:
             print(f"Erreur lors de l'export {config.format}: {e}")
             return False
@@ -119,6 +124,9 @@ class ExportManager:
                 data_group[dataset_name].attrs['channel_index'] = ch
                 data_group[dataset_name].attrs['unit'] = 'V'  # Volts par défaut
                 data_group[dataset_name].attrs['sensor_type'] = 'wave_probe'
+                
+                if config.build_pyramid:
+                    MinMaxPyramid.build(f, f'acquisition_data/{dataset_name}')
             
             # Métadonnées globales
             metadata_group = f.create_group('metadata')
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Index de recherche des métadonnées de session
+
+Les champs courants des fichiers JSON de métadonnées (type d'expérience et
+de houle, Hs, Tp, profondeur, date, opérateur...) sont copiés dans une table
+SQLite indexée, placée à côté des fichiers. L'index est rafraîchi de façon
+incrémentale : seuls les fichiers dont la date ou la taille a changé sont
+relus (en JSON brut, sans reconstruire les dataclasses) et les fichiers
+disparus sont retirés.
+
+Critères de recherche : `champ=valeur` (égalité), `champ__gte`, `__gt`,
+`__lte`, `__lt` (intervalle), `champ__in` (liste), `champ__contains`
+(sous-chaîne, insensible à la casse) et `text` (recherche dans le nom, la
+description, l'opérateur, le projet, le laboratoire, le numéro d'essai, le
+spectre et les étiquettes).
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".metadata_index.sqlite"
+
+# Version du schéma (PRAGMA user_version)
+SCHEMA_VERSION = 1
+
+# Champ indexé -> type SQL
+INDEXED_FIELDS = {
+    'session_id': 'TEXT',
+    'session_name': 'TEXT',
+    'created_at': 'TEXT',
+    'experiment_type': 'TEXT',
+    'wave_type': 'TEXT',
+    'significant_height': 'REAL',
+    'peak_period': 'REAL',
+    'water_depth': 'REAL',
+    'spectrum_type': 'TEXT',
+    'operator': 'TEXT',
+    'laboratory': 'TEXT',
+    'project_name': 'TEXT',
+    'test_number': 'TEXT',
+    'validation_status': 'TEXT',
+    'total_samples': 'INTEGER',
+}
+
+# Raccourcis usuels
+FIELD_ALIASES = {'hs': 'significant_height', 'tp': 'peak_period', 'depth': 'water_depth', 'date': 'created_at'}
+
+_OPERATORS = {'gte': '>=', 'gt': '>', 'lte': '<=', 'lt': '<'}
+
+_TEXT_FIELDS = ('session_name', 'experiment_description', 'operator', 'project_name',
+                'laboratory', 'test_number')
+
+
+def _index_row(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Champs indexés d'un dictionnaire SessionMetadata.to_dict()"""
+    wave = data.get('wave_conditions') or {}
+    row = {name: data.get(name) for name in INDEXED_FIELDS}
+    for name in ('wave_type', 'significant_height', 'peak_period', 'water_depth', 'spectrum_type'):
+        row[name] = wave.get(name)
+    words = [str(data.get(name) or '') for name in _TEXT_FIELDS]
+    words += [str(wave.get('spectrum_type') or '')] + [str(tag) for tag in data.get('tags') or []]
+    row['search_text'] = ' '.join(word for word in words if word).lower()
+    return row
+
+
+def _sql_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class MetadataIndex:
+    """
+    Index SQLite des fichiers de métadonnées d'un répertoire
+
+    Args:
+        directory: Répertoire des fichiers JSON
+        pattern: Motif des fichiers indexés
+        db_path: Fichier de l'index (par défaut dans le répertoire)
+    """
+
+    def __init__(self, directory: Union[str, Path], pattern: str = "*.json",
+                 db_path: Optional[Union[str, Path]] = None):
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.db_path = Path(db_path) if db_path else self.directory / INDEX_FILENAME
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        columns = ',\n'.join(f"    {name} {sql_type}" for name, sql_type in INDEXED_FIELDS.items())
+        with self._lock, self._conn:
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS sessions")
+            self._conn.executescript(f"""
+CREATE TABLE IF NOT EXISTS sessions (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+{columns},
+    search_text TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_meta_experiment ON sessions(experiment_type);
+CREATE INDEX IF NOT EXISTS idx_meta_wave_hs ON sessions(wave_type, significant_height);
+CREATE INDEX IF NOT EXISTS idx_meta_hs ON sessions(significant_height);
+CREATE INDEX IF NOT EXISTS idx_meta_tp ON sessions(peak_period);
+CREATE INDEX IF NOT EXISTS idx_meta_depth ON sessions(water_depth);
+CREATE INDEX IF NOT EXISTS idx_meta_created ON sessions(created_at);
+CREATE INDEX IF NOT EXISTS idx_meta_operator ON sessions(operator);
+""")
+            self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Met l'index à jour depuis le répertoire
+
+        Returns:
+            Nombres de fichiers ajoutés ou modifiés, retirés et en erreur
+        """
+        on_disk = {}
+        for path in self.directory.glob(self.pattern):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            on_disk[str(path)] = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            known = {row['path']: (row['mtime_ns'], row['size'])
+                     for row in self._conn.execute("SELECT path, mtime_ns, size FROM sessions")}
+
+        changed, errors = [], 0
+        for path, signature in on_disk.items():
+            if known.get(path) == signature:
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    row = _index_row(json.load(f))
+            except (OSError, ValueError, AttributeError) as e:
+                logger.warning(f"Métadonnées non indexées {path}: {e}")
+                errors += 1
+                continue
+            row.update(path=path, mtime_ns=signature[0], size=signature[1])
+            changed.append(row)
+        removed = [(path,) for path in known if path not in on_disk]
+
+        if changed or removed:
+            names = ['path', 'mtime_ns', 'size', *INDEXED_FIELDS, 'search_text']
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO sessions ({', '.join(names)}) "
+                    f"VALUES ({', '.join('?' * len(names))})",
+                    [tuple(row[name] for name in names) for row in changed]
+                )
+                self._conn.executemany("DELETE FROM sessions WHERE path = ?", removed)
+            logger.debug(f"Index des métadonnées: {len(changed)} mis à jour, {len(removed)} retirés")
+        return {'updated': len(changed), 'removed': len(removed), 'errors': errors}
+
+    @staticmethod
+    def is_indexed(criterion: str) -> bool:
+        """Vrai si le critère peut être évalué par l'index"""
+        name = criterion.split('__', 1)[0]
+        return criterion == 'text' or FIELD_ALIASES.get(name, name) in INDEXED_FIELDS
+
+    def _where(self, criteria: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        for criterion, value in criteria.items():
+            if criterion == 'text':
+                for word in str(value).lower().split():
+                    clauses.append("search_text LIKE ? ESCAPE '\\'")
+                    params.append(f"%{_escape_like(word)}%")
+                continue
+            name, _, operator = criterion.partition('__')
+            column = FIELD_ALIASES.get(name, name)
+            if column not in INDEXED_FIELDS:
+                raise ValueError(f"Champ non indexé: {name}")
+            if not operator:
+                if value is None:
+                    clauses.append(f"{column} IS NULL")
+                else:
+                    clauses.append(f"{column} = ?")
+                    params.append(_sql_value(value))
+            elif operator in _OPERATORS:
+                clauses.append(f"{column} {_OPERATORS[operator]} ?")
+                params.append(_sql_value(value))
+            elif operator == 'in':
+                values = [_sql_value(item) for item in value]
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})" if values else "0")
+                params.extend(values)
+            elif operator == 'contains':
+                clauses.append(f"lower({column}) LIKE ? ESCAPE '\\'")
+                params.append(f"%{_escape_like(str(value).lower())}%")
+            else:
+                raise ValueError(f"Opérateur de recherche inconnu: {operator}")
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def query(self, order_by: str = 'created_at', limit: Optional[int] = None,
+              **criteria) -> List[Dict[str, Any]]:
+        """
+        Entrées de l'index correspondant aux critères (sans relire les fichiers)
+
+        Returns:
+            Dictionnaires {path, champs indexés}
+        """
+        where, params = self._where(criteria)
+        column = FIELD_ALIASES.get(order_by.lstrip('-'), order_by.lstrip('-'))
+        if column not in INDEXED_FIELDS:
+            raise ValueError(f"Tri impossible sur {order_by}")
+        direction = 'DESC' if order_by.startswith('-') else 'ASC'
+        query = f"SELECT path, {', '.join(INDEXED_FIELDS)} FROM sessions{where} ORDER BY {column} {direction}, path"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(query, params)]
+
+
+def _escape_like(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
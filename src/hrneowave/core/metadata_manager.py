@@ -14,6 +14,8 @@ from dataclasses import dataclass, asdict, field
 from enum import Enum
 import hashlib
 
+from .metadata_index import MetadataIndex
+
 # Import conditionnel pour la validation de schéma
 try:
     import jsonschema
@@ -304,6 +306,9 @@ class MetadataManager:
         
         # Schéma JSON pour validation (si disponible)
         self.schema = self._create_json_schema() if JSONSCHEMA_AVAILABLE else None
+
+        # Index de recherche, rafraîchi avant chaque recherche
+        self.index = MetadataIndex(self.base_path)
     
     def create_session(self, session_name: str = "", 
                       experiment_type: ExperimentType = ExperimentType.OTHER) -> SessionMetadata:
@@ -364,69 +369,57 @@ class MetadataManager:
         return list(self.base_path.glob(pattern))
     
     def search_sessions(self, **criteria) -> List[SessionMetadata]:
-        """Recherche des sessions selon des critères"""
+        """
+        Recherche des sessions selon des critères
+
+        Les critères portant sur les champs indexés (voir metadata_index) sont
+        évalués par l'index : `wave_type='jonswap'`, `hs__gte=0.1`,
+        `created_at__lt=datetime(...)`, `text='bassin'`... Seules les sessions
+        retenues sont chargées ; les autres attributs de SessionMetadata sont
+        ensuite comparés par égalité.
+        """
+        indexed = {key: value for key, value in criteria.items() if MetadataIndex.is_indexed(key)}
+        remaining = {key: value for key, value in criteria.items() if key not in indexed}
+
+        self.index.refresh()
         sessions = []
-        
-        for file_path in self.list_sessions():
+        for entry in self.index.query(**indexed):
             try:
-                metadata = self.load_metadata(file_path)
-                
-                # Vérifier les critères
-                match = True
-                for key, value in criteria.items():
-                    if hasattr(metadata, key):
-                        attr_value = getattr(metadata, key)
-                        
-                        # Gérer les comparaisons d'enum
-                        if isinstance(attr_value, Enum) and isinstance(value, Enum):
-                            # Comparer les enums directement
-                            if attr_value != value:
-                                match = False
-                                break
-                        elif isinstance(attr_value, Enum):
-                            # Comparer enum avec valeur
-                            if attr_value.value != value:
-                                match = False
-                                break
-                        elif isinstance(value, Enum):
-                            # Comparer valeur avec enum
-                            if attr_value != value.value:
-                                match = False
-                                break
-                        else:
-                            # Comparaison normale
-                            if attr_value != value:
-                                match = False
-                                break
-                
-                if match:
-                    sessions.append(metadata)
-                    
+                metadata = self.load_metadata(entry['path'])
             except Exception as e:
-                print(f"Erreur lecture métadonnées {file_path}: {e}")
-        
+                print(f"Erreur lecture métadonnées {entry['path']}: {e}")
+                continue
+            if self._matches(metadata, remaining):
+                sessions.append(metadata)
+
         return sessions
+
+    @staticmethod
+    def _matches(metadata: SessionMetadata, criteria: Dict[str, Any]) -> bool:
+        """Égalité des attributs, enums comparés par valeur"""
+        for key, value in criteria.items():
+            if not hasattr(metadata, key):
+                continue
+            attr_value = getattr(metadata, key)
+            if isinstance(attr_value, Enum) and not isinstance(value, Enum):
+                attr_value = attr_value.value
+            elif isinstance(value, Enum) and not isinstance(attr_value, Enum):
+                value = value.value
+            if attr_value != value:
+                return False
+        return True
     
     def export_metadata_summary(self, output_path: Union[str, Path]) -> bool:
         """Exporte un résumé de toutes les sessions"""
         try:
             sessions = []
             
-            for file_path in self.list_sessions():
-                try:
-                    metadata = self.load_metadata(file_path)
-                    summary = {
-                        'session_id': metadata.session_id,
-                        'session_name': metadata.session_name,
-                        'created_at': metadata.created_at.isoformat(),
-                        'experiment_type': metadata.experiment_type.value,
-                        'operator': metadata.operator,
-                        'total_samples': metadata.total_samples,
-                        'validation_status': metadata.validation_status
-                    }
-                    sessions.append(summary)
-                except Exception as e:
-                    print(f"Erreur lecture {file_path}: {e}")
+            # Résumé lu dans l'index, sans recharger chaque session
+            self.index.refresh()
+            fields = ('session_id', 'session_name', 'created_at', 'experiment_type',
+                      'operator', 'total_samples', 'validation_status')
+            for entry in self.index.query():
+                sessions.append({name: entry[name] for name in fields})
             
             with open(output_path, 'w', encoding='utf-8') as f:
                 json.dump(sessions, f, indent=2, ensure_ascii=False)
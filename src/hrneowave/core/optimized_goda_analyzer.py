@@ -211,9 +211,9 @@ class OptimizedGodaAnalyzer:
         Returns:
             Solution [Ai, Ar] (amplitudes incidente et réfléchie)
         """
-        # Pseudo-inverse via SVD: A⁺ = V @ diag(1/s) @ Uᵀ
+        # Pseudo-inverse via SVD: A⁺ = V @ diag(1/s) @ Uᴴ (A est complexe)
         s_inv = 1.0 / s
-        A_pinv = Vt.T @ np.diag(s_inv) @ U.T
+        A_pinv = Vt.conj().T @ np.diag(s_inv) @ U.conj().T
 
         # Solution des moindres carrés
         solution = A_pinv @ measurements
@@ -334,6 +334,68 @@ def create_analyzer_from_positions(
     return OptimizedGodaAnalyzer(geometry)
 
 
+def reflection_coefficient(
+    data: np.ndarray,
+    sample_rate: float,
+    positions: List[float],
+    water_depth: float,
+    frequency_band: Optional[Tuple[float, float]] = None,
+    energy_threshold: float = 0.01,
+) -> Dict[str, float]:
+    """
+    Coefficient de réflexion global sur la bande énergétique du spectre
+
+    Args:
+        data: Signaux des sondes (sondes x échantillons), dans l'ordre de positions
+        sample_rate: Fréquence d'échantillonnage [Hz]
+        positions: Positions des sondes [m]
+        water_depth: Profondeur d'eau [m]
+        frequency_band: Bande d'analyse [Hz] ; sinon fréquences dont
+            l'énergie dépasse energy_threshold x pic
+
+    Returns:
+        {'kr', 'hm0_incident', 'hm0_reflected'} (NaN si bande vide)
+    """
+    probes = data[: len(positions)]
+    n = probes.shape[1]
+    coefficients = 2.0 * np.fft.rfft(probes - probes.mean(axis=1, keepdims=True), axis=1) / n
+    freqs = np.fft.rfftfreq(n, 1.0 / sample_rate)
+
+    if frequency_band:
+        fmin, fmax = frequency_band
+        band = (freqs >= fmin) & (freqs <= fmax)
+    else:
+        energy = np.mean(np.abs(coefficients) ** 2, axis=0)
+        band = energy >= energy_threshold * energy[1:].max()
+    band[0] = False
+    indices = np.flatnonzero(band)
+    if not len(indices):
+        return {"kr": np.nan, "hm0_incident": np.nan, "hm0_reflected": np.nan}
+
+    analyzer = OptimizedGodaAnalyzer(
+        ProbeGeometry(
+            positions=positions,
+            water_depth=water_depth,
+            frequency_range=(freqs[indices[0]], freqs[indices[-1]]),
+        ),
+        enable_cache=False,
+    )
+    incident = reflected = 0.0
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for i in indices:
+            # numpy : onde incidente (+x) en exp(-ikx), conjuguée pour la convention de l'analyseur
+            components = analyzer.analyze_frequency(np.conj(coefficients[:, i]), freqs[i])
+            incident += components.incident_amplitude**2 / 2
+            reflected += components.reflected_amplitude**2 / 2
+
+    return {
+        "kr": float(np.sqrt(reflected / incident)) if incident > 0 else np.nan,
+        "hm0_incident": float(4.0 * np.sqrt(incident)),
+        "hm0_reflected": float(4.0 * np.sqrt(reflected)),
+    }
+
+
 # Exemple d'utilisation
 if __name__ == "__main__":
     import time
@@ -4,9 +4,11 @@ Module de monitoring des performances pour CHNeoWave
 Collecte et surveille les métriques système en temps réel
 """
 
+import math
 import time
 import psutil
 import threading
+from collections import deque
 from typing import Dict, Any, Optional, Callable, List
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -15,6 +17,10 @@ import json
 import logging
 from enum import Enum
 
+from .tracing import get_tracer
+
+_tracer = get_tracer()
+
 # Import conditionnel pour Qt
 try:
     from PySide6.QtCore import QObject, Signal
@@ -92,6 +98,149 @@ class PerformanceThresholds:
     disk_critical: float = 95.0
     threads_warning: int = 100
     threads_critical: int = 200
+    
+    # Seuils de latence p99 par étape du pipeline (ms), ex. {'fft': 20.0}
+    stage_p99_warning_ms: Dict[str, float] = field(default_factory=dict)
+    stage_p99_critical_ms: Dict[str, float] = field(default_factory=dict)
+    
+    # Seuils sur les valeurs observées (dernière valeur), ex. {'buffer_fill': 0.8}
+    observed_warning: Dict[str, float] = field(default_factory=dict)
+    observed_critical: Dict[str, float] = field(default_factory=dict)
+
+# Étapes instrumentées du pipeline d'acquisition
+PIPELINE_STAGES = ('read', 'calibrate', 'buffer_write', 'validate', 'fft', 'plot', 'disk_write')
+
+class LatencyHistogram:
+    """
+    Histogramme de latences à buckets logarithmiques
+    
+    BUCKETS_PER_DECADE buckets par décade entre MIN_LATENCY et MAX_LATENCY :
+    enregistrement en O(1), percentiles avec une erreur relative bornée
+    (~12 % pour 20 buckets par décade), mémoire constante quelle que soit la
+    durée de la session.
+    """
+    
+    MIN_LATENCY = 1e-6   # 1 µs
+    MAX_LATENCY = 100.0  # 100 s
+    BUCKETS_PER_DECADE = 20
+    
+    def __init__(self, name: str = ""):
+        self.name = name
+        self._n_buckets = int(math.log10(self.MAX_LATENCY / self.MIN_LATENCY) * self.BUCKETS_PER_DECADE) + 2
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Remet l'histogramme à zéro"""
+        with self._lock:
+            self._counts = [0] * self._n_buckets
+            self.count = 0
+            self.items = 0
+            self.total = 0.0
+            self.max = 0.0
+            self.min = math.inf
+            self._started = None
+    
+    def _bucket(self, seconds: float) -> int:
+        if seconds < self.MIN_LATENCY:
+            return 0
+        index = int(math.log10(seconds / self.MIN_LATENCY) * self.BUCKETS_PER_DECADE) + 1
+        return min(index, self._n_buckets - 1)
+    
+    def _upper_edge(self, index: int) -> float:
+        return self.MIN_LATENCY * 10 ** (index / self.BUCKETS_PER_DECADE)
+    
+    def record(self, seconds: float, items: int = 1):
+        """Enregistre une durée (secondes) et le nombre d'éléments traités"""
+        index = self._bucket(seconds)
+        with self._lock:
+            if self._started is None:
+                self._started = time.monotonic()
+            self._counts[index] += 1
+            self.count += 1
+            self.items += items
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+            if seconds < self.min:
+                self.min = seconds
+    
+    def percentile(self, q: float) -> float:
+        """Percentile q (0-100) en secondes (borne haute du bucket, plafonnée au max)"""
+        with self._lock:
+            if self.count == 0:
+                return 0.0
+            rank = max(1, math.ceil(q / 100.0 * self.count))
+            cumulative = 0
+            for index, n in enumerate(self._counts):
+                cumulative += n
+                if cumulative >= rank:
+                    if index == self._n_buckets - 1:
+                        return self.max  # bucket de débordement
+                    return min(max(self._upper_edge(index), self.min), self.max)
+            return self.max
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Résumé : nombre, percentiles et débit (éléments/s depuis la première mesure)"""
+        p50, p90, p99 = self.percentile(50), self.percentile(90), self.percentile(99)
+        with self._lock:
+            elapsed = time.monotonic() - self._started if self._started is not None else 0.0
+            return {
+                'count': self.count,
+                'items': self.items,
+                'mean_ms': 1000.0 * self.total / self.count if self.count else 0.0,
+                'p50_ms': 1000.0 * p50,
+                'p90_ms': 1000.0 * p90,
+                'p99_ms': 1000.0 * p99,
+                'max_ms': 1000.0 * self.max,
+                'throughput_per_s': self.items / elapsed if elapsed > 0 else 0.0,
+                'busy_percent': 100.0 * self.total / elapsed if elapsed > 0 else 0.0
+            }
+
+class ObservedValue:
+    """Suivi d'une grandeur observée (dernière valeur, min, max, moyenne)"""
+    
+    def __init__(self, name: str = ""):
+        self.name = name
+        self.count = 0
+        self.last = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.mean = 0.0
+    
+    def update(self, value: float):
+        """Ajoute une observation"""
+        self.count += 1
+        self.last = value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.mean += (value - self.mean) / self.count
+    
+    def snapshot(self) -> Dict[str, float]:
+        """Résumé de la grandeur"""
+        if not self.count:
+            return {'count': 0}
+        return {'count': self.count, 'last': self.last, 'min': self.min, 'max': self.max, 'mean': self.mean}
+
+class _Span:
+    """Mesure de la durée d'un bloc `with` (perf_counter_ns), tracée si le traçage est actif"""
+    
+    __slots__ = ('_histogram', '_items', '_start')
+    
+    def __init__(self, histogram: LatencyHistogram, items: int):
+        self._histogram = histogram
+        self._items = items
+    
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        end = time.perf_counter_ns()
+        self._histogram.record((end - self._start) * 1e-9, self._items)
+        if _tracer.enabled:
+            _tracer.record(self._histogram.name, self._start, end)
+        return False
 
 @dataclass
 class Alert:
@@ -168,9 +317,16 @@ class PerformanceMonitor(QObject):
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
         
-        # Stockage des données
-        self._metrics_history: List[PerformanceMetrics] = []
-        self._alerts_history: List[Alert] = []
+        # Stockage des données (historiques bornés)
+        self._metrics_history = deque(maxlen=max_history_size)
+        self._alerts_history = deque(maxlen=max_history_size)
+        
+        # Instrumentation du pipeline
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._observations: Dict[str, ObservedValue] = {}
+        self._counters: Dict[str, int] = {}
+        self._counters_started = time.monotonic()
+        self._instrumentation_lock = threading.Lock()
         
         # Callbacks pour les alertes
         self._alert_callbacks: List[Callable[[Alert], None]] = []
@@ -180,6 +336,9 @@ class PerformanceMonitor(QObject):
         
         # Métriques de base du processus
         self._process = psutil.Process()
+        
+        # Amorce de la mesure CPU non bloquante (intervalle entre deux collectes)
+        psutil.cpu_percent(interval=None)
     
     @property
     def is_monitoring(self) -> bool:
@@ -237,13 +396,9 @@ class PerformanceMonitor(QObject):
                 # Collecter les métriques
                 metrics = self._collect_metrics()
                 
-                # Stocker dans l'historique
+                # Stocker dans l'historique (deque bornée)
                 with self._lock:
                     self._metrics_history.append(metrics)
-                    
-                    # Limiter la taille de l'historique
-                    if len(self._metrics_history) > self.max_history_size:
-                        self._metrics_history.pop(0)
                 
                 # Émettre le signal de mise à jour des métriques
                 if QT_AVAILABLE:
@@ -251,6 +406,7 @@ class PerformanceMonitor(QObject):
                 
                 # Vérifier les seuils et générer des alertes
                 alerts = self._check_thresholds(metrics)
+                alerts.extend(self._check_pipeline_thresholds())
                 
                 for alert in alerts:
                     self._handle_alert(alert)
@@ -267,8 +423,8 @@ class PerformanceMonitor(QObject):
             
     def _collect_metrics(self) -> PerformanceMetrics:
         """Collecte les métriques système actuelles"""
-        # Métriques CPU
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        # Métriques CPU (non bloquant : moyenne depuis la collecte précédente)
+        cpu_percent = psutil.cpu_percent(interval=None)
         
         # Métriques mémoire
         memory = psutil.virtual_memory()
@@ -378,15 +534,128 @@ class PerformanceMonitor(QObject):
             
         return alerts
         
+    def _check_pipeline_thresholds(self) -> List[Alert]:
+        """Vérifie les seuils de latence par étape et de valeurs observées"""
+        alerts = []
+        thresholds = self.thresholds
+        
+        for stage, stats in self.get_stage_statistics().items():
+            p99 = stats['p99_ms']
+            critical = thresholds.stage_p99_critical_ms.get(stage)
+            warning = thresholds.stage_p99_warning_ms.get(stage)
+            if critical is not None and p99 >= critical:
+                alerts.append(Alert(
+                    level=AlertLevel.CRITICAL,
+                    metric=f"{stage}.p99_ms",
+                    value=p99,
+                    threshold=critical,
+                    message=f"Latence p99 critique pour l'étape {stage}: {p99:.2f} ms"
+                ))
+            elif warning is not None and p99 >= warning:
+                alerts.append(Alert(
+                    level=AlertLevel.WARNING,
+                    metric=f"{stage}.p99_ms",
+                    value=p99,
+                    threshold=warning,
+                    message=f"Latence p99 élevée pour l'étape {stage}: {p99:.2f} ms"
+                ))
+        
+        for name, stats in self.get_observations().items():
+            if not stats['count']:
+                continue
+            value = stats['last']
+            critical = thresholds.observed_critical.get(name)
+            warning = thresholds.observed_warning.get(name)
+            if critical is not None and value >= critical:
+                alerts.append(Alert(
+                    level=AlertLevel.CRITICAL,
+                    metric=name,
+                    value=value,
+                    threshold=critical,
+                    message=f"Valeur critique pour {name}: {value:.3g}"
+                ))
+            elif warning is not None and value >= warning:
+                alerts.append(Alert(
+                    level=AlertLevel.WARNING,
+                    metric=name,
+                    value=value,
+                    threshold=warning,
+                    message=f"Valeur élevée pour {name}: {value:.3g}"
+                ))
+        
+        return alerts
+    
+    def _histogram(self, stage: str) -> LatencyHistogram:
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            with self._instrumentation_lock:
+                histogram = self._histograms.setdefault(stage, LatencyHistogram(stage))
+        return histogram
+    
+    def span(self, stage: str, items: int = 1) -> _Span:
+        """
+        Mesure la durée d'une étape du pipeline
+        
+        Example:
+            >>> with monitor.span("fft", items=n_samples):
+            ...     spectrum = np.fft.rfft(block)
+        
+        Args:
+            stage: Nom de l'étape (voir PIPELINE_STAGES)
+            items: Nombre d'éléments traités (échantillons, blocs...) pour le débit
+        """
+        return _Span(self._histogram(stage), items)
+    
+    def record_latency(self, stage: str, seconds: float, items: int = 1):
+        """Enregistre une durée mesurée ailleurs pour une étape (qui vient de se terminer)"""
+        self._histogram(stage).record(seconds, items)
+        if _tracer.enabled:
+            _tracer.record_duration(stage, seconds)
+    
+    def observe(self, name: str, value: float):
+        """Enregistre la valeur courante d'une grandeur (ex. 'buffer_fill')"""
+        observation = self._observations.get(name)
+        if observation is None:
+            with self._instrumentation_lock:
+                observation = self._observations.setdefault(name, ObservedValue(name))
+        observation.update(float(value))
+    
+    def count(self, name: str, n: int = 1):
+        """Incrémente un compteur de débit (ex. 'samples_acquired')"""
+        with self._instrumentation_lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+    
+    def get_stage_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Percentiles de latence et débit par étape"""
+        return {stage: histogram.snapshot() for stage, histogram in list(self._histograms.items())}
+    
+    def get_observations(self) -> Dict[str, Dict[str, float]]:
+        """Résumé des grandeurs observées"""
+        return {name: observation.snapshot() for name, observation in list(self._observations.items())}
+    
+    def get_counters(self) -> Dict[str, Dict[str, float]]:
+        """Totaux et débits des compteurs depuis leur remise à zéro"""
+        elapsed = time.monotonic() - self._counters_started
+        with self._instrumentation_lock:
+            counters = dict(self._counters)
+        return {
+            name: {'total': total, 'rate_per_s': total / elapsed if elapsed > 0 else 0.0}
+            for name, total in counters.items()
+        }
+    
+    def reset_instrumentation(self):
+        """Remet à zéro histogrammes, observations et compteurs"""
+        with self._instrumentation_lock:
+            self._histograms.clear()
+            self._observations.clear()
+            self._counters.clear()
+            self._counters_started = time.monotonic()
+    
     def _handle_alert(self, alert: Alert):
         """Traite une alerte générée"""
         # Stocker l'alerte
         with self._lock:
             self._alerts_history.append(alert)
-            
-            # Limiter l'historique des alertes
-            if len(self._alerts_history) > self.max_history_size:
-                self._alerts_history.pop(0)
         
         # Logger l'alerte
         if alert.level == AlertLevel.CRITICAL:
@@ -433,7 +702,7 @@ class PerformanceMonitor(QObject):
                            end_time: Optional[datetime] = None) -> List[PerformanceMetrics]:
         """Retourne l'historique des métriques dans une plage de temps ou limité en nombre"""
         with self._lock:
-            history = self._metrics_history.copy()
+            history = list(self._metrics_history)
             
         # Filtrer par temps si spécifié
         if start_time or end_time:
@@ -457,7 +726,7 @@ class PerformanceMonitor(QObject):
                           start_time: Optional[datetime] = None) -> List[Alert]:
         """Retourne l'historique des alertes"""
         with self._lock:
-            alerts = self._alerts_history.copy()
+            alerts = list(self._alerts_history)
             
         if level or start_time:
             filtered_alerts = []
@@ -520,7 +789,12 @@ class PerformanceMonitor(QObject):
             },
             "recent_alerts": alert_counts,
             "total_metrics_collected": len(self._metrics_history),
-            "monitoring_duration": self.collection_interval * len(self._metrics_history)
+            "monitoring_duration": self.collection_interval * len(self._metrics_history),
+            "pipeline": {
+                "stages": self.get_stage_statistics(),
+                "observations": self.get_observations(),
+                "counters": self.get_counters()
+            }
         }
         
     def export_metrics(self, file_path: Path, 
@@ -592,7 +866,11 @@ def initialize_performance_monitoring(config: Optional[Dict[str, Any]] = None) -
             disk_warning=threshold_config.get('disk_warning', 80.0),
             disk_critical=threshold_config.get('disk_critical', 95.0),
             threads_warning=threshold_config.get('threads_warning', 100),
-            threads_critical=threshold_config.get('threads_critical', 200)
+            threads_critical=threshold_config.get('threads_critical', 200),
+            stage_p99_warning_ms=dict(threshold_config.get('stage_p99_warning_ms', {})),
+            stage_p99_critical_ms=dict(threshold_config.get('stage_p99_critical_ms', {})),
+            observed_warning=dict(threshold_config.get('observed_warning', {})),
+            observed_critical=dict(threshold_config.get('observed_critical', {}))
         )
     
     # Créer le moniteur
@@ -1,9 +1,12 @@
 # post_processor.py - Module de post-traitement pour l'analyse des données de houle
 import os
 import json
+import sqlite3
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 
+from .wave_analysis import channel_statistics, zero_up_crossing
+
 # Variables globales pour les imports Qt conditionnels
 QObject = None
 Signal = None
@@ -25,6 +28,9 @@ def _ensure_qt_imports():
 
 _ensure_qt_imports()
 
+# Version des calculs de run_analysis : à incrémenter si un résultat change
+ANALYSIS_VERSION = 2
+
 class PostProcessor(QObject):
     """Contrôleur pour le post-traitement et l'analyse des données de houle
     
@@ -42,7 +48,12 @@ class PostProcessor(QObject):
     exportCompleted = Signal(str)  # Export terminé
     errorOccurred = Signal(str)  # Erreur
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, cache=None):
+        """
+        Args:
+            config_path: Fichier de configuration JSON
+            cache: Cache des résultats (None : cache partagé, False : désactivé)
+        """
         super().__init__()
         
         # Configuration
@@ -53,6 +64,10 @@ class PostProcessor(QObject):
         self.current_analysis = None
         self.sample_rate = 32.0  # Hz par défaut
         
+        # Cache des résultats : ouvert à la première analyse d'un fichier
+        self._cache = cache
+        self._source: Optional[Tuple[str, Dict]] = None  # (fichier, données chargées)
+        
         print("PostProcessor initialisé")
         
     def _load_config(self, config_path: Optional[str]) -> Dict:
@@ -114,6 +129,7 @@ class PostProcessor(QObject):
                 return False
                 
             self.current_data = data
+            self._source = (file_path, data)
             self.dataLoaded.emit(data)
             
             print(f"Données chargées: {file_path}")
@@ -209,17 +225,22 @@ class PostProcessor(QObject):
             return False
             
         try:
-            analysis_results = {
-                'basic_stats': self._compute_basic_stats(),
-                'spectral_analysis': self._compute_spectral_analysis(),
-                'goda_metrics': self._compute_goda_metrics(),
-                'timestamp': np.datetime64('now').astype(str)
-            }
+            cache_key = self._cache_key()
+            analysis_results = self._cache_get(cache_key)
+            if analysis_results is not None:
+                print("Analyse relue depuis le cache")
+            else:
+                analysis_results = {
+                    'basic_stats': self._compute_basic_stats(),
+                    'spectral_analysis': self._compute_spectral_analysis(),
+                    'goda_metrics': self._compute_goda_metrics(),
+                    'timestamp': np.datetime64('now').astype(str)
+                }
+                self._cache_put(cache_key, analysis_results)
+                print("Analyse terminée")
             
             self.current_analysis = analysis_results
             self.analysisCompleted.emit(analysis_results)
-            
-            print("Analyse terminée")
             return True
             
         except Exception as e:
@@ -228,20 +249,61 @@ class PostProcessor(QObject):
             self.errorOccurred.emit(error_msg)
             return False
             
+    def _result_cache(self):
+        """Cache des résultats, None si désactivé ou indisponible"""
+        if self._cache is False:
+            return None
+        if self._cache is None:
+            from .result_cache import get_result_cache
+            try:
+                self._cache = get_result_cache()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Cache d'analyse indisponible: {e}")
+                self._cache = False
+                return None
+        return self._cache
+        
+    def _cache_key(self) -> Optional[str]:
+        """Clé du résultat : empreinte du fichier chargé, configuration, version du code
+        
+        Pas de clé si les données courantes ne proviennent pas de load_data_file.
+        """
+        if self._source is None or self._source[1] is not self.current_data:
+            return None
+        cache = self._result_cache()
+        if cache is None:
+            return None
+        try:
+            digest = cache.file_digest(self._source[0])
+        except OSError:
+            return None
+        settings = {'config': self.config, 'sample_rate': self.sample_rate}
+        return cache.make_key('post_processor', digest, settings, ANALYSIS_VERSION)
+        
+    def _cache_get(self, key: Optional[str]) -> Optional[Dict]:
+        if key is None:
+            return None
+        try:
+            return self._cache.get(key)
+        except sqlite3.Error as e:
+            print(f"Lecture du cache d'analyse impossible: {e}")
+            return None
+            
+    def _cache_put(self, key: Optional[str], results: Dict):
+        if key is None:
+            return
+        try:
+            self._cache.put(key, results)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Écriture du cache d'analyse impossible: {e}")
+            
     def _compute_basic_stats(self) -> Dict:
         """Calcule les statistiques de base"""
         stats = {}
         
         for channel, data in self.current_data['channels'].items():
-            stats[channel] = {
-                'mean': float(np.mean(data)),
-                'std': float(np.std(data)),
-                'min': float(np.min(data)),
-                'max': float(np.max(data)),
-                'rms': float(np.sqrt(np.mean(data**2))),
-                'skewness': float(self._compute_skewness(data)),
-                'kurtosis': float(self._compute_kurtosis(data))
-            }
+            values = channel_statistics(np.asarray(data, dtype=float))
+            stats[channel] = {key: float(value[0]) for key, value in values.items()}
             
         return stats
         
@@ -279,8 +341,8 @@ class PostProcessor(QObject):
         goda_results = {}
         
         for channel, data in self.current_data['channels'].items():
-            # Calcul des hauteurs de vagues (méthode zero-crossing)
-            wave_heights = self._extract_wave_heights(data)
+            # Vagues délimitées par les passages par zéro ascendants
+            wave_heights, wave_periods = zero_up_crossing(np.asarray(data, dtype=float), self.sample_rate)
             
             if len(wave_heights) > 0:
                 # Trier par ordre décroissant
@@ -295,7 +357,7 @@ class PostProcessor(QObject):
                     'H_rms': float(np.sqrt(np.mean(sorted_heights**2))),
                     'n_waves': int(n_waves),
                     'Tp': self._compute_peak_period(data),
-                    'Tm': self._compute_mean_period(data)
+                    'Tm': float(np.mean(wave_periods))
                 }
             else:
                 goda_results[channel] = {
@@ -305,24 +367,6 @@ class PostProcessor(QObject):
                 
         return goda_results
         
-    def _extract_wave_heights(self, data: np.ndarray) -> np.ndarray:
-        """Extrait les hauteurs de vagues par méthode zero-crossing"""
-        # Détecter les passages par zéro
-        zero_crossings = np.where(np.diff(np.sign(data)))[0]
-        
-        wave_heights = []
-        for i in range(0, len(zero_crossings)-1, 2):
-            if i+1 < len(zero_crossings):
-                start_idx = zero_crossings[i]
-                end_idx = zero_crossings[i+1]
-                wave_segment = data[start_idx:end_idx]
-                
-                if len(wave_segment) > 0:
-                    height = np.max(wave_segment) - np.min(wave_segment)
-                    wave_heights.append(height)
-                    
-        return np.array(wave_heights)
-        
     def _compute_peak_period(self, data: np.ndarray) -> float:
         """Calcule la période de pic"""
         # Analyse spectrale pour trouver la fréquence de pic
@@ -337,32 +381,6 @@ class PostProcessor(QObject):
             return 1.0 / peak_freq if peak_freq > 0 else 0.0
         return 0.0
         
-    def _compute_mean_period(self, data: np.ndarray) -> float:
-        """Calcule la période moyenne"""
-        # Détecter les passages par zéro pour estimer la période
-        zero_crossings = np.where(np.diff(np.sign(data)))[0]
-        
-        if len(zero_crossings) > 1:
-            periods = np.diff(zero_crossings) / self.sample_rate * 2  # *2 car demi-période
-            return float(np.mean(periods))
-        return 0.0
-        
-    def _compute_skewness(self, data: np.ndarray) -> float:
-        """Calcule l'asymétrie (skewness)"""
-        mean = np.mean(data)
-        std = np.std(data)
-        if std > 0:
-            return np.mean(((data - mean) / std) ** 3)
-        return 0.0
-        
-    def _compute_kurtosis(self, data: np.ndarray) -> float:
-        """Calcule l'aplatissement (kurtosis)"""
-        mean = np.mean(data)
-        std = np.std(data)
-        if std > 0:
-            return np.mean(((data - mean) / std) ** 4) - 3.0  # Excès de kurtosis
-        return 0.0
-        
     def export_results(self, output_path: str, format_type: str = 'csv') -> bool:
         """Exporte les résultats d'analyse
         
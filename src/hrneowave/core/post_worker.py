@@ -12,27 +12,35 @@ def _ensure_qt_imports():
             from PyQt6.QtCore import QThread, pyqtSignal as Signal
             return True
         except ImportError:
-            try:
-                from PySide6.QtCore import QThread, Signal
-                return True
-            except ImportError:
-                return False
+            return False
+
+_ensure_qt_imports()
 
 class PostWorker(QThread):
     analysisDone = Signal(dict)
 
-    def __init__(self, file_path: str, config: dict):
-        _ensure_qt_imports()
+    def __init__(self, file_path: str, config: dict, cache=None):
+        """
+        Args:
+            file_path: Fichier de données à analyser (CSV, JSON, HDF5)
+            config: Configuration du PostProcessor ('sample_rate' optionnel)
+            cache: Cache des résultats (None : cache partagé, False : désactivé)
+        """
         super().__init__()
         self.file_path = file_path
         self.config = config
+        self.cache = cache
 
     def run(self):
         """Exécute le post-traitement dans un thread séparé."""
-        from hrneowave.gui.post_processor import PostProcessor
+        from hrneowave.core.post_processor import PostProcessor
         
         # Crée une instance de PostProcessor avec la configuration
-        processor = PostProcessor(config=self.config)
+        processor = PostProcessor(cache=self.cache)
+        config = dict(self.config or {})
+        if 'sample_rate' in config:
+            processor.sample_rate = float(config.pop('sample_rate'))
+        processor.config.update(config)
         
         # Charge les données et exécute l'analyse
         if processor.load_data_file(self.file_path):
@@ -44,4 +52,4 @@ class PostWorker(QThread):
                 self.analysisDone.emit({'error': 'Analysis failed'})
         else:
             # Émettre un dictionnaire vide ou avec une erreur en cas d'échec de chargement
-            self.analysisDone.emit({'error': f'Failed to load data from {self.file_path}'})
\ No newline at end of file
+            self.analysisDone.emit({'error': f'Failed to load data from {self.file_path}'})
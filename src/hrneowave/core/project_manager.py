@@ -20,6 +20,8 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import uuid
 
+from .workspace_catalog import CATALOG_FILENAME, WorkspaceCatalog
+
 logger = logging.getLogger(__name__)
 
 class ProjectStatus(Enum):
@@ -104,40 +106,52 @@ class ProjectManager:
             
         self.workspace_dir.mkdir(parents=True, exist_ok=True)
         
-        # Fichier d'index des projets
+        # Ancien index JSON des projets (lu une fois pour la migration)
         self.projects_index_file = self.workspace_dir / "projects_index.json"
         
         # Projet et session actuels
         self._current_project: Optional[ProjectMetadata] = None
         self._current_session: Optional[SessionMetadata] = None
         
-        # Index des projets
-        self._projects_index: Dict[str, Dict[str, Any]] = {}
-        
-        # Charger l'index
-        self._load_projects_index()
+        # Catalogue SQLite des projets, sessions et fichiers
+        catalog_file = self.workspace_dir / CATALOG_FILENAME
+        is_new_catalog = not catalog_file.exists()
+        self.catalog = WorkspaceCatalog(catalog_file)
+        if is_new_catalog:
+            self.rescan_workspace()
         
-    def _load_projects_index(self):
-        """Charge l'index des projets"""
+    def _project_dirs_on_disk(self) -> List[Path]:
+        """Répertoires de projets de l'espace de travail et de l'ancien index JSON"""
+        project_dirs = {path for path in self.workspace_dir.glob("project_*") if path.is_dir()}
         if self.projects_index_file.exists():
             try:
                 with open(self.projects_index_file, 'r', encoding='utf-8') as f:
-                    self._projects_index = json.load(f)
-                logger.info(f"Index des projets chargé: {len(self._projects_index)} projets")
+                    project_dirs.update(Path(entry["path"]) for entry in json.load(f).values())
             except Exception as e:
-                logger.error(f"Erreur lors du chargement de l'index des projets: {e}")
-                self._projects_index = {}
-        else:
-            self._projects_index = {}
-            
-    def _save_projects_index(self):
-        """Sauvegarde l'index des projets"""
-        try:
-            with open(self.projects_index_file, 'w', encoding='utf-8') as f:
-                json.dump(self._projects_index, f, indent=2, ensure_ascii=False)
-            logger.info("Index des projets sauvegardé")
-        except Exception as e:
-            logger.error(f"Erreur lors de la sauvegarde de l'index des projets: {e}")
+                logger.warning(f"Ancien index des projets illisible: {e}")
+        return sorted(project_dirs)
+        
+    def rescan_workspace(self) -> Dict[str, int]:
+        """Reconstruit le catalogue depuis les métadonnées présentes sur disque
+        
+        Returns:
+            Nombres de projets, sessions et fichiers catalogués
+        """
+        return self.catalog.rescan(self._project_dirs_on_disk())
+        
+    def register_files(self, paths: List[Union[str, Path]], session_id: Optional[str] = None,
+                       project_id: Optional[str] = None) -> None:
+        """Enregistre (ou met à jour) des fichiers de données et leur taille dans le catalogue
+        
+        Args:
+            paths: Fichiers écrits dans le projet
+            session_id: Session associée (optionnel)
+            project_id: ID du projet (par défaut: projet actuel)
+        """
+        project_id = project_id or (self._current_project.id if self._current_project else None)
+        if project_id is None:
+            raise ValueError("Aucun projet spécifié")
+        self.catalog.upsert_files(project_id, [(path, session_id) for path in paths])
             
     def create_project(self, name: str, description: str = "", **kwargs) -> str:
         """Crée un nouveau projet
@@ -180,17 +194,8 @@ class ProjectManager:
         with open(metadata_file, 'w', encoding='utf-8') as f:
             json.dump(asdict(metadata), f, indent=2, ensure_ascii=False)
             
-        # Mettre à jour l'index
-        self._projects_index[project_id] = {
-            "name": name,
-            "description": description,
-            "created_at": timestamp,
-            "modified_at": timestamp,
-            "status": ProjectStatus.ACTIVE.value,
-            "path": str(project_dir)
-        }
-        
-        self._save_projects_index()
+        # Mettre à jour le catalogue
+        self.catalog.upsert_project(asdict(metadata), project_dir, files=[metadata_file])
         
         logger.info(f"Projet créé: {name} (ID: {project_id})")
         return project_id
@@ -204,11 +209,12 @@ class ProjectManager:
         Returns:
             True si le projet a été chargé avec succès
         """
-        if project_id not in self._projects_index:
+        project_info = self.catalog.get_project(project_id)
+        if project_info is None:
             logger.error(f"Projet introuvable: {project_id}")
             return False
             
-        project_dir = Path(self._projects_index[project_id]["path"])
+        project_dir = Path(project_info["path"])
         metadata_file = project_dir / "project_metadata.json"
         
         if not metadata_file.exists():
@@ -266,15 +272,8 @@ class ProjectManager:
             with open(metadata_file, 'w', encoding='utf-8') as f:
                 json.dump(asdict(self._current_project), f, indent=2, ensure_ascii=False)
                 
-            # Mettre à jour l'index
-            self._projects_index[self._current_project.id].update({
-                "name": self._current_project.name,
-                "description": self._current_project.description,
-                "modified_at": self._current_project.modified_at,
-                "status": self._current_project.status
-            })
-            
-            self._save_projects_index()
+            # Mettre à jour le catalogue
+            self.catalog.upsert_project(asdict(self._current_project), project_dir, files=[metadata_file])
             return True
             
         except Exception as e:
@@ -318,6 +317,7 @@ class ProjectManager:
         with open(metadata_file, 'w', encoding='utf-8') as f:
             json.dump(asdict(metadata), f, indent=2, ensure_ascii=False)
             
+        self.catalog.upsert_session(asdict(metadata), files=[metadata_file])
         self._current_session = metadata
         
         logger.info(f"Session créée: {name} (ID: {session_id})")
@@ -366,13 +366,7 @@ class ProjectManager:
         Returns:
             Liste des projets avec leurs métadonnées
         """
-        projects = []
-        for project_id, project_info in self._projects_index.items():
-            projects.append({
-                "id": project_id,
-                **project_info
-            })
-        return projects
+        return self.catalog.list_projects()
         
     def list_sessions(self, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Liste les sessions d'un projet
@@ -388,25 +382,7 @@ class ProjectManager:
                 return []
             project_id = self._current_project.id
             
-        project_dir = self.get_project_directory(project_id)
-        sessions_dir = project_dir / "sessions"
-        
-        if not sessions_dir.exists():
-            return []
-            
-        sessions = []
-        for session_dir in sessions_dir.iterdir():
-            if session_dir.is_dir() and session_dir.name.startswith("session_"):
-                metadata_file = session_dir / "session_metadata.json"
-                if metadata_file.exists():
-                    try:
-                        with open(metadata_file, 'r', encoding='utf-8') as f:
-                            session_data = json.load(f)
-                        sessions.append(session_data)
-                    except Exception as e:
-                        logger.warning(f"Erreur lors de la lecture de la session {session_dir.name}: {e}")
-                        
-        return sessions
+        return self.catalog.list_sessions(project_id)
         
     def get_project_directory(self, project_id: str) -> Path:
         """Retourne le répertoire d'un projet
@@ -417,8 +393,9 @@ class ProjectManager:
         Returns:
             Chemin du répertoire du projet
         """
-        if project_id in self._projects_index:
-            return Path(self._projects_index[project_id]["path"])
+        project_info = self.catalog.get_project(project_id)
+        if project_info is not None:
+            return Path(project_info["path"])
         else:
             return self.workspace_dir / f"project_{project_id}"
             
@@ -454,19 +431,19 @@ class ProjectManager:
             logger.warning("Suppression annulée: confirmation requise")
             return False
             
-        if project_id not in self._projects_index:
+        project_info = self.catalog.get_project(project_id)
+        if project_info is None:
             logger.error(f"Projet introuvable: {project_id}")
             return False
             
         try:
             # Supprimer le répertoire
-            project_dir = Path(self._projects_index[project_id]["path"])
+            project_dir = Path(project_info["path"])
             if project_dir.exists():
                 shutil.rmtree(project_dir)
                 
-            # Supprimer de l'index
-            del self._projects_index[project_id]
-            self._save_projects_index()
+            # Supprimer du catalogue
+            self.catalog.delete_project(project_id)
             
             # Décharger si c'est le projet actuel
             if self._current_project and self._current_project.id == project_id:
@@ -490,12 +467,13 @@ class ProjectManager:
         Returns:
             True si l'export a réussi
         """
-        if project_id not in self._projects_index:
+        project_info = self.catalog.get_project(project_id)
+        if project_info is None:
             logger.error(f"Projet introuvable: {project_id}")
             return False
             
         try:
-            project_dir = Path(self._projects_index[project_id]["path"])
+            project_dir = Path(project_info["path"])
             export_path = Path(export_path)
             
             # Créer l'archive
@@ -508,32 +486,30 @@ class ProjectManager:
             logger.error(f"Erreur lors de l'export du projet: {e}")
             return False
             
-    def get_workspace_info(self) -> Dict[str, Any]:
+    def get_workspace_info(self, refresh: bool = True) -> Dict[str, Any]:
         """Retourne les informations sur l'espace de travail
         
+        Les nombres de projets et sessions sont lus dans le catalogue. Les
+        données d'acquisition et les exports sont écrits hors du gestionnaire :
+        avec refresh, l'inventaire des fichiers est d'abord resynchronisé
+        avec le disque pour que la taille totale les inclue.
+        
+        Args:
+            refresh: Reparcourir les répertoires des projets (sinon tailles
+                des seuls fichiers catalogués)
+            
         Returns:
             Informations sur l'espace de travail
         """
-        total_size = 0
-        project_count = len(self._projects_index)
-        session_count = 0
+        if refresh:
+            self.catalog.refresh_files()
+        stats = self.catalog.statistics()
+        total_size = stats["total_size_bytes"]
         
-        for project_id in self._projects_index:
-            project_dir = self.get_project_directory(project_id)
-            if project_dir.exists():
-                # Calculer la taille
-                for file_path in project_dir.rglob('*'):
-                    if file_path.is_file():
-                        total_size += file_path.stat().st_size
-                        
-                # Compter les sessions
-                sessions = self.list_sessions(project_id)
-                session_count += len(sessions)
-                
         return {
             "workspace_dir": str(self.workspace_dir),
-            "project_count": project_count,
-            "session_count": session_count,
+            "project_count": stats["project_count"],
+            "session_count": stats["session_count"],
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2)
         }
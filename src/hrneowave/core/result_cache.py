@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache des résultats d'analyse, adressé par contenu
+
+Un résultat (statistiques, spectres, tables de vagues) est rangé sous une clé
+dérivée de l'empreinte SHA-256 du fichier de données, de l'empreinte de la
+configuration d'analyse et de la version du code : un fichier rouvert avec
+les mêmes réglages est relu au lieu d'être réanalysé, quel que soit son
+chemin. L'empreinte d'un fichier est elle-même mémorisée par (chemin,
+taille, date) pour ne pas relire les gros fichiers à chaque ouverture.
+
+Les résultats sont stockés en binaire (npz compressé : structure JSON et
+tableaux float64, sans pickle) dans une base SQLite en mode WAL partagée par
+l'interface, la commande `chneowave analyze` et l'API bridge. Au-delà de la
+taille maximale, les entrées les moins récemment lues sont supprimées.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "results.sqlite"
+
+# Version du schéma et du format des entrées (PRAGMA user_version)
+SCHEMA_VERSION = 1
+
+# Taille maximale par défaut des résultats stockés
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Listes de flottants stockées comme tableaux à partir de cette longueur
+_MIN_ARRAY_LIST = 16
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_accessed ON results(accessed_at);
+
+CREATE TABLE IF NOT EXISTS file_digests (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+"""
+
+
+def default_cache_dir() -> Path:
+    """Répertoire du cache partagé (~/.chneowave/cache/analysis)"""
+    return Path.home() / ".chneowave" / "cache" / "analysis"
+
+
+def encode_result(value: Any) -> bytes:
+    """
+    Sérialise un résultat d'analyse (dict, listes, scalaires, tableaux numpy)
+
+    Les tableaux et les longues listes de flottants sont extraits de la
+    structure JSON et stockés en binaire.
+    """
+    arrays: List[np.ndarray] = []
+
+    def pack(item):
+        if isinstance(item, dict):
+            return {str(key): pack(val) for key, val in item.items()}
+        if isinstance(item, np.ndarray) and item.dtype != object:
+            arrays.append(item)
+            return {'__nd__': len(arrays) - 1}
+        if isinstance(item, np.ndarray):
+            return [pack(val) for val in item.tolist()]
+        if isinstance(item, (list, tuple)):
+            if len(item) >= _MIN_ARRAY_LIST and all(type(val) is float for val in item):
+                arrays.append(np.asarray(item, dtype=np.float64))
+                return {'__nd__': len(arrays) - 1, 'list': True}
+            return [pack(val) for val in item]
+        if isinstance(item, np.generic):
+            return item.item()
+        return item
+
+    tree = json.dumps(pack(value), separators=(',', ':')).encode('utf-8')
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, __tree__=np.frombuffer(tree, dtype=np.uint8),
+                        **{f"a{i}": array for i, array in enumerate(arrays)})
+    return buffer.getvalue()
+
+
+def decode_result(payload: bytes) -> Any:
+    """Inverse de encode_result"""
+    with np.load(io.BytesIO(payload), allow_pickle=False) as archive:
+        tree = json.loads(archive['__tree__'].tobytes().decode('utf-8'))
+
+        def unpack(item):
+            if isinstance(item, dict):
+                if '__nd__' in item:
+                    array = archive[f"a{item['__nd__']}"]
+                    return array.tolist() if item.get('list') else array
+                return {key: unpack(val) for key, val in item.items()}
+            if isinstance(item, list):
+                return [unpack(val) for val in item]
+            return item
+
+        return unpack(tree)
+
+
+def config_digest(config: Any) -> str:
+    """Empreinte d'une configuration (clés triées, valeurs non JSON en texte)"""
+    text = json.dumps(config, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class AnalysisResultCache:
+    """
+    Cache LRU des résultats d'analyse sur disque
+
+    Args:
+        cache_dir: Répertoire de la base (None : default_cache_dir())
+        max_bytes: Taille maximale des résultats stockés
+        version: Version de l'application, incluse dans les clés
+            (par défaut hrneowave.__version__)
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES, version: Optional[str] = None):
+        if version is None:
+            from hrneowave import __version__ as version
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / CACHE_FILENAME
+        self.max_bytes = int(max_bytes)
+        self.version = version
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        self._lock = threading.RLock()
+        # Base partagée entre processus (interface, CLI) : attente plutôt qu'échec
+        self._conn = sqlite3.connect(str(self.db_path), timeout=10.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self._conn.executescript("DROP TABLE IF EXISTS results; DROP TABLE IF EXISTS file_digests;")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def file_digest(self, path: Union[str, Path]) -> str:
+        """Empreinte SHA-256 du contenu d'un fichier, mémorisée par (taille, date)"""
+        path = Path(path).resolve()
+        stat = path.stat()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest FROM file_digests WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (str(path), stat.st_size, stat.st_mtime_ns)
+            ).fetchone()
+        if row:
+            return row[0]
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO file_digests (path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)",
+                (str(path), stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+            )
+        return digest.hexdigest()
+
+    def make_key(self, namespace: str, data_digest: str, config: Any, code_version: Any = '') -> str:
+        """Clé d'un résultat : (données, configuration, version du code)"""
+        parts = [namespace, data_digest, config_digest(config), str(code_version), self.version]
+        return f"{namespace}:" + hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Résultat rangé sous la clé, None si absent"""
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            with self._conn:
+                self._conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        try:
+            value = decode_result(row[0])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Entrée de cache illisible {key}: {e}")
+            self.discard(key)
+            self.stats['misses'] += 1
+            return None
+        self.stats['hits'] += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        """Range un résultat et applique la limite de taille"""
+        payload = encode_result(value)
+        if len(payload) > self.max_bytes:
+            logger.debug(f"Résultat trop volumineux pour le cache ({len(payload)} octets)")
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, namespace, size, created_at, accessed_at, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, key.split(':', 1)[0], len(payload), now, now, sqlite3.Binary(payload))
+            )
+            self._evict()
+
+    def discard(self, key: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+
+    def clear(self):
+        """Vide le cache"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+            self._conn.execute("DELETE FROM file_digests")
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0])
+
+    def info(self) -> Dict[str, Any]:
+        """Nombre d'entrées, taille occupée et compteurs de la session"""
+        with self._lock:
+            count, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        return {'entries': count, 'bytes': size, 'max_bytes': self.max_bytes,
+                'path': str(self.db_path), **self.stats}
+
+    def _evict(self):
+        """Supprime les entrées les moins récemment lues au-delà de max_bytes (verrou tenu)"""
+        excess = self.total_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM results ORDER BY accessed_at, created_at"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM results WHERE key = ?", victims)
+        self.stats['evictions'] += len(victims)
+        logger.debug(f"Cache d'analyse: {len(victims)} entrée(s) supprimée(s)")
+
+
+_shared_cache: Optional[AnalysisResultCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_result_cache() -> AnalysisResultCache:
+    """Cache partagé du processus, dans default_cache_dir()"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = AnalysisResultCache()
+        return _shared_cache
@@ -60,13 +60,20 @@ class SessionState(Enum):
 
 @dataclass
 class DataBlock:
-    """Bloc de données avec métadonnées"""
+    """Bloc de données avec métadonnées
+    
+    sequence_id est un compteur de blocs contigu sur la session et
+    start_sample l'indice absolu du premier échantillon : un abonné peut
+    ainsi détecter toute perte de bloc ou d'échantillons. data est
+    généralement une vue en lecture seule sur l'anneau d'acquisition.
+    """
     data: np.ndarray
     timestamp: float
     sample_rate: float
     n_channels: int
     sequence_id: int = 0
     metadata: Optional[Dict[str, Any]] = None
+    start_sample: int = 0
     
     def __post_init__(self):
         if self.metadata is None:
@@ -88,6 +95,127 @@ class DataBlock:
     def duration(self) -> float:
         """Durée du bloc en secondes"""
         return self.n_samples / self.sample_rate if self.sample_rate > 0 else 0.0
+    
+    @property
+    def end_sample(self) -> int:
+        """Indice absolu de l'échantillon suivant le bloc"""
+        return self.start_sample + self.n_samples
+    
+    def follows(self, previous: 'DataBlock') -> bool:
+        """Indique si le bloc suit directement le précédent (ni trou ni recouvrement)"""
+        return (self.sequence_id == previous.sequence_id + 1
+                and self.start_sample == previous.end_sample)
+
+
+@dataclass
+class BlockSummary:
+    """Résumé de plusieurs blocs pour les abonnés à cadence réduite"""
+    first_sequence_id: int
+    last_sequence_id: int
+    start_sample: int
+    n_samples: int
+    timestamp: float
+    sample_rate: float
+    minimum: np.ndarray
+    maximum: np.ndarray
+    mean: np.ndarray
+    rms: np.ndarray
+    last: np.ndarray
+    gaps: int = 0
+    
+    @property
+    def duration(self) -> float:
+        """Durée couverte par le résumé en secondes"""
+        return self.n_samples / self.sample_rate if self.sample_rate > 0 else 0.0
+
+
+class BlockSubscription:
+    """
+    Abonnement au flux de blocs de données
+    
+    Avec cadence == 0 l'abonné reçoit chaque DataBlock (enregistreur,
+    traitement). Avec cadence > 0 il reçoit un BlockSummary toutes les
+    `cadence` secondes de données (tableaux de bord, indicateurs).
+    """
+    
+    def __init__(self, callback: Callable[[Any], None], cadence: float = 0.0, name: str = ""):
+        self.callback = callback
+        self.cadence = max(float(cadence), 0.0)
+        self.name = name or getattr(callback, '__name__', 'subscriber')
+        self.blocks_received = 0
+        self.gaps = 0
+        self._next_sequence_id: Optional[int] = None
+        self._reset_summary()
+    
+    def _reset_summary(self) -> None:
+        """Réinitialise l'agrégation en cours"""
+        self._first_block: Optional[DataBlock] = None
+        self._last_block: Optional[DataBlock] = None
+        self._n_samples = 0
+        self._summary_gaps = 0
+        self._min = self._max = self._sum = self._sum_sq = None
+    
+    def reset(self) -> None:
+        """Remet à zéro le suivi des séquences (nouvelle session)"""
+        self._next_sequence_id = None
+        self._reset_summary()
+    
+    def deliver(self, block: DataBlock) -> None:
+        """Transmet un bloc à l'abonné selon sa cadence"""
+        if self._next_sequence_id is not None and block.sequence_id != self._next_sequence_id:
+            self.gaps += 1
+            self._summary_gaps += 1
+        self._next_sequence_id = block.sequence_id + 1
+        self.blocks_received += 1
+        
+        if self.cadence <= 0:
+            self.callback(block)
+            return
+        
+        self._accumulate(block)
+        if self._n_samples >= self.cadence * block.sample_rate:
+            self.callback(self._build_summary())
+            self._reset_summary()
+    
+    def _accumulate(self, block: DataBlock) -> None:
+        """Agrège les statistiques d'un bloc (réductions vectorisées)"""
+        data = block.data
+        block_min = data.min(axis=-1)
+        block_max = data.max(axis=-1)
+        block_sum = data.sum(axis=-1, dtype=np.float64)
+        block_sum_sq = np.einsum('...i,...i->...', data, data, dtype=np.float64)
+        
+        if self._first_block is None:
+            self._first_block = block
+            self._min, self._max = block_min, block_max
+            self._sum, self._sum_sq = block_sum, block_sum_sq
+        else:
+            self._min = np.minimum(self._min, block_min)
+            self._max = np.maximum(self._max, block_max)
+            self._sum = self._sum + block_sum
+            self._sum_sq = self._sum_sq + block_sum_sq
+        
+        self._last_block = block
+        self._n_samples += block.n_samples
+    
+    def _build_summary(self) -> BlockSummary:
+        """Construit le résumé des blocs agrégés"""
+        first, last = self._first_block, self._last_block
+        n = max(self._n_samples, 1)
+        return BlockSummary(
+            first_sequence_id=first.sequence_id,
+            last_sequence_id=last.sequence_id,
+            start_sample=first.start_sample,
+            n_samples=self._n_samples,
+            timestamp=last.timestamp,
+            sample_rate=last.sample_rate,
+            minimum=self._min,
+            maximum=self._max,
+            mean=self._sum / n,
+            rms=np.sqrt(self._sum_sq / n),
+            last=np.array(last.data[..., -1]),
+            gaps=self._summary_gaps
+        )
 
 
 @dataclass
@@ -210,10 +338,14 @@ class SignalBus(QObject):
         self._session_state = SessionState.IDLE
         self._session_stats = {}
         self._lock = threading.Lock()
+        self._subscriptions: List[BlockSubscription] = []
+        self._next_sequence_id: Optional[int] = None
+        self._block_gaps = 0
     
     def emit_data_block(self, data: np.ndarray, timestamp: float, sample_rate: float, 
                        n_channels: int, sequence_id: int = 0, 
-                       metadata: Optional[Dict[str, Any]] = None) -> None:
+                       metadata: Optional[Dict[str, Any]] = None,
+                       start_sample: int = 0) -> None:
         """Émet un bloc de données"""
         data_block = DataBlock(
             data=data,
@@ -221,9 +353,66 @@ class SignalBus(QObject):
             sample_rate=sample_rate,
             n_channels=n_channels,
             sequence_id=sequence_id,
-            metadata=metadata
+            metadata=metadata,
+            start_sample=start_sample
         )
-        self.dataBlockReady.emit(data_block)
+        self.publish_block(data_block)
+    
+    def publish_block(self, block: DataBlock) -> None:
+        """
+        Publie un bloc : détection des trous de séquence, distribution aux
+        abonnés selon leur cadence puis émission du signal dataBlockReady
+        """
+        with self._lock:
+            if self._next_sequence_id is not None and block.sequence_id != self._next_sequence_id:
+                self._block_gaps += 1
+                self._session_stats['block_gaps'] = self._block_gaps
+                logger.warning(
+                    f"Trou dans le flux de blocs: attendu {self._next_sequence_id}, "
+                    f"reçu {block.sequence_id}"
+                )
+            self._next_sequence_id = block.sequence_id + 1
+            if 'blocks_processed' in self._session_stats:
+                self._session_stats['blocks_processed'] += 1
+                self._session_stats['total_samples'] += block.n_samples
+            subscriptions = list(self._subscriptions)
+        
+        for subscription in subscriptions:
+            try:
+                subscription.deliver(block)
+            except Exception as e:
+                logger.error(f"Erreur dans l'abonné {subscription.name}: {e}")
+        
+        self.dataBlockReady.emit(block)
+    
+    def subscribe_data_blocks(self, callback: Callable[[Any], None], cadence: float = 0.0,
+                              name: str = "") -> BlockSubscription:
+        """
+        Abonne un callback au flux de blocs
+        
+        Args:
+            callback: Appelé dans le thread d'acquisition avec un DataBlock
+                (cadence == 0) ou un BlockSummary (cadence > 0)
+            cadence: Période de livraison en secondes de données (0 = chaque bloc)
+            name: Nom de l'abonné pour les journaux
+        """
+        subscription = BlockSubscription(callback, cadence, name)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+    
+    def unsubscribe_data_blocks(self, subscription: BlockSubscription) -> None:
+        """Désabonne un abonné du flux de blocs"""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+    
+    def reset_block_sequence(self) -> None:
+        """Repart d'une nouvelle séquence de blocs (buffer vidé) sans compter de trou"""
+        with self._lock:
+            self._next_sequence_id = None
+            for subscription in self._subscriptions:
+                subscription.reset()
     
     def start_session(self, config: Dict[str, Any]) -> None:
         """Démarre une session d'acquisition"""
@@ -233,8 +422,13 @@ class SignalBus(QObject):
                 'start_time': time.time(),
                 'config': config.copy(),
                 'blocks_processed': 0,
-                'total_samples': 0
+                'total_samples': 0,
+                'block_gaps': 0
             }
+            self._next_sequence_id = None
+            self._block_gaps = 0
+            for subscription in self._subscriptions:
+                subscription.reset()
         
         self.sessionStateChanged.emit(SessionState.STARTING)
         self.sessionStarted.emit(config)
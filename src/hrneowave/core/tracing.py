@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Traçage des étapes d'acquisition et de traitement pour CHNeoWave
+
+Anneau borné d'événements (thread, étape, t_début, t_fin) horodatés avec
+perf_counter_ns, exportable au format Chrome trace (chrome://tracing, Perfetto).
+Module sans dépendance Qt : utilisable depuis le processus d'acquisition et
+les threads de travail.
+
+Désactivé, `trace_span()` retourne un contexte vide partagé : le coût se
+limite à un appel de fonction et un test booléen.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Capacité par défaut de l'anneau (événements)
+DEFAULT_TRACE_CAPACITY = 200_000
+
+# Variable d'environnement activant le traçage au démarrage (chemin d'export)
+TRACE_ENV_VAR = 'CHNEOWAVE_TRACE'
+
+TraceEvent = Tuple[int, str, int, int, Optional[Dict[str, Any]]]
+
+
+class _NullSpan:
+    """Contexte vide utilisé lorsque le traçage est désactivé"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _TraceSpan:
+    """Enregistre un événement à la sortie du bloc `with`"""
+
+    __slots__ = ('_tracer', '_stage', '_args', '_start')
+
+    def __init__(self, tracer: 'Tracer', stage: str, args: Optional[Dict[str, Any]]):
+        self._tracer = tracer
+        self._stage = stage
+        self._args = args
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._tracer.record(self._stage, self._start, time.perf_counter_ns(), self._args)
+        return False
+
+
+class Tracer:
+    """
+    Anneau d'événements de traçage
+
+    Les écritures sont des `deque.append` (atomiques sous le GIL) : plusieurs
+    threads peuvent tracer sans verrou ; les événements les plus anciens sont
+    écrasés quand l'anneau est plein.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_TRACE_CAPACITY):
+        self.enabled = False
+        self._events = deque(maxlen=capacity)
+        self._thread_names: Dict[int, str] = {}
+        self._origin_ns = time.perf_counter_ns()
+
+    @property
+    def capacity(self) -> int:
+        """Nombre maximal d'événements conservés"""
+        return self._events.maxlen
+
+    def enable(self, capacity: Optional[int] = None):
+        """Active le traçage (et redimensionne l'anneau si demandé)"""
+        if capacity is not None and capacity != self._events.maxlen:
+            self._events = deque(self._events, maxlen=capacity)
+        self.enabled = True
+        logger.info(f"Traçage activé (capacité {self.capacity} événements)")
+
+    def disable(self):
+        """Désactive le traçage ; les événements déjà enregistrés sont conservés"""
+        self.enabled = False
+
+    def clear(self):
+        """Vide l'anneau"""
+        self._events.clear()
+        self._thread_names.clear()
+        self._origin_ns = time.perf_counter_ns()
+
+    def span(self, stage: str, args: Optional[Dict[str, Any]] = None):
+        """Contexte mesurant une étape (vide si le traçage est désactivé)"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _TraceSpan(self, stage, args)
+
+    def record(self, stage: str, start_ns: int, end_ns: int,
+               args: Optional[Dict[str, Any]] = None):
+        """Enregistre un événement déjà mesuré (horloge perf_counter_ns)"""
+        if not self.enabled:
+            return
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        self._events.append((tid, stage, start_ns, end_ns, args))
+
+    def record_duration(self, stage: str, seconds: float,
+                        args: Optional[Dict[str, Any]] = None):
+        """Enregistre une étape de durée connue qui vient de se terminer"""
+        if not self.enabled:
+            return
+        end_ns = time.perf_counter_ns()
+        self.record(stage, end_ns - int(seconds * 1e9), end_ns, args)
+
+    def events(self) -> List[TraceEvent]:
+        """Copie des événements (thread, étape, t_début_ns, t_fin_ns, args)"""
+        return list(self._events)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Événements au format Chrome trace (« X » complets, en microsecondes)"""
+        pid = os.getpid()
+        origin = self._origin_ns
+        trace_events = [
+            {'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+             'args': {'name': 'CHNeoWave'}}
+        ]
+        for tid, name in list(self._thread_names.items()):
+            trace_events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                                 'args': {'name': name}})
+
+        for tid, stage, start_ns, end_ns, args in self.events():
+            event = {
+                'name': stage,
+                'cat': 'chneowave',
+                'ph': 'X',
+                'ts': (start_ns - origin) / 1000.0,
+                'dur': (end_ns - start_ns) / 1000.0,
+                'pid': pid,
+                'tid': tid
+            }
+            if args:
+                event['args'] = args
+            trace_events.append(event)
+
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, filepath: Union[str, Path]) -> Path:
+        """
+        Exporte la trace au format JSON Chrome trace
+
+        Args:
+            filepath: Fichier de sortie (ouvrable dans chrome://tracing ou ui.perfetto.dev)
+
+        Returns:
+            Chemin du fichier écrit
+        """
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        trace = self.to_chrome_trace()
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(trace, f)
+        logger.info(f"Trace exportée: {filepath} ({len(trace['traceEvents'])} événements)")
+        return filepath
+
+
+# Traceur global
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Retourne le traceur global"""
+    return _tracer
+
+
+def trace_span(stage: str, **args):
+    """
+    Contexte de traçage d'une étape sur le traceur global
+
+    Example:
+        >>> with trace_span("hdf5_write", n_samples=len(data)):
+        ...     writer.write_acquisition_data(...)
+    """
+    if not _tracer.enabled:
+        return _NULL_SPAN
+    return _TraceSpan(_tracer, stage, args or None)
+
+
+def enable_tracing(capacity: Optional[int] = None):
+    """Active le traçage global"""
+    _tracer.enable(capacity)
+
+
+def disable_tracing():
+    """Désactive le traçage global"""
+    _tracer.disable()
+
+
+def is_tracing_enabled() -> bool:
+    """Indique si le traçage global est actif"""
+    return _tracer.enabled
+
+
+def export_chrome_trace(filepath: Union[str, Path]) -> Path:
+    """Exporte la trace globale au format Chrome trace"""
+    return _tracer.export_chrome_trace(filepath)
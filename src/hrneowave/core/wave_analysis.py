@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Noyaux d'analyse de houle partagés (numpy, vectorisés par canal)
+
+Utilisés par l'analyse headless (graphe d'analyse par session) et par le
+PostProcessor de l'interface : les deux chemins calculent les statistiques,
+la DSP de Welch, les moments spectraux et les vagues par passages par zéro
+avec le même code. Données en (canaux x échantillons).
+
+scipy n'est importé qu'à l'appel (fenêtre de Welch), pas à l'import.
+"""
+
+import warnings
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+SPECTRAL_PARAMETERS = ('hm0', 'tp', 'tm01', 'tm02')
+
+
+def channel_statistics(data: np.ndarray) -> Dict[str, np.ndarray]:
+    """Statistiques par canal, échantillons non finis ignorés"""
+    data = np.atleast_2d(data)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        mean = np.nanmean(data, axis=1)
+        std = np.nanstd(data, axis=1)
+        centered = (data - mean[:, None]) / np.where(std > 0, std, np.nan)[:, None]
+        return {
+            'mean': mean,
+            'std': std,
+            'min': np.nanmin(data, axis=1),
+            'max': np.nanmax(data, axis=1),
+            'rms': np.sqrt(np.nanmean(data ** 2, axis=1)),
+            'skewness': np.nan_to_num(np.nanmean(centered ** 3, axis=1)),
+            'kurtosis': np.nan_to_num(np.nanmean(centered ** 4, axis=1) - 3.0),
+        }
+
+
+def fill_invalid(data: np.ndarray) -> np.ndarray:
+    """Remplace les échantillons non finis par la moyenne du canal"""
+    invalid = ~np.isfinite(data)
+    if not invalid.any():
+        return data
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        fill = np.nan_to_num(np.nanmean(np.where(invalid, np.nan, data), axis=1))
+    return np.where(invalid, fill[:, None], data)
+
+
+def welch_segments(data: np.ndarray, segment_length: int, overlap: float = 0.5) -> np.ndarray:
+    """Segments de Welch (canaux x segments x échantillons), vue sans copie"""
+    nperseg = min(data.shape[1], segment_length)
+    step = max(1, nperseg - int(nperseg * overlap))
+    return np.lib.stride_tricks.sliding_window_view(data, nperseg, axis=-1)[:, ::step]
+
+
+def welch_psd(segments: np.ndarray, sample_rate: float) -> Tuple[np.ndarray, np.ndarray]:
+    """DSP de Welch unilatérale : périodogrammes (Hann, moyenne retirée) moyennés"""
+    from scipy.signal import get_window
+
+    nperseg = segments.shape[-1]
+    window = get_window('hann', nperseg)
+    spectra = np.fft.rfft((segments - segments.mean(axis=-1, keepdims=True)) * window, axis=-1)
+    psd = (np.abs(spectra) ** 2).mean(axis=1) / (sample_rate * (window ** 2).sum())
+    psd[:, 1:-1 if nperseg % 2 == 0 else None] *= 2
+    return np.fft.rfftfreq(nperseg, 1.0 / sample_rate), psd
+
+
+def spectral_moments(freqs: np.ndarray, psd: np.ndarray,
+                     band: Optional[Tuple[float, float]] = None) -> Dict[str, np.ndarray]:
+    """Moments m0, m1, m2 et Hm0, Tp, Tm01, Tm02 de chaque canal (DC exclu)"""
+    keep = freqs > 0
+    if band:
+        keep &= (freqs >= band[0]) & (freqs <= band[1])
+    if not keep.any():
+        empty = np.full(psd.shape[0], np.nan)
+        return {name: empty for name in ('m0', 'm1', 'm2') + SPECTRAL_PARAMETERS}
+    df = freqs[1] - freqs[0]
+    freqs, psd = freqs[keep], psd[:, keep]
+    m0 = psd.sum(axis=1) * df
+    m1 = (psd * freqs).sum(axis=1) * df
+    m2 = (psd * freqs ** 2).sum(axis=1) * df
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return {
+            'm0': m0,
+            'm1': m1,
+            'm2': m2,
+            'hm0': 4.0 * np.sqrt(m0),
+            'tp': np.where(m0 > 0, 1.0 / freqs[np.argmax(psd, axis=1)], np.nan),
+            'tm01': np.where(m1 > 0, m0 / m1, np.nan),
+            'tm02': np.where(m2 > 0, np.sqrt(m0 / m2), np.nan),
+        }
+
+
+def zero_up_crossing(signal: np.ndarray, sample_rate: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vagues délimitées par les passages par zéro ascendants
+
+    Returns:
+        (hauteurs crête-creux, périodes [s]) de chaque vague complète
+    """
+    eta = signal - signal.mean()
+    up = np.flatnonzero((eta[:-1] < 0) & (eta[1:] >= 0))
+    if len(up) < 2:
+        return np.empty(0), np.empty(0)
+
+    # Hauteur crête-creux de chaque vague (segments entre passages successifs)
+    starts = up + 1
+    heights = (np.maximum.reduceat(eta, starts) - np.minimum.reduceat(eta, starts))[:-1]
+    # Instants de passage interpolés linéairement
+    crossings = (up + eta[up] / (eta[up] - eta[up + 1])) / sample_rate
+    return heights, np.diff(crossings)
+
+
+def wave_by_wave(signal: np.ndarray, sample_rate: float) -> Dict[str, float]:
+    """Paramètres vague par vague : nombre, H1/3, Hmax, Hmoy, Tz"""
+    heights, periods = zero_up_crossing(signal, sample_rate)
+    if not len(heights):
+        return {'n_waves': 0, 'h13': 0.0, 'hmax': 0.0, 'hmean': 0.0, 'tz': np.nan}
+
+    ordered = np.sort(heights)[::-1]
+    return {
+        'n_waves': int(len(heights)),
+        'h13': float(ordered[:max(1, len(ordered) // 3)].mean()),
+        'hmax': float(ordered[0]),
+        'hmean': float(heights.mean()),
+        'tz': float(periods.mean()),
+    }
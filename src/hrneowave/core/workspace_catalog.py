@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CHNeoWave - Catalogue SQLite de l'espace de travail
+
+Projets, sessions et fichiers de données (avec leur taille) dans une base
+SQLite en mode WAL, placée à la racine de l'espace de travail. Chaque
+modification est un upsert dans une transaction unique ; la navigation
+(liste des projets, des sessions, statistiques) devient une requête indexée
+au lieu d'un parcours des répertoires et de la relecture des JSON.
+
+Les fichiers JSON de métadonnées restent la source de vérité : `rescan`
+reconstruit le catalogue depuis le disque.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = "workspace_catalog.sqlite"
+
+# Version du schéma (PRAGMA user_version)
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    created_at TEXT,
+    modified_at TEXT,
+    status TEXT,
+    path TEXT NOT NULL,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_projects_name ON projects(name);
+CREATE INDEX IF NOT EXISTS idx_projects_modified ON projects(modified_at);
+CREATE INDEX IF NOT EXISTS idx_projects_status ON projects(status);
+
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    project_id TEXT NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    session_type TEXT,
+    created_at TEXT,
+    duration REAL NOT NULL DEFAULT 0,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_project_date ON sessions(project_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_name ON sessions(name);
+CREATE INDEX IF NOT EXISTS idx_sessions_type ON sessions(session_type);
+
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    project_id TEXT NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    session_id TEXT,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_files_project ON files(project_id);
+CREATE INDEX IF NOT EXISTS idx_files_session ON files(session_id);
+"""
+
+_PROJECT_COLUMNS = ('id', 'name', 'description', 'created_at', 'modified_at', 'status', 'path')
+
+
+class WorkspaceCatalog:
+    """
+    Catalogue SQLite des projets, sessions et fichiers
+
+    Args:
+        db_path: Fichier de la base (créé si absent)
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                # Le catalogue n'est qu'un cache des JSON : reconstruit par rescan
+                logger.warning(f"Schéma du catalogue v{version} obsolète, recréation")
+                self._conn.executescript(
+                    "DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS sessions; DROP TABLE IF EXISTS projects;"
+                )
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+
+    def upsert_project(self, project: Dict[str, Any], path: Union[str, Path],
+                       files: Iterable[Union[str, Path]] = ()):
+        """Ajoute ou met à jour un projet (dictionnaire ProjectMetadata) et ses fichiers"""
+        file_rows = self._stat_files(project['id'], [(file, None) for file in files])
+        with self._lock, self._conn:
+            self._upsert_project(project, path)
+            self._write_files(*file_rows)
+
+    def _upsert_project(self, project: Dict[str, Any], path: Union[str, Path]):
+        self._conn.execute(
+            """INSERT INTO projects (id, name, description, created_at, modified_at, status, path, metadata)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                   name=excluded.name, description=excluded.description,
+                   created_at=excluded.created_at, modified_at=excluded.modified_at,
+                   status=excluded.status, path=excluded.path, metadata=excluded.metadata""",
+            (project['id'], project.get('name', ''), project.get('description', ''),
+             project.get('created_at'), project.get('modified_at'), project.get('status'),
+             str(path), json.dumps(project, ensure_ascii=False))
+        )
+
+    def upsert_session(self, session: Dict[str, Any], files: Iterable[Union[str, Path]] = ()):
+        """Ajoute ou met à jour une session (dictionnaire SessionMetadata) et ses fichiers"""
+        file_rows = self._stat_files(session['project_id'], [(file, session['id']) for file in files])
+        with self._lock, self._conn:
+            self._upsert_session(session)
+            self._write_files(*file_rows)
+
+    def _upsert_session(self, session: Dict[str, Any]):
+        self._conn.execute(
+            """INSERT INTO sessions (id, project_id, name, session_type, created_at, duration, metadata)
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                   project_id=excluded.project_id, name=excluded.name,
+                   session_type=excluded.session_type, created_at=excluded.created_at,
+                   duration=excluded.duration, metadata=excluded.metadata""",
+            (session['id'], session['project_id'], session.get('name', ''), session.get('session_type'),
+             session.get('created_at'), float(session.get('duration') or 0.0),
+             json.dumps(session, ensure_ascii=False))
+        )
+
+    def upsert_files(self, project_id: str, files: Iterable[Tuple[Union[str, Path], Optional[str]]]):
+        """
+        Enregistre des fichiers de données avec leur taille actuelle
+
+        Args:
+            project_id: Projet propriétaire
+            files: Couples (chemin, id de session ou None) ; les fichiers
+                absents du disque sont retirés du catalogue
+        """
+        file_rows = self._stat_files(project_id, files)
+        with self._lock, self._conn:
+            self._write_files(*file_rows)
+
+    @staticmethod
+    def _stat_files(project_id: str, files) -> Tuple[List[Tuple], List[Tuple]]:
+        # Appels système hors transaction : le verrou d'écriture reste court
+        present, missing = [], []
+        for path, session_id in files:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                missing.append((str(path),))
+                continue
+            present.append((str(path), project_id, session_id, stat.st_size, stat.st_mtime_ns))
+        return present, missing
+
+    def _write_files(self, present: List[Tuple], missing: List[Tuple]):
+        self._conn.executemany(
+            """INSERT INTO files (path, project_id, session_id, size, mtime_ns) VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(path) DO UPDATE SET
+                   project_id=excluded.project_id, session_id=excluded.session_id,
+                   size=excluded.size, mtime_ns=excluded.mtime_ns""",
+            present
+        )
+        self._conn.executemany("DELETE FROM files WHERE path = ?", missing)
+
+    def delete_project(self, project_id: str):
+        """Retire un projet, ses sessions et ses fichiers"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+
+    def has_project(self, project_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM projects WHERE id = ?", (project_id,)).fetchone() is not None
+
+    def get_project(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """Entrée d'index du projet (id, name, description, dates, status, path)"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_PROJECT_COLUMNS)} FROM projects WHERE id = ?", (project_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def list_projects(self, status: Optional[str] = None, order_by: str = 'name') -> List[Dict[str, Any]]:
+        """Projets, éventuellement filtrés par statut, triés par nom ou date de modification"""
+        order = {'name': 'name', 'modified_at': 'modified_at DESC', 'created_at': 'created_at DESC'}[order_by]
+        query = f"SELECT {', '.join(_PROJECT_COLUMNS)} FROM projects"
+        params: Tuple = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(f"{query} ORDER BY {order}", params)]
+
+    def list_sessions(self, project_id: str, session_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Métadonnées complètes des sessions d'un projet, par date de création"""
+        query = "SELECT metadata FROM sessions WHERE project_id = ?"
+        params: Tuple = (project_id,)
+        if session_type is not None:
+            query += " AND session_type = ?"
+            params += (session_type,)
+        with self._lock:
+            rows = self._conn.execute(f"{query} ORDER BY created_at", params).fetchall()
+        return [json.loads(row['metadata']) for row in rows]
+
+    def statistics(self) -> Dict[str, int]:
+        """Nombres de projets, sessions, fichiers et taille totale [octets]"""
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT (SELECT COUNT(*) FROM projects) AS project_count,
+                          (SELECT COUNT(*) FROM sessions) AS session_count,
+                          COUNT(*) AS file_count,
+                          COALESCE(SUM(size), 0) AS total_size_bytes
+                   FROM files"""
+            ).fetchone()
+        return dict(row)
+
+    # ------------------------------------------------------------------
+    # Reconstruction
+    # ------------------------------------------------------------------
+
+    def rescan(self, project_dirs: Iterable[Union[str, Path]]) -> Dict[str, int]:
+        """
+        Reconstruit le catalogue depuis les répertoires de projets
+
+        Chaque répertoire doit contenir project_metadata.json ; les sessions
+        sont lues dans sessions/session_*/session_metadata.json et tous les
+        fichiers du projet sont inventoriés. Le remplacement est atomique.
+
+        Returns:
+            Nombres de projets, sessions et fichiers catalogués
+        """
+        projects, sessions, files = [], [], []
+        for project_dir in project_dirs:
+            project_dir = Path(project_dir)
+            project = _read_json(project_dir / "project_metadata.json")
+            if not project or 'id' not in project:
+                continue
+            projects.append((project, project_dir))
+
+            session_ids = {}
+            sessions_dir = project_dir / "sessions"
+            if sessions_dir.is_dir():
+                for session_dir in sessions_dir.iterdir():
+                    if not session_dir.name.startswith("session_"):
+                        continue
+                    session = _read_json(session_dir / "session_metadata.json")
+                    if session and 'id' in session:
+                        # Le répertoire fait foi pour le rattachement au projet
+                        session['project_id'] = project['id']
+                        sessions.append(session)
+                        session_ids[session_dir.name] = session['id']
+
+            files.extend(_walk_files(project['id'], project_dir, session_ids))
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM projects")
+            for project, project_dir in projects:
+                self._upsert_project(project, project_dir)
+            for session in sessions:
+                self._upsert_session(session)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files (path, project_id, session_id, size, mtime_ns) VALUES (?, ?, ?, ?, ?)",
+                files
+            )
+
+        counts = {'projects': len(projects), 'sessions': len(sessions), 'files': len(files)}
+        logger.info(f"Catalogue reconstruit: {counts}")
+        return counts
+
+    def refresh_files(self) -> int:
+        """
+        Resynchronise l'inventaire des fichiers avec le disque
+
+        Les fichiers écrits hors du ProjectManager (acquisition, exports)
+        ne passent pas par `upsert_files` : les répertoires des projets
+        catalogués sont reparcourus (stat seulement, sans relire les JSON)
+        et leurs fichiers remplacés dans une transaction unique.
+
+        Returns:
+            Nombre de fichiers catalogués
+        """
+        with self._lock:
+            projects = self._conn.execute("SELECT id, path FROM projects").fetchall()
+            sessions = self._conn.execute("SELECT id, project_id FROM sessions").fetchall()
+
+        files = []
+        for project in projects:
+            session_ids = {f"session_{row['id']}": row['id'] for row in sessions
+                           if row['project_id'] == project['id']}
+            files.extend(_walk_files(project['id'], Path(project['path']), session_ids))
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM files")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files (path, project_id, session_id, size, mtime_ns) VALUES (?, ?, ?, ?, ?)",
+                files
+            )
+        return len(files)
+
+
+def _walk_files(project_id: str, project_dir: Path, session_ids: Dict[str, str]) -> List[Tuple]:
+    """Lignes (chemin, projet, session, taille, mtime) de tous les fichiers d'un projet"""
+    files = []
+    for root, _, names in os.walk(project_dir):
+        root_path = Path(root)
+        parts = root_path.relative_to(project_dir).parts
+        session_id = session_ids.get(parts[1]) if len(parts) > 1 and parts[0] == "sessions" else None
+        for name in names:
+            path = root_path / name
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((str(path), project_id, session_id, stat.st_size, stat.st_mtime_ns))
+    return files
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        if path.exists():
+            logger.warning(f"Métadonnées illisibles {path}: {e}")
+        return None
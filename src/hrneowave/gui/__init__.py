@@ -4,24 +4,46 @@ Module GUI moderne pour CHNeoWave v3.0.0
 Architecture MVC avec workflow guidé en 5 étapes
 """
 
-# Import du thème (sans dépendances)
-from .styles.theme_manager import ThemeManager as CHNeoWaveTheme
+import importlib
+
+# Symbole -> (module, nom) : chargés à la première utilisation (PEP 562), ce qui
+# évite les importations circulaires et le coût de Qt pour `import hrneowave.gui`
+_LAZY_ATTRIBUTES = {
+    'MainController': ('controllers.main_controller', 'MainController'),
+    'AcquisitionController': ('controllers.acquisition_controller', 'AcquisitionController'),
+    'OptimizedProcessingWorker': ('controllers.optimized_processing_worker', 'OptimizedProcessingWorker'),
+    'ViewManager': ('view_manager', 'ViewManager'),
+    'WorkflowStep': ('components.breadcrumbs', 'WorkflowStep'),
+    'WelcomeView': ('views.welcome_view', 'WelcomeView'),
+    'CalibrationView': ('views.calibration_view', 'CalibrationView'),
+    'AcquisitionView': ('views.acquisition_view', 'AcquisitionView'),
+    'AnalysisView': ('views.analysis_view', 'AnalysisView'),
+    'ExportView': ('views.report_view', 'ReportView'),
+    'CHNeoWaveTheme': ('styles.theme_manager', 'ThemeManager'),
+}
+
+
+def __getattr__(name):
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = target
+    value = getattr(importlib.import_module(f".{module}", __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
-# Les autres imports seront faits à la demande pour éviter les importations circulaires
 def get_main_controller():
     from .controllers.main_controller import MainController
     return MainController
 
 
 def get_views():
-    from .views import (
-        WelcomeView,
-        CalibrationView,
-        AcquisitionView,
-        AnalysisView,
-        ExportView
-    )
-    return WelcomeView, CalibrationView, AcquisitionView, AnalysisView, ExportView
+    return tuple(__getattr__(name) for name in
+                 ('WelcomeView', 'CalibrationView', 'AcquisitionView', 'AnalysisView', 'ExportView'))
 
 # Fonctions individuelles pour le ViewManager
 
@@ -48,7 +70,7 @@ def get_analysis_view():
 
 def get_export_view():
     try:
-        from .views.export_view import ExportView
+        from .views.report_view import ReportView as ExportView
         return ExportView
     except ImportError:
         return None
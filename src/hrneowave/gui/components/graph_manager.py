@@ -14,7 +14,7 @@ Date: 2024
 import logging
 import time
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Dict, List, Optional, Tuple, Any, Union
 
 import numpy as np
@@ -27,9 +27,9 @@ try:
     QT_AVAILABLE = True
 except ImportError:
     try:
-        from PySide6.QtCore import QObject, QThread, QTimer, QMutex, Signal
-from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt
+        from PySide6.QtCore import QObject, QThread, QTimer, QMutex, Signal as pyqtSignal
+        from PySide6.QtWidgets import QWidget
+        from PySide6.QtCore import Qt
         QT_AVAILABLE = True
     except ImportError:
         QT_AVAILABLE = False
@@ -62,17 +62,26 @@ from PySide6.QtCore import Qt
                 DashDotLine = 4
 
 try:
-    # import pyqtgraph as pg
-# from pyqtgraph import PlotWidget
-# Utilisation de l'adaptateur matplotlib pour compatibilité PySide6
-from .matplotlib_adapter import pg, PlotWidget
+    import pyqtgraph as pg
+    import pyqtgraph.exporters
+    from pyqtgraph import PlotWidget
     PG_AVAILABLE = True
 except ImportError:
-    PG_AVAILABLE = False
-    # Classe factice pour les tests
-    class PlotWidget:
-        def __init__(self, parent=None): pass
-    pg = None
+    try:
+        # Adaptateur matplotlib si pyqtgraph n'est pas installé
+        from .matplotlib_adapter import pg, PlotWidget
+        PG_AVAILABLE = True
+    except ImportError:
+        PG_AVAILABLE = False
+        # Classe factice pour les tests
+        class PlotWidget:
+            def __init__(self, parent=None): pass
+        pg = None
+
+try:
+    from hrneowave.core.performance_monitor import get_performance_monitor
+except ImportError:
+    get_performance_monitor = None
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -115,7 +124,9 @@ class GraphConfiguration:
     update_rate_ms: int = 50
     max_points: int = 10000
     downsample_threshold: int = 5000
-    downsample_method: str = "lttb"  # lttb, uniform, peak
+    downsample_method: str = "auto"  # auto, lttb, minmax, uniform, peak
+    points_per_pixel: int = 2
+    max_fps: float = 30.0  # Cadence maximale de rafraîchissement des courbes temps réel
     
     # Paramètres d'export
     export_dpi: int = 300
@@ -130,7 +141,20 @@ def _ensure_qt_imports():
         raise ImportError("PyQtGraph requis pour les graphiques")
 
 class DownsamplingEngine:
-    """Moteur de down-sampling pour optimiser les performances"""
+    """Moteur de down-sampling pour optimiser les performances
+    
+    Toutes les méthodes sont vectorisées avec NumPy : les buckets sont
+    manipulés comme des tableaux 2-D (une ligne par bucket) et la sélection
+    se fait par argmin/argmax le long des lignes, sans boucle Python sur
+    les points.
+    """
+    
+    # Au-delà de ce ratio (points d'entrée / points de sortie), le LTTB
+    # travaille sur une présélection min/max (MinMaxLTTB)
+    MINMAX_PRESELECTION_RATIO = 4
+    
+    # Nombre de passes d'affinage des points d'ancrage du LTTB vectorisé
+    LTTB_PASSES = 2
     
     @staticmethod
     def uniform_downsample(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
@@ -142,63 +166,116 @@ class DownsamplingEngine:
         return x[indices], y[indices]
     
     @staticmethod
-    def lttb_downsample(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
-        """Largest Triangle Three Buckets algorithm"""
+    def _minmax_indices(y: np.ndarray, n_bins: int) -> np.ndarray:
+        """
+        Indices des minimum et maximum de chaque bin, dans l'ordre temporel
+        
+        Les bins sont contigus : les premiers font q+1 échantillons, les
+        suivants q, ce qui permet de travailler sur deux vues 2-D sans copie.
+        """
+        q, r = divmod(len(y), n_bins)
+        split = r * (q + 1)
+        parts = []
+        
+        for offset, block, width in ((0, y[:split], q + 1), (split, y[split:], q)):
+            if block.size == 0:
+                continue
+            rows = block.reshape(-1, width)
+            base = offset + np.arange(rows.shape[0]) * width
+            parts.append(np.stack((base + rows.argmin(axis=1), base + rows.argmax(axis=1)), axis=1))
+        
+        return np.sort(np.concatenate(parts), axis=1).ravel()
+    
+    @staticmethod
+    def minmax_downsample(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Down-sampling min/max par pixel
+        
+        Conserve le minimum et le maximum de chacun des n_out/2 bins : aucun
+        pic n'est perdu lorsque chaque bin correspond à une colonne de pixels.
+        """
         if len(x) <= n_out:
             return x, y
         
-        if n_out < 3:
-            return DownsamplingEngine.uniform_downsample(x, y, n_out)
+        n_bins = max(n_out // 2, 1)
+        indices = DownsamplingEngine._minmax_indices(y, n_bins)
+        return x[indices], y[indices]
+    
+    @classmethod
+    def _lttb_indices(cls, x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+        """
+        Indices retenus par le LTTB vectorisé
         
-        # Initialisation
-        sampled_x = np.zeros(n_out)
-        sampled_y = np.zeros(n_out)
+        Les aires des triangles sont calculées pour tous les buckets à la fois
+        sur une matrice (bucket, point). Le point d'ancrage de chaque bucket,
+        qui dépend séquentiellement de la sélection précédente dans le LTTB
+        classique, est initialisé au barycentre du bucket précédent puis
+        affiné en LTTB_PASSES passes.
+        """
+        n = len(x)
+        n_buckets = n_out - 2
+        every = (n - 2) / n_buckets
         
-        # Premier et dernier points
-        sampled_x[0] = x[0]
-        sampled_y[0] = y[0]
-        sampled_x[-1] = x[-1]
-        sampled_y[-1] = y[-1]
+        edges = (np.floor(np.arange(n_buckets + 1) * every) + 1).astype(np.intp)
+        edges[-1] = n - 1
+        starts = edges[:-1]
+        counts = np.diff(edges)
+        width = int(counts.max())
         
-        # Taille des buckets
-        bucket_size = (len(x) - 2) / (n_out - 2)
+        if np.all(counts == width):
+            x2d = x[1:n - 1].reshape(n_buckets, width)
+            y2d = y[1:n - 1].reshape(n_buckets, width)
+        else:
+            # Buckets inégaux : on complète en répétant le dernier point du bucket
+            idx = np.minimum(starts[:, None] + np.arange(width), (edges[1:] - 1)[:, None])
+            x2d = x[idx]
+            y2d = y[idx]
         
-        a = 0  # Point précédent
+        # Barycentres des buckets et point moyen du bucket suivant
+        mean_x = np.add.reduceat(x[:n - 1], starts) / counts
+        mean_y = np.add.reduceat(y[:n - 1], starts) / counts
+        next_x = np.append(mean_x[1:], x[-1])
+        next_y = np.append(mean_y[1:], y[-1])
         
-        for i in range(1, n_out - 1):
-            # Calcul des indices du bucket
-            avg_range_start = int(np.floor((i - 1) * bucket_size) + 1)
-            avg_range_end = int(np.floor(i * bucket_size) + 1)
-            avg_range_end = min(avg_range_end, len(x))
-            
-            # Point moyen du bucket suivant
-            avg_range_start_next = int(np.floor(i * bucket_size) + 1)
-            avg_range_end_next = int(np.floor((i + 1) * bucket_size) + 1)
-            avg_range_end_next = min(avg_range_end_next, len(x))
-            
-            if avg_range_start_next < len(x):
-                avg_x = np.mean(x[avg_range_start_next:avg_range_end_next])
-                avg_y = np.mean(y[avg_range_start_next:avg_range_end_next])
-            else:
-                avg_x = x[-1]
-                avg_y = y[-1]
-            
-            # Trouver le point avec la plus grande aire
-            max_area = -1
-            max_area_point = avg_range_start
-            
-            for j in range(avg_range_start, avg_range_end):
-                if j < len(x):
-                    area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
-                    if area > max_area:
-                        max_area = area
-                        max_area_point = j
-            
-            sampled_x[i] = x[max_area_point]
-            sampled_y[i] = y[max_area_point]
-            a = max_area_point
+        anchor_x = np.empty(n_buckets)
+        anchor_y = np.empty(n_buckets)
+        anchor_x[0], anchor_y[0] = x[0], y[0]
+        anchor_x[1:] = mean_x[:-1]
+        anchor_y[1:] = mean_y[:-1]
+        
+        selected = starts
+        for _ in range(max(cls.LTTB_PASSES, 1)):
+            # Aire (x2) du triangle (ancre, point candidat, moyenne suivante)
+            area = np.abs(
+                x2d * (next_y - anchor_y)[:, None]
+                + y2d * (anchor_x - next_x)[:, None]
+                + (next_x * anchor_y - anchor_x * next_y)[:, None]
+            )
+            selected = starts + area.argmax(axis=1)
+            anchor_x[1:] = x[selected[:-1]]
+            anchor_y[1:] = y[selected[:-1]]
         
-        return sampled_x, sampled_y
+        return np.concatenate(([0], selected, [n - 1]))
+    
+    @classmethod
+    def lttb_downsample(cls, x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Largest Triangle Three Buckets algorithm (vectorisé)"""
+        if len(x) <= n_out:
+            return x, y
+        
+        if n_out < 3:
+            return cls.uniform_downsample(x, y, n_out)
+        
+        n = len(x)
+        if n > cls.MINMAX_PRESELECTION_RATIO * n_out:
+            # MinMaxLTTB : présélection des extrêmes puis LTTB sur la présélection
+            n_bins = cls.MINMAX_PRESELECTION_RATIO * n_out // 2
+            inner = cls._minmax_indices(y[1:n - 1], n_bins) + 1
+            preselected = np.concatenate(([0], inner, [n - 1]))
+            x, y = x[preselected], y[preselected]
+        
+        indices = cls._lttb_indices(x, y, n_out)
+        return x[indices], y[indices]
     
     @staticmethod
     def peak_downsample(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
@@ -227,16 +304,159 @@ class DownsamplingEngine:
         
         return x[final_indices], y[final_indices]
     
+    @staticmethod
+    def select_method(method: str, pixel_width: int = 0) -> str:
+        """
+        Résout la méthode "auto" à partir de la largeur du widget en pixels
+        
+        Quand la largeur est connue, le min/max par colonne de pixels est
+        visuellement sans perte ; sinon on se rabat sur le LTTB.
+        """
+        if method != "auto":
+            return method
+        return "minmax" if pixel_width > 0 else "lttb"
+    
+    @staticmethod
+    def target_points(config: 'GraphConfiguration', pixel_width: int = 0) -> int:
+        """Nombre de points à afficher pour un widget de largeur donnée"""
+        if pixel_width > 0:
+            return max(min(config.points_per_pixel * pixel_width, config.max_points), 3)
+        return min(config.downsample_threshold, config.max_points)
+    
     @classmethod
-    def downsample(cls, x: np.ndarray, y: np.ndarray, n_out: int, method: str = "lttb") -> Tuple[np.ndarray, np.ndarray]:
+    def downsample(cls, x: np.ndarray, y: np.ndarray, n_out: int, method: str = "lttb",
+                   pixel_width: int = 0) -> Tuple[np.ndarray, np.ndarray]:
         """Interface principale de down-sampling"""
+        method = cls.select_method(method, pixel_width)
         if method == "uniform":
             return cls.uniform_downsample(x, y, n_out)
         elif method == "peak":
             return cls.peak_downsample(x, y, n_out)
+        elif method == "minmax":
+            return cls.minmax_downsample(x, y, n_out)
         else:
             return cls.lttb_downsample(x, y, n_out)  # Fallback
 
+class LiveCurveRing:
+    """
+    Courbe temps réel à capacité fixe alimentée par ajout
+    
+    Les nouveaux échantillons sont décimés (min/max par bucket de
+    `decimation` échantillons) au fil de l'eau : seul le nouveau segment est
+    traité, le reliquat incomplet est conservé pour l'ajout suivant. Chaque
+    point est écrit deux fois (anneau miroir) afin que la fenêtre courante
+    soit toujours une vue contiguë, transmise au widget sans copie.
+    """
+    
+    def __init__(self, capacity: int, decimation: int = 1):
+        """
+        Args:
+            capacity: Nombre maximal de points affichés
+            decimation: Échantillons bruts par paire min/max (1 = sans décimation)
+        """
+        if capacity < 2:
+            raise ValueError("La capacité doit être d'au moins 2 points")
+        
+        self.capacity = int(capacity)
+        self.decimation = max(int(decimation), 1)
+        self._x = np.empty(2 * self.capacity)
+        self._y = np.empty(2 * self.capacity)
+        self._count = 0
+        self._pending_x = np.empty(0)
+        self._pending_y = np.empty(0)
+        self.samples_appended = 0
+    
+    @classmethod
+    def for_window(cls, window_samples: int, pixel_width: int,
+                   points_per_pixel: int = 2) -> 'LiveCurveRing':
+        """
+        Dimensionne l'anneau pour une fenêtre glissante affichée sur pixel_width pixels
+        """
+        pixel_width = max(int(pixel_width), 1)
+        max_points = max(points_per_pixel * pixel_width, 2)
+        if window_samples <= max_points:
+            return cls(max(window_samples, 2), 1)
+        
+        decimation = -(-window_samples // (max_points // 2))
+        return cls(2 * (-(-window_samples // decimation)), decimation)
+    
+    def resized(self, window_samples: int, pixel_width: int,
+                points_per_pixel: int = 2) -> 'LiveCurveRing':
+        """
+        Anneau redimensionné pour une nouvelle largeur, initialisé avec la fenêtre courante
+        
+        Retourne l'anneau lui-même si le dimensionnement est inchangé.
+        """
+        ring = self.for_window(window_samples, pixel_width, points_per_pixel)
+        if (ring.capacity, ring.decimation) == (self.capacity, self.decimation):
+            return self
+        
+        x, y = self.view()
+        if len(x) > ring.capacity:
+            x, y = DownsamplingEngine.minmax_downsample(x, y, ring.capacity)
+        ring._write(x, y)
+        ring.samples_appended = self.samples_appended
+        return ring
+    
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+    
+    def append(self, x: np.ndarray, y: np.ndarray) -> int:
+        """
+        Ajoute de nouveaux échantillons
+        
+        Returns:
+            Nombre de points ajoutés à l'anneau après décimation
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if len(x) != len(y):
+            raise ValueError("Les arrays x et y doivent avoir la même longueur")
+        self.samples_appended += len(x)
+        
+        if self.decimation > 1:
+            if len(self._pending_x):
+                x = np.concatenate((self._pending_x, x))
+                y = np.concatenate((self._pending_y, y))
+            n_buckets = len(x) // self.decimation
+            complete = n_buckets * self.decimation
+            self._pending_x, self._pending_y = x[complete:], y[complete:]
+            if n_buckets == 0:
+                return 0
+            indices = DownsamplingEngine._minmax_indices(y[:complete], n_buckets)
+            x, y = x[indices], y[indices]
+        
+        self._write(x, y)
+        return len(x)
+    
+    def _write(self, x: np.ndarray, y: np.ndarray):
+        """Écrit des points dans les deux moitiés de l'anneau miroir"""
+        if len(x) > self.capacity:
+            skipped = len(x) - self.capacity
+            self._count += skipped
+            x, y = x[skipped:], y[skipped:]
+        
+        positions = (self._count + np.arange(len(x))) % self.capacity
+        self._x[positions] = x
+        self._y[positions] = y
+        self._x[positions + self.capacity] = x
+        self._y[positions + self.capacity] = y
+        self._count += len(x)
+    
+    def view(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Vues (sans copie) sur les points de la fenêtre courante, dans l'ordre"""
+        if self._count <= self.capacity:
+            return self._x[:self._count], self._y[:self._count]
+        start = self._count % self.capacity
+        return self._x[start:start + self.capacity], self._y[start:start + self.capacity]
+    
+    def clear(self):
+        """Vide l'anneau"""
+        self._count = 0
+        self._pending_x = np.empty(0)
+        self._pending_y = np.empty(0)
+        self.samples_appended = 0
+
 # Classes créées dynamiquement après import PyQt
 GraphWorker = None
 OptimizedPlotWidget = None
@@ -262,17 +482,20 @@ def _create_graph_classes():
             self.mutex = QMutex()
             self.executor = ThreadPoolExecutor(max_workers=2)
         
-        def process_data(self, graph_id: str, plot_data: PlotData, config: GraphConfiguration):
+        def process_data(self, graph_id: str, plot_data: PlotData, config: GraphConfiguration,
+                         pixel_width: int = 0):
             """
             Traite les données de graphique de manière asynchrone
             """
-            future = self.executor.submit(self._process_data_sync, graph_id, plot_data, config)
+            future = self.executor.submit(self._process_data_sync, graph_id, plot_data, config, pixel_width)
             future.add_done_callback(lambda f: self._on_processing_complete(graph_id, f))
         
-        def _process_data_sync(self, graph_id: str, plot_data: PlotData, config: GraphConfiguration) -> PlotData:
+        def _process_data_sync(self, graph_id: str, plot_data: PlotData, config: GraphConfiguration,
+                               pixel_width: int = 0) -> PlotData:
             """
             Traitement synchrone des données
             """
+            start = time.perf_counter()
             try:
                 # Copie des données pour éviter les modifications concurrentes
                 x = plot_data.x.copy()
@@ -293,10 +516,12 @@ def _create_graph_classes():
                 if len(x) == 0:
                     raise ValueError("Aucune donnée valide après nettoyage")
                 
-                # Down-sampling si nécessaire
-                if len(x) > config.downsample_threshold:
-                    target_points = min(config.downsample_threshold, config.max_points)
-                    x, y = DownsamplingEngine.downsample(x, y, target_points, config.downsample_method)
+                # Down-sampling si nécessaire (cible dérivée de la largeur en pixels)
+                target_points = DownsamplingEngine.target_points(config, pixel_width)
+                if len(x) > target_points:
+                    x, y = DownsamplingEngine.downsample(
+                        x, y, target_points, config.downsample_method, pixel_width
+                    )
                     logger.debug(f"Down-sampling: {len(plot_data.x)} -> {len(x)} points")
                 
                 # Création des données traitées
@@ -313,6 +538,10 @@ def _create_graph_classes():
                     z_order=plot_data.z_order
                 )
                 
+                if get_performance_monitor is not None:
+                    get_performance_monitor().record_latency(
+                        'plot_prepare', time.perf_counter() - start, len(plot_data.x)
+                    )
                 return processed_data
             
             except Exception as e:
@@ -340,6 +569,13 @@ def _create_graph_classes():
             self.update_timer = QTimer()
             self.pending_updates = []
             
+            # Courbes temps réel et gouverneur de cadence d'affichage
+            self.live_curves: Dict[str, LiveCurveRing] = {}
+            self.live_windows: Dict[str, int] = {}
+            self.dirty_curves = set()
+            self.frame_timer = QTimer()
+            self.frames_rendered = 0
+            
             self.setup_plot()
             self.setup_timer()
             
@@ -367,7 +603,7 @@ def _create_graph_classes():
             self.getPlotItem().enableAutoRange()
             
             # Anti-aliasing pour de meilleurs rendus
-            self.getPlotItem().setAntialiasing(True)
+            self.setAntialiasing(True)
             
         def setup_timer(self):
             """
@@ -376,6 +612,83 @@ def _create_graph_classes():
             self.update_timer.timeout.connect(self.process_pending_updates)
             self.update_timer.setSingleShot(False)
             self.update_timer.setInterval(self.config.update_rate_ms)
+            
+            # Les courbes temps réel ne sont redessinées qu'à max_fps au plus,
+            # quelle que soit la fréquence d'arrivée des données
+            self.frame_timer.timeout.connect(self.render_live_frame)
+            self.frame_timer.setSingleShot(False)
+            self.frame_timer.setInterval(max(int(1000 / self.config.max_fps), 1))
+        
+        def add_live_curve(self, plot_data: PlotData, window_samples: int) -> LiveCurveRing:
+            """
+            Crée une courbe temps réel adossée à un anneau de capacité fixe
+            
+            Args:
+                plot_data: Style de la courbe (x et y sont ignorés)
+                window_samples: Nombre d'échantillons bruts de la fenêtre glissante
+            """
+            ring = LiveCurveRing.for_window(
+                window_samples, self.width(), self.config.points_per_pixel
+            )
+            self.remove_plot_data(plot_data.name)
+            self._add_plot_data_immediate(replace(plot_data, x=np.empty(0), y=np.empty(0)))
+            self.live_curves[plot_data.name] = ring
+            self.live_windows[plot_data.name] = window_samples
+            return ring
+        
+        def resizeEvent(self, event):
+            """
+            Redimensionne les anneaux temps réel sur la nouvelle largeur en pixels
+            """
+            super().resizeEvent(event)
+            # Aussi appelé pendant PlotWidget.__init__, avant les courbes temps réel
+            if 'live_curves' not in self.__dict__:
+                return
+            for name, ring in list(self.live_curves.items()):
+                resized = ring.resized(
+                    self.live_windows[name], self.width(), self.config.points_per_pixel
+                )
+                if resized is not ring:
+                    self.live_curves[name] = resized
+                    self.dirty_curves.add(name)
+            if self.dirty_curves and not self.frame_timer.isActive():
+                self.frame_timer.start()
+        
+        def append_live_data(self, name: str, x: np.ndarray, y: np.ndarray):
+            """
+            Ajoute des échantillons à une courbe temps réel
+            
+            Aucun redessin n'est fait ici : la courbe est marquée et sera
+            rafraîchie au prochain tick du gouverneur de cadence.
+            """
+            ring = self.live_curves.get(name)
+            if ring is None:
+                raise KeyError(f"Courbe temps réel inconnue: {name}")
+            
+            if ring.append(x, y):
+                self.dirty_curves.add(name)
+                if not self.frame_timer.isActive():
+                    self.frame_timer.start()
+        
+        def render_live_frame(self):
+            """
+            Redessine les courbes temps réel modifiées depuis la dernière image
+            """
+            if not self.dirty_curves:
+                self.frame_timer.stop()
+                return
+            
+            start = time.perf_counter()
+            for name in self.dirty_curves:
+                if name in self.plot_items and name in self.live_curves:
+                    self.plot_items[name].setData(*self.live_curves[name].view())
+            
+            if get_performance_monitor is not None:
+                get_performance_monitor().record_latency(
+                    'plot', time.perf_counter() - start, len(self.dirty_curves)
+                )
+            self.dirty_curves.clear()
+            self.frames_rendered += 1
         
         def add_plot_data(self, plot_data: PlotData, update_immediately: bool = True):
             """
@@ -461,6 +774,9 @@ def _create_graph_classes():
             if name in self.plot_items:
                 self.removeItem(self.plot_items[name])
                 del self.plot_items[name]
+            self.live_curves.pop(name, None)
+            self.live_windows.pop(name, None)
+            self.dirty_curves.discard(name)
         
         def clear_all_plots(self):
             """
@@ -469,6 +785,10 @@ def _create_graph_classes():
             self.clear()
             self.plot_items.clear()
             self.pending_updates.clear()
+            self.live_curves.clear()
+            self.live_windows.clear()
+            self.dirty_curves.clear()
+            self.frame_timer.stop()
         
         def process_pending_updates(self):
             """
@@ -528,6 +848,7 @@ class GraphManager(QObject):
         super().__init__(parent)
         self.graphs: Dict[str, OptimizedPlotWidget] = {}
         self.configurations: Dict[str, GraphConfiguration] = {}
+        self.pyramid_sources: Dict[str, Tuple[Any, Optional[int], float, PlotData, Any]] = {}
         self.worker_thread = QThread()
         self.worker = GraphWorker()
         self.worker.moveToThread(self.worker_thread)
@@ -574,19 +895,110 @@ class GraphManager(QObject):
             return
         
         config = self.configurations[graph_id]
+        pixel_width = self.graphs[graph_id].width()
         
         if async_processing and len(plot_data.x) > 1000:
             # Traitement asynchrone pour les gros datasets
-            self.worker.process_data(graph_id, plot_data, config)
+            self.worker.process_data(graph_id, plot_data, config, pixel_width)
         else:
             # Traitement synchrone pour les petits datasets
             try:
-                processed_data = self.worker._process_data_sync(graph_id, plot_data, config)
+                processed_data = self.worker._process_data_sync(graph_id, plot_data, config, pixel_width)
                 self.graphs[graph_id].add_plot_data(processed_data)
                 self.graph_updated.emit(graph_id)
             except Exception as e:
                 self.error_occurred.emit(graph_id, str(e))
     
+    def attach_pyramid(self, graph_id: str, pyramid, sample_rate: float,
+                       channel: Optional[int] = None, style: Optional[PlotData] = None):
+        """
+        Associe une pyramide min/max (voir utils.hdf_pyramid) à un graphique
+        
+        Chaque changement de plage X du graphique (zoom, déplacement) relit
+        alors le niveau adapté au lieu de redécimer les données brutes. Le
+        graphique est d'abord cadré sur l'enregistrement complet.
+        """
+        if graph_id not in self.graphs:
+            logger.error(f"Graphique {graph_id} non trouvé")
+            return
+        
+        self.detach_pyramid(graph_id)
+        if style is None:
+            style = PlotData(x=np.empty(0), y=np.empty(0), name=graph_id)
+        
+        graph = self.graphs[graph_id]
+        view_box = graph.getPlotItem().getViewBox()
+        on_range_changed = lambda _view_box, x_range: self.update_graph_range(graph_id, *x_range)
+        self.pyramid_sources[graph_id] = (pyramid, channel, sample_rate, style, on_range_changed)
+        
+        # La plage X est pilotée par l'utilisateur ; seul Y suit les données
+        view_box.enableAutoRange(x=False)
+        duration = pyramid.n_samples / sample_rate
+        graph.setXRange(0, duration, padding=0)
+        self.update_graph_range(graph_id, 0, duration)
+        view_box.sigXRangeChanged.connect(on_range_changed)
+    
+    def detach_pyramid(self, graph_id: str):
+        """
+        Dissocie la pyramide d'un graphique (la courbe affichée est conservée)
+        """
+        source = self.pyramid_sources.pop(graph_id, None)
+        if source is None or graph_id not in self.graphs:
+            return
+        self.graphs[graph_id].getPlotItem().getViewBox().sigXRangeChanged.disconnect(source[-1])
+    
+    def update_graph_range(self, graph_id: str, t_start: float, t_end: float):
+        """
+        Affiche la plage [t_start, t_end] (secondes) depuis la pyramide associée
+        
+        Le niveau est choisi d'après la plage visible et la largeur du widget en
+        pixels : seuls quelques milliers de points sont lus quel que soit le zoom.
+        """
+        if graph_id not in self.pyramid_sources:
+            logger.error(f"Aucune pyramide associée au graphique {graph_id}")
+            return
+        
+        pyramid, channel, sample_rate, style, _ = self.pyramid_sources[graph_id]
+        graph = self.graphs[graph_id]
+        pixel_width = max(graph.width(), 1)
+        start = int(np.floor(t_start * sample_rate))
+        stop = int(np.ceil(t_end * sample_rate))
+        
+        try:
+            index, values = pyramid.read_envelope(start, stop, pixel_width, channel)
+            if style.name in graph.plot_items:
+                # Mise à jour en place : recréer la courbe relancerait l'auto-range
+                graph.plot_items[style.name].setData(index / sample_rate, values)
+            else:
+                graph.update_plot_data(style.name, replace(style, x=index / sample_rate, y=values))
+            self.graph_updated.emit(graph_id)
+        except Exception as e:
+            self.error_occurred.emit(graph_id, str(e))
+    
+    def create_live_curve(self, graph_id: str, plot_data: PlotData, window_samples: int) -> Optional[LiveCurveRing]:
+        """
+        Crée une courbe temps réel (ajout seul) sur un graphique
+        
+        Les données temps réel ne passent pas par le GraphWorker : elles sont
+        décimées à l'ajout et affichées au rythme du gouverneur de cadence.
+        """
+        if graph_id not in self.graphs:
+            logger.error(f"Graphique {graph_id} non trouvé")
+            return None
+        return self.graphs[graph_id].add_live_curve(plot_data, window_samples)
+    
+    def append_live_data(self, graph_id: str, name: str, x: np.ndarray, y: np.ndarray):
+        """
+        Ajoute des échantillons à une courbe temps réel (thread GUI)
+        """
+        if graph_id not in self.graphs:
+            logger.error(f"Graphique {graph_id} non trouvé")
+            return
+        try:
+            self.graphs[graph_id].append_live_data(name, x, y)
+        except Exception as e:
+            self.error_occurred.emit(graph_id, str(e))
+    
     def on_data_processed(self, graph_id: str, processed_data: PlotData):
         """
         Gestionnaire de données traitées
@@ -607,6 +1019,7 @@ class GraphManager(QObject):
         Efface un graphique
         """
         if graph_id in self.graphs:
+            self.detach_pyramid(graph_id)
             self.graphs[graph_id].clear_all_plots()
     
     def remove_graph(self, graph_id: str):
@@ -614,6 +1027,7 @@ class GraphManager(QObject):
         Supprime un graphique
         """
         if graph_id in self.graphs:
+            self.detach_pyramid(graph_id)
             self.graphs[graph_id].deleteLater()
             del self.graphs[graph_id]
             del self.configurations[graph_id]
@@ -640,7 +1054,9 @@ class GraphManager(QObject):
             stats['graphs'][graph_id] = {
                 'plot_items_count': len(graph.plot_items),
                 'pending_updates': len(graph.pending_updates),
-                'timer_active': graph.update_timer.isActive()
+                'timer_active': graph.update_timer.isActive(),
+                'live_curves': len(graph.live_curves),
+                'frames_rendered': graph.frames_rendered
             }
         
         return stats
@@ -678,13 +1094,13 @@ def benchmark_downsampling(n_points: int = 100000, n_out: int = 1000):
     x = np.linspace(0, 100, n_points)
     y = np.sin(x) + 0.1 * np.random.randn(n_points)
     
-    methods = ["uniform", "lttb", "peak"]
+    methods = ["uniform", "lttb", "minmax", "peak"]
     results = {}
     
     for method in methods:
-        start_time = time.time()
+        start_time = time.perf_counter()
         x_down, y_down = DownsamplingEngine.downsample(x, y, n_out, method)
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         results[method] = {
             'time': end_time - start_time,
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 """
 Contrôleur principal pour l'acquisition de données de houle
-Supporte différents backends: simulate, NI-DAQ, IOTech, Arduino
+Supporte différents backends: simulate, NI-DAQ, IOTech, Arduino, synthétique, rejeu
 Intégration complète avec l'interface utilisateur PyQt5
 """
 
@@ -23,13 +23,19 @@ from PySide6.QtWidgets import QApplication
 # Import du nouveau système de signaux unifié
 try:
     from hrneowave.core.signal_bus import (
-        get_signal_bus, get_error_bus, ErrorLevel, SessionState
+        get_signal_bus, get_error_bus, ErrorLevel, SessionState, DataBlock
     )
     UNIFIED_SIGNALS_AVAILABLE = True
 except ImportError:
     UNIFIED_SIGNALS_AVAILABLE = False
     print("Système de signaux unifié non disponible, utilisation des signaux legacy")
 
+# Instrumentation des étapes du pipeline
+try:
+    from hrneowave.core.performance_monitor import get_performance_monitor
+except ImportError:
+    get_performance_monitor = None
+
 # Tentative d'import du circular_buffer
 try:
     from hrneowave.core.circular_buffer import create_circular_buffer, BufferConfig
@@ -121,6 +127,8 @@ class AcquisitionMode(Enum):
     NI_DAQ = "ni"
     IOTECH = "iotech"
     ARDUINO = "arduino"
+    SYNTHETIC = "synthetic"
+    REPLAY = "replay"
 
 class AcquisitionState(Enum):
     """États de l'acquisition"""
@@ -149,6 +157,9 @@ class AcquisitionConfig:
     # Paramètres d'interface
     update_interval_ms: int = 15  # 60+ FPS pour fluidité
     
+    # Durée d'un DataBlock publié sur le bus (secondes)
+    block_duration: float = 0.1
+    
     def __post_init__(self):
         if self.device_config is None:
             self.device_config = {}
@@ -162,8 +173,8 @@ class AcquisitionController(QObject):
     Version 3.0.0 - Intégration du système de signaux unifié
     """
     
-    # Signaux Qt unifiés (P0) - émis toutes les 0,5s
-    dataBlockReady = Signal(object)  # DataBlock (émis toutes 0,5s)
+    # Signaux Qt unifiés (P0)
+    dataBlockReady = Signal(object)  # DataBlock (chaque bloc, tous les échantillons)
     sessionFinished = Signal()       # émis après Stop
     error = Signal(str)              # erreur simplifiée
     
@@ -185,20 +196,35 @@ class AcquisitionController(QObject):
         self._start_time = None
         self._sequence_id = 0
         
-        # Initialiser le buffer circulaire
+        # Initialiser le buffer circulaire (anneau en écrasement : les blocs
+        # publiés sont des vues sur cet anneau)
         buffer_config = BufferConfig(
             n_channels=config.n_channels,
             buffer_size=config.buffer_size,
-            sample_rate=config.sample_rate
+            sample_rate=config.sample_rate,
+            enable_overflow_detection=False
         )
         self.buffer = create_circular_buffer(buffer_config)
+        self._block_start = 0
+        
+        # Logger
+        self.logger = logging.getLogger(__name__)
+        
+        # Un bloc publié doit tenir dans l'anneau (vues sans copie)
+        self._block_size = max(1, int(round(config.block_duration * config.sample_rate)))
+        if self._block_size > config.buffer_size:
+            self.logger.warning(
+                f"Bloc de {self._block_size} échantillons plus grand que l'anneau "
+                f"({config.buffer_size}) : ramené à la taille de l'anneau"
+            )
+            self._block_size = config.buffer_size
         
         # Backend d'acquisition
         self._backend = None
         self._init_backend()
         
-        # Logger
-        self.logger = logging.getLogger(__name__)
+        # Moniteur de performance (latences read / calibrate / buffer_write)
+        self._monitor = get_performance_monitor() if get_performance_monitor else None
         
         # Système de signaux unifié
         if UNIFIED_SIGNALS_AVAILABLE:
@@ -234,6 +260,11 @@ class AcquisitionController(QObject):
                     self._backend = IOTechBackend(self.config)
             elif self.config.mode == AcquisitionMode.ARDUINO:
                 self._backend = ArduinoBackend(self.config)
+            elif self.config.mode == AcquisitionMode.SYNTHETIC:
+                self._backend = BlockDAQBackend(self.config, 'synthetic')
+            elif self.config.mode == AcquisitionMode.REPLAY:
+                # Session enregistrée rejouée à travers calibration, validation et affichage
+                self._backend = BlockDAQBackend(self.config, 'replay')
             else:
                 raise ValueError(f"Mode d'acquisition non supporté: {self.config.mode}")
         except Exception as e:
@@ -280,6 +311,7 @@ class AcquisitionController(QObject):
             self.buffer.reset()
             self._samples_count = 0
             self._sequence_id = 0
+            self._block_start = 0
             self._start_time = time.time()
             
             # Configuration de session
@@ -357,6 +389,10 @@ class AcquisitionController(QObject):
         if self._acquisition_thread and self._acquisition_thread.is_alive():
             self._acquisition_thread.join(timeout=2.0)
         
+        # Dernier bloc partiel
+        if not (self._acquisition_thread and self._acquisition_thread.is_alive()):
+            self._publish_blocks()
+        
         if self._backend:
             self._backend.disconnect()
         
@@ -388,48 +424,45 @@ class AcquisitionController(QObject):
         sample_interval = 1.0 / self.config.sample_rate
         last_emit_time = time.time()
         emit_interval = 0.5  # P0: émission toutes les 0,5s
+        monitor = self._monitor
+        self_paced = getattr(self._backend, 'self_paced', False)
         
         while not self._stop_event.is_set():
             try:
                 start_time = time.time()
                 
                 # Lire les données du backend
-                data = self._backend.read_sample()
+                if monitor is not None:
+                    with monitor.span('read'):
+                        data = self._backend.read_sample()
+                else:
+                    data = self._backend.read_sample()
                 if data is not None:
-                    # Appliquer la calibration si disponible
-                    calibrated_data = self._apply_calibration(data)
-                    
-                    # Écrire dans le buffer
-                    self.buffer.write(calibrated_data)
+                    if monitor is not None:
+                        # Appliquer la calibration si disponible
+                        with monitor.span('calibrate'):
+                            calibrated_data = self._apply_calibration(data)
+                        
+                        # Écrire dans le buffer (un échantillon par canal)
+                        with monitor.span('buffer_write'):
+                            self.buffer.write(np.asarray(calibrated_data).reshape(-1, 1))
+                    else:
+                        calibrated_data = self._apply_calibration(data)
+                        self.buffer.write(np.asarray(calibrated_data).reshape(-1, 1))
                     self._samples_count += 1
-                    self._sequence_id += 1
                     
-                    # Émettre les signaux à intervalle régulier pour éviter la surcharge
+                    # Publier chaque bloc complet : tous les échantillons, sans copie
+                    if self._samples_count - self._block_start >= self._block_size:
+                        self._publish_blocks()
+                    
+                    # Signaux legacy à intervalle régulier pour éviter la surcharge
                     current_time = time.time()
                     if current_time - last_emit_time >= emit_interval:
-                        # Signaux legacy
                         self.data_ready.emit(calibrated_data, current_time)
                         self.samples_acquired.emit(self._samples_count)
-                        
-                        # Nouveau système unifié - créer un DataBlock
-                        if self.signal_bus:
-                            data_block = {
-                                'data': calibrated_data,
-                                'timestamp': current_time,
-                                'sequence_id': self._sequence_id,
-                                'sample_rate': self.config.sample_rate,
-                                'n_channels': self.config.n_channels
-                            }
-                            self.dataBlockReady.emit(data_block)
-                            self.signal_bus.emit_data_block(
-                                data=calibrated_data,
-                                timestamp=current_time,
-                                sample_rate=self.config.sample_rate,
-                                n_channels=self.config.n_channels,
-                                sequence_id=self._sequence_id
-                            )
-                        
                         last_emit_time = current_time
+                        if monitor is not None and hasattr(self.buffer, 'get_fill_ratio'):
+                            monitor.observe('buffer_fill', self.buffer.get_fill_ratio())
                     
                     # Vérifier la durée maximale si définie
                     if (self.config.duration and 
@@ -437,6 +470,9 @@ class AcquisitionController(QObject):
                         break
                 
                 # Attendre pour maintenir la fréquence d'échantillonnage
+                # (sauf backend qui cadence lui-même ses blocs)
+                if self_paced:
+                    continue
                 elapsed = time.time() - start_time
                 sleep_time = max(0, sample_interval - elapsed)
                 if sleep_time > 0:
@@ -459,6 +495,36 @@ class AcquisitionController(QObject):
                 self._set_state(AcquisitionState.ERROR)
                 break
     
+    def _publish_blocks(self):
+        """
+        Publie les échantillons écrits depuis le dernier bloc
+        
+        Les données sont des vues en lecture seule sur l'anneau ; un bloc qui
+        franchit la fin de l'anneau est publié en deux DataBlocks contigus.
+        """
+        n_samples = self._samples_count - self._block_start
+        if n_samples <= 0 or not UNIFIED_SIGNALS_AVAILABLE or not hasattr(self.buffer, 'get_views'):
+            return
+        
+        start_sample = self._block_start
+        for view in self.buffer.get_views(start_sample, n_samples):
+            block = DataBlock(
+                data=view,
+                timestamp=self._start_time + start_sample / self.config.sample_rate,
+                sample_rate=self.config.sample_rate,
+                n_channels=self.config.n_channels,
+                sequence_id=self._sequence_id,
+                start_sample=start_sample
+            )
+            self._sequence_id += 1
+            start_sample += block.n_samples
+            
+            if self.signal_bus:
+                self.signal_bus.publish_block(block)
+            self.dataBlockReady.emit(block)
+        
+        self._block_start = self._samples_count
+    
     def _apply_calibration(self, raw_data: np.ndarray) -> np.ndarray:
         """Applique la calibration aux données brutes"""
         if not self.config.calibration_params:
@@ -556,10 +622,19 @@ class AcquisitionController(QObject):
     
     def clear(self):
         """Vide le buffer circulaire"""
+        # Publier les échantillons en attente avant de repartir de zéro
+        try:
+            self._publish_blocks()
+        except ValueError as e:
+            self.logger.warning(f"Échantillons en attente non publiés: {e}")
+        
         if hasattr(self.buffer, 'reset'):
             self.buffer.reset()
         self._samples_count = 0
         self._sequence_id = 0
+        self._block_start = 0
+        if self.signal_bus:
+            self.signal_bus.reset_block_sequence()
         self.status_changed.emit("Buffer vidé")
         
         if self.error_bus:
@@ -849,14 +924,101 @@ class ArduinoBackend(AcquisitionBackend):
         }
 
 
+class BlockDAQBackend(AcquisitionBackend):
+    """
+    Adaptateur des backends par blocs de hrneowave.hardware (synthétique, rejeu)
+    
+    Le backend est ouvert avec la configuration du contrôleur complétée par
+    device_config ; ses blocs (canaux x échantillons) sont servis échantillon
+    par échantillon. Ces backends cadencent eux-mêmes leurs blocs (temps réel,
+    accéléré ou sans limite) : le contrôleur ne temporise pas.
+    """
+    
+    def __init__(self, config: AcquisitionConfig, backend_name: str):
+        super().__init__(config)
+        self.backend_name = backend_name
+        self.is_connected = False
+        self.handler = None
+        self._block = None
+        self._index = 0
+    
+    @property
+    def self_paced(self) -> bool:
+        return bool(getattr(self.handler, 'self_paced', False))
+    
+    def connect(self) -> bool:
+        """Ouvre et démarre le backend matériel"""
+        from hrneowave.hardware.manager import AVAILABLE_BACKENDS
+        
+        settings = {
+            'sample_rate': self.config.sample_rate,
+            'channels': self.config.n_channels,
+            'num_samples': max(1, int(round(self.config.block_duration * self.config.sample_rate)))
+        }
+        settings.update(self.config.device_config)
+        try:
+            handler = AVAILABLE_BACKENDS[self.backend_name](settings)
+            if not handler.open():
+                return False
+            handler.start()
+        except Exception as e:
+            print(f"Erreur backend {self.backend_name}: {e}")
+            return False
+        
+        # Fréquence imposée par le backend (ex. celle de la session rejouée)
+        sample_rate = float(getattr(handler, 'sample_rate', self.config.sample_rate))
+        if sample_rate != self.config.sample_rate:
+            print(f"Fréquence d'échantillonnage imposée par {self.backend_name}: {sample_rate} Hz")
+            self.config.sample_rate = sample_rate
+        
+        self.handler = handler
+        self._block = None
+        self._index = 0
+        self.is_connected = True
+        return True
+    
+    def disconnect(self):
+        """Arrête et ferme le backend matériel"""
+        if self.handler is not None:
+            if getattr(self.handler, 'is_running', False):
+                self.handler.stop()
+            self.handler.close()
+            self.handler = None
+        self.is_connected = False
+    
+    def read_sample(self) -> Optional[np.ndarray]:
+        """Échantillon suivant (un par canal), None si aucun bloc disponible"""
+        if not self.is_connected:
+            return None
+        if self._block is None or self._index >= self._block.shape[1]:
+            block = self.handler.read()
+            if block is None or not block.shape[1]:
+                return None
+            self._block = block
+            self._index = 0
+        sample = self._block[:, self._index]
+        self._index += 1
+        return sample
+    
+    def get_status(self) -> Dict[str, Any]:
+        status = {'type': self.backend_name, 'connected': self.is_connected}
+        if self.handler is not None:
+            status.update(self.handler.get_status())
+        return status
+
+
 def create_acquisition_controller(mode_str: str = "simulate", fs: float = 32.0, 
-                                sensor_type: str = "wave_probe") -> AcquisitionController:
+                                sensor_type: str = "wave_probe",
+                                device_config: Optional[Dict[str, Any]] = None) -> AcquisitionController:
     """Factory function pour créer un contrôleur d'acquisition"""
     
     # Utiliser les variables d'environnement si disponibles
     mode_str = os.getenv('CHNW_MODE', mode_str)
     fs = float(os.getenv('CHNW_FS', fs))
     sensor_type = os.getenv('CHNW_SENSOR_TYPE', sensor_type)
+    device_config = dict(device_config or {})
+    if os.getenv('CHNW_REPLAY_PATH'):
+        device_config['path'] = os.getenv('CHNW_REPLAY_PATH')
     
     # Convertir le mode string en enum
     mode_mapping = {
@@ -864,7 +1026,9 @@ def create_acquisition_controller(mode_str: str = "simulate", fs: float = 32.0,
         'offline': AcquisitionMode.SIMULATE,  # Alias
         'ni': AcquisitionMode.NI_DAQ,
         'iotech': AcquisitionMode.IOTECH,
-        'arduino': AcquisitionMode.ARDUINO
+        'arduino': AcquisitionMode.ARDUINO,
+        'synthetic': AcquisitionMode.SYNTHETIC,
+        'replay': AcquisitionMode.REPLAY
     }
     
     mode = mode_mapping.get(mode_str, AcquisitionMode.SIMULATE)
@@ -872,7 +1036,8 @@ def create_acquisition_controller(mode_str: str = "simulate", fs: float = 32.0,
     config = AcquisitionConfig(
         mode=mode,
         sample_rate=fs,
-        n_channels=4  # Valeur par défaut pour houle
+        n_channels=4,  # Valeur par défaut pour houle
+        device_config=device_config
     )
     
     return AcquisitionController(config)
\ No newline at end of file
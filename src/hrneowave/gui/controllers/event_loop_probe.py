@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Sonde de la boucle d'événements Qt pour le traçage
+
+Un QTimer à intervalle court mesure le retard de chaque tick : un tick en
+retard signifie que le thread GUI était occupé. Le créneau bloqué est tracé
+comme une étape « qt_event_loop » dans le thread principal.
+"""
+
+import time
+import logging
+
+from PySide6.QtCore import QObject, QTimer
+
+from hrneowave.core.tracing import get_tracer
+
+
+class EventLoopProbe(QObject):
+    """Mesure les blocages de la boucle d'événements Qt"""
+
+    def __init__(self, interval_ms: int = 10, threshold_ms: float = 5.0, parent=None):
+        """
+        Args:
+            interval_ms: Période du timer de sonde
+            threshold_ms: Retard minimal tracé comme blocage
+        """
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.interval_ns = interval_ms * 1_000_000
+        self.threshold_ns = int(threshold_ms * 1e6)
+        self.stalls = 0
+        self._tracer = get_tracer()
+        self._last_tick = 0
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_tick)
+
+    @property
+    def is_active(self) -> bool:
+        """Indique si la sonde tourne"""
+        return self._timer.isActive()
+
+    def set_active(self, active: bool):
+        """Démarre ou arrête la sonde (suivre l'état du traçage)"""
+        if active and not self._timer.isActive():
+            self._last_tick = time.perf_counter_ns()
+            self._timer.start()
+        elif not active and self._timer.isActive():
+            self._timer.stop()
+
+    def _on_tick(self):
+        now = time.perf_counter_ns()
+        expected = self._last_tick + self.interval_ns
+        self._last_tick = now
+        if now - expected >= self.threshold_ns:
+            self.stalls += 1
+            self._tracer.record('qt_event_loop', expected, now, {'lag_ms': (now - expected) / 1e6})
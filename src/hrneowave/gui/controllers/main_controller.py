@@ -14,7 +14,7 @@ from PySide6.QtCore import QObject, Signal, QTimer
 from ..view_manager import ViewManager
 from hrneowave.core.signal_bus import get_signal_bus
 from hrneowave.hardware.manager import HardwareManager
-from hrneowave.core.post_processor import PostProcessor
+from hrneowave.core.post_worker import PostWorker
 from .optimized_processing_worker import OptimizedProcessingWorker
 from hrneowave.core.error_handler import get_error_handler, ErrorCategory, ErrorContext, handle_errors
 from hrneowave.core.performance_monitor import get_performance_monitor, Alert, AlertLevel
@@ -58,7 +58,7 @@ class MainController(QObject):
         
         # Modules backend
         self.hardware_adapter: Optional[HardwareManager] = None
-        self.post_processor: Optional[PostProcessor] = None
+        self.post_worker: Optional[PostWorker] = None
         self.processing_worker: Optional[OptimizedProcessingWorker] = None
         
         # Initialisation
@@ -91,11 +91,6 @@ class MainController(QObject):
         Initialise les modules backend
         """
         try:
-            # Initialiser le post-processor
-            if PostProcessor:
-                self.post_processor = PostProcessor()
-                self.logger.info("PostProcessor initialisé")
-                
             # Initialiser l'adaptateur matériel
             if HardwareManager:
                 self.hardware_adapter = HardwareManager(self.config)
@@ -405,6 +400,10 @@ class MainController(QObject):
         # Démarrer le traitement automatique
         self._start_data_processing(acquisition_data)
         
+        # Post-traitement du fichier enregistré (PostProcessor, cache partagé)
+        if acquisition_data.get('file_path'):
+            self._start_post_analysis(acquisition_data['file_path'], acquisition_data.get('sample_rate'))
+        
         # Navigation stricte: acquisition → analysis
         self._navigate_to_view("analysis", "Analyser acquisition OK")
         
@@ -425,6 +424,31 @@ class MainController(QObject):
         except Exception as e:
             self.logger.error(f"Erreur démarrage traitement: {e}")
             
+    def _start_post_analysis(self, file_path: str, sample_rate: Optional[float] = None):
+        """
+        Lance le post-traitement d'un fichier de données dans un thread séparé
+        """
+        if self.post_worker is not None and self.post_worker.isRunning():
+            self.logger.warning("Post-traitement déjà en cours")
+            return
+            
+        config = {'sample_rate': sample_rate} if sample_rate else {}
+        self.post_worker = PostWorker(file_path, config)
+        self.post_worker.analysisDone.connect(self._on_post_analysis_done)
+        self.post_worker.start()
+        self.logger.info(f"Post-traitement démarré: {file_path}")
+        
+    def _on_post_analysis_done(self, analysis: Dict[str, Any]):
+        """
+        Gestionnaire pour fin de post-traitement du fichier d'acquisition
+        """
+        if 'error' in analysis:
+            self.logger.error(f"Erreur post-traitement: {analysis['error']}")
+            return
+            
+        self.workflow_data['post_analysis'] = analysis
+        self.logger.info("Post-traitement terminé")
+        
     def _on_processing_finished(self, processed_data: Dict[str, Any]):
         from PySide6.QtCore import Slot
         # Décorateur appliqué dynamiquement
@@ -627,6 +651,10 @@ class MainController(QObject):
             self.processing_worker.terminate()
             self.processing_worker.wait(3000)  # Attendre 3 secondes max
             
+        # Laisser finir le post-traitement (écriture du cache en cours)
+        if self.post_worker and self.post_worker.isRunning():
+            self.post_worker.wait(3000)
+            
         # Fermer l'adaptateur matériel
         if self.hardware_adapter:
             try:
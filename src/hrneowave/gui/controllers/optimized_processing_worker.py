@@ -37,6 +37,13 @@ try:
 except ImportError:
     CHNeoWaveOptimizationConfig = None
 
+try:
+    from hrneowave.core.performance_monitor import get_performance_monitor
+    from hrneowave.core.tracing import trace_span
+except ImportError:
+    get_performance_monitor = None
+    from contextlib import nullcontext as trace_span
+
 
 @dataclass
 class ProcessingStats:
@@ -64,6 +71,7 @@ class OptimizedProcessingWorker(QThread):
     newStats = Signal(dict)  # Nouvelles statistiques Goda
     performanceStats = Signal(dict)  # Métriques de performance
     processingError = Signal(str)  # Erreurs de traitement
+    validationResults = Signal(list)  # Résultats de validation par bloc
     
     def __init__(self, parent, config: Optional[Any] = None):
         """Initialise le worker optimisé.
@@ -86,6 +94,14 @@ class OptimizedProcessingWorker(QThread):
         self.data_queue = []
         self.stats = ProcessingStats()
         
+        # Validation des blocs dans ce thread (hors du fil d'acquisition)
+        self.validator = None
+        self.sample_rate = None
+        self._stream_time = 0.0
+        
+        # Latences par étape (fft, validate) dans le moniteur global
+        self.monitor = get_performance_monitor() if get_performance_monitor else None
+        
         # Timer pour les métriques
         self.metrics_timer = QTimer()
         self.metrics_timer.timeout.connect(self._emit_performance_stats)
@@ -116,6 +132,28 @@ class OptimizedProcessingWorker(QThread):
             self.logger.error(f"Erreur initialisation composants: {e}")
             self.processingError.emit(f"Erreur initialisation: {e}")
     
+    def set_validator(self, validator: Optional[Any], sample_rate: float):
+        """Active la validation des blocs (règles vectorisées et contrôle spectral planifié).
+        
+        Args:
+            validator: DataValidator partagé, ou None pour désactiver
+            sample_rate: Fréquence d'échantillonnage des blocs [Hz]
+        """
+        if self.validator is not None and self._on_validator_result in self.validator.result_callbacks:
+            self.validator.result_callbacks.remove(self._on_validator_result)
+        
+        self.validator = validator
+        self.sample_rate = sample_rate
+        self._stream_time = 0.0
+        if validator is not None:
+            # Contrôle spectral : résultats diffusés par le thread du validateur
+            validator.add_result_callback(self._on_validator_result)
+    
+    def _on_validator_result(self, result: Any):
+        """Relaie les résultats du contrôle spectral planifié"""
+        if result.rule_type.value == 'spectral_analysis':
+            self.validationResults.emit([result])
+    
     def start_processing(self):
         """Démarre le traitement."""
         if not self.is_running:
@@ -150,7 +188,8 @@ class OptimizedProcessingWorker(QThread):
             try:
                 if self.data_queue:
                     data = self.data_queue.pop(0)
-                    self._process_data(data)
+                    with trace_span('process_block'):
+                        self._process_data(data)
                 else:
                     self.msleep(1)  # Attente courte si pas de données
                     
@@ -186,6 +225,15 @@ class OptimizedProcessingWorker(QThread):
                 self.newSpectra.emit(spectrum)
             
             self.stats.fft_time = time.perf_counter() - fft_start
+            if self.monitor is not None:
+                self.monitor.record_latency('fft', self.stats.fft_time, data.size)
+            
+            # Validation : le spectre d'affichage sert au contrôle spectral
+            if self.validator is not None and self.sample_rate:
+                validate_start = time.perf_counter()
+                self._validate_block(data, spectrum)
+                if self.monitor is not None:
+                    self.monitor.record_latency('validate', time.perf_counter() - validate_start, data.size)
             
             # Analyse Goda
             goda_start = time.perf_counter()
@@ -213,6 +261,25 @@ class OptimizedProcessingWorker(QThread):
             self.processingError.emit(f"Erreur traitement: {e}")
             self.stats.errors_count += 1
     
+    def _validate_block(self, data: np.ndarray, spectrum: np.ndarray):
+        """Valide un bloc et réutilise son spectre d'affichage.
+        
+        Args:
+            data: Bloc (n_channels, n_samples) ou (n_samples,)
+            spectrum: Amplitude FFT calculée pour l'affichage
+        """
+        block = np.atleast_2d(data)
+        spectrum = np.atleast_2d(spectrum)
+        # Réutilisable seulement à la résolution du contrôle spectral
+        if spectrum.shape == block.shape and block.shape[1] == self.validator.spectral_window_size:
+            freqs = np.fft.fftfreq(block.shape[1], 1.0 / self.sample_rate)
+            self.validator.submit_spectrum(freqs, np.abs(spectrum) ** 2)
+        
+        results = self.validator.validate_block(block, self._stream_time, self.sample_rate)
+        self._stream_time += block.shape[1] / self.sample_rate
+        if results:
+            self.validationResults.emit(results)
+    
     def _emit_performance_stats(self):
         """Émet les statistiques de performance."""
         try:
@@ -45,6 +45,8 @@ class GoldenRatioLayout(QLayout):
         """Ajoute un widget avec un type de ratio spécifique"""
         from PySide6.QtWidgets import QWidgetItem
         
+        # Comme QLayout.addWidget : le widget devient enfant du widget du layout
+        self.addChildWidget(widget)
         item = QWidgetItem(widget)
         
         # Stocker le type de ratio
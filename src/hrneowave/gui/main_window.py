@@ -30,13 +30,7 @@ except ImportError:
 
 # Import des vues v2 et configurations
 from .views import (
-    DashboardViewMaritime,
     WelcomeView,
-    get_calibration_view,
-    get_acquisition_view,
-    get_analysis_view,
-    get_export_view,
-    get_settings_view,
     VIEWS_CONFIG,
     NAVIGATION_ORDER
 )
@@ -206,22 +200,17 @@ class MainWindow(QMainWindow):
         print("🔍 DEBUG: _create_and_register_views - WelcomeView enregistrée")
         welcome_view.projectCreationRequested.connect(self._handle_project_creation)
 
-        # Dashboard maritime
-        print("🔍 DEBUG: _create_and_register_views - Étape 3: Création DashboardViewMaritime")
-        dashboard_view = DashboardViewMaritime(parent=None)
-        self.view_manager.register_view('dashboard', dashboard_view)
-        print("🔍 DEBUG: _create_and_register_views - DashboardViewMaritime enregistrée")
-
-        # Vues avec lazy loading
-        print("🔍 DEBUG: _create_and_register_views - Étape 4: Vues avec lazy loading")
-#         for view_name, config in VIEWS_CONFIG.items():
-#             if 'loader' in config:
-#                 view_instance = config['loader'](parent=None)
-#                 self.view_manager.register_view(view_name, view_instance)
-#                 logger.info(f"[VIEW REGISTRATION] '{view_name}' view registered with object ID: {id(view_instance)}")
+        # Autres vues : construites à la première navigation ou pendant les
+        # temps morts de la boucle d'événements, dans l'ordre du workflow
+        print("🔍 DEBUG: _create_and_register_views - Étape 3: Fabriques des vues")
+        for view_name in NAVIGATION_ORDER:
+            loader = VIEWS_CONFIG.get(view_name, {}).get('loader')
+            if loader:
+                self.view_manager.register_view_factory(view_name, lambda loader=loader: loader(parent=None))
+        self.view_manager.start_prefetch()
 
         # Navigation initiale
-        print("🔍 DEBUG: _create_and_register_views - Étape 5: Navigation initiale")
+        print("🔍 DEBUG: _create_and_register_views - Étape 4: Navigation initiale")
         self.view_manager.switch_to_view('welcome')
         self._update_breadcrumbs_for_view('welcome')
 
@@ -300,6 +300,19 @@ class PreferencesDialog(QDialog):
         
         layout.addWidget(defaults_group)
         
+        # Diagnostic des performances
+        diagnostics_group = QGroupBox("Diagnostic des performances")
+        diagnostics_layout = QFormLayout(diagnostics_group)
+        
+        self.tracing_checkbox = QCheckBox("Tracer l'acquisition et le traitement (Chrome trace)")
+        diagnostics_layout.addRow(self.tracing_checkbox)
+        
+        self.export_trace_button = QPushButton("Exporter la trace...")
+        self.export_trace_button.clicked.connect(self._export_trace)
+        diagnostics_layout.addRow(self.export_trace_button)
+        
+        layout.addWidget(diagnostics_group)
+        
         layout.addStretch()
     
     def _create_accessibility_tab(self):
@@ -448,6 +461,7 @@ class PreferencesDialog(QDialog):
         self.default_frequency_spinbox.setValue(
             self.preferences.get_preference("acquisition", "default_frequency")
         )
+        self.tracing_checkbox.setChecked(self.preferences.is_tracing_enabled())
         
         # Accessibilité
         self.high_contrast_checkbox.setChecked(
@@ -531,6 +545,17 @@ class PreferencesDialog(QDialog):
                             widget = self.shortcut_widgets[category][action]
                             widget.setKeySequence(QKeySequence(shortcut))
     
+    def _export_trace(self):
+        """Exporte la trace courante au format Chrome trace"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Exporter la trace",
+            self.preferences.get_preference("diagnostics", "trace_file"),
+            "Chrome trace (*.json)"
+        )
+        if file_path:
+            from ...core.tracing import export_chrome_trace
+            export_chrome_trace(file_path)
+    
     def _reset_preferences(self):
         """Réinitialise toutes les préférences"""
         reply = QMessageBox.question(
@@ -588,6 +613,7 @@ class PreferencesDialog(QDialog):
         self.preferences.set_preference("acquisition", "backup_count", self.backup_count_spinbox.value())
         self.preferences.set_preference("acquisition", "default_duration", self.default_duration_spinbox.value())
         self.preferences.set_preference("acquisition", "default_frequency", self.default_frequency_spinbox.value())
+        self.preferences.set_tracing_enabled(self.tracing_checkbox.isChecked())
         
         # Accessibilité
         self.preferences.set_preference("accessibility", "high_contrast", self.high_contrast_checkbox.isChecked())
@@ -41,6 +41,7 @@ class UserPreferences(QObject):
     theme_changed = Signal(str)  # nouveau thème
     language_changed = Signal(str)  # nouvelle langue
     shortcuts_changed = Signal(dict)  # nouveaux raccourcis
+    tracing_changed = Signal(bool)  # traçage des performances activé/désactivé
     preferences_reset = Signal()  # préférences réinitialisées
     
     def __init__(self, parent=None):
@@ -121,6 +122,11 @@ class UserPreferences(QObject):
                 "large_fonts": False,
                 "screen_reader": False,
                 "keyboard_navigation": True
+            },
+            "diagnostics": {
+                "tracing_enabled": False,
+                "trace_capacity": 200000,
+                "trace_file": "chneowave_trace.json"
             }
         }
         
@@ -221,6 +227,8 @@ class UserPreferences(QObject):
             self.language_changed.emit(value)
         elif category == "shortcuts":
             self.shortcuts_changed.emit(self.preferences["shortcuts"])
+        elif category == "diagnostics" and key == "tracing_enabled":
+            self.tracing_changed.emit(self.is_tracing_enabled())
     
     def get_theme_mode(self) -> str:
         """Récupère le mode de thème actuel"""
@@ -244,6 +252,16 @@ class UserPreferences(QObject):
         else:
             self.logger.warning(f"Langue invalide: {language}")
     
+    def is_tracing_enabled(self) -> bool:
+        """Indique si le traçage des performances est activé"""
+        value = self.get_preference("diagnostics", "tracing_enabled")
+        # QSettings peut restituer les booléens sous forme de chaîne
+        return value in (True, "true", "True", 1, "1")
+    
+    def set_tracing_enabled(self, enabled: bool):
+        """Active ou désactive le traçage des performances"""
+        self.set_preference("diagnostics", "tracing_enabled", bool(enabled))
+    
     def get_shortcuts(self) -> Dict[str, Dict[str, str]]:
         """Récupère tous les raccourcis clavier"""
         return self.preferences.get("shortcuts", {})
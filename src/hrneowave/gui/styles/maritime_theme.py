@@ -25,6 +25,14 @@ class MaritimeTheme(QObject):
     # Constante du nombre d'or
     PHI = (1 + math.sqrt(5)) / 2
     
+    # Espacements Fibonacci des layouts (px), communs aux vues maritimes
+    SPACE_XS = 8
+    SPACE_SM = 13
+    SPACE_MD = 21
+    SPACE_LG = 34
+    SPACE_XL = 55
+    SPACE_XXL = 89
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Compilation et cache des feuilles de style QSS
+
+Un thème est compilé une fois : les fichiers .qss sont concaténés, les
+`var(--nom)` remplacés par leur valeur et les blocs de définition de
+variables retirés. Le résultat est conservé en mémoire et sur disque, indexé
+par (thème, DPI, version) et par l'empreinte (taille, date) des fichiers
+sources : un fichier modifié invalide l'entrée.
+
+Les longueurs en px ne sont pas réécrites : Qt les interprète déjà en pixels
+logiques et applique lui-même le facteur d'échelle de l'écran. La résolution
+ne fait partie que de la clé, pour qu'un écran de DPI différent ne relise pas
+une entrée compilée pour un autre.
+
+Module sans Qt : le ThemeManager lui passe la résolution de l'écran.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Version du compilateur : à incrémenter si la transformation change
+COMPILER_VERSION = 2
+
+# Résolution de référence des feuilles de style
+REFERENCE_DPI = 96
+
+_VARIABLE_DEFINITION = re.compile(r'(--[a-zA-Z0-9-]+):\s*([^;]+);')
+_VARIABLE_USE = re.compile(r'var\((--[a-zA-Z0-9-]+)\)')
+_VARIABLE_BLOCK = re.compile(r'QWidget\s*\{[^\}]*--bg-primary[^\}]*\}', re.DOTALL)
+
+
+def default_cache_dir() -> Path:
+    """Répertoire du cache disque (~/.chneowave/cache/qss)"""
+    return Path.home() / ".chneowave" / "cache" / "qss"
+
+
+def parse_variables(content: str) -> Dict[str, str]:
+    """Variables `--nom: valeur;` d'une feuille de style"""
+    return {name.strip(): value.strip() for name, value in _VARIABLE_DEFINITION.findall(content)}
+
+
+def replace_variables(content: str, variables: Dict[str, str]) -> str:
+    """Remplace les `var(--nom)` connues, laisse les autres intactes"""
+    def replacer(match):
+        name = match.group(1).strip()
+        return variables.get(name, f'var({name})')
+
+    return _VARIABLE_USE.sub(replacer, content)
+
+
+class ThemeCompiler:
+    """
+    Compilateur de thèmes QSS avec cache mémoire et disque
+
+    Args:
+        styles_dir: Répertoire des fichiers .qss
+        cache_dir: Répertoire du cache disque (None : default_cache_dir(),
+            False : cache mémoire uniquement)
+        version: Version de l'application, incluse dans la clé de cache
+    """
+
+    def __init__(self, styles_dir: Path, cache_dir=None, version: str = ""):
+        self.styles_dir = Path(styles_dir)
+        self.cache_dir = None if cache_dir is False else Path(cache_dir or default_cache_dir())
+        self.version = version
+        self._memory: Dict[str, str] = {}
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'compilations': 0}
+
+    def cache_key(self, theme_name: str, files: Sequence[str], dpi: int) -> str:
+        """Clé de cache : thème, DPI, versions et empreinte des fichiers sources"""
+        digest = hashlib.sha256()
+        digest.update(f"{theme_name}|{dpi}|{COMPILER_VERSION}|{self.version}".encode('utf-8'))
+        for name in files:
+            path = self.styles_dir / name
+            try:
+                stat = path.stat()
+                digest.update(f"|{name}:{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'))
+            except OSError:
+                digest.update(f"|{name}:absent".encode('utf-8'))
+        return f"{theme_name}-{dpi}dpi-{digest.hexdigest()[:16]}"
+
+    def compile(self, theme_name: str, files: Sequence[str], dpi: int = REFERENCE_DPI) -> str:
+        """
+        Feuille de style compilée du thème
+
+        Args:
+            theme_name: Nom du thème (clé de cache)
+            files: Fichiers .qss dans l'ordre ; les variables sont lues dans le premier
+            dpi: Résolution logique de l'écran (clé de cache uniquement)
+
+        Returns:
+            Feuille de style finale, vide si le fichier principal manque
+        """
+        key = self.cache_key(theme_name, files, dpi)
+        stylesheet = self._memory.get(key)
+        if stylesheet is not None:
+            self.stats['memory_hits'] += 1
+            return stylesheet
+
+        stylesheet = self._read_cache(key)
+        if stylesheet is not None:
+            self.stats['disk_hits'] += 1
+            logger.debug(f"Thème '{theme_name}' lu depuis le cache ({key})")
+        else:
+            stylesheet = self._compile(files)
+            if not stylesheet:
+                return ""
+            self.stats['compilations'] += 1
+            self._write_cache(key, stylesheet)
+            logger.info(f"Thème '{theme_name}' compilé ({len(stylesheet)} caractères, {dpi} dpi)")
+        self._memory[key] = stylesheet
+        return stylesheet
+
+    def clear(self):
+        """Vide les caches mémoire et disque"""
+        self._memory.clear()
+        if self.cache_dir and self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.qss"):
+                path.unlink(missing_ok=True)
+
+    def _compile(self, files: Sequence[str]) -> str:
+        parts: List[str] = []
+        for index, name in enumerate(files):
+            path = self.styles_dir / name
+            try:
+                parts.append(path.read_text(encoding='utf-8'))
+            except OSError as e:
+                if index == 0:
+                    logger.error(f"Fichier de thème principal illisible: {path} ({e})")
+                    return ""
+                logger.debug(f"Fichier de style optionnel ignoré: {path}")
+
+        variables = parse_variables(parts[0])
+        stylesheet = replace_variables('\n'.join(parts), variables)
+        # Les blocs de définition de variables ne sont pas du QSS valide
+        return _VARIABLE_BLOCK.sub('', stylesheet)
+
+    def _read_cache(self, key: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        try:
+            return (self.cache_dir / f"{key}.qss").read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+    def _write_cache(self, key: str, stylesheet: str):
+        if not self.cache_dir:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Écriture atomique : deux instances peuvent démarrer en même temps
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(stylesheet)
+            os.replace(tmp_path, self.cache_dir / f"{key}.qss")
+            # Entrées périmées du même thème et de la même résolution
+            prefix = key.rsplit('-', 1)[0]
+            for path in self.cache_dir.glob(f"{prefix}-*.qss"):
+                if path.stem != key:
+                    path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Cache de thème non écrit ({self.cache_dir}): {e}")
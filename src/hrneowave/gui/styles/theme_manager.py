@@ -1,6 +1,4 @@
-import os
 import logging
-import re
 from pathlib import Path
 
 try:
@@ -9,11 +7,14 @@ try:
 except ImportError:
     raise ImportError("PySide6 n'est pas installé. Veuillez l'installer pour utiliser CHNeoWave.")
 
+from hrneowave import __version__
+from .theme_compiler import REFERENCE_DPI, ThemeCompiler
+
 class ThemeManager(QObject):
     """Gestionnaire de thèmes simplifié pour charger les fichiers QSS."""
     theme_changed = Signal(str)
 
-    def __init__(self, app: QApplication):
+    def __init__(self, app: QApplication, cache_dir=None):
         super().__init__(app)
         self.app = app
         self._styles_dir = Path(__file__).parent
@@ -22,92 +23,30 @@ class ThemeManager(QObject):
         
         # Ajouter l'attribut available_themes manquant
         self.available_themes = ['light', 'dark', 'maritime_modern']
+        
+        # Feuilles de style compilées une fois par (thème, DPI, version)
+        self.compiler = ThemeCompiler(self._styles_dir, cache_dir=cache_dir, version=__version__)
+        self._applied_stylesheet = None
 
-    def _parse_variables(self, content: str) -> dict:
-        """Parse les variables CSS-like depuis une chaîne de caractères."""
-        import re
-        variables = {}
-        # Regex simple pour extraire --variable: valeur;
-        var_matches = re.findall(r'(--[a-zA-Z0-9-]+):\s*([^;]+);', content)
-        for name, value in var_matches:
-            variables[name.strip()] = value.strip()
-        self._logger.debug(f"{len(variables)} variables de thème parsées.")
-        return variables
-
-    def _replace_variables(self, content: str, variables: dict) -> str:
-        """Remplace les `var(--variable)` par leurs valeurs."""
-        import re
-        def replacer(match):
-            var_name = match.group(1).strip()
-            return variables.get(var_name, f'var({var_name})') # Garde l'original si non trouvé
-
-        return re.sub(r'var\((--[a-zA-Z0-9-]+)\)', replacer, content)
-
-    def _load_stylesheet(self, theme_name: str) -> str:
-        """Charge, parse les variables et combine les fichiers QSS."""
-        # 1. Charger le nouveau thème maritime moderne
+    def _theme_files(self, theme_name: str) -> list:
+        """Fichiers QSS du thème, le premier porte les variables"""
         if theme_name == 'maritime_modern':
-            theme_file_path = self._styles_dir / 'maritime_modern.qss'
+            # Nouveau thème maritime moderne et ses animations
+            files = ['maritime_modern.qss', 'animations.qss']
         else:
             # Fallback vers l'ancien thème professionnel
-            theme_file_path = self._styles_dir / 'professional_theme.qss'
-            
-        if not theme_file_path.exists():
-            self._logger.error(f"Fichier de thème principal manquant: {theme_file_path}")
-            return ""
-        
-        try:
-            theme_content = theme_file_path.read_text(encoding='utf-8')
-        except IOError as e:
-            self._logger.error(f"Impossible de lire {theme_file_path}: {e}")
-            return ""
-
-        # 2. Parser les variables depuis ce fichier (si applicable)
-        variables = self._parse_variables(theme_content)
+            files = ['professional_theme.qss']
+        # Fichiers QSS des composants (optionnels)
+        return files + ['main_sidebar.qss', 'components.qss']
 
-        # 3. Charger tous les autres fichiers QSS et les concaténer
-        full_stylesheet = self._load_all_qss_files(theme_name, theme_content)
-
-        # 4. Remplacer les variables dans la feuille de style complète
-        final_stylesheet = self._replace_variables(full_stylesheet, variables)
-        
-        # Supprimer les blocs de définition de variables pour ne pas polluer le QSS final
-        final_stylesheet = re.sub(r'QWidget\s*\{[^\}]*--bg-primary[^\}]*\}', '', final_stylesheet, flags=re.DOTALL)
-
-        return final_stylesheet
-
-    def _load_all_qss_files(self, theme_name: str, base_theme_content: str) -> str:
-        """Charge et concatène tous les fichiers QSS nécessaires."""
-        stylesheet_parts = [base_theme_content]
+    def _screen_dpi(self) -> int:
+        screen = self.app.primaryScreen() if hasattr(self.app, 'primaryScreen') else None
+        return int(round(screen.logicalDotsPerInch())) if screen else REFERENCE_DPI
 
+    def _load_stylesheet(self, theme_name: str) -> str:
+        """Feuille de style compilée du thème (cache mémoire puis disque)"""
         self._logger.info(f"Chargement du thème '{theme_name}'")
-
-        # Charger les fichiers d'animation pour le thème maritime moderne
-        if theme_name == 'maritime_modern':
-            animation_file = self._styles_dir / 'animations.qss'
-            if animation_file.exists():
-                try:
-                    stylesheet_parts.append(animation_file.read_text(encoding='utf-8'))
-                    self._logger.info("Animations maritimes chargées")
-                except IOError as e:
-                    self._logger.error(f"Impossible de lire le fichier d'animations {animation_file}: {e}")
-
-        # Fichiers QSS des composants
-        component_qss_files = [
-            'main_sidebar.qss',
-            'components.qss' # Fichier générique pour les petits composants
-        ]
-
-        for qss_file in component_qss_files:
-            file_path = self._styles_dir / qss_file
-            if file_path.exists():
-                try:
-                    stylesheet_parts.append(file_path.read_text(encoding='utf-8'))
-                except IOError as e:
-                    self._logger.error(f"Impossible de lire le fichier de composant {file_path}: {e}")
-            # Pas de warning si le fichier de composant est manquant, c'est optionnel
-
-        return '\n'.join(stylesheet_parts)
+        return self.compiler.compile(theme_name, self._theme_files(theme_name), self._screen_dpi())
 
     def apply_theme(self, theme_name: str):
         """Applique un thème à l'application avec protection contre les erreurs."""
@@ -120,7 +59,11 @@ class ThemeManager(QObject):
             # Charger et appliquer le thème
             stylesheet = self._load_stylesheet(theme_name)
             if stylesheet:
-                self.app.setStyleSheet(stylesheet)
+                # Une seule feuille au niveau de l'application ; setStyleSheet
+                # réanalyse tout l'arbre de widgets, évité si rien ne change
+                if stylesheet != self._applied_stylesheet:
+                    self.app.setStyleSheet(stylesheet)
+                    self._applied_stylesheet = stylesheet
                 if self._current_theme != theme_name:
                     self._current_theme = theme_name
                     self.theme_changed.emit(theme_name)
@@ -7,7 +7,9 @@ Il utilise des imports conditionnels pour éviter la création de widgets avant
 """
 
 import logging
-from typing import Dict, Optional, List
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, List
 
 from PySide6.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QHBoxLayout, QApplication,
@@ -18,6 +20,8 @@ from PySide6.QtCore import (
 )
 from PySide6.QtGui import QScreen
 
+from hrneowave.core.tracing import trace_span
+
 # Import du système de toast amélioré
 from .components.enhanced_toast import ToastManager, ToastLevel
 
@@ -132,6 +136,12 @@ class ViewManager(QObject):
             self.views: Dict[str, QWidget] = {}
             self.current_view: Optional[str] = None
             
+            # Vues construites à la demande : fabrique, durée de construction [s]
+            self.view_factories: Dict[str, Callable[[], QWidget]] = {}
+            self.build_times: Dict[str, float] = {}
+            self._prefetch_queue: Deque[str] = deque()
+            self._prefetch_timer: Optional[QTimer] = None
+            
             # Gestionnaire de toasts amélioré
             self.toast_manager = ToastManager(max_toasts=3, parent=self)
             
@@ -163,6 +173,82 @@ class ViewManager(QObject):
             index = self.stacked_widget.addWidget(widget)
             self.logger.info(f"Vue '{name}' enregistrée avec succès dans le QStackedWidget à l'index {index}")
 
+        def register_view_factory(self, name: str, factory: Callable[[], QWidget],
+                                  prefetch: bool = True) -> None:
+            """
+            Enregistre une vue construite à la première navigation
+
+            La fabrique est appelée sans argument et retourne le widget. Avec
+            prefetch, la vue est aussi construite pendant les temps morts de la
+            boucle Qt une fois start_prefetch() appelé.
+            """
+            if name in self.views:
+                self.logger.warning(f"Vue '{name}' déjà construite, la fabrique la remplacera")
+                self.stacked_widget.removeWidget(self.views.pop(name))
+            self.view_factories[name] = factory
+            if prefetch and name not in self._prefetch_queue:
+                self._prefetch_queue.append(name)
+            self.logger.debug(f"Fabrique de vue '{name}' enregistrée")
+
+        def is_view_built(self, name: str) -> bool:
+            """Vrai si le widget de la vue existe déjà"""
+            return name in self.views
+
+        def ensure_view(self, name: str) -> Optional[QWidget]:
+            """Retourne le widget de la vue, en le construisant si nécessaire"""
+            widget = self.views.get(name)
+            if widget is not None or name not in self.view_factories:
+                return widget
+
+            # La fabrique n'est retirée qu'après succès : une vue en échec
+            # peut être reconstruite à la navigation suivante
+            factory = self.view_factories[name]
+            start = time.perf_counter()
+            try:
+                with trace_span('build_view', view=name):
+                    widget = factory()
+            except Exception as e:
+                self.logger.error(f"Construction de la vue '{name}' impossible: {e}", exc_info=True)
+                return None
+            if widget is None:
+                self.logger.error(f"La fabrique de la vue '{name}' n'a retourné aucun widget")
+                return None
+            del self.view_factories[name]
+            self.build_times[name] = time.perf_counter() - start
+            self.logger.info(f"Vue '{name}' construite en {self.build_times[name] * 1e3:.1f} ms")
+            self.register_view(name, widget)
+            return widget
+
+        def start_prefetch(self, delay_ms: int = 500) -> None:
+            """
+            Construit les vues en attente pendant les temps morts de la boucle Qt
+
+            Un QTimer d'intervalle nul ne se déclenche que lorsque la file
+            d'événements est vide ; une seule vue est construite par passage
+            pour que l'interface reste réactive entre deux constructions.
+            """
+            if self._prefetch_timer is None:
+                self._prefetch_timer = QTimer(self)
+                self._prefetch_timer.setInterval(0)
+                self._prefetch_timer.timeout.connect(self._prefetch_next)
+            QTimer.singleShot(delay_ms, self._prefetch_timer.start)
+
+        def stop_prefetch(self) -> None:
+            """Interrompt la construction anticipée"""
+            if self._prefetch_timer is not None:
+                self._prefetch_timer.stop()
+
+        def _prefetch_next(self) -> None:
+            while self._prefetch_queue:
+                name = self._prefetch_queue.popleft()
+                if name in self.view_factories:
+                    self.ensure_view(name)
+                    return
+            self._prefetch_timer.stop()
+            if self.build_times:
+                total = sum(self.build_times.values()) * 1e3
+                self.logger.info(f"Préchargement des vues terminé ({len(self.build_times)} vues, {total:.1f} ms)")
+
         @Slot(str)
         def change_view_by_name(self, name: str):
             """Slot public pour changer de vue par son nom."""
@@ -170,11 +256,11 @@ class ViewManager(QObject):
 
         def change_view(self, name: str) -> None:
             """Change la vue affichée dans le QStackedWidget"""
-            if name not in self.views:
+            widget_to_show = self.ensure_view(name)
+            if widget_to_show is None:
                 self.logger.error(f"Tentative d'affichage d'une vue non enregistrée: {name}")
                 return
 
-            widget_to_show = self.views[name]
             self.stacked_widget.setCurrentWidget(widget_to_show)
             self.current_view = name
             self.view_changed.emit(name)
@@ -243,7 +329,7 @@ class ViewManager(QObject):
             # 🔍 TRAÇAGE FIN - Ajouté pour diagnostic navigation
             print(f"[NAV] {self.current_view} → {view_name}")
             
-            if view_name not in self.views:
+            if self.ensure_view(view_name) is None:
                 self.logger.error(f"Vue '{view_name}' non trouvée")
                 print(f"[NAV ERROR] Vue '{view_name}' non trouvée dans {list(self.views.keys())}")
                 if self.error_bus and UNIFIED_SIGNALS_AVAILABLE:
@@ -306,12 +392,12 @@ class ViewManager(QObject):
             return self.current_view
         
         def get_view_widget(self, view_name: str):
-            """Retourne le widget d'une vue"""
-            return self.views.get(view_name)
+            """Retourne le widget d'une vue (construit à la demande)"""
+            return self.ensure_view(view_name)
         
         def has_view(self, view_name: str) -> bool:
-            """Vérifie si une vue est enregistrée"""
-            return view_name in self.views
+            """Vérifie si une vue est enregistrée, construite ou non"""
+            return view_name in self.views or view_name in self.view_factories
         
         def show_error_toast(self, error_msg) -> None:
             """Affiche un toast d'erreur avec le système amélioré"""
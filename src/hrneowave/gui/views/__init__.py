@@ -4,18 +4,35 @@ Vues principales de l'application avec design maritime et Golden Ratio
 Version: 2.0.0
 """
 
-# Import direct des vues principales
-from .dashboard_view import DashboardViewMaritime
+# Import direct de la vue d'accueil, affichée au démarrage
 from .welcome_view import WelcomeView
 
 # Variables pour le lazy loading
+_dashboard_view = None
 _calibration_view = None
 _acquisition_view = None
 _analysis_view = None
 _export_view = None
 _settings_view = None
 
+
+def __getattr__(name):
+    # Tableau de bord chargé à la première utilisation (PEP 562)
+    if name == 'DashboardViewMaritime':
+        from .dashboard_view import DashboardViewMaritime
+        return DashboardViewMaritime
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Fonctions d'accès pour le ViewManager avec lazy loading
+def get_dashboard_view(parent=None):
+    """Retourne une instance de DashboardViewMaritime"""
+    global _dashboard_view
+    if _dashboard_view is None:
+        from .dashboard_view import DashboardViewMaritime
+        _dashboard_view = DashboardViewMaritime
+    return _dashboard_view(parent=parent)
+
 def get_calibration_view(parent=None):
     """Retourne une instance de CalibrationView"""
     global _calibration_view
@@ -60,6 +77,7 @@ __all__ = [
     'DashboardViewMaritime',
     'WelcomeView',
     # Fonctions d'accès pour les vues
+    'get_dashboard_view',
     'get_calibration_view',
     'get_acquisition_view',
     'get_analysis_view',
@@ -82,7 +100,8 @@ VIEWS_CONFIG = {
         'class': 'DashboardViewMaritime',
         'title': '🏠 Tableau de Bord',
         'icon': '🏠',
-        'description': 'Vue d\'ensemble du système et monitoring'
+        'description': 'Vue d\'ensemble du système et monitoring',
+        'loader': get_dashboard_view
     },
     'calibration': {
         'class': 'CalibrationView', 
@@ -12,11 +12,24 @@ from PySide6.QtWidgets import (
     QTabWidget, QScrollArea, QSpacerItem, QSizePolicy
 )
 from PySide6.QtGui import QFont, QPainter, QColor, QLinearGradient, QPixmap
+import numpy as np
+
+try:
+    from ..components.graph_manager import (
+        DEFAULT_COLORS, GraphConfiguration, OptimizedPlotWidget, PlotData
+    )
+except ImportError:
+    OptimizedPlotWidget = None
 
 # Golden Ratio Constants
 FIBONACCI_SPACING = [8, 13, 21, 34, 55, 89]
 GOLDEN_RATIO = 1.618
 
+# Graphique temps réel : fenêtre glissante affichée et format par défaut
+LIVE_WINDOW_SECONDS = 60.0
+LIVE_DEFAULT_CHANNELS = 4
+LIVE_DEFAULT_SAMPLE_RATE = 32.0
+
 class AcquisitionControlPanel(QFrame):
     """
     Panneau de contrôle pour l'acquisition de données
@@ -506,6 +519,9 @@ class DataVisualizationArea(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        self.live_plot = None
+        self.live_format = (LIVE_DEFAULT_CHANNELS, LIVE_DEFAULT_SAMPLE_RATE)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -653,11 +669,19 @@ class DataVisualizationArea(QFrame):
         """)
         
         main_graph_layout = QVBoxLayout(main_graph_frame)
-        main_graph_placeholder = QLabel("📈 Graphique Principal - Séries Temporelles")
-        main_graph_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        main_graph_placeholder.setFont(QFont("Inter", 16))
-        main_graph_placeholder.setStyleSheet("color: #445868;")
-        main_graph_layout.addWidget(main_graph_placeholder)
+        if OptimizedPlotWidget is not None:
+            self.live_plot = OptimizedPlotWidget(GraphConfiguration(
+                x_label="Temps", x_unit="s", y_label="Élévation", y_unit="m",
+                background_color="#F5FBFF", text_color="#445868"
+            ))
+            self.configure_live_plot(*self.live_format)
+            main_graph_layout.addWidget(self.live_plot)
+        else:
+            main_graph_placeholder = QLabel("📈 Graphique Principal - Séries Temporelles")
+            main_graph_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            main_graph_placeholder.setFont(QFont("Inter", 16))
+            main_graph_placeholder.setStyleSheet("color: #445868;")
+            main_graph_layout.addWidget(main_graph_placeholder)
         
         # Graphiques secondaires (miniatures)
         mini_graphs_layout = QHBoxLayout()
@@ -688,6 +712,43 @@ class DataVisualizationArea(QFrame):
         
         return tab
         
+    def configure_live_plot(self, n_channels: int, sample_rate: float):
+        """
+        (Re)crée une courbe temps réel par canal sur une fenêtre glissante
+        
+        Les courbes sont adossées à des anneaux dimensionnés sur la largeur du
+        graphique et redessinées au plus à max_fps.
+        """
+        if self.live_plot is None:
+            return
+        
+        self.live_plot.clear_all_plots()
+        window_samples = int(LIVE_WINDOW_SECONDS * sample_rate)
+        for channel in range(n_channels):
+            self.live_plot.add_live_curve(PlotData(
+                x=np.empty(0), y=np.empty(0), name=f"Canal {channel + 1}",
+                color=DEFAULT_COLORS[channel % len(DEFAULT_COLORS)]
+            ), window_samples)
+        self.live_format = (n_channels, sample_rate)
+        
+    def append_block(self, block):
+        """
+        Ajoute un DataBlock d'acquisition aux courbes temps réel
+        
+        Les échantillons sont recopiés (et décimés) dans les anneaux dès la
+        réception : le bloc peut ensuite être réécrit par l'acquisition.
+        """
+        if self.live_plot is None:
+            return
+        
+        # Nouvelle session (premier bloc) ou format modifié : courbes recréées
+        if block.sequence_id == 0 or (block.n_channels, block.sample_rate) != self.live_format:
+            self.configure_live_plot(block.n_channels, block.sample_rate)
+        
+        time_axis = (block.start_sample + np.arange(block.n_samples)) / block.sample_rate
+        for channel, samples in enumerate(np.atleast_2d(block.data)):
+            self.live_plot.append_live_data(f"Canal {channel + 1}", time_axis, samples)
+        
     def create_spectrum_tab(self) -> QWidget:
         """Crée l'onglet du spectrogramme"""
         tab = QWidget()
@@ -972,6 +1033,8 @@ class AcquisitionView(QWidget):
             controller.acquisition_started.connect(self._on_controller_acquisition_started)
         if hasattr(controller, 'acquisition_stopped'):
             controller.acquisition_stopped.connect(self._on_controller_acquisition_stopped)
+        if hasattr(controller, 'dataBlockReady'):
+            controller.dataBlockReady.connect(self.visualization_area.append_block)
     
     def _on_controller_acquisition_started(self):
         """Gestionnaire pour le démarrage d'acquisition depuis le contrôleur"""
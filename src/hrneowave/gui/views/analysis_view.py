@@ -4,7 +4,7 @@ Analysis View - Maritime Theme 2025
 Vue d'analyse des données avec design maritime et Golden Ratio
 """
 
-from PySide6.QtCore import Qt, Signal, QTimer, QPropertyAnimation, QEasingCurve
+from PySide6.QtCore import Qt, Signal, QTimer, QThread, QPropertyAnimation, QEasingCurve
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
     QGroupBox, QGridLayout, QSpinBox, QDoubleSpinBox, QComboBox,
@@ -13,11 +13,68 @@ from PySide6.QtWidgets import (
     QListWidgetItem, QTableWidget, QTableWidgetItem, QHeaderView
 )
 from PySide6.QtGui import QFont, QPainter, QColor, QLinearGradient, QPixmap
+import numpy as np
+
+try:
+    from ..components.graph_manager import (
+        GraphConfiguration, GraphManager, OptimizedPlotWidget, PlotData
+    )
+except ImportError:
+    OptimizedPlotWidget = None
 
 # Golden Ratio Constants
 FIBONACCI_SPACING = [8, 13, 21, 34, 55, 89]
 GOLDEN_RATIO = 1.618
 
+# Graphique principal : session HDF5 affichée depuis sa pyramide min/max
+SESSION_GRAPH_ID = "analysis_session"
+
+# Type d'analyse -> étape du graphe d'analyse (rapport complet par défaut)
+ANALYSIS_STAGES = {
+    'statistics': 'statistics',
+    'spectral': 'moments',
+    'temporal': 'wave_by_wave',
+}
+
+# Filtres du panneau -> type de filtre du graphe
+FILTER_TYPES = {
+    'Passe-bas': 'lowpass',
+    'Passe-haut': 'highpass',
+}
+
+def run_graph_stage(graph, stage: str, params: dict) -> dict:
+    """Modifie des paramètres du graphe puis calcule une étape
+    
+    Returns:
+        Résultat de l'étape (copie) et étapes effectivement recalculées
+    """
+    try:
+        if params:
+            graph.set_params(**params)
+        data = graph.compute(stage, copy=True)
+    except Exception as e:
+        print(f"Erreur analyse ({stage}): {e}")
+        return {"status": "error", "stage": stage, "error": str(e)}
+    return {"status": "completed", "stage": stage, "data": data,
+            "recomputed": list(graph.last_run)}
+
+
+class AnalysisStageThread(QThread):
+    """Calcul d'une étape du graphe d'analyse hors du thread de l'interface"""
+    
+    stage_finished = Signal(str, dict)  # type d'analyse, résultats
+    
+    def __init__(self, graph, analysis_type: str, stage: str, params: dict, parent=None):
+        super().__init__(parent)
+        self.graph = graph
+        self.analysis_type = analysis_type
+        self.stage = stage
+        self.params = params
+        
+    def run(self):
+        self.stage_finished.emit(self.analysis_type, run_graph_stage(self.graph, self.stage, self.params))
+
+
 class AnalysisToolsPanel(QFrame):
     """
     Panneau d'outils d'analyse
@@ -323,6 +380,26 @@ class AnalysisToolsPanel(QFrame):
         analysis_layout = QVBoxLayout(analysis_group)
         analysis_layout.setSpacing(FIBONACCI_SPACING[1])
         
+        # Fréquence d'échantillonnage des sessions qui ne l'enregistrent pas (CSV)
+        rate_layout = QHBoxLayout()
+        rate_layout.setSpacing(FIBONACCI_SPACING[1])
+        
+        rate_label = QLabel("Fe:")
+        rate_label.setFont(QFont("Inter", 12))
+        rate_label.setMinimumWidth(50)
+        rate_label.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Preferred)
+        rate_label.setToolTip("Fréquence d'échantillonnage si la session ne l'enregistre pas")
+        
+        self.sample_rate_spinbox = QDoubleSpinBox()
+        self.sample_rate_spinbox.setRange(0.1, 100000.0)
+        self.sample_rate_spinbox.setValue(32.0)
+        self.sample_rate_spinbox.setSuffix(" Hz")
+        self.sample_rate_spinbox.setFont(QFont("Inter", 11))
+        
+        rate_layout.addWidget(rate_label)
+        rate_layout.addWidget(self.sample_rate_spinbox)
+        analysis_layout.addLayout(rate_layout)
+        
         # Boutons d'analyse
         analysis_buttons = [
             ("📊 Analyse Statistique", "statistics"),
@@ -428,7 +505,7 @@ class AnalysisToolsPanel(QFrame):
         
     def request_analysis(self, analysis_type: str):
         """Demande une analyse"""
-        params = {}  # Paramètres par défaut
+        params = {'sample_rate': self.sample_rate_spinbox.value()}
         self.analysis_requested.emit(analysis_type, params)
         
     def request_export(self, export_type: str):
@@ -444,6 +521,10 @@ class AnalysisResultsArea(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        self.graph_manager = None
+        self.session_plot = None
+        self.session_file = None
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -596,11 +677,19 @@ class AnalysisResultsArea(QFrame):
         """)
         
         main_graph_layout = QVBoxLayout(main_graph_frame)
-        main_graph_placeholder = QLabel("📈 Graphique d'Analyse Principal")
-        main_graph_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        main_graph_placeholder.setFont(QFont("Inter", 16))
-        main_graph_placeholder.setStyleSheet("color: #445868;")
-        main_graph_layout.addWidget(main_graph_placeholder)
+        if OptimizedPlotWidget is not None:
+            self.graph_manager = GraphManager(self)
+            self.session_plot = self.graph_manager.create_graph(SESSION_GRAPH_ID, GraphConfiguration(
+                x_label="Temps", x_unit="s", y_label="Élévation", y_unit="m",
+                auto_range=False, background_color="#F5FBFF", text_color="#445868"
+            ))
+            main_graph_layout.addWidget(self.session_plot)
+        else:
+            main_graph_placeholder = QLabel("📈 Graphique d'Analyse Principal")
+            main_graph_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            main_graph_placeholder.setFont(QFont("Inter", 16))
+            main_graph_placeholder.setStyleSheet("color: #445868;")
+            main_graph_layout.addWidget(main_graph_placeholder)
         
         # Contrôles du graphique
         controls_frame = QFrame()
@@ -962,6 +1051,53 @@ Analyse complète des données d'acquisition maritime effectuée le 2025-01-XX.
         
         return tab
         
+    def display_session(self, file_path: str, sample_rate: float, channel: int = 0) -> bool:
+        """
+        Affiche un canal d'une session HDF5 depuis sa pyramide min/max
+        
+        Le fichier reste ouvert : chaque zoom ou déplacement relit le niveau
+        adapté à la plage visible. Retourne False si la session n'a pas de
+        pyramide (fichier non HDF5 ou enregistré sans pyramide).
+        """
+        self.close_session()
+        if self.graph_manager is None:
+            return False
+        
+        import h5py
+        from hrneowave.utils.hdf_pyramid import MinMaxPyramid
+        try:
+            session_file = h5py.File(file_path, 'r')
+        except OSError:
+            return False
+        if not MinMaxPyramid.exists(session_file):
+            session_file.close()
+            return False
+        
+        pyramid = MinMaxPyramid(session_file)
+        self.session_file = session_file
+        self.graph_manager.attach_pyramid(
+            SESSION_GRAPH_ID, pyramid, float(session_file.attrs.get('fs', sample_rate)),
+            channel if pyramid.source.ndim == 2 else None,
+            PlotData(x=np.empty(0), y=np.empty(0), name=f"Canal {channel + 1}", color="#2B79B6")
+        )
+        return True
+        
+    def close_session(self):
+        """Retire la session affichée et ferme son fichier"""
+        if self.graph_manager is not None:
+            self.graph_manager.clear_graph(SESSION_GRAPH_ID)
+        if self.session_file is not None:
+            self.session_file.close()
+            self.session_file = None
+        
+    def shutdown(self):
+        """Ferme la session et arrête le thread du gestionnaire de graphiques"""
+        self.close_session()
+        if self.graph_manager is not None:
+            self.graph_manager.cleanup()
+            self.graph_manager = None
+            self.session_plot = None
+        
     def update_analysis_status(self, status: str, count: int = 0):
         """Met à jour le statut d'analyse"""
         self.analysis_status_label.setText(status)
@@ -984,6 +1120,18 @@ class AnalysisView(QWidget):
         self.is_dark_mode = False
         self.analysis_count = 0
         
+        # Graphe d'analyse de la session chargée : seules les étapes en aval
+        # d'un paramètre modifié sont recalculées
+        self.analysis_graph = None
+        self.current_file = None
+        
+        # Calcul en cours (un seul à la fois : le graphe n'est pas partagé
+        # entre threads), dernière étape demandée pendant ce calcul et
+        # paramètres à appliquer ensuite
+        self._stage_thread = None
+        self._pending_stage = None
+        self._pending_params = {}
+        
         self.setup_ui()
         self.setup_connections()
         
@@ -1034,24 +1182,81 @@ class AnalysisView(QWidget):
         """Gestionnaire de demande d'analyse"""
         print(f"Analyse demandée: {analysis_type} avec paramètres: {params}")
         
-        # Simuler l'analyse
         self.analysis_count += 1
         self.results_area.update_analysis_status(f"🔬 Analyse en cours...", self.analysis_count)
         
-        # Émettre le signal
-        results = {"status": "completed", "data": "sample_results"}
-        self.analysis_completed.emit(analysis_type, results)
-        
-        # Mettre à jour le statut
-        self.results_area.update_analysis_status(f"✅ Analyse terminée", self.analysis_count)
+        if self.current_file is None:
+            self.on_stage_finished(analysis_type, {"status": "completed", "data": "sample_results"})
+        else:
+            self.submit_stage(analysis_type, ANALYSIS_STAGES.get(analysis_type, 'report'), **params)
         
     def on_filter_applied(self, filter_type: str, params: dict):
         """Gestionnaire d'application de filtre"""
         print(f"Filtre appliqué: {filter_type} avec paramètres: {params}")
         
+        if filter_type in FILTER_TYPES and self.current_file is not None:
+            self.submit_stage(
+                'report', 'report', filter_type=FILTER_TYPES[filter_type],
+                cutoff=params.get('frequency'), filter_order=params.get('order', 4)
+            )
+        
         # Émettre le signal
         self.filter_applied.emit(filter_type, params)
         
+    def submit_stage(self, analysis_type: str, stage: str, **params):
+        """Calcule une étape dans un thread ; résultat émis par analysis_completed
+        
+        Une demande arrivée pendant un calcul est mise en attente (la plus
+        récente l'emporte, ses paramètres s'ajoutant à ceux déjà en attente).
+        """
+        self._pending_params.update(params)
+        if self._stage_thread is not None:
+            self._pending_stage = (analysis_type, stage)
+            return
+        params, self._pending_params = self._pending_params, {}
+        thread = AnalysisStageThread(self.analysis_graph, analysis_type, stage, params, self)
+        thread.stage_finished.connect(self.on_stage_finished)
+        thread.finished.connect(self._on_stage_thread_finished)
+        self._stage_thread = thread
+        thread.start()
+        
+    def on_stage_finished(self, analysis_type: str, results: dict):
+        """Résultat d'une analyse (thread de l'interface)"""
+        self.analysis_completed.emit(analysis_type, results)
+        
+        # Mettre à jour le statut
+        if results["status"] == "completed":
+            self.results_area.update_analysis_status(f"✅ Analyse terminée", self.analysis_count)
+        else:
+            self.results_area.update_analysis_status(f"❌ Analyse en échec", self.analysis_count)
+        
+    def _on_stage_thread_finished(self):
+        thread, self._stage_thread = self._stage_thread, None
+        if thread is not None:
+            thread.deleteLater()
+        if self._pending_stage is not None:
+            analysis_type, stage = self._pending_stage
+            self._pending_stage = None
+            self.submit_stage(analysis_type, stage)
+        elif self._pending_params:
+            params, self._pending_params = self._pending_params, {}
+            self.analysis_graph.set_params(**params)
+        
+    def wait_for_analysis(self, timeout_ms: int = 30000) -> bool:
+        """Attend la fin du calcul en cours ; False si le délai est dépassé"""
+        thread = self._stage_thread
+        return thread is None or thread.wait(timeout_ms)
+        
+    def run_stage(self, stage: str, **params) -> dict:
+        """Calcul synchrone d'une étape (scripts, tests)"""
+        return run_graph_stage(self.analysis_graph, stage, params)
+        
+    def closeEvent(self, event):
+        self._pending_stage = None
+        self.wait_for_analysis()
+        self.results_area.shutdown()
+        super().closeEvent(event)
+        
     def on_export_requested(self, export_type: str):
         """Gestionnaire de demande d'export"""
         print(f"Export demandé: {export_type}")
@@ -1081,16 +1286,38 @@ class AnalysisView(QWidget):
                 }
             """)
             
-    def load_data_file(self, file_path: str):
-        """Charge un fichier de données pour analyse"""
+    def load_data_file(self, file_path: str, sample_rate: float = None):
+        """Charge un fichier de données pour analyse
+        
+        Args:
+            file_path: Fichier de session
+            sample_rate: Fréquence d'échantillonnage si la session ne
+                l'enregistre pas (valeur du panneau d'outils par défaut)
+        """
         print(f"Chargement du fichier: {file_path}")
-        # Logique de chargement des données
+        if self.analysis_graph is None:
+            from hrneowave.headless.analyze import build_session_graph
+            from hrneowave.core.result_cache import get_result_cache
+            try:
+                store = get_result_cache()
+            except Exception as e:
+                print(f"Cache d'analyse indisponible: {e}")
+                store = None
+            self.analysis_graph = build_session_graph(store=store)
+        params = {'source': str(file_path),
+                  'sample_rate': sample_rate or self.tools_panel.sample_rate_spinbox.value()}
+        self.results_area.display_session(str(file_path), params['sample_rate'])
+        if self._stage_thread is not None:
+            self._pending_params.update(params)  # appliqués à la fin du calcul en cours
+        else:
+            self.analysis_graph.set_params(**params)
+        self.current_file = str(file_path)
         
     def get_analysis_results(self) -> dict:
         """Retourne les résultats d'analyse actuels"""
         return {
             "analysis_count": self.analysis_count,
-            "current_data": "sample_data",
+            "current_data": self.current_file or "sample_data",
             "last_analysis": "spectral"
         }
         
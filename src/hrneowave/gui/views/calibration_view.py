@@ -210,9 +210,9 @@ class CalibrationSidebar(QFrame):
         footer_layout.setSpacing(MaritimeTheme.SPACE_SM)
         
         # Boutons d'action
-        self.save_button = MaritimeButton("Save Progress", variant="secondary")
-        self.reset_button = MaritimeButton("Reset All", variant="outline")
-        self.export_button = MaritimeButton("Export Config", variant="outline")
+        self.save_button = MaritimeButton(text="Save Progress", variant="secondary")
+        self.reset_button = MaritimeButton(text="Reset All", variant="outline")
+        self.export_button = MaritimeButton(text="Export Config", variant="outline")
         
         footer_layout.addWidget(self.save_button)
         footer_layout.addWidget(self.reset_button)
@@ -260,7 +260,7 @@ class CalibrationSidebar(QFrame):
         # Status beacon
         status_beacon = StatusBeacon(
             parent=step_frame,
-            status=StatusBeacon.STATUS_PENDING,
+            status=StatusBeacon.STATUS_INACTIVE,
             label=""
         )
         
@@ -468,7 +468,7 @@ class CalibrationMainArea(QFrame):
         # Status indicator
         self.main_status = StatusBeacon(
             parent=header,
-            status=StatusBeacon.STATUS_PENDING,
+            status=StatusBeacon.STATUS_INACTIVE,
             label="Ready"
         )
         
@@ -517,7 +517,7 @@ class CalibrationMainArea(QFrame):
         layout.addWidget(title)
         
         # Configuration des capteurs dans une carte maritime
-        sensor_card = MaritimeCard("Sensor Settings")
+        sensor_card = MaritimeCard(title="Sensor Settings")
         sensor_content = QWidget()
         sensor_layout = QGridLayout(sensor_content)
         sensor_layout.setSpacing(MaritimeTheme.SPACE_SM)
@@ -539,7 +539,7 @@ class CalibrationMainArea(QFrame):
         range_max_spin.setValue(100)
         sensor_layout.addWidget(range_max_spin, 2, 1)
         
-        sensor_card.add_content(sensor_content)
+        sensor_card.add_widget(sensor_content)
         layout.addWidget(sensor_card)
         
         layout.addStretch()
@@ -561,7 +561,7 @@ class CalibrationMainArea(QFrame):
         layout.addWidget(instructions)
         
         # Carte de calibration zéro
-        zero_card = MaritimeCard("Zero Calibration")
+        zero_card = MaritimeCard(title="Zero Calibration")
         zero_content = QWidget()
         zero_layout = QVBoxLayout(zero_content)
         
@@ -571,10 +571,10 @@ class CalibrationMainArea(QFrame):
         zero_layout.addWidget(current_value)
         
         # Bouton de calibration
-        set_zero_btn = MaritimeButton("Set Zero Point", variant="primary")
+        set_zero_btn = MaritimeButton(text="Set Zero Point", variant="primary")
         zero_layout.addWidget(set_zero_btn)
         
-        zero_card.add_content(zero_content)
+        zero_card.add_widget(zero_content)
         layout.addWidget(zero_card)
         
         layout.addStretch()
@@ -591,7 +591,7 @@ class CalibrationMainArea(QFrame):
         layout.addWidget(title)
         
         # Carte de calibration d'étendue
-        span_card = MaritimeCard("Span Settings")
+        span_card = MaritimeCard(title="Span Settings")
         span_content = QWidget()
         span_layout = QGridLayout(span_content)
         
@@ -605,10 +605,10 @@ class CalibrationMainArea(QFrame):
         current_reading = QLabel("95.234")
         span_layout.addWidget(current_reading, 1, 1)
         
-        set_span_btn = MaritimeButton("Set Span", variant="primary")
+        set_span_btn = MaritimeButton(text="Set Span", variant="primary")
         span_layout.addWidget(set_span_btn, 2, 0, 1, 2)
         
-        span_card.add_content(span_content)
+        span_card.add_widget(span_content)
         layout.addWidget(span_card)
         
         layout.addStretch()
@@ -625,7 +625,7 @@ class CalibrationMainArea(QFrame):
         layout.addWidget(title)
         
         # Graphique de linéarité (placeholder)
-        linearity_card = MaritimeCard("Linearity Graph")
+        linearity_card = MaritimeCard(title="Linearity Graph")
         linearity_content = QWidget()
         linearity_layout = QVBoxLayout(linearity_content)
         
@@ -645,7 +645,7 @@ class CalibrationMainArea(QFrame):
         
         linearity_layout.addLayout(results_layout)
         
-        linearity_card.add_content(linearity_content)
+        linearity_card.add_widget(linearity_content)
         layout.addWidget(linearity_card)
         
         layout.addStretch()
@@ -662,16 +662,16 @@ class CalibrationMainArea(QFrame):
         layout.addWidget(title)
         
         # Résumé de validation
-        validation_card = MaritimeCard("Validation Summary")
+        validation_card = MaritimeCard(title="Validation Summary")
         validation_content = QWidget()
         validation_layout = QVBoxLayout(validation_content)
         
         # KPIs de validation
         kpi_layout = QGridLayout()
         
-        accuracy_kpi = KPIIndicator("Accuracy", "±0.1%", "success")
-        repeatability_kpi = KPIIndicator("Repeatability", "±0.05%", "success")
-        stability_kpi = KPIIndicator("Stability", "±0.02%", "success")
+        accuracy_kpi = KPIIndicator(label="Accuracy (±)", value=0.1, unit="%", state="success")
+        repeatability_kpi = KPIIndicator(label="Repeatability (±)", value=0.05, unit="%", precision=2, state="success")
+        stability_kpi = KPIIndicator(label="Stability (±)", value=0.02, unit="%", precision=2, state="success")
         
         kpi_layout.addWidget(accuracy_kpi, 0, 0)
         kpi_layout.addWidget(repeatability_kpi, 0, 1)
@@ -680,10 +680,10 @@ class CalibrationMainArea(QFrame):
         validation_layout.addLayout(kpi_layout)
         
         # Bouton de validation finale
-        validate_btn = MaritimeButton("Validate Calibration", variant="primary")
+        validate_btn = MaritimeButton(text="Validate Calibration", variant="primary")
         validation_layout.addWidget(validate_btn)
         
-        validation_card.add_content(validation_content)
+        validation_card.add_widget(validation_content)
         layout.addWidget(validation_card)
         
         layout.addStretch()
@@ -700,7 +700,7 @@ class CalibrationMainArea(QFrame):
         layout.addWidget(title)
         
         # Génération de rapport
-        doc_card = MaritimeCard("Report Generation")
+        doc_card = MaritimeCard(title="Report Generation")
         doc_content = QWidget()
         doc_layout = QVBoxLayout(doc_content)
         
@@ -720,14 +720,14 @@ class CalibrationMainArea(QFrame):
         
         # Boutons d'action
         actions_layout = QHBoxLayout()
-        preview_btn = MaritimeButton("Preview Report", variant="secondary")
-        generate_btn = MaritimeButton("Generate Report", variant="primary")
+        preview_btn = MaritimeButton(text="Preview Report", variant="secondary")
+        generate_btn = MaritimeButton(text="Generate Report", variant="primary")
         
         actions_layout.addWidget(preview_btn)
         actions_layout.addWidget(generate_btn)
         doc_layout.addLayout(actions_layout)
         
-        doc_card.add_content(doc_content)
+        doc_card.add_widget(doc_content)
         layout.addWidget(doc_card)
         
         layout.addStretch()
@@ -745,9 +745,9 @@ class CalibrationMainArea(QFrame):
         action_layout.setSpacing(MaritimeTheme.SPACE_SM)
         
         # Boutons de navigation
-        self.prev_button = MaritimeButton("← Previous", variant="outline")
-        self.next_button = MaritimeButton("Next →", variant="primary")
-        self.complete_button = MaritimeButton("Complete Step", variant="secondary")
+        self.prev_button = MaritimeButton(text="← Previous", variant="outline")
+        self.next_button = MaritimeButton(text="Next →", variant="primary")
+        self.complete_button = MaritimeButton(text="Complete Step", variant="secondary")
         
         action_layout.addWidget(self.prev_button)
         action_layout.addStretch()
@@ -875,7 +875,7 @@ un niveau de bruit de fond à -40 dB.
         if dialog.exec() == QPrintDialog.DialogCode.Accepted:
             self.report_text.print(printer)
             
-    def update_content(self, /* content: str):
+    def update_content(self, content: str):
         """Met à jour le contenu du rapport"""
         self.report_text.setHtml(content)
         
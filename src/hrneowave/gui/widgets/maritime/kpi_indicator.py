@@ -16,11 +16,11 @@ from typing import Optional, Union
 
 try:
     from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
-    from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Signal, QTimer
+    from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Signal, QTimer, QSize
     from PySide6.QtGui import QFont, QPixmap, QPainter, QColor, QPen
 except ImportError:
     from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
-    from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal as Signal, QTimer
+    from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal as Signal, QTimer, QSize
     from PyQt6.QtGui import QFont, QPixmap, QPainter, QColor, QPen
 
 from .maritime_card import MaritimeCard
@@ -334,14 +334,4 @@ class KPIIndicator(MaritimeCard):
         # Largeur basée sur le contenu, hauteur selon Golden Ratio
         base_width = 200
         base_height = int(base_width / self.GOLDEN_RATIO)
-        return super().sizeHint().expandedTo(
-            self.size().expandedTo(
-                self.minimumSize().expandedTo(
-                    self.sizeHint().expandedTo(
-                        self.size().expandedTo(
-                            self.minimumSizeHint()
-                        )
-                    )
-                )
-            )
-        )
\ No newline at end of file
+        return super().sizeHint().expandedTo(QSize(base_width, base_height))
\ No newline at end of file
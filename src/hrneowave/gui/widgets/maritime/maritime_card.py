@@ -15,17 +15,17 @@ from typing import Optional, Union
 
 try:
     from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
-    from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Signal, QRect
+    from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Signal, QRect, QSize
     from PySide6.QtGui import QPainter, QPainterPath, QColor, QPen
     pyqtSignal = Signal
 except ImportError:
     try:
         from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
-        from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, QRect
+        from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, QRect, QSize
         from PyQt6.QtGui import QPainter, QPainterPath, QColor, QPen
     except ImportError:
         from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
-        from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, QRect
+        from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, QRect, QSize
         from PyQt5.QtGui import QPainter, QPainterPath, QColor, QPen
 
 # Import du système d'animations Phase 6
@@ -350,15 +350,7 @@ class MaritimeCard(QFrame):
         """Taille suggérée basée sur le Golden Ratio."""
         base_width = 323  # Basé sur Golden Ratio
         base_height = int(base_width / self.GOLDEN_RATIO)
-        return super().sizeHint().expandedTo(self.size().expandedTo(
-            self.minimumSize().expandedTo(
-                self.sizeHint().expandedTo(
-                    self.size().expandedTo(
-                        self.minimumSizeHint()
-                    )
-                )
-            )
-        ))
+        return super().sizeHint().expandedTo(QSize(base_width, base_height))
     
     def minimumSizeHint(self):
         """Taille minimale suggérée."""
@@ -1,3 +1,32 @@
 """
 hardware module
+
+Les symboles sont chargés à la première utilisation (PEP 562) : le processus
+d'acquisition n'importe que les backends réellement utilisés.
 """
+
+import importlib
+
+# Symbole -> sous-module qui le définit
+_LAZY_ATTRIBUTES = {
+    'DAQHandler': 'base',
+    'HardwareManager': 'manager',
+    'AVAILABLE_BACKENDS': 'manager',
+    'SharedRingBuffer': 'shared_ring',
+    'AcquisitionProcess': 'shared_ring',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Backend MCC DAQ (USB-1608FS) pour CHNeoWave.
+
+S'appuie sur le wrapper ctypes `acquisition.mcc_daq_wrapper` : balayage
+continu en arrière-plan (cbAInScan CONTINUOUS | BACKGROUND) dans un buffer
+circulaire, relu par blocs à partir du compteur d'échantillons de la carte.
+"""
+
+import logging
+from threading import Event
+from typing import Optional, List
+
+import numpy as np
+
+from ..base import DAQHandler
+
+logger = logging.getLogger(__name__)
+
+# Pleine échelle (V) des plages de la USB-1608FS, valeurs de MCCRanges
+_RANGE_SPANS = {1: 20.0, 2: 10.0, 5: 4.0, 7: 2.0}
+
+
+class MCCBackend(DAQHandler):
+    """Backend pour cartes Measurement Computing USB-1608FS"""
+
+    MAX_CHANNELS = 8
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.config = config
+        self.board = None
+        self.is_running = False
+        self.stop_event = Event()
+        self.data_callback = None
+        self.error_callback = None
+
+        self.sample_rate = float(config.get('sample_rate', 1000))
+        self.num_samples = int(config.get('num_samples', 1000))
+        self.board_num = int(config.get('board_num', 0))
+        self.range_type = int(config.get('range_type', 1))  # MCCRanges.BIP10VOLTS
+        self.buffer_seconds = float(config.get('buffer_seconds', 10.0))
+        self.channel_list: List[int] = list(range(int(config.get('channels', 8))))
+
+        self._read_count = 0
+        self._lost_samples = 0
+
+    def open(self) -> bool:
+        try:
+            from ...acquisition.mcc_daq_wrapper import MCCDAQ_USB1608FS
+            self.board = MCCDAQ_USB1608FS(self.config.get('dll_path'))
+        except Exception as e:
+            logger.error(f"Bibliothèque MCC DAQ indisponible: {e}")
+            return False
+        return self.board.initialize(self.board_num)
+
+    def close(self):
+        if self.board:
+            self.board.close()
+            self.board = None
+
+    def configure_acquisition(self, sample_rate: int, num_samples_per_channel: int):
+        self.sample_rate = float(sample_rate)
+        self.num_samples = int(num_samples_per_channel)
+
+    def configure_channels(self, channels: list):
+        self.channel_list = [c['channel'] if isinstance(c, dict) else int(c) for c in channels]
+        if max(self.channel_list) >= self.MAX_CHANNELS:
+            raise ValueError(f"La USB-1608FS n'a que {self.MAX_CHANNELS} canaux")
+
+    @property
+    def _scan_channels(self) -> int:
+        return max(self.channel_list) - min(self.channel_list) + 1
+
+    def start(self):
+        if self.is_running:
+            logger.warning("L'acquisition est déjà en cours.")
+            return
+        from ...acquisition.mcc_daq_wrapper import MCCRanges
+
+        low, high = min(self.channel_list), max(self.channel_list)
+        for channel in range(low, high + 1):
+            self.board.configure_channel(channel, MCCRanges(self.range_type))
+        buffer_size = max(int(self.sample_rate * self.buffer_seconds), 4 * self.num_samples)
+        if not self.board.start_continuous_acquisition(low, high, self.sample_rate, buffer_size):
+            raise RuntimeError("Démarrage du balayage MCC impossible")
+        self.sample_rate = float(self.board.acquisition_config.rate)
+        self._read_count = 0
+        self._lost_samples = 0
+        self.stop_event.clear()
+        self.is_running = True
+
+    def stop(self):
+        if not self.is_running:
+            return
+        self.stop_event.set()
+        self.board.stop_acquisition()
+        self.is_running = False
+
+    def read(self) -> np.ndarray:
+        """Bloc suivant du buffer circulaire de la carte (canaux x échantillons, V)"""
+        n_scan = self._scan_channels
+        wanted = self.num_samples * n_scan
+        total = self.board.acquisition_config.count
+
+        while not self.stop_event.is_set():
+            acquired = self.board.get_acquisition_status().get('current_count', 0)
+            available = acquired - self._read_count
+            if available > total:
+                # Débordement du buffer de la carte : reprise sur les données les plus anciennes valides
+                lost = available - total + wanted
+                lost -= lost % n_scan
+                self._read_count += lost
+                self._lost_samples += lost // n_scan
+                logger.warning(f"Débordement du buffer MCC: {lost // n_scan} échantillons perdus")
+                continue
+            if available >= wanted:
+                break
+            self.stop_event.wait(min(0.005, self.num_samples / self.sample_rate / 4))
+        else:
+            return np.empty((len(self.channel_list), 0))
+
+        raw = np.frombuffer(self.board.data_buffer, dtype=np.uint16)
+        values = raw[(self._read_count + np.arange(wanted)) % total].astype(np.int32)
+        self._read_count += wanted
+        values[values > 32767] -= 65536
+        volts = values.reshape(-1, n_scan).T * (_RANGE_SPANS.get(self.range_type, 20.0) / 65536)
+        low = min(self.channel_list)
+        return volts[[c - low for c in self.channel_list]]
+
+    def get_status(self) -> dict:
+        return {
+            'running': self.is_running,
+            'board_num': self.board_num,
+            'channels': self.channel_list,
+            'lost_samples': self._lost_samples
+        }
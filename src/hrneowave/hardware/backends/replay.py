@@ -0,0 +1,415 @@
+# -*- coding: utf-8 -*-
+"""
+Backend de rejeu de sessions enregistrées pour CHNeoWave.
+
+Relit une session (HDF5 de HDF5Writer ou d'ExportManager, TDMS, CSV) par
+blocs, sans la charger en mémoire, et la réinjecte dans le pipeline
+d'acquisition comme un matériel réel. La vitesse est réglable : temps réel
+(speed=1), N fois plus vite, ou sans limite (speed=0), ce qui fait du rejeu
+un banc de débit du pipeline complet sur données réelles.
+"""
+
+import abc
+import csv
+import itertools
+import logging
+import time
+from pathlib import Path
+from threading import Thread, Event
+from typing import Optional, Callable, List
+
+import numpy as np
+
+from ..base import DAQHandler
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_FORMATS = ('hdf5', 'tdms', 'csv')
+
+_SUFFIX_FORMATS = {
+    '.h5': 'hdf5',
+    '.hdf5': 'hdf5',
+    '.hdf': 'hdf5',
+    '.tdms': 'tdms',
+    '.csv': 'csv',
+}
+
+
+class _SessionSource(abc.ABC):
+    """Lecture séquentielle par blocs d'une session (canaux x échantillons)"""
+
+    sample_rate: Optional[float] = None
+    n_channels: int = 0
+    n_samples: Optional[int] = None  # inconnu pour le CSV
+    channel_names: List[str] = []
+    metadata: dict = {}
+
+    @abc.abstractmethod
+    def read(self, n_samples: int) -> np.ndarray:
+        """Au plus n_samples échantillons suivants (canaux x échantillons)"""
+
+    @abc.abstractmethod
+    def rewind(self):
+        """Reprend la lecture au début de la session"""
+
+    def read_all(self, chunk_size: int = 65536) -> np.ndarray:
+        """Reste de la session, lu par blocs"""
+        blocks = []
+        while True:
+            block = self.read(chunk_size)
+            if not block.shape[1]:
+                break
+            blocks.append(block)
+            if block.shape[1] < chunk_size and self.n_samples is not None:
+                break
+        return np.concatenate(blocks, axis=1) if blocks else np.empty((self.n_channels, 0))
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class _HDF5Source(_SessionSource):
+    """HDF5 : '/raw' (échantillons x canaux, HDF5Writer) ou 'acquisition_data/channel_XX' (ExportManager)"""
+
+    def __init__(self, path: Path):
+        import h5py
+
+        self._file = h5py.File(path, 'r')
+        self._position = 0
+        if 'raw' in self._file:
+            raw = self._file['raw']
+            self._datasets = None
+            self._raw = raw
+            self.n_samples, self.n_channels = raw.shape
+            self.sample_rate = self._attr(self._file.attrs, 'fs')
+            self.metadata = dict(self._file.attrs)
+            names = self._file.attrs.get('channel_names')
+            self.channel_names = [n.decode('utf-8') if isinstance(n, bytes) else str(n)
+                                  for n in names] if names is not None else []
+        elif 'acquisition_data' in self._file:
+            group = self._file['acquisition_data']
+            keys = sorted(k for k in group.keys() if k.startswith('channel_'))
+            self._raw = None
+            self._datasets = [group[k] for k in keys]
+            self.n_channels = len(keys)
+            self.n_samples = min(len(d) for d in self._datasets) if keys else 0
+            self.channel_names = keys
+            session = self._file.get('metadata/session')
+            if 'metadata' in self._file:
+                self.metadata = dict(self._file['metadata'].attrs)
+            self.sample_rate = self._attr(session.attrs, 'sample_rate') if session is not None else None
+        else:
+            self._file.close()
+            raise ValueError(f"Structure HDF5 non reconnue: {path}")
+
+    @staticmethod
+    def _attr(attrs, key: str) -> Optional[float]:
+        value = attrs.get(key)
+        return float(value) if value is not None else None
+
+    def read(self, n_samples: int) -> np.ndarray:
+        start = self._position
+        stop = min(start + n_samples, self.n_samples)
+        self._position = stop
+        if self._raw is not None:
+            return np.asarray(self._raw[start:stop], dtype=float).T
+        return np.stack([np.asarray(d[start:stop], dtype=float) for d in self._datasets])
+
+    def rewind(self):
+        self._position = 0
+
+    def close(self):
+        self._file.close()
+
+
+class _TdmsSource(_SessionSource):
+    """TDMS (nptdms), ouvert en flux : seules les tranches lues sont chargées"""
+
+    def __init__(self, path: Path):
+        from nptdms import TdmsFile
+
+        self._file = TdmsFile.open(str(path))
+        self._position = 0
+        groups = self._file.groups()
+        if not groups or not groups[0].channels():
+            self._file.close()
+            raise ValueError(f"Aucun canal dans le fichier TDMS: {path}")
+        self._channels = groups[0].channels()
+        self.n_channels = len(self._channels)
+        self.n_samples = min(len(c) for c in self._channels)
+        self.channel_names = [c.name for c in self._channels]
+
+        increment = self._channels[0].properties.get('wf_increment')
+        rate = self._file.properties.get('Sample_Rate')
+        if increment:
+            self.sample_rate = 1.0 / float(increment)
+        elif rate:
+            self.sample_rate = float(rate)
+
+    def read(self, n_samples: int) -> np.ndarray:
+        start = self._position
+        stop = min(start + n_samples, self.n_samples)
+        self._position = stop
+        return np.stack([np.asarray(c[start:stop], dtype=float) for c in self._channels])
+
+    def rewind(self):
+        self._position = 0
+
+    def close(self):
+        self._file.close()
+
+
+class _CsvSource(_SessionSource):
+    """CSV : une ligne par échantillon, colonne d'horodatage éventuelle ignorée"""
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._handle = None
+        self._reader = None
+        self._skip = 0
+        self.rewind()
+
+    def rewind(self):
+        if self._handle:
+            self._handle.close()
+        self._handle = open(self._path, 'r', newline='', encoding='utf-8')
+        self._reader = csv.reader(self._handle)
+        header = next(self._reader, None)
+        if header is None:
+            raise ValueError(f"Fichier CSV vide: {self._path}")
+        first = header[0].strip().lower()
+        self._skip = 1 if first in ('timestamp', 'time', 'temps', 't') else 0
+        self.channel_names = [name.strip() for name in header[self._skip:]]
+        self.n_channels = len(self.channel_names)
+
+    def read(self, n_samples: int) -> np.ndarray:
+        rows = [row[self._skip:] for row in itertools.islice(self._reader, n_samples) if row]
+        if not rows:
+            return np.empty((self.n_channels, 0))
+        return np.array(rows, dtype=float).T
+
+    def close(self):
+        if self._handle:
+            self._handle.close()
+            self._handle = None
+
+
+_SOURCES = {
+    'hdf5': _HDF5Source,
+    'tdms': _TdmsSource,
+    'csv': _CsvSource,
+}
+
+
+def detect_format(path: Path) -> str:
+    """Format de session déduit de l'extension du fichier"""
+    fmt = _SUFFIX_FORMATS.get(Path(path).suffix.lower())
+    if fmt is None:
+        raise ValueError(f"Format de session non reconnu: {path} (formats: {', '.join(SUPPORTED_FORMATS)})")
+    return fmt
+
+
+def open_session(path: Path, fmt: Optional[str] = None) -> _SessionSource:
+    """
+    Ouvre une session enregistrée en lecture séquentielle par blocs
+
+    Args:
+        path: Fichier de session
+        fmt: Format ('hdf5', 'tdms', 'csv'), déduit de l'extension par défaut
+
+    Returns:
+        Source exposant sample_rate, n_channels, channel_names, read(n) et read_all()
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in _SOURCES:
+        raise ValueError(f"Format de session non supporté: {fmt}")
+    return _SOURCES[fmt](Path(path))
+
+
+class ReplayBackend(DAQHandler):
+    """Backend de rejeu : diffuse une session enregistrée par blocs, à vitesse réglable."""
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.config = config
+        self.is_running = False
+        self.acquisition_thread: Optional[Thread] = None
+        self.stop_event = Event()
+        self.data_callback: Optional[Callable[[np.ndarray], None]] = None
+        self.error_callback: Optional[Callable[[str], None]] = None
+
+        path = config.get('path')
+        self.path = Path(path) if path else None
+        self.format = config.get('format')
+        self.sample_rate = float(config.get('sample_rate', 32))
+        self.num_channels = int(config.get('channels', 0)) or None
+        self.num_samples = int(config.get('num_samples', 1024))
+
+        # Vitesse : 1.0 temps réel, N fois plus vite, 0 sans limite
+        self.speed = float(config.get('speed', 1.0))
+        self.loop = bool(config.get('loop', False))
+
+        self._source: Optional[_SessionSource] = None
+        self._samples_emitted = 0
+        self._started_at = 0.0
+        self._elapsed = 0.0
+        self.finished = False
+
+        logger.info("Backend de rejeu initialisé.")
+
+    @property
+    def self_paced(self) -> bool:
+        """read() respecte lui-même la cadence de rejeu"""
+        return True
+
+    def open(self) -> bool:
+        if self.path is None or not self.path.exists():
+            logger.error(f"Session à rejouer introuvable: {self.path}")
+            return False
+        try:
+            self._source = open_session(self.path, self.format)
+        except ImportError as e:
+            logger.error(f"Dépendance manquante pour rejouer {self.path}: {e}")
+            return False
+        except (OSError, ValueError) as e:
+            logger.error(f"Ouverture de la session {self.path} impossible: {e}")
+            return False
+
+        source = self._source
+        if source.sample_rate:
+            if source.sample_rate != self.sample_rate:
+                logger.warning(
+                    f"Fréquence de la session ({source.sample_rate} Hz) prioritaire sur "
+                    f"la configuration ({self.sample_rate} Hz)"
+                )
+            self.sample_rate = source.sample_rate
+
+        if self.num_channels is None:
+            self.num_channels = source.n_channels
+        elif self.num_channels > source.n_channels:
+            logger.error(
+                f"La session ne contient que {source.n_channels} canaux ({self.num_channels} demandés)"
+            )
+            self.close()
+            return False
+
+        logger.info(
+            f"Session ouverte pour rejeu: {self.path.name} ({source.n_channels} canaux, "
+            f"{self.sample_rate} Hz, vitesse {self.speed or 'max'})"
+        )
+        return True
+
+    def close(self):
+        if self._source:
+            self._source.close()
+            self._source = None
+        logger.info("Backend de rejeu fermé.")
+
+    def configure_acquisition(self, sample_rate: int, num_samples_per_channel: int):
+        if self._source and self._source.sample_rate and float(sample_rate) != self._source.sample_rate:
+            logger.warning(f"Fréquence imposée par la session: {self._source.sample_rate} Hz")
+        else:
+            self.sample_rate = float(sample_rate)
+        self.num_samples = int(num_samples_per_channel)
+        logger.info(f"Acquisition configurée: Fs={self.sample_rate}Hz, N={num_samples_per_channel} échantillons.")
+
+    def configure_channels(self, channels: list):
+        self.num_channels = len(channels)
+        logger.info(f"{self.num_channels} canaux configurés.")
+
+    def start(self):
+        if self.is_running:
+            logger.warning("L'acquisition est déjà en cours.")
+            return
+        if self._source is None and not self.open():
+            raise RuntimeError(f"Session à rejouer indisponible: {self.path}")
+
+        self.is_running = True
+        self.stop_event.clear()
+        self._samples_emitted = 0
+        self._started_at = time.perf_counter()
+        if self.data_callback:
+            self.acquisition_thread = Thread(target=self._acquisition_loop, daemon=True)
+            self.acquisition_thread.start()
+        logger.info("Rejeu démarré.")
+
+    def stop(self):
+        if not self.is_running:
+            logger.warning("L'acquisition n'est pas en cours.")
+            return
+
+        self.stop_event.set()
+        if self.acquisition_thread:
+            self.acquisition_thread.join()
+            self.acquisition_thread = None
+        self.is_running = False
+        self._elapsed = time.perf_counter() - self._started_at
+        logger.info("Rejeu arrêté.")
+
+    def read(self) -> np.ndarray:
+        """
+        Bloc suivant (canaux x échantillons), cadencé pendant l'acquisition
+
+        En fin de session sans boucle, retourne le dernier bloc partiel puis des
+        blocs vides (en attendant la durée d'un bloc pour ne pas boucler à vide).
+        """
+        if self._source is None:
+            raise RuntimeError("Session de rejeu non ouverte")
+
+        if self.finished:
+            self.stop_event.wait(self.num_samples / self.sample_rate)
+            return np.empty((self.num_channels, 0))
+
+        if self.is_running and self.speed > 0:
+            due = self._started_at + (self._samples_emitted + self.num_samples) / (
+                self.sample_rate * self.speed)
+            delay = due - time.perf_counter()
+            if delay > 0:
+                self.stop_event.wait(delay)
+
+        block = self._source.read(self.num_samples)
+        while self.loop and block.shape[1] < self.num_samples:
+            self._source.rewind()
+            chunk = self._source.read(self.num_samples - block.shape[1])
+            if not chunk.shape[1]:
+                break  # session vide
+            block = np.concatenate([block, chunk], axis=1)
+        if block.shape[1] < self.num_samples:
+            self.finished = True
+            logger.info(f"Fin de la session rejouée ({self._samples_emitted + block.shape[1]} échantillons)")
+
+        block = block[:self.num_channels]
+        self._samples_emitted += block.shape[1]
+        return block
+
+    def rewind(self):
+        """Reprend le rejeu au début de la session"""
+        if self._source:
+            self._source.rewind()
+        self.finished = False
+        self._samples_emitted = 0
+        self._started_at = time.perf_counter()
+
+    def get_status(self) -> dict:
+        elapsed = time.perf_counter() - self._started_at if self.is_running else self._elapsed
+        return {
+            'running': self.is_running,
+            'path': str(self.path) if self.path else None,
+            'speed': self.speed,
+            'finished': self.finished,
+            'samples_emitted': self._samples_emitted,
+            'session_samples': self._source.n_samples if self._source else None,
+            'throughput': self._samples_emitted / elapsed if elapsed > 0 else 0.0
+        }
+
+    def _acquisition_loop(self):
+        while not self.stop_event.is_set():
+            data = self.read()
+            if data.shape[1] and self.data_callback and not self.stop_event.is_set():
+                self.data_callback(data)
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Backend synthétique haut débit pour CHNeoWave.
+
+Une mer irrégulière JONSWAP est précalculée une fois par transformée de
+Fourier inverse (phases aléatoires à graine fixe) sur un enregistrement
+périodique, puis diffusée par blocs. Chaque sonde voit la même houle avec
+la phase de sa position (houle incidente plus réfléchie), ce qui rend les
+données exploitables par l'analyse de Goda. Le débit n'est limité que par
+des copies mémoire : 32 canaux à 5 kHz en temps réel ou plus vite.
+"""
+
+import logging
+import time
+from threading import Thread, Event
+from typing import Optional, Callable
+
+import numpy as np
+
+from ..base import DAQHandler
+
+logger = logging.getLogger(__name__)
+
+GRAVITY = 9.81
+
+
+def jonswap_spectrum(freqs: np.ndarray, hs: float, tp: float, gamma: float = 3.3) -> np.ndarray:
+    """
+    Densité spectrale JONSWAP S(f) [m²/Hz] normalisée sur Hs
+
+    Args:
+        freqs: Fréquences [Hz]
+        hs: Hauteur significative [m]
+        tp: Période de pic [s]
+        gamma: Facteur d'amplification du pic
+    """
+    fp = 1.0 / tp
+    spectrum = np.zeros_like(freqs, dtype=float)
+    f = freqs[freqs > 0]
+    sigma = np.where(f <= fp, 0.07, 0.09)
+    peak = gamma ** np.exp(-((f - fp) ** 2) / (2 * sigma ** 2 * fp ** 2))
+    spectrum[freqs > 0] = f ** -5 * np.exp(-1.25 * (fp / f) ** 4) * peak
+
+    df = freqs[1] - freqs[0] if len(freqs) > 1 else 1.0
+    m0 = spectrum.sum() * df
+    if m0 > 0:
+        spectrum *= (hs / 4.0) ** 2 / m0
+    return spectrum
+
+
+def wave_numbers(freqs: np.ndarray, depth: float) -> np.ndarray:
+    """
+    Nombres d'onde k de la relation de dispersion ω² = g k tanh(k h)
+
+    Approximation explicite puis itérations de Newton, vectorisées.
+    """
+    omega = 2 * np.pi * np.asarray(freqs, dtype=float)
+    k0 = omega ** 2 / GRAVITY
+    k = np.where(k0 > 0, k0 / np.sqrt(np.tanh(np.maximum(k0 * depth, 1e-12))), 0.0)
+    for _ in range(4):
+        tanh = np.tanh(k * depth)
+        f = GRAVITY * k * tanh - omega ** 2
+        df = GRAVITY * (tanh + k * depth * (1 - tanh ** 2))
+        k = np.where(df > 0, k - f / np.where(df > 0, df, 1.0), k)
+    return k
+
+
+class SyntheticSeaBackend(DAQHandler):
+    """Backend synthétique : mer JONSWAP précalculée, diffusée par blocs."""
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.config = config
+        self.is_running = False
+        self.acquisition_thread: Optional[Thread] = None
+        self.stop_event = Event()
+        self.data_callback: Optional[Callable[[np.ndarray], None]] = None
+        self.error_callback: Optional[Callable[[str], None]] = None
+
+        self.sample_rate = float(config.get('sample_rate', 32))
+        self.num_channels = int(config.get('channels', 8))
+        self.num_samples = int(config.get('num_samples', 1024))
+
+        # Houle et géométrie
+        self.hs = float(config.get('hs', 0.1))
+        self.tp = float(config.get('tp', 1.5))
+        self.gamma = float(config.get('gamma', 3.3))
+        self.water_depth = float(config.get('water_depth', 0.5))
+        self.probe_positions = config.get('probe_positions')
+        self.probe_spacing = float(config.get('probe_spacing', 0.3))
+        self.reflection_coefficient = float(config.get('reflection_coefficient', 0.0))
+        self.reflection_phase = float(config.get('reflection_phase', 0.0))
+        self.seed = int(config.get('seed', 0))
+        self.record_samples = int(config.get('record_samples', 2 ** 18))
+
+        # Cadence : 1.0 temps réel, N fois plus vite, 0 sans limite
+        self.realtime_factor = float(config.get('realtime_factor', 1.0))
+
+        # Défauts injectés
+        self.noise_level = float(config.get('noise_level', 0.0))
+        self.dropout_rate = float(config.get('dropout_rate', 0.0))  # par bloc et par canal
+        self.dropout_duration = float(config.get('dropout_duration', 0.05))  # secondes
+        self.dropout_value = float(config.get('dropout_value', np.nan))
+        saturation_level = config.get('saturation_level')
+        self.saturation_level = float(saturation_level) if saturation_level is not None else None
+
+        self._record: Optional[np.ndarray] = None
+        self._position = 0
+        self._samples_emitted = 0
+        self._started_at = 0.0
+        self._rng = np.random.default_rng(self.seed + 1)
+
+        logger.info("Backend synthétique initialisé.")
+
+    @property
+    def self_paced(self) -> bool:
+        """read() respecte lui-même la cadence (temps réel ou accéléré)"""
+        return True
+
+    def open(self) -> bool:
+        self._ensure_record()
+        logger.info("Backend synthétique ouvert.")
+        return True
+
+    def close(self):
+        self._record = None
+        logger.info("Backend synthétique fermé.")
+
+    def configure_acquisition(self, sample_rate: int, num_samples_per_channel: int):
+        if float(sample_rate) != self.sample_rate:
+            self._record = None
+        self.sample_rate = float(sample_rate)
+        self.num_samples = int(num_samples_per_channel)
+        logger.info(f"Acquisition configurée: Fs={sample_rate}Hz, N={num_samples_per_channel} échantillons.")
+
+    def configure_channels(self, channels: list):
+        if len(channels) != self.num_channels:
+            self._record = None
+        self.num_channels = len(channels)
+        logger.info(f"{self.num_channels} canaux configurés.")
+
+    def start(self):
+        if self.is_running:
+            logger.warning("L'acquisition est déjà en cours.")
+            return
+
+        self._ensure_record()
+        self.is_running = True
+        self.stop_event.clear()
+        self._samples_emitted = 0
+        self._started_at = time.perf_counter()
+        if self.data_callback:
+            self.acquisition_thread = Thread(target=self._acquisition_loop, daemon=True)
+            self.acquisition_thread.start()
+        logger.info("Acquisition synthétique démarrée.")
+
+    def stop(self):
+        if not self.is_running:
+            logger.warning("L'acquisition n'est pas en cours.")
+            return
+
+        self.stop_event.set()
+        if self.acquisition_thread:
+            self.acquisition_thread.join()
+            self.acquisition_thread = None
+        self.is_running = False
+        logger.info("Acquisition synthétique arrêtée.")
+
+    def read(self) -> np.ndarray:
+        """Bloc suivant (canaux x échantillons), cadencé pendant l'acquisition"""
+        self._ensure_record()
+        if self.is_running and self.realtime_factor > 0:
+            due = self._started_at + (self._samples_emitted + self.num_samples) / (
+                self.sample_rate * self.realtime_factor)
+            delay = due - time.perf_counter()
+            if delay > 0:
+                self.stop_event.wait(delay)
+
+        block = self._next_block(self.num_samples)
+        self._samples_emitted += self.num_samples
+        return block
+
+    def get_status(self) -> dict:
+        return {
+            'running': self.is_running,
+            'samples_emitted': self._samples_emitted,
+            'realtime_factor': self.realtime_factor,
+            'record_samples': self.record_samples,
+            'seed': self.seed
+        }
+
+    def _acquisition_loop(self):
+        while not self.stop_event.is_set():
+            data = self.read()
+            if self.data_callback and not self.stop_event.is_set():
+                self.data_callback(data)
+
+    def _positions(self) -> np.ndarray:
+        if self.probe_positions is not None:
+            positions = np.asarray(self.probe_positions, dtype=float)
+            if len(positions) >= self.num_channels:
+                return positions[:self.num_channels]
+            logger.warning("Moins de positions que de canaux : espacement régulier pour les suivantes")
+            extra = positions[-1] + self.probe_spacing * np.arange(1, self.num_channels - len(positions) + 1)
+            return np.concatenate([positions, extra])
+        return self.probe_spacing * np.arange(self.num_channels)
+
+    def _ensure_record(self):
+        """Précalcule l'enregistrement périodique (canaux x record_samples)"""
+        if self._record is not None:
+            return
+
+        n = self.record_samples
+        freqs = np.fft.rfftfreq(n, 1.0 / self.sample_rate)
+        df = freqs[1]
+        amplitudes = np.sqrt(2.0 * jonswap_spectrum(freqs, self.hs, self.tp, self.gamma) * df)
+        amplitudes[0] = 0.0
+        if n % 2 == 0:
+            amplitudes[-1] = 0.0
+
+        rng = np.random.default_rng(self.seed)
+        phases = rng.uniform(0, 2 * np.pi, len(freqs))
+        k = wave_numbers(freqs, self.water_depth)
+
+        # Houle incidente (+x) et réfléchie (-x) vues par chaque sonde
+        kx = np.outer(self._positions(), k)
+        transfer = np.exp(-1j * kx) + self.reflection_coefficient * np.exp(1j * (kx + self.reflection_phase))
+        spectrum = (n / 2.0) * amplitudes * np.exp(1j * phases) * transfer
+
+        self._record = np.fft.irfft(spectrum, n=n, axis=1).astype(np.float32)
+        self._position = 0
+        logger.info(
+            f"Mer JONSWAP précalculée: Hs={self.hs} m, Tp={self.tp} s, "
+            f"{self.num_channels} canaux x {n} échantillons"
+        )
+
+    def _next_block(self, n_samples: int) -> np.ndarray:
+        record = self._record
+        length = record.shape[1]
+        start = self._position
+        if start + n_samples <= length:
+            block = record[:, start:start + n_samples].astype(float)
+        else:
+            block = np.take(record, np.arange(start, start + n_samples) % length, axis=1).astype(float)
+        self._position = (start + n_samples) % length
+
+        self._inject_faults(block)
+        return block
+
+    def _inject_faults(self, block: np.ndarray):
+        """Bruit, pertes de signal et saturation, sur place"""
+        n_channels, n_samples = block.shape
+        if self.noise_level > 0:
+            block += self._rng.normal(0.0, self.noise_level, block.shape)
+
+        if self.dropout_rate > 0:
+            hits = np.flatnonzero(self._rng.random(n_channels) < self.dropout_rate)
+            length = max(1, min(n_samples, int(round(self.dropout_duration * self.sample_rate))))
+            for channel in hits:
+                start = self._rng.integers(0, n_samples - length + 1)
+                block[channel, start:start + length] = self.dropout_value
+
+        if self.saturation_level is not None:
+            np.clip(block, -self.saturation_level, self.saturation_level, out=block)
@@ -3,7 +3,7 @@
 Module de gestion du matériel pour CHNeoWave.
 
 Ce module fournit une classe `HardwareManager` qui agit comme une façade 
-pour interagir avec différents backends matériels (NI-DAQmx, IOtech, Démo).
+pour interagir avec différents backends matériels (NI-DAQmx, IOtech, MCC, Démo, synthétique, rejeu).
 Il charge dynamiquement les backends disponibles et sélectionne celui 
 spécifié dans la configuration.
 """
@@ -15,6 +15,9 @@ from .base import DAQHandler
 from .backends.ni_daqmx import NIDaqmxBackend
 from .backends.iotech import IOTechBackend
 from .backends.demo import DemoBackend
+from .backends.synthetic import SyntheticSeaBackend
+from .backends.replay import ReplayBackend
+from .backends.mcc import MCCBackend
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +25,10 @@ logger = logging.getLogger(__name__)
 AVAILABLE_BACKENDS: Dict[str, Type[DAQHandler]] = {
     'ni-daqmx': NIDaqmxBackend,
     'iotech': IOTechBackend,
+    'mcc': MCCBackend,
     'demo': DemoBackend,
+    'synthetic': SyntheticSeaBackend,
+    'replay': ReplayBackend,
 }
 
 class HardwareManager:
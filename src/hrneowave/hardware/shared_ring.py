@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Anneau en mémoire partagée et processus d'acquisition headless CHNeoWave
+
+Topologie optionnelle multi-processus : un processus d'acquisition sans Qt
+écrit les blocs du backend matériel dans un anneau
+`multiprocessing.shared_memory` ; les processus d'analyse et d'interface
+s'y attachent en lecture seule. Le débit d'acquisition ne dépend plus de la
+charge de l'interface (le GIL n'est plus partagé).
+
+Disposition mémoire:
+- En-tête de HEADER_BYTES octets (compteurs int64, dtype, fréquence)
+- Données (n_channels, buffer_size) comme ThreadSafeCircularBuffer.buffer :
+  l'échantillon absolu k est stocké dans la colonne k % buffer_size
+
+Protocole d'écriture (un seul écrivain) : l'en-tête WRITE_HEAD est avancé
+avant la copie des données, COMMITTED après. Un lecteur valide sa copie en
+relisant WRITE_HEAD : si l'intervalle copié a pu être réécrit entre-temps,
+la lecture est rejetée.
+"""
+
+__all__ = [
+    'SharedRingBuffer',
+    'AcquisitionProcess',
+    'RingState'
+]
+
+import logging
+import multiprocessing as mp
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Pas d'import de hrneowave.core à l'exécution : le processus d'acquisition
+# ne charge que hrneowave.hardware et ses dépendances directes
+if TYPE_CHECKING:
+    from ..core.circular_buffer import BufferConfig
+
+logger = logging.getLogger(__name__)
+
+# Signature de l'en-tête (b'CHNWRING')
+RING_MAGIC = 0x474E4952574E4843
+
+# Taille de l'en-tête, alignée sur une ligne de cache
+HEADER_BYTES = 128
+
+# Indices des compteurs int64 de l'en-tête
+_MAGIC, _N_CHANNELS, _BUFFER_SIZE, _WRITE_HEAD, _COMMITTED, _STATE, _BLOCKS, _ERRORS = range(8)
+
+# Position du dtype (chaîne numpy, ex. '<f4') et de la fréquence d'échantillonnage
+_DTYPE_OFFSET = 64
+_DTYPE_BYTES = 8
+_SAMPLE_RATE_OFFSET = 72
+
+
+def _open_untracked(name: str) -> shared_memory.SharedMemory:
+    """Ouvre un segment existant sans l'enregistrer auprès du resource_tracker"""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    
+    # Avant 3.13, SharedMemory enregistre tout segment ouvert et le tracker
+    # du processus le supprime à sa sortie : l'enregistrement est annulé
+    shm = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+class RingState:
+    """États publiés par l'écrivain dans l'en-tête de l'anneau"""
+    IDLE = 0
+    RUNNING = 1
+    STOPPED = 2
+    ERROR = 3
+
+
+class SharedRingBuffer:
+    """
+    Anneau circulaire multi-canaux en mémoire partagée
+
+    Un seul processus écrit (attach(name, writable=True)) ; les lecteurs
+    obtiennent des vues en lecture seule ou des copies validées.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool, writable: bool):
+        self._shm = shm
+        self._owner = owner
+        self.writable = writable
+
+        self._header = np.ndarray((8,), dtype=np.int64, buffer=shm.buf)
+        if self._header[_MAGIC] != RING_MAGIC:
+            raise ValueError(f"Mémoire partagée '{shm.name}' : en-tête d'anneau invalide")
+
+        self.n_channels = int(self._header[_N_CHANNELS])
+        self.buffer_size = int(self._header[_BUFFER_SIZE])
+        dtype_str = bytes(shm.buf[_DTYPE_OFFSET:_DTYPE_OFFSET + _DTYPE_BYTES]).rstrip(b'\0')
+        self.dtype = np.dtype(dtype_str.decode('ascii'))
+        self._sample_rate = np.ndarray((1,), dtype=np.float64, buffer=shm.buf, offset=_SAMPLE_RATE_OFFSET)
+
+        self.buffer = np.ndarray(
+            (self.n_channels, self.buffer_size), dtype=self.dtype,
+            buffer=shm.buf, offset=HEADER_BYTES
+        )
+        if not writable:
+            self.buffer.flags.writeable = False
+
+    @classmethod
+    def create(cls, config: 'BufferConfig', name: Optional[str] = None) -> 'SharedRingBuffer':
+        """
+        Crée l'anneau partagé (le créateur en est propriétaire et le libère)
+
+        Le handle du créateur est en lecture seule : l'écriture est réservée
+        au processus d'acquisition.
+        """
+        dtype = np.dtype(config.dtype)
+        size = HEADER_BYTES + config.n_channels * config.buffer_size * dtype.itemsize
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        header = np.ndarray((8,), dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[_N_CHANNELS] = config.n_channels
+        header[_BUFFER_SIZE] = config.buffer_size
+        header[_STATE] = RingState.IDLE
+        shm.buf[_DTYPE_OFFSET:_DTYPE_OFFSET + _DTYPE_BYTES] = dtype.str.encode('ascii').ljust(_DTYPE_BYTES, b'\0')
+        np.ndarray((1,), dtype=np.float64, buffer=shm.buf, offset=_SAMPLE_RATE_OFFSET)[0] = config.sample_rate
+        header[_MAGIC] = RING_MAGIC
+        del header
+
+        logger.info(
+            f"Anneau partagé '{shm.name}' créé: {config.n_channels} canaux x "
+            f"{config.buffer_size} échantillons ({size / 1024 ** 2:.1f} Mo)"
+        )
+        return cls(shm, owner=True, writable=False)
+
+    @classmethod
+    def attach(cls, name: str, writable: bool = False) -> 'SharedRingBuffer':
+        """
+        S'attache à un anneau existant (lecture seule par défaut)
+        
+        Le segment n'est pas suivi par le resource_tracker du processus
+        lecteur : seul le propriétaire le libère, même si le lecteur est un
+        interpréteur indépendant qui se termine avant lui.
+        """
+        return cls(_open_untracked(name), owner=False, writable=writable)
+
+    @property
+    def name(self) -> str:
+        """Nom système du segment de mémoire partagée"""
+        return self._shm.name
+
+    @property
+    def sample_rate(self) -> float:
+        """Fréquence d'échantillonnage publiée par l'écrivain [Hz]"""
+        return float(self._sample_rate[0])
+
+    @property
+    def total_written(self) -> int:
+        """Nombre total d'échantillons validés par l'écrivain"""
+        return int(self._header[_COMMITTED])
+
+    @property
+    def blocks_written(self) -> int:
+        """Nombre de blocs écrits"""
+        return int(self._header[_BLOCKS])
+
+    @property
+    def state(self) -> int:
+        """État de l'écrivain (voir RingState)"""
+        return int(self._header[_STATE])
+
+    @property
+    def error_count(self) -> int:
+        """Nombre d'erreurs de lecture matérielle côté écrivain"""
+        return int(self._header[_ERRORS])
+
+    def _require_writable(self) -> None:
+        if not self.writable:
+            raise PermissionError(f"Anneau '{self.name}' attaché en lecture seule")
+
+    def set_state(self, state: int) -> None:
+        """Publie l'état de l'écrivain"""
+        self._require_writable()
+        self._header[_STATE] = state
+
+    def set_sample_rate(self, sample_rate: float) -> None:
+        """Publie une nouvelle fréquence d'échantillonnage"""
+        self._require_writable()
+        self._sample_rate[0] = sample_rate
+
+    def increment_errors(self) -> None:
+        """Compte une erreur de lecture matérielle"""
+        self._require_writable()
+        self._header[_ERRORS] += 1
+
+    def write(self, data: np.ndarray) -> int:
+        """
+        Écrit un bloc (n_channels, n_samples) en écrasant les plus anciens
+
+        Returns:
+            Indice absolu du premier échantillon écrit
+        """
+        self._require_writable()
+        data = np.asarray(data, dtype=self.dtype)
+        if data.ndim == 1 and self.n_channels == 1:
+            data = data.reshape(1, -1)
+        if data.ndim != 2 or data.shape[0] != self.n_channels:
+            raise ValueError(f"Forme de bloc incorrecte: {data.shape}, attendu ({self.n_channels}, n)")
+
+        size = self.buffer_size
+        if data.shape[1] > size:
+            # Seule la fin du bloc tient dans l'anneau
+            skipped = data.shape[1] - size
+            self._header[_WRITE_HEAD] += skipped
+            self._header[_COMMITTED] += skipped
+            data = data[:, skipped:]
+
+        n_samples = data.shape[1]
+        start_sample = int(self._header[_COMMITTED])
+        self._header[_WRITE_HEAD] = start_sample + n_samples
+
+        start = start_sample % size
+        first_part = min(n_samples, size - start)
+        self.buffer[:, start:start + first_part] = data[:, :first_part]
+        if first_part < n_samples:
+            self.buffer[:, :n_samples - first_part] = data[:, first_part:]
+
+        self._header[_COMMITTED] = start_sample + n_samples
+        self._header[_BLOCKS] += 1
+        return start_sample
+
+    def get_views(self, start_sample: int, n_samples: int) -> List[np.ndarray]:
+        """
+        Vues en lecture seule (sans copie) sur l'intervalle absolu
+        [start_sample, start_sample + n_samples), comme
+        ThreadSafeCircularBuffer.get_views
+
+        Les vues ne sont pas protégées contre une réécriture concurrente :
+        utiliser read_range pour une copie validée.
+
+        Raises:
+            ValueError: Si l'intervalle n'est plus (ou pas encore) dans l'anneau
+        """
+        size = self.buffer_size
+        end_sample = start_sample + n_samples
+        if n_samples <= 0 or start_sample < int(self._header[_WRITE_HEAD]) - size or end_sample > self.total_written:
+            raise ValueError(
+                f"Intervalle [{start_sample}, {end_sample}) hors de l'anneau "
+                f"(écrits: {self.total_written}, capacité: {size})"
+            )
+
+        start = start_sample % size
+        if start + n_samples <= size:
+            segments = [self.buffer[:, start:start + n_samples]]
+        else:
+            segments = [self.buffer[:, start:], self.buffer[:, :start + n_samples - size]]
+
+        for view in segments:
+            view.flags.writeable = False
+        return segments
+
+    def read_range(self, start_sample: int, n_samples: int) -> np.ndarray:
+        """
+        Copie validée de l'intervalle absolu [start_sample, start_sample + n_samples)
+
+        Raises:
+            ValueError: Si l'intervalle est hors de l'anneau ou a été réécrit
+                pendant la copie
+        """
+        views = self.get_views(start_sample, n_samples)
+        data = np.concatenate(views, axis=1) if len(views) > 1 else views[0].copy()
+        if start_sample < int(self._header[_WRITE_HEAD]) - self.buffer_size:
+            raise ValueError(f"Intervalle [{start_sample}, {start_sample + n_samples}) réécrit pendant la lecture")
+        return data
+
+    def read_latest(self, n_samples: int) -> np.ndarray:
+        """Copie des n_samples derniers échantillons (moins si l'anneau est plus court)"""
+        for _ in range(3):
+            end = self.total_written
+            n = min(n_samples, end, self.buffer_size)
+            if n <= 0:
+                return np.empty((self.n_channels, 0), dtype=self.dtype)
+            try:
+                return self.read_range(end - n, n)
+            except ValueError:
+                continue
+        raise ValueError("Écrivain trop rapide: lecture des derniers échantillons impossible")
+
+    def read_since(self, cursor: int, max_samples: Optional[int] = None) -> Tuple[np.ndarray, int, int]:
+        """
+        Lecture incrémentale pour un consommateur (analyse, enregistrement)
+
+        Args:
+            cursor: Indice absolu du prochain échantillon attendu
+            max_samples: Nombre maximal d'échantillons retournés
+
+        Returns:
+            Tuple (données copiées, nouveau curseur, échantillons perdus).
+            Les échantillons déjà réécrits avant la lecture sont sautés et
+            comptés comme perdus.
+        """
+        lost = 0
+        for _ in range(3):
+            end = self.total_written
+            oldest = int(self._header[_WRITE_HEAD]) - self.buffer_size
+            if cursor < oldest:
+                lost += oldest - cursor
+                cursor = oldest
+            n = end - cursor
+            if max_samples is not None:
+                n = min(n, max_samples)
+            if n <= 0:
+                return np.empty((self.n_channels, 0), dtype=self.dtype), cursor, lost
+            try:
+                return self.read_range(cursor, n), cursor + n, lost
+            except ValueError:
+                continue
+        raise ValueError("Écrivain trop rapide: le consommateur ne rattrape pas l'anneau")
+
+    def get_stats(self) -> dict:
+        """Retourne les statistiques de l'anneau"""
+        return {
+            'name': self.name,
+            'n_channels': self.n_channels,
+            'buffer_size': self.buffer_size,
+            'sample_rate': self.sample_rate,
+            'total_written': self.total_written,
+            'blocks_written': self.blocks_written,
+            'state': self.state,
+            'errors': self.error_count,
+            'buffer_duration_s': self.buffer_size / self.sample_rate if self.sample_rate > 0 else 0.0
+        }
+
+    def close(self) -> None:
+        """Détache le segment ; le propriétaire le libère aussi"""
+        if self._shm is None:
+            return
+        # Les vues numpy doivent être libérées avant la fermeture du mmap
+        self.buffer = self._header = self._sample_rate = None
+        self._shm.close()
+        if self._owner:
+            if sys.version_info < (3, 13):
+                # Un lecteur partageant le tracker (même processus ou enfant) a pu
+                # annuler l'enregistrement : il est rétabli pour que unlink() le retire
+                resource_tracker.register(self._shm._name, 'shared_memory')
+            self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _acquisition_main(ring_name: str, conn, backend_name: str, backend_config: Dict[str, Any],
+                      block_size: int) -> None:
+    """
+    Point d'entrée du processus d'acquisition headless
+
+    Boucle : commandes du canal de contrôle entre deux blocs, lecture du
+    backend cadencée sur la durée d'un bloc (les backends matériels
+    bloquants ne sont jamais en avance et ne sont donc pas ralentis).
+    Un backend `self_paced` (synthétique accéléré, rejeu) impose sa propre
+    cadence : ses lectures ne sont pas retardées.
+    """
+    from .manager import AVAILABLE_BACKENDS
+
+    ring = SharedRingBuffer.attach(ring_name, writable=True)
+    backend_class = AVAILABLE_BACKENDS.get(backend_name)
+    if backend_class is None:
+        ring.set_state(RingState.ERROR)
+        conn.send(('error', f"Backend inconnu: {backend_name}"))
+        ring.close()
+        return
+
+    config = dict(backend_config)
+    config.setdefault('sample_rate', ring.sample_rate)
+    config.setdefault('channels', ring.n_channels)
+    config.setdefault('num_samples', block_size)
+    backend = backend_class(config)
+    self_paced = getattr(backend, 'self_paced', False)
+    running = False
+    deadline = 0.0
+
+    def handle(command: str, payload: Dict[str, Any]):
+        nonlocal running, deadline, block_size
+        if command == 'start':
+            if not running:
+                backend.start()
+                running = True
+                deadline = time.perf_counter()
+                ring.set_state(RingState.RUNNING)
+            return {'start_sample': ring.total_written}
+        if command == 'stop':
+            if running:
+                backend.stop()
+                running = False
+                ring.set_state(RingState.STOPPED)
+            return {'total_written': ring.total_written}
+        if command == 'configure':
+            if running:
+                raise RuntimeError("Configuration impossible pendant l'acquisition")
+            sample_rate = float(payload.get('sample_rate', ring.sample_rate))
+            block_size = int(payload.get('block_size', block_size))
+            backend.configure_acquisition(sample_rate, block_size)
+            ring.set_sample_rate(sample_rate)
+            return {'sample_rate': sample_rate, 'block_size': block_size}
+        if command == 'status':
+            status = ring.get_stats()
+            status.update({
+                'running': running,
+                'block_size': block_size,
+                'backend': backend.get_status(),
+                'headless': 'PySide6' not in sys.modules
+            })
+            return status
+        raise ValueError(f"Commande inconnue: {command}")
+
+    try:
+        if not backend.open():
+            raise RuntimeError(f"Ouverture du backend '{backend_name}' impossible")
+        if config.get('channel_list'):
+            backend.configure_channels([
+                {'id': f"ai{channel}", 'channel': channel} for channel in config['channel_list']
+            ])
+        conn.send(('ok', {'pid': mp.current_process().pid}))
+
+        while True:
+            if running:
+                timeout = 0.0 if self_paced else max(0.0, deadline - time.perf_counter())
+            else:
+                timeout = None
+            if conn.poll(timeout):
+                command, payload = conn.recv()
+                if command == 'shutdown':
+                    conn.send(('ok', {'total_written': ring.total_written}))
+                    break
+                try:
+                    conn.send(('ok', handle(command, payload)))
+                except Exception as e:
+                    conn.send(('error', str(e)))
+                continue
+
+            try:
+                block = np.atleast_2d(np.asarray(backend.read()))
+                if block.size:
+                    ring.write(block)
+            except Exception as e:
+                ring.increment_errors()
+                logger.error(f"Erreur de lecture dans le processus d'acquisition: {e}")
+            deadline = max(deadline + block_size / ring.sample_rate, time.perf_counter() - 1.0)
+    except (EOFError, BrokenPipeError):
+        logger.warning("Canal de contrôle fermé, arrêt du processus d'acquisition")
+    except Exception as e:
+        ring.set_state(RingState.ERROR)
+        logger.error(f"Processus d'acquisition interrompu: {e}")
+        try:
+            conn.send(('error', str(e)))
+        except (OSError, EOFError):
+            pass
+    finally:
+        if running:
+            backend.stop()
+            ring.set_state(RingState.STOPPED)
+        backend.close()
+        ring.close()
+
+
+class AcquisitionProcess:
+    """
+    Pilote, depuis le processus principal, d'un processus d'acquisition headless
+
+    Le processus principal crée et possède l'anneau partagé ; les processus
+    d'analyse s'y attachent par son nom (ring_name) avec
+    SharedRingBuffer.attach. Le canal de contrôle est un Pipe : chaque
+    commande (start, stop, configure, status) reçoit une réponse.
+
+    Le processus fils n'importe que hrneowave.hardware (sans Qt).
+    
+    Example:
+        >>> with AcquisitionProcess(BufferConfig(n_channels=4, sample_rate=500.0)) as acq:
+        ...     acq.start()
+        ...     data = acq.ring.read_latest(500)
+    """
+
+    def __init__(self, config: 'BufferConfig', backend: str = 'demo',
+                 backend_config: Optional[Dict[str, Any]] = None,
+                 block_duration: float = 0.1, start_method: str = 'spawn',
+                 timeout: float = 10.0):
+        """
+        Args:
+            config: Dimensions de l'anneau et fréquence d'échantillonnage
+            backend: Nom du backend matériel (voir hardware.manager.AVAILABLE_BACKENDS)
+            backend_config: Configuration transmise au backend
+            block_duration: Durée d'un bloc lu sur le backend [s]
+            start_method: Méthode multiprocessing ('spawn' évite d'hériter de l'état Qt)
+            timeout: Délai maximal d'attente d'une réponse du processus [s]
+        """
+        self.config = config
+        self.backend = backend
+        self.backend_config = dict(backend_config or {})
+        self.block_size = max(1, int(round(block_duration * config.sample_rate)))
+        self.timeout = timeout
+        self._context = mp.get_context(start_method)
+        self.ring: Optional[SharedRingBuffer] = None
+        self._conn = None
+        self._process = None
+
+    @property
+    def ring_name(self) -> Optional[str]:
+        """Nom de l'anneau partagé à transmettre aux processus lecteurs"""
+        return self.ring.name if self.ring else None
+
+    def is_alive(self) -> bool:
+        """Indique si le processus d'acquisition tourne"""
+        return self._process is not None and self._process.is_alive()
+
+    def launch(self) -> None:
+        """Crée l'anneau et lance le processus d'acquisition (sans démarrer la lecture)"""
+        if self.is_alive():
+            return
+        self.ring = SharedRingBuffer.create(self.config)
+        self._conn, child_conn = self._context.Pipe()
+        self._process = self._context.Process(
+            target=_acquisition_main,
+            args=(self.ring.name, child_conn, self.backend, self.backend_config, self.block_size),
+            name='chneowave-acquisition',
+            daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        try:
+            self._receive()
+        except Exception:
+            self.shutdown()
+            raise
+        logger.info(f"Processus d'acquisition lancé (pid {self._process.pid}, backend '{self.backend}')")
+
+    def _receive(self) -> Dict[str, Any]:
+        if not self._conn.poll(self.timeout):
+            raise TimeoutError("Le processus d'acquisition ne répond pas")
+        try:
+            status, payload = self._conn.recv()
+        except EOFError:
+            raise RuntimeError("Processus d'acquisition terminé de façon inattendue") from None
+        if status != 'ok':
+            raise RuntimeError(f"Processus d'acquisition: {payload}")
+        return payload
+
+    def _request(self, command: str, **payload) -> Dict[str, Any]:
+        if not self.is_alive():
+            raise RuntimeError("Processus d'acquisition non lancé")
+        self._conn.send((command, payload))
+        return self._receive()
+
+    def start(self) -> Dict[str, Any]:
+        """Démarre l'acquisition (lance le processus si nécessaire)"""
+        self.launch()
+        return self._request('start')
+
+    def stop(self) -> Dict[str, Any]:
+        """Arrête l'acquisition sans terminer le processus"""
+        return self._request('stop')
+
+    def configure(self, sample_rate: Optional[float] = None, block_size: Optional[int] = None) -> Dict[str, Any]:
+        """Reconfigure la fréquence et/ou la taille de bloc (acquisition arrêtée)"""
+        payload = {}
+        if sample_rate is not None:
+            payload['sample_rate'] = sample_rate
+        if block_size is not None:
+            payload['block_size'] = block_size
+        result = self._request('configure', **payload)
+        self.block_size = result['block_size']
+        return result
+
+    def status(self) -> Dict[str, Any]:
+        """Statut du processus d'acquisition et de l'anneau"""
+        return self._request('status')
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Termine le processus et libère l'anneau partagé"""
+        if self._process is not None:
+            if self._process.is_alive():
+                try:
+                    self._conn.send(('shutdown', {}))
+                    if self._conn.poll(timeout):
+                        self._conn.recv()
+                except (OSError, EOFError):
+                    pass
+                self._process.join(timeout)
+            if self._process.is_alive():
+                logger.warning("Processus d'acquisition forcé à s'arrêter")
+                self._process.terminate()
+                self._process.join(timeout)
+            self._process = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+    def __enter__(self):
+        self.launch()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
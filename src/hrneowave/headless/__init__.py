@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Commandes headless de CHNeoWave (sans Qt)
+
+Usage:
+    chneowave analyze campagne/ --jobs 8 --out resultats.h5
+    chneowave acquire --backend demo --fs 2000 --channels 0-15 --duration 3600 --out essai.h5
+
+Les symboles sont chargés à la première utilisation (PEP 562) : la commande
+acquire n'importe pas le pipeline d'analyse, et inversement.
+"""
+
+import importlib
+
+# Symbole -> sous-module qui le définit
+_LAZY_ATTRIBUTES = {
+    'AcquisitionStats': 'acquire',
+    'StreamingRecorder': 'acquire',
+    'load_calibration': 'acquire',
+    'parse_channels': 'acquire',
+    'run_headless_acquisition': 'acquire',
+    'RESULT_COLUMNS': 'analyze',
+    'AnalysisOptions': 'analyze',
+    'ResultTableWriter': 'analyze',
+    'analyze_file': 'analyze',
+    'analyze_session': 'analyze',
+    'build_session_graph': 'analyze',
+    'collect_sessions': 'analyze',
+    'run_batch_analysis': 'analyze',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
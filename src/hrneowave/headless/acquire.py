@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+"""
+Acquisition headless avec enregistrement direct sur disque, sans Qt
+
+Le backend tourne dans le processus d'acquisition (hardware.shared_ring) et
+écrit dans l'anneau en mémoire partagée ; le processus principal relit
+l'anneau, applique la calibration et ajoute les blocs au fichier HDF5 au fil
+de l'eau. Les écritures disque ne retardent donc jamais la lecture de la
+carte ; un retard de l'enregistreur se traduit par des échantillons perdus,
+comptés et signalés.
+
+Le fichier produit suit la disposition d'HDF5Writer ('/raw', échantillons x
+canaux, attributs fs/channel_names/sha256) : il est relu par HDF5Writer,
+le backend de rejeu et `chneowave analyze`.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from threading import Event
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def parse_channels(spec: str) -> List[int]:
+    """
+    Liste de canaux depuis une spécification '0-15' ou '0,2,4-7'
+    """
+    channels: List[int] = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            first, last = (int(value) for value in part.split('-', 1))
+            if last < first:
+                raise ValueError(f"Plage de canaux invalide: {part}")
+            channels.extend(range(first, last + 1))
+        else:
+            channels.append(int(part))
+    if not channels or len(set(channels)) != len(channels) or min(channels) < 0:
+        raise ValueError(f"Spécification de canaux invalide: {spec}")
+    return channels
+
+
+def load_calibration(path: Path, channels: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pentes et ordonnées à l'origine des canaux acquis
+
+    Le fichier JSON contient une liste (ou {'channels': [...]}) d'entrées
+    {'channel', 'slope', 'intercept'} ; 'gain'/'offset' sont acceptés. Les
+    canaux absents restent en volts (pente 1, ordonnée 0).
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        content = json.load(f)
+    entries = content.get('channels', []) if isinstance(content, dict) else content
+
+    by_channel = {}
+    for index, entry in enumerate(entries):
+        channel = int(entry.get('channel', index))
+        by_channel[channel] = (
+            float(entry.get('slope', entry.get('gain', 1.0))),
+            float(entry.get('intercept', entry.get('offset', 0.0)))
+        )
+    slopes = np.array([by_channel.get(c, (1.0, 0.0))[0] for c in channels])
+    intercepts = np.array([by_channel.get(c, (1.0, 0.0))[1] for c in channels])
+    return slopes, intercepts
+
+
+class StreamingRecorder:
+    """
+    Enregistreur HDF5 incrémental au format HDF5Writer
+
+    Les blocs sont ajoutés à un dataset '/raw' extensible et compressé par
+    morceaux ; le hash SHA-256 d'HDF5Writer est calculé à la fermeture en
+    relisant le fichier par tranches (mémoire bornée quelle que soit la durée).
+    """
+
+    def __init__(self, filepath: Path, n_channels: int, sample_rate: float,
+                 channel_names: List[str], metadata: Optional[Dict[str, Any]] = None,
+                 chunk_samples: int = 4096, dtype=np.float32, compression: Optional[str] = 'gzip'):
+        self.filepath = Path(filepath)
+        self.n_channels = n_channels
+        self.sample_rate = sample_rate
+        self.channel_names = channel_names
+        self.metadata = metadata or {}
+        self.chunk_samples = chunk_samples
+        self.dtype = np.dtype(dtype)
+        self.compression = compression
+        self.n_samples = 0
+        self.bytes_written = 0
+        self._file = None
+        self._dataset = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self):
+        import h5py
+
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._file = h5py.File(self.filepath, 'w')
+        options = {'compression': self.compression, 'shuffle': True} if self.compression else {}
+        if self.compression == 'gzip':
+            options['compression_opts'] = 1  # niveau bas : débit soutenu en continu
+        self._dataset = self._file.create_dataset(
+            'raw', shape=(0, self.n_channels), maxshape=(None, self.n_channels), dtype=self.dtype,
+            chunks=(self.chunk_samples, self.n_channels), **options
+        )
+        attrs = self._file.attrs
+        attrs['fs'] = self.sample_rate
+        attrs['n_channels'] = self.n_channels
+        attrs['created_at'] = datetime.now().isoformat()
+        attrs['software'] = 'CHNeoWave'
+        attrs['channel_names'] = [name.encode('utf-8') for name in self.channel_names]
+        for key, value in self.metadata.items():
+            attrs[key] = json.dumps(value) if isinstance(value, dict) else value
+
+    def append(self, block: np.ndarray):
+        """Ajoute un bloc (canaux x échantillons)"""
+        n = block.shape[1]
+        if not n:
+            return
+        self._dataset.resize((self.n_samples + n, self.n_channels))
+        self._dataset[self.n_samples:] = block.T
+        self.n_samples += n
+        self.bytes_written += n * self.n_channels * self.dtype.itemsize
+
+    def flush(self):
+        if self._file:
+            self._file.flush()
+
+    def close(self, extra_attrs: Optional[Dict[str, Any]] = None):
+        if self._file is None:
+            return
+        attrs = self._file.attrs
+        attrs['n_samples'] = self.n_samples
+        attrs['duration'] = self.n_samples / self.sample_rate
+        for key, value in (extra_attrs or {}).items():
+            attrs[key] = value
+        self._file.flush()
+        attrs['sha256'] = self._hash()
+        self._file.close()
+        self._file = None
+
+    def _hash(self) -> str:
+        """Hash identique à HDF5Writer._calculate_internal_hash, calculé par tranches"""
+        sha256 = hashlib.sha256()
+        for key, value in sorted(self._file.attrs.items()):
+            if key == 'sha256':
+                continue
+            sha256.update(str(key).encode('utf-8'))
+            sha256.update(str(value).encode('utf-8'))
+        sha256.update(b'raw')
+        step = self.chunk_samples * 64
+        for start in range(0, self.n_samples, step):
+            sha256.update(np.ascontiguousarray(self._dataset[start:start + step]).tobytes())
+        return sha256.hexdigest()
+
+
+@dataclass
+class AcquisitionStats:
+    """Compteurs de l'acquisition headless"""
+    elapsed_s: float = 0.0
+    samples: int = 0
+    lost_samples: int = 0
+    backend_errors: int = 0
+    ring_fill: float = 0.0  # fraction de l'anneau non encore enregistrée
+    bytes_written: int = 0
+    history: List[Dict[str, float]] = field(default_factory=list)
+
+    @property
+    def sample_rate(self) -> float:
+        return self.samples / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'elapsed_s': self.elapsed_s,
+            'samples': self.samples,
+            'sample_rate': self.sample_rate,
+            'lost_samples': self.lost_samples,
+            'backend_errors': self.backend_errors,
+            'ring_fill': self.ring_fill,
+            'bytes_written': self.bytes_written
+        }
+
+
+def run_headless_acquisition(output: Path, backend: str = 'demo', sample_rate: float = 1000.0,
+                             channels: Optional[List[int]] = None, duration: Optional[float] = None,
+                             backend_config: Optional[Dict[str, Any]] = None,
+                             calibration: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                             block_duration: float = 0.1, buffer_duration: float = 10.0,
+                             poll_interval: float = 0.05, stats_interval: float = 5.0,
+                             stop_event: Optional[Event] = None,
+                             report: Optional[Callable[[AcquisitionStats], None]] = None) -> AcquisitionStats:
+    """
+    Acquiert et enregistre jusqu'à la durée demandée ou jusqu'à stop_event
+
+    Args:
+        output: Fichier HDF5 de sortie
+        backend: Nom du backend (hardware.manager.AVAILABLE_BACKENDS)
+        sample_rate: Fréquence d'échantillonnage [Hz]
+        channels: Canaux physiques acquis (0..7 par défaut)
+        duration: Durée d'acquisition [s], illimitée par défaut
+        backend_config: Réglages supplémentaires du backend
+        calibration: (pentes, ordonnées) par canal, volts conservés sinon
+        block_duration: Durée d'un bloc lu sur la carte [s]
+        buffer_duration: Profondeur de l'anneau partagé [s]
+        poll_interval: Période de relève de l'anneau par l'enregistreur [s]
+        stats_interval: Période des rapports de débit [s]
+        stop_event: Arrêt anticipé (signal, interface)
+        report: Rappel périodique avec les statistiques courantes
+
+    Returns:
+        Statistiques finales
+    """
+    from ..core.circular_buffer import BufferConfig
+    from ..hardware.shared_ring import AcquisitionProcess
+
+    channels = channels if channels is not None else list(range(8))
+    stop_event = stop_event or Event()
+    target = int(round(duration * sample_rate)) if duration else None
+    config = BufferConfig(
+        n_channels=len(channels),
+        buffer_size=max(int(buffer_duration * sample_rate), int(8 * block_duration * sample_rate)),
+        sample_rate=sample_rate
+    )
+    settings = dict(backend_config or {})
+    settings['channel_list'] = channels
+
+    slopes = intercepts = None
+    if calibration is not None:
+        slopes, intercepts = (np.asarray(values, dtype=np.float32)[:, None] for values in calibration)
+
+    stats = AcquisitionStats()
+    metadata = {
+        'backend': backend,
+        'channels': channels,
+        'calibrated': calibration is not None
+    }
+    if calibration is not None:
+        metadata['calibration_slopes'] = np.asarray(calibration[0], dtype=float)
+        metadata['calibration_intercepts'] = np.asarray(calibration[1], dtype=float)
+
+    with AcquisitionProcess(config, backend=backend, backend_config=settings,
+                            block_duration=block_duration) as acq, \
+            StreamingRecorder(output, len(channels), sample_rate,
+                              [f"CH{c}" for c in channels], metadata,
+                              dtype=acq.ring.dtype) as recorder:
+        ring = acq.ring
+        cursor = acq.start()['start_sample']
+        start = time.perf_counter()
+        next_report = start + stats_interval
+        logger.info(f"Acquisition headless démarrée: {backend}, {len(channels)} canaux à {sample_rate} Hz")
+
+        def drain():
+            nonlocal cursor
+            block, cursor, lost = ring.read_since(cursor)
+            if lost:
+                stats.lost_samples += lost
+                logger.warning(f"Enregistreur en retard: {lost} échantillons perdus")
+            if target is not None:
+                block = block[:, :max(0, target - stats.samples)]
+            if slopes is not None and block.shape[1]:
+                block = block * slopes + intercepts
+            recorder.append(block)
+            stats.samples = recorder.n_samples
+
+        try:
+            while not stop_event.is_set() and (target is None or stats.samples < target):
+                stop_event.wait(poll_interval)
+                drain()
+
+                now = time.perf_counter()
+                stats.elapsed_s = now - start
+                if now >= next_report:
+                    next_report += stats_interval
+                    stats.backend_errors = ring.error_count
+                    stats.ring_fill = (ring.total_written - cursor) / ring.buffer_size
+                    stats.bytes_written = recorder.bytes_written
+                    stats.history.append(stats.to_dict())
+                    recorder.flush()
+                    if report:
+                        report(stats)
+        finally:
+            try:
+                acq.stop()
+                drain()  # blocs écrits entre la dernière relève et l'arrêt
+            except (RuntimeError, ValueError) as e:
+                logger.error(f"Arrêt de l'acquisition: {e}")
+            stats.elapsed_s = time.perf_counter() - start
+            stats.backend_errors = ring.error_count
+            stats.bytes_written = recorder.bytes_written
+            recorder.close({'lost_samples': stats.lost_samples, 'backend_errors': stats.backend_errors})
+
+    logger.info(f"Acquisition headless terminée: {stats.samples} échantillons, {stats.lost_samples} perdus")
+    return stats
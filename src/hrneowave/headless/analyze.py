@@ -0,0 +1,493 @@
+# -*- coding: utf-8 -*-
+"""
+Analyse par lots de sessions enregistrées, sans Qt
+
+Chaque session (HDF5, TDMS, CSV) est analysée dans un processus du pool :
+statistiques, spectre de Welch, analyse vague par vague (passages par zéro
+ascendants) et séparation incident/réfléchi de Goda lorsque la géométrie des
+sondes est connue. Les résultats sont écrits au fil de l'eau dans une table
+unique (HDF5 ou CSV), une ligne par canal.
+
+Les étapes de l'analyse forment un graphe mémoïsé (build_session_graph),
+partagé avec la vue d'analyse : avec un cache, un retraitement ne recalcule
+que les étapes dont les entrées ont changé.
+"""
+
+import csv
+import glob
+import logging
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.wave_analysis import (
+    SPECTRAL_PARAMETERS, channel_statistics, fill_invalid, spectral_moments, wave_by_wave,
+    welch_psd, welch_segments
+)
+from ..hardware.backends.replay import open_session
+
+logger = logging.getLogger(__name__)
+
+# Colonnes de la table de résultats : (nom, type)
+RESULT_COLUMNS: List[Tuple[str, str]] = [
+    ('file', 'str'),
+    ('channel', 'str'),
+    ('sample_rate', 'float'),
+    ('n_samples', 'int'),
+    ('duration_s', 'float'),
+    ('n_invalid', 'int'),
+    # Statistiques
+    ('mean', 'float'),
+    ('std', 'float'),
+    ('min', 'float'),
+    ('max', 'float'),
+    ('rms', 'float'),
+    ('skewness', 'float'),
+    ('kurtosis', 'float'),
+    # Spectre
+    ('hm0', 'float'),
+    ('tp', 'float'),
+    ('tm01', 'float'),
+    ('tm02', 'float'),
+    # Vague par vague
+    ('n_waves', 'int'),
+    ('h13', 'float'),
+    ('hmax', 'float'),
+    ('hmean', 'float'),
+    ('tz', 'float'),
+    # Réflexion (Goda), par session
+    ('kr', 'float'),
+    ('hm0_incident', 'float'),
+    ('hm0_reflected', 'float'),
+]
+
+_SESSION_SUFFIXES = {'.h5', '.hdf5', '.hdf', '.tdms', '.csv'}
+
+
+@dataclass
+class AnalysisOptions:
+    """Paramètres de l'analyse par lots (paramètres du graphe d'analyse)"""
+    sample_rate: Optional[float] = None  # CSV sans fréquence enregistrée
+    detrend: Optional[str] = 'constant'  # 'constant', 'linear' ou None
+    filter_type: Optional[str] = None  # 'lowpass', 'highpass', 'bandpass' ou None
+    cutoff: Optional[Any] = None  # [Hz], (fmin, fmax) pour 'bandpass'
+    filter_order: int = 4  # Butterworth, appliqué aller-retour
+    segment_length: int = 1024  # segments de Welch
+    overlap: float = 0.5  # recouvrement des segments
+    spectral_band: Optional[Tuple[float, float]] = None  # bande des moments spectraux (Hm0) [Hz]
+    probe_positions: Optional[List[float]] = None  # [m], métadonnées de la session sinon
+    water_depth: Optional[float] = None  # [m]
+    frequency_band: Optional[Tuple[float, float]] = None  # bande de Goda [Hz]
+    energy_threshold: float = 0.01  # bande de Goda automatique : énergie > seuil x pic
+
+
+def collect_sessions(inputs: Sequence[str]) -> List[Path]:
+    """
+    Sessions désignées par des répertoires (parcourus récursivement), motifs glob ou fichiers
+    """
+    sessions: List[Path] = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            candidates = sorted(p for p in path.rglob('*') if p.suffix.lower() in _SESSION_SUFFIXES)
+        elif any(char in item for char in '*?['):
+            candidates = sorted(Path(p) for p in glob.glob(item, recursive=True))
+        elif path.exists():
+            candidates = [path]
+        else:
+            logger.warning(f"Aucune session pour: {item}")
+            continue
+        sessions.extend(p for p in candidates if p.is_file() and p.suffix.lower() in _SESSION_SUFFIXES)
+
+    unique = {}
+    for session in sessions:
+        unique.setdefault(session.resolve(), session)
+    return list(unique.values())
+
+
+# Étapes du graphe d'analyse : load -> detrend -> filter -> segment -> psd -> moments,
+# statistics (données brutes), wave_by_wave et reflection (données filtrées) -> report
+
+def _signal(data: np.ndarray, sample_rate: float, channel_names: Sequence[str],
+            metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Signal d'une session : données (canaux x échantillons) et description"""
+    data = np.atleast_2d(np.asarray(data, dtype=float))
+    names = list(channel_names) + [f"channel_{i:02d}" for i in range(len(channel_names), data.shape[0])]
+    return {'data': data, 'sample_rate': float(sample_rate), 'channel_names': names[:data.shape[0]],
+            'metadata': dict(metadata or {})}
+
+
+def _stage_load(source: str, sample_rate: Optional[float] = None) -> Dict[str, Any]:
+    with open_session(Path(source)) as session:
+        data = session.read_all()
+        rate = session.sample_rate or sample_rate
+        if not rate:
+            raise ValueError("Fréquence d'échantillonnage inconnue (option sample_rate)")
+        return _signal(data, rate, session.channel_names, session.metadata)
+
+
+def _stage_detrend(signal: Dict[str, Any], detrend: Optional[str] = 'constant') -> Dict[str, Any]:
+    """Échantillons non finis remplacés, puis moyenne ou tendance linéaire retirée"""
+    data = fill_invalid(signal['data'])
+    if detrend == 'constant':
+        data = data - data.mean(axis=1, keepdims=True)
+    elif detrend == 'linear':
+        from scipy.signal import detrend as linear_detrend
+        data = linear_detrend(data, axis=1, type='linear')
+    elif detrend:
+        raise ValueError(f"Détendance inconnue: {detrend}")
+    return dict(signal, data=data)
+
+
+def _stage_filter(signal: Dict[str, Any], filter_type: Optional[str] = None, cutoff: Any = None,
+                  filter_order: int = 4) -> Dict[str, Any]:
+    """Filtre de Butterworth à phase nulle"""
+    if not filter_type:
+        return signal
+    from scipy.signal import butter, sosfiltfilt
+
+    if cutoff is None:
+        raise ValueError(f"Fréquence de coupure requise pour le filtre {filter_type}")
+    sos = butter(filter_order, cutoff, btype=filter_type, fs=signal['sample_rate'], output='sos')
+    return dict(signal, data=sosfiltfilt(sos, signal['data'], axis=1))
+
+
+def _stage_segment(signal: Dict[str, Any], segment_length: int = 1024, overlap: float = 0.5) -> Dict[str, Any]:
+    return {'segments': welch_segments(signal['data'], segment_length, overlap), 'sample_rate': signal['sample_rate']}
+
+
+def _stage_psd(segmented: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    freqs, psd = welch_psd(segmented['segments'], segmented['sample_rate'])
+    return {'frequencies': freqs, 'psd': psd}
+
+
+def _stage_moments(spectrum: Dict[str, np.ndarray],
+                   spectral_band: Optional[Tuple[float, float]] = None) -> Dict[str, np.ndarray]:
+    return spectral_moments(spectrum['frequencies'], spectrum['psd'], spectral_band)
+
+
+def _stage_statistics(signal: Dict[str, Any]) -> Dict[str, Any]:
+    """Statistiques des données brutes et description de la session"""
+    data = signal['data']
+    stats = channel_statistics(data)
+    stats['n_invalid'] = (~np.isfinite(data)).sum(axis=1)
+    stats['sample_rate'] = signal['sample_rate']
+    stats['n_samples'] = int(data.shape[1])
+    stats['channel_names'] = signal['channel_names']
+    return stats
+
+
+def _stage_wave_by_wave(signal: Dict[str, Any]) -> List[Dict[str, float]]:
+    """Analyse vague par vague de chaque canal"""
+    return [wave_by_wave(channel, signal['sample_rate']) for channel in signal['data']]
+
+
+def _stage_reflection(signal: Dict[str, Any], probe_positions: Optional[Sequence[float]] = None,
+                      water_depth: Optional[float] = None,
+                      frequency_band: Optional[Tuple[float, float]] = None,
+                      energy_threshold: float = 0.01) -> Dict[str, float]:
+    """Réflexion de Goda si la géométrie des sondes est connue (options ou métadonnées)"""
+    metadata = signal['metadata']
+    positions = probe_positions
+    if positions is None and metadata.get('probe_positions') is not None:
+        positions = list(np.asarray(metadata['probe_positions'], dtype=float))
+    depth = water_depth or metadata.get('water_depth')
+    data = signal['data']
+    if positions is not None and depth and 2 <= len(positions) <= data.shape[0]:
+        from ..core.optimized_goda_analyzer import reflection_coefficient
+
+        return reflection_coefficient(data, signal['sample_rate'], positions, float(depth),
+                                      frequency_band, energy_threshold)
+    return {'kr': np.nan, 'hm0_incident': np.nan, 'hm0_reflected': np.nan}
+
+
+def _stage_report(stats: Dict[str, Any], moments: Dict[str, np.ndarray], waves: List[Dict[str, float]],
+                  reflection: Dict[str, float]) -> List[Dict[str, Any]]:
+    """Une ligne par canal (voir RESULT_COLUMNS), colonne 'file' à renseigner"""
+    rows = []
+    sample_rate, n_samples = stats['sample_rate'], stats['n_samples']
+    for i, name in enumerate(stats['channel_names']):
+        row = {
+            'file': '',
+            'channel': name,
+            'sample_rate': float(sample_rate),
+            'n_samples': int(n_samples),
+            'duration_s': n_samples / sample_rate,
+            'n_invalid': int(stats['n_invalid'][i]),
+        }
+        row.update({key: float(stats[key][i]) for key in ('mean', 'std', 'min', 'max', 'rms', 'skewness', 'kurtosis')})
+        row.update({key: float(moments[key][i]) for key in SPECTRAL_PARAMETERS})
+        row.update(waves[i])
+        row.update({key: float(value) for key, value in reflection.items()})
+        rows.append(row)
+    return rows
+
+
+def build_session_graph(options: Optional[AnalysisOptions] = None, store=None):
+    """
+    Graphe d'analyse d'une session, paramètres initialisés depuis les options
+
+    Le fichier est désigné par le paramètre `source`. Avec un store
+    (AnalysisResultCache), les résultats compacts (DSP, moments, statistiques,
+    vagues, réflexion, rapport) sont conservés sur disque.
+
+    Example:
+        >>> graph = build_session_graph(AnalysisOptions(segment_length=2048))
+        >>> graph.set_params(source='essai.h5')
+        >>> rows = graph.compute('report')
+        >>> graph.set_params(spectral_band=(0.3, 2.0))  # seuls moments et report sont recalculés
+    """
+    from ..core.analysis_graph import AnalysisGraph, Stage
+
+    options = options or AnalysisOptions()
+    stages = [
+        Stage('load', _stage_load, params=('sample_rate',), files=('source',)),
+        Stage('detrend', _stage_detrend, ('load',), ('detrend',)),
+        Stage('filter', _stage_filter, ('detrend',), ('filter_type', 'cutoff', 'filter_order')),
+        Stage('segment', _stage_segment, ('filter',), ('segment_length', 'overlap')),
+        Stage('psd', _stage_psd, ('segment',), persist=True),
+        Stage('moments', _stage_moments, ('psd',), ('spectral_band',), persist=True),
+        Stage('statistics', _stage_statistics, ('load',), persist=True),
+        Stage('wave_by_wave', _stage_wave_by_wave, ('filter',), persist=True),
+        Stage('reflection', _stage_reflection, ('filter',),
+              ('probe_positions', 'water_depth', 'frequency_band', 'energy_threshold'), persist=True),
+        Stage('report', _stage_report, ('statistics', 'moments', 'wave_by_wave', 'reflection'), persist=True),
+    ]
+    return AnalysisGraph(stages, params=asdict(options), store=store)
+
+
+def analyze_session(data: np.ndarray, sample_rate: float, channel_names: Sequence[str],
+                    name: str = '', options: Optional[AnalysisOptions] = None,
+                    metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Analyse complète d'une session en mémoire (étapes du graphe enchaînées)
+
+    Args:
+        data: Données (canaux x échantillons)
+        sample_rate: Fréquence d'échantillonnage [Hz]
+        channel_names: Noms des canaux
+        name: Nom de la session (colonne 'file')
+        options: Paramètres d'analyse
+        metadata: Métadonnées de la session (probe_positions, water_depth)
+
+    Returns:
+        Une ligne de résultats par canal (voir RESULT_COLUMNS)
+    """
+    options = options or AnalysisOptions()
+    signal = _signal(data, sample_rate, channel_names, metadata)
+    filtered = _stage_filter(_stage_detrend(signal, options.detrend),
+                             options.filter_type, options.cutoff, options.filter_order)
+    spectrum = _stage_psd(_stage_segment(filtered, options.segment_length, options.overlap))
+    reflection = _stage_reflection(filtered, options.probe_positions, options.water_depth,
+                                   options.frequency_band, options.energy_threshold)
+    rows = _stage_report(_stage_statistics(signal), _stage_moments(spectrum, options.spectral_band),
+                         _stage_wave_by_wave(filtered), reflection)
+    for row in rows:
+        row['file'] = name
+    return rows
+
+
+def analyze_file(path: Path, options: Optional[AnalysisOptions] = None, store=None) -> List[Dict[str, Any]]:
+    """
+    Analyse une session enregistrée
+
+    Args:
+        path: Fichier de session
+        options: Paramètres d'analyse
+        store: AnalysisResultCache ; les étapes dont les entrées n'ont pas
+            changé ne sont pas recalculées
+    """
+    graph = build_session_graph(options, store)
+    graph.set_params(source=str(path))
+    return [dict(row, file=str(path)) for row in graph.compute('report')]
+
+
+_worker_stores: Dict[Tuple, Any] = {}
+
+
+def _analyze_task(path: str, options: AnalysisOptions,
+                  store_spec: Optional[Tuple[str, int, str]] = None) -> Tuple[str, List[Dict[str, Any]], Optional[str]]:
+    """Tâche du pool : les erreurs sont retournées, pas levées
+
+    `store_spec` (répertoire, taille maximale, version) désigne le cache,
+    ouvert une fois par processus de calcul.
+    """
+    try:
+        store = None
+        if store_spec is not None:
+            store = _worker_stores.get(store_spec)
+            if store is None:
+                from ..core.result_cache import AnalysisResultCache
+                store = _worker_stores[store_spec] = AnalysisResultCache(*store_spec)
+        return path, analyze_file(Path(path), options, store), None
+    except Exception as e:
+        return path, [], f"{type(e).__name__}: {e}"
+
+
+class ResultTableWriter:
+    """Écriture incrémentale de la table de résultats (HDF5 ou CSV selon l'extension)"""
+
+    def __init__(self, filepath: Path):
+        self.filepath = Path(filepath)
+        self.format = 'csv' if self.filepath.suffix.lower() == '.csv' else 'hdf5'
+        self.n_rows = 0
+        self.n_errors = 0
+        self._handle = None
+        self._writer = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self):
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        names = [name for name, _ in RESULT_COLUMNS]
+        if self.format == 'csv':
+            self._handle = open(self.filepath, 'w', newline='', encoding='utf-8')
+            self._writer = csv.writer(self._handle)
+            self._writer.writerow(names)
+            return
+
+        import h5py
+        self._handle = h5py.File(self.filepath, 'w')
+        self._dtype = np.dtype([
+            (name, h5py.string_dtype() if kind == 'str' else ('i8' if kind == 'int' else 'f8'))
+            for name, kind in RESULT_COLUMNS
+        ])
+        self._table = self._handle.create_dataset('results', shape=(0,), maxshape=(None,),
+                                                  dtype=self._dtype, chunks=(256,))
+        self._errors = self._handle.create_dataset('errors', shape=(0, 2), maxshape=(None, 2),
+                                                   dtype=h5py.string_dtype(), chunks=(64, 2))
+        self._handle.attrs['created_at'] = datetime.now().isoformat()
+        self._handle.attrs['software'] = 'CHNeoWave'
+
+    def append(self, rows: List[Dict[str, Any]]):
+        """Ajoute des lignes et les rend durables"""
+        if not rows:
+            return
+        if self.format == 'csv':
+            for row in rows:
+                self._writer.writerow([row[name] for name, _ in RESULT_COLUMNS])
+            self._handle.flush()
+        else:
+            records = np.array([tuple(row[name] for name in self._dtype.names) for row in rows],
+                               dtype=self._dtype)
+            self._table.resize((self.n_rows + len(records),))
+            self._table[self.n_rows:] = records
+            self._handle.flush()
+        self.n_rows += len(rows)
+
+    def append_error(self, path: str, message: str):
+        """Consigne une session en échec (dataset 'errors' en HDF5, journal en CSV)"""
+        self.n_errors += 1
+        if self.format == 'hdf5':
+            self._errors.resize((self.n_errors, 2))
+            self._errors[self.n_errors - 1] = [path, message]
+            self._handle.flush()
+
+    def close(self):
+        if self._handle:
+            if self.format == 'hdf5':
+                self._handle.attrs['n_rows'] = self.n_rows
+                self._handle.attrs['n_errors'] = self.n_errors
+            self._handle.close()
+            self._handle = None
+
+
+def run_batch_analysis(inputs: Sequence[str], output: Path, jobs: Optional[int] = None,
+                       options: Optional[AnalysisOptions] = None,
+                       progress: Optional[Callable[[int, int, str, Optional[str]], None]] = None,
+                       cache=None) -> Dict[str, Any]:
+    """
+    Analyse un ensemble de sessions sur un pool de processus
+
+    Args:
+        inputs: Répertoires, motifs glob ou fichiers de sessions
+        output: Table de résultats (.h5 ou .csv)
+        jobs: Processus de calcul (nombre de cœurs par défaut, 1 : dans le processus courant)
+        options: Paramètres d'analyse
+        progress: Rappel après chaque session (terminées, total, session, erreur)
+        cache: AnalysisResultCache partagé par les processus ; une session
+            dont le rapport est connu n'est pas relue, et seules les étapes
+            dont les entrées ont changé sont recalculées pour les autres
+
+    Returns:
+        Bilan : sessions, échecs, sessions relues du cache, lignes écrites, durée
+    """
+    options = options or AnalysisOptions()
+    output = Path(output)
+    sessions = [p for p in collect_sessions(inputs) if p.resolve() != output.resolve()]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(sessions) or 1))
+    logger.info(f"Analyse de {len(sessions)} session(s) sur {jobs} processus")
+
+    failed = []
+    done = 0
+    start = time.perf_counter()
+    with ResultTableWriter(output) as writer:
+        def collect(path: str, rows: List[Dict[str, Any]], error: Optional[str]):
+            nonlocal done
+            done += 1
+            if error:
+                failed.append(path)
+                writer.append_error(path, error)
+                logger.error(f"Analyse de {path} impossible: {error}")
+            else:
+                writer.append(rows)
+            if progress:
+                progress(done, len(sessions), path, error)
+
+        # Rapports déjà calculés : ni lecture des données, ni tâche
+        pending = []
+        for session in sessions:
+            rows = None
+            if cache is not None:
+                try:
+                    graph = build_session_graph(options, cache)
+                    graph.set_params(source=str(session))
+                    rows = graph.cached('report')
+                except Exception as e:
+                    logger.warning(f"Cache d'analyse ignoré pour {session}: {e}")
+            if rows is not None:
+                collect(str(session), [dict(row, file=str(session)) for row in rows], None)
+            else:
+                pending.append(session)
+        cached = len(sessions) - len(pending)
+        if cached:
+            logger.info(f"{cached} session(s) inchangée(s) relue(s) depuis le cache")
+
+        if jobs == 1 or len(pending) <= 1:
+            for session in pending:
+                path = str(session)
+                try:
+                    collect(path, analyze_file(session, options, cache), None)
+                except Exception as e:
+                    collect(path, [], f"{type(e).__name__}: {e}")
+        elif pending:
+            store_spec = (str(cache.cache_dir), cache.max_bytes, cache.version) if cache is not None else None
+            # spawn : processus de calcul identiques sous Linux et Windows, sans état hérité
+            with ProcessPoolExecutor(max_workers=min(jobs, len(pending)), mp_context=mp.get_context('spawn')) as pool:
+                futures = [pool.submit(_analyze_task, str(session), options, store_spec) for session in pending]
+                for future in as_completed(futures):
+                    collect(*future.result())
+
+        n_rows = writer.n_rows
+
+    return {
+        'sessions': len(sessions),
+        'failed': failed,
+        'cached': cached,
+        'rows': n_rows,
+        'jobs': jobs,
+        'elapsed_s': time.perf_counter() - start,
+        'output': str(output),
+    }
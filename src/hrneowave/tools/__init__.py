@@ -7,15 +7,6 @@ Ce module contient les outils en ligne de commande et les utilitaires
 pour la configuration et la gestion du système CHNeoWave.
 """
 
-from .lab_config import (
-    MediterraneanLabConfigurator,
-    LabConfiguration,
-    HardwareConfig,
-    ProcessingConfig,
-    EnvironmentConfig,
-    CalibrationConfig,
-)
-
 __all__ = [
     "MediterraneanLabConfigurator",
     "LabConfiguration",
@@ -26,3 +17,11 @@ __all__ = [
 ]
 
 __version__ = "1.0.0"
+
+
+def __getattr__(name):
+    # lab_config importe yaml : chargé à la première utilisation (PEP 562)
+    if name in __all__:
+        from . import lab_config
+        return getattr(lab_config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,11 +7,17 @@ Ce module contient les utilitaires pour la génération de documentation,
 le monitoring et les outils de développement pour CHNeoWave.
 """
 
-# Import depuis core au lieu de utils (après nettoyage des doublons)
-from ..core.logging_config import setup_logging
-
 __all__ = [
     "setup_logging",
 ]
 
 __version__ = "1.0.0"
+
+
+def __getattr__(name):
+    # Chargé à la première utilisation (PEP 562) : importer hrneowave.utils.hash_tools
+    # ne charge pas hrneowave.core
+    if name == "setup_logging":
+        from ..core.logging_config import setup_logging
+        return setup_logging
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Pyramide multi-résolution min/max/moyenne pour CHNeoWave
+Datasets annexes stockés à côté des données brutes dans le fichier HDF5 de session
+"""
+
+import h5py
+import numpy as np
+from typing import Optional, Tuple
+
+# Groupe racine des pyramides (données dérivées, exclues du hash d'intégrité)
+PYRAMID_GROUP = 'pyramid'
+
+# Facteur de réduction entre deux niveaux successifs
+PYRAMID_FACTOR = 4
+
+# Un niveau n'est créé que s'il contient au moins ce nombre de buckets
+MIN_LEVEL_LENGTH = 256
+
+# Nombre d'échantillons source traités par bloc lors de la construction
+CHUNK_SAMPLES = 1 << 18
+
+
+def _pyramid_path(source: str) -> str:
+    """Chemin du groupe de pyramide associé à un dataset source"""
+    return f"/{PYRAMID_GROUP}/{source.strip('/').replace('/', '_')}"
+
+
+def _bucket_counts(start: int, stop: int, bucket: int, n_samples: int) -> np.ndarray:
+    """Nombre d'échantillons bruts couverts par les buckets [start, stop) d'un niveau"""
+    first = np.arange(start, stop, dtype=np.int64) * bucket
+    return np.minimum(bucket, n_samples - first)
+
+
+class MinMaxPyramid:
+    """
+    Pyramide min/max/moyenne d'un dataset HDF5
+
+    Le niveau k regroupe PYRAMID_FACTOR**k échantillons bruts par bucket.
+    Chaque niveau contient trois datasets (min, max, mean) de même forme
+    que la source, première dimension réduite.
+    """
+
+    def __init__(self, h5_file: h5py.File, source: str = '/raw'):
+        """
+        Ouvre la pyramide existante d'un dataset
+
+        Args:
+            h5_file: Fichier HDF5 ouvert
+            source: Chemin du dataset brut
+        """
+        path = _pyramid_path(source)
+        if path not in h5_file:
+            raise KeyError(f"Aucune pyramide pour {source}")
+
+        self.source = h5_file[source]
+        self.group = h5_file[path]
+        self.factor = int(self.group.attrs['factor'])
+        self.n_levels = int(self.group.attrs['n_levels'])
+        self.n_samples = int(self.group.attrs['n_samples'])
+
+    @classmethod
+    def exists(cls, h5_file: h5py.File, source: str = '/raw') -> bool:
+        """Indique si une pyramide a déjà été construite pour ce dataset"""
+        return _pyramid_path(source) in h5_file
+
+    @classmethod
+    def build(cls, h5_file: h5py.File, source: str = '/raw',
+              factor: int = PYRAMID_FACTOR,
+              min_level_length: int = MIN_LEVEL_LENGTH,
+              chunk_samples: int = CHUNK_SAMPLES) -> 'MinMaxPyramid':
+        """
+        Construit (ou reconstruit) la pyramide d'un dataset par blocs
+
+        Le niveau 1 est calculé à partir des données brutes, chaque niveau
+        suivant à partir du précédent ; la mémoire utilisée reste bornée
+        par chunk_samples quelle que soit la durée de l'enregistrement.
+        """
+        dataset = h5_file[source]
+        n_samples = dataset.shape[0]
+        path = _pyramid_path(source)
+        if path in h5_file:
+            del h5_file[path]
+
+        group = h5_file.create_group(path)
+        group.attrs['source'] = source
+        group.attrs['factor'] = factor
+        group.attrs['n_samples'] = n_samples
+
+        mean_dtype = np.result_type(dataset.dtype, np.float32)
+        chunk_samples = max(chunk_samples - chunk_samples % factor, factor)
+
+        src_min = src_max = src_mean = dataset
+        src_length, src_bucket = n_samples, 1
+        level = 0
+
+        while -(-src_length // factor) >= min_level_length:
+            level += 1
+            length = -(-src_length // factor)
+            bucket = src_bucket * factor
+            level_group = group.create_group(f'level_{level}')
+            level_group.attrs['bucket'] = bucket
+
+            shape = (length,) + dataset.shape[1:]
+            options = dict(chunks=True, compression='gzip', compression_opts=1, shuffle=True)
+            dst_min = level_group.create_dataset('min', shape=shape, dtype=dataset.dtype, **options)
+            dst_max = level_group.create_dataset('max', shape=shape, dtype=dataset.dtype, **options)
+            dst_mean = level_group.create_dataset('mean', shape=shape, dtype=mean_dtype, **options)
+
+            for start in range(0, src_length, chunk_samples):
+                stop = min(start + chunk_samples, src_length)
+                edges = np.arange(0, stop - start, factor)
+                weights = _bucket_counts(start, stop, src_bucket, n_samples)
+                weights = weights.reshape((-1,) + (1,) * (len(shape) - 1))
+
+                block_min = np.minimum.reduceat(src_min[start:stop], edges, axis=0)
+                block_max = np.maximum.reduceat(src_max[start:stop], edges, axis=0)
+                block_sum = np.add.reduceat(src_mean[start:stop] * weights, edges, axis=0)
+                block_count = np.add.reduceat(weights, edges, axis=0)
+
+                out = slice(start // factor, start // factor + len(edges))
+                dst_min[out] = block_min
+                dst_max[out] = block_max
+                dst_mean[out] = block_sum / block_count
+
+            src_min, src_max, src_mean = dst_min, dst_max, dst_mean
+            src_length, src_bucket = length, bucket
+
+        group.attrs['n_levels'] = level
+        return cls(h5_file, source)
+
+    def bucket_size(self, level: int) -> int:
+        """Nombre d'échantillons bruts par bucket au niveau donné"""
+        return self.factor ** level
+
+    def select_level(self, start: int, stop: int, n_pixels: int) -> int:
+        """
+        Choisit le niveau le plus grossier offrant encore au moins un bucket
+        par pixel sur l'intervalle visible (0 = données brutes)
+        """
+        visible = max(stop - start, 0)
+        level = 0
+        while level < self.n_levels and visible // self.bucket_size(level + 1) >= n_pixels:
+            level += 1
+        return level
+
+    def read(self, start: int, stop: int, n_pixels: int,
+             channel: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Lit l'intervalle [start, stop) réduit à au plus n_pixels bins
+
+        Args:
+            start: Premier échantillon brut visible
+            stop: Fin (exclue) de l'intervalle visible
+            n_pixels: Nombre de colonnes de pixels disponibles
+            channel: Canal à lire pour une source 2-D (samples x channels)
+
+        Returns:
+            Tuple (indice du premier échantillon de chaque bin, min, max, moyenne)
+        """
+        start = max(int(start), 0)
+        stop = min(int(stop), self.n_samples)
+        n_pixels = max(int(n_pixels), 1)
+        if stop <= start:
+            empty = np.empty(0)
+            return empty.astype(np.int64), empty, empty, empty
+
+        level = self.select_level(start, stop, n_pixels)
+        bucket = self.bucket_size(level)
+        first, last = start // bucket, -(-stop // bucket)
+        select = (slice(first, last),) if channel is None else (slice(first, last), channel)
+
+        if level == 0:
+            y_min = y_max = y_mean = self.source[select]
+        else:
+            level_group = self.group[f'level_{level}']
+            y_min = level_group['min'][select]
+            y_max = level_group['max'][select]
+            y_mean = level_group['mean'][select]
+
+        index = np.arange(first, last, dtype=np.int64) * bucket
+        if len(index) <= n_pixels:
+            return index, y_min, y_max, y_mean
+
+        # Regroupement final des buckets par colonne de pixels
+        edges = np.linspace(0, len(index), n_pixels + 1).astype(np.intp)[:-1]
+        weights = _bucket_counts(first, last, bucket, self.n_samples)
+        weights = weights.reshape((-1,) + (1,) * (np.ndim(y_mean) - 1))
+        mean = np.add.reduceat(y_mean * weights, edges, axis=0) / np.add.reduceat(weights, edges, axis=0)
+        return (
+            index[edges],
+            np.minimum.reduceat(y_min, edges, axis=0),
+            np.maximum.reduceat(y_max, edges, axis=0),
+            mean,
+        )
+
+    def read_envelope(self, start: int, stop: int, n_pixels: int,
+                      channel: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Enveloppe min/max entrelacée prête à tracer (deux points par pixel)
+
+        Returns:
+            Tuple (indices d'échantillons, valeurs)
+        """
+        index, y_min, y_max, _ = self.read(start, stop, n_pixels, channel)
+        return np.repeat(index, 2), np.stack((y_min, y_max), axis=1).ravel()
+
+
+def build_pyramid(filepath, source: str = '/raw', **kwargs) -> int:
+    """
+    Construit la pyramide d'un fichier de session existant
+
+    Args:
+        filepath: Chemin du fichier HDF5
+        source: Chemin du dataset brut
+
+    Returns:
+        Nombre de niveaux créés
+    """
+    with h5py.File(filepath, 'a') as f:
+        return MinMaxPyramid.build(f, source, **kwargs).n_levels
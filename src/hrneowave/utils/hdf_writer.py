@@ -15,6 +15,9 @@ import tempfile
 import os
 import shutil
 
+from .hdf_pyramid import MinMaxPyramid, PYRAMID_GROUP
+from ..core.tracing import trace_span
+
 class HDF5Writer:
     """
     Écrivain HDF5 pour données d'acquisition CHNeoWave
@@ -45,7 +48,8 @@ class HDF5Writer:
                              data: np.ndarray,
                              sampling_rate: float,
                              channel_names: list,
-                             metadata: Optional[Dict[str, Any]] = None):
+                             metadata: Optional[Dict[str, Any]] = None,
+                             build_pyramid: bool = True):
         """
         Écrit les données d'acquisition en format HDF5 standardisé
         
@@ -54,18 +58,20 @@ class HDF5Writer:
             sampling_rate: Fréquence d'échantillonnage en Hz
             channel_names: Noms des canaux
             metadata: Métadonnées additionnelles
+            build_pyramid: Construit la pyramide min/max pour le zoom rapide
         """
         if self.file_handle is None:
             raise RuntimeError("Fichier HDF5 non ouvert")
             
         # Dataset principal des données brutes
-        raw_dataset = self.file_handle.create_dataset(
-            '/raw', 
-            data=data,
-            compression='gzip',
-            compression_opts=6,
-            shuffle=True
-        )
+        with trace_span('hdf5_write', n_samples=int(data.shape[0])):
+            raw_dataset = self.file_handle.create_dataset(
+                '/raw', 
+                data=data,
+                compression='gzip',
+                compression_opts=6,
+                shuffle=True
+            )
         
         # Attributs et métadonnées
         attrs = {
@@ -88,9 +94,15 @@ class HDF5Writer:
                 self.file_handle.attrs[key] = value
 
         # Calcul et écriture du hash
-        self.file_handle.flush()
-        file_hash = self._calculate_internal_hash(self.file_handle)
+        with trace_span('hdf5_hash'):
+            self.file_handle.flush()
+            file_hash = self._calculate_internal_hash(self.file_handle)
         self.file_handle.attrs['sha256'] = file_hash
+
+        # Pyramide multi-résolution (données dérivées, hors hash)
+        if build_pyramid:
+            with trace_span('hdf5_pyramid'):
+                MinMaxPyramid.build(self.file_handle, '/raw')
                     
 
 
@@ -108,15 +120,17 @@ class HDF5Writer:
         # Hasher les attributs du fichier racine
         hash_attrs(h5_file.attrs)
 
-        # Hasher les datasets et leurs attributs
-        def hash_dataset(name):
-            dataset = h5_file[name]
-            dataset_array = dataset[:]
+        # Hasher les datasets et leurs attributs (la pyramide est dérivée des
+        # données brutes et peut être reconstruite, elle n'est pas hashée)
+        def hash_dataset(name, obj):
+            if not isinstance(obj, h5py.Dataset) or name.split('/')[0] == PYRAMID_GROUP:
+                return
+            dataset_array = obj[:]
             sha256_hash.update(name.encode('utf-8'))
             sha256_hash.update(dataset_array.tobytes())
-            hash_attrs(dataset.attrs)
+            hash_attrs(obj.attrs)
 
-        h5_file.visit(hash_dataset)
+        h5_file.visititems(hash_dataset)
 
         return sha256_hash.hexdigest()
         
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du graphique temps réel de la vue d'acquisition
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from hrneowave.core.signal_bus import DataBlock
+from hrneowave.gui.views.acquisition_view import LIVE_WINDOW_SECONDS, DataVisualizationArea
+
+
+@pytest.fixture
+def area(qtbot):
+    area = DataVisualizationArea()
+    qtbot.addWidget(area)
+    area.resize(1200, 800)
+    area.show()
+    qtbot.waitExposed(area)
+    return area
+
+
+def _block(sequence_id, n_samples=64, n_channels=4, fs=2000.0):
+    """Bloc sinusoïdal contigu de la session"""
+    start = sequence_id * n_samples
+    t = (start + np.arange(n_samples)) / fs
+    data = np.vstack([np.sin(2 * np.pi * 0.5 * t + channel) for channel in range(n_channels)])
+    return DataBlock(data=data, timestamp=t[0], sample_rate=fs, n_channels=n_channels,
+                     sequence_id=sequence_id, start_sample=start)
+
+
+def test_blocks_feed_live_curves(area, qtbot):
+    """Test blocs d'acquisition affichés sur une courbe par canal"""
+    for sequence_id in range(50):
+        area.append_block(_block(sequence_id, n_channels=8))
+    qtbot.waitUntil(lambda: not area.live_plot.dirty_curves, timeout=2000)
+
+    plot = area.live_plot
+    assert area.live_format == (8, 2000.0)
+    assert len(plot.live_curves) == 8
+    ring = plot.live_curves["Canal 8"]
+    assert ring.samples_appended == 50 * 64
+    x_data, _ = plot.plot_items["Canal 8"].getData()
+    assert len(x_data) == len(ring)
+
+    # Nouvelle session : courbes vidées
+    area.append_block(_block(0, n_channels=8))
+    assert plot.live_curves["Canal 8"].samples_appended == 64
+
+
+def test_frame_rate_is_capped(area, qtbot):
+    """Test gouverneur : redessins plafonnés à max_fps malgré des blocs à 1 kHz"""
+    plot = area.live_plot
+    frames = plot.frames_rendered
+    start = time.perf_counter()
+    sequence_id = 0
+    while time.perf_counter() - start < 1.0:
+        area.append_block(_block(sequence_id))
+        sequence_id += 1
+        qtbot.wait(1)
+    elapsed = time.perf_counter() - start
+
+    rendered = plot.frames_rendered - frames
+    assert sequence_id > 2 * plot.config.max_fps
+    assert 0 < rendered <= elapsed * plot.config.max_fps + 2
+
+
+def test_rings_follow_plot_width(area, qtbot):
+    """Test anneaux redimensionnés quand le graphique change de largeur"""
+    plot = area.live_plot
+    for sequence_id in range(100):
+        area.append_block(_block(sequence_id))
+    window_samples = int(LIVE_WINDOW_SECONDS * 2000.0)
+    assert plot.live_windows["Canal 1"] == window_samples
+
+    before = plot.live_curves["Canal 1"]
+    area.resize(600, 800)
+    qtbot.waitUntil(lambda: plot.live_curves["Canal 1"] is not before, timeout=2000)
+
+    after = plot.live_curves["Canal 1"]
+    assert after.capacity <= 2 * plot.width() < before.capacity
+    assert after.samples_appended == before.samples_appended
+    qtbot.waitUntil(lambda: not plot.dirty_curves, timeout=2000)
+    assert len(plot.plot_items["Canal 1"].getData()[0]) == len(after)
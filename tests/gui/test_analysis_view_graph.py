@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du recalcul incrémental de la vue d'analyse
+"""
+
+import numpy as np
+import pytest
+
+from hrneowave.core import result_cache
+from hrneowave.gui.views.analysis_view import AnalysisView
+
+
+@pytest.fixture
+def view(qtbot, tmp_path, monkeypatch):
+    cache = result_cache.AnalysisResultCache(tmp_path / "cache", version="test")
+    monkeypatch.setattr(result_cache, "_shared_cache", cache)
+    view = AnalysisView()
+    qtbot.addWidget(view)
+    yield view
+    cache.close()
+
+
+def _write_csv(path, fs=20.0):
+    """Session CSV sans fréquence d'échantillonnage enregistrée"""
+    t = np.arange(4096) / fs
+    path.write_text("WP0\n" + "\n".join(repr(float(v)) for v in 0.05 * np.sin(2 * np.pi * 0.6 * t)) + "\n",
+                    encoding="utf-8")
+    return path
+
+
+def _run(qtbot, view, request, *args):
+    """Demande une analyse et attend son résultat (calcul dans un thread)"""
+    with qtbot.waitSignal(view.analysis_completed, timeout=30000) as blocker:
+        request(*args)
+    return blocker.args[1]
+
+
+def test_filter_change_recomputes_downstream_only(view, qtbot, tmp_path):
+    """Test filtre modifié : chargement et statistiques non recalculés"""
+    view.load_data_file(str(_write_csv(tmp_path / "essai.csv")))
+    results = _run(qtbot, view, view.on_analysis_requested, "statistics", {"sample_rate": 20.0})
+    assert results["recomputed"] == ["load", "statistics"]
+
+    results = _run(qtbot, view, view.on_filter_applied, "Passe-bas", {"frequency": 2.0, "order": 4})
+    assert results["status"] == "completed"
+    assert "load" not in results["recomputed"] and "statistics" not in results["recomputed"]
+    assert results["data"][0]["hm0"] > 0
+
+
+def test_analysis_runs_off_gui_thread(view, qtbot, tmp_path, monkeypatch):
+    """Test calcul dans un thread et fréquence prise dans le panneau d'outils"""
+    import threading
+
+    from hrneowave.headless import analyze
+
+    threads = []
+    stage = analyze._stage_statistics
+    monkeypatch.setattr(analyze, "_stage_statistics",
+                        lambda signal: threads.append(threading.current_thread()) or stage(signal))
+    view.tools_panel.sample_rate_spinbox.setValue(20.0)
+    view.load_data_file(str(_write_csv(tmp_path / "essai.csv")))
+
+    with qtbot.waitSignal(view.analysis_completed, timeout=30000) as blocker:
+        view.tools_panel.request_analysis("statistics")
+    results = blocker.args[1]
+    assert results["status"] == "completed"
+    assert results["data"]["sample_rate"] == 20.0
+    assert threads and threads[0] is not threading.main_thread()
+
+    results = _run(qtbot, view, view.tools_panel.request_analysis, "temporal")
+    assert results["stage"] == "wave_by_wave"
+    assert results["data"][0]["n_waves"] > 0
+
+
+def test_session_plot_reads_pyramid_on_zoom(view, qtbot, tmp_path):
+    """Test graphique de session : niveau de pyramide relu à chaque zoom"""
+    from hrneowave.utils.hdf_writer import HDF5Writer
+
+    fs = 32.0
+    t = np.arange(400_000) / fs
+    data = np.column_stack((0.05 * np.sin(2 * np.pi * 0.6 * t), np.zeros(len(t))))
+    data[250_001, 0] = 1.0
+    path = tmp_path / "session.h5"
+    with HDF5Writer(path) as writer:
+        writer.write_acquisition_data(data, fs, ["WP1", "WP2"])
+
+    view.resize(1400, 900)
+    view.show()
+    qtbot.waitExposed(view)
+    view.load_data_file(str(path))
+
+    area = view.results_area
+    plot = area.session_plot
+    curve = plot.plot_items["Canal 1"]
+    x_data, y_data = curve.getData()
+    assert len(x_data) <= 2 * plot.width()
+    assert x_data[0] == 0 and x_data[-1] > 0.99 * t[-1]
+    assert y_data.max() == 1.0
+
+    # Zoom autour du pic : lecture plus fine, limitée à la plage visible
+    plot.setXRange(7800, 7820, padding=0)
+    qtbot.waitUntil(lambda: curve.getData()[0][0] >= 7799, timeout=2000)
+    x_zoom, y_zoom = curve.getData()
+    assert x_zoom[-1] <= 7821
+    assert len(x_zoom) <= 2 * plot.width()
+    assert np.array_equal(y_zoom[::2], data[int(x_zoom[0] * fs):int(x_zoom[0] * fs) + len(x_zoom) // 2, 0])
+    assert y_zoom.max() == 1.0
+
+    # Nouveau fichier sans pyramide : session fermée
+    view.load_data_file(str(_write_csv(tmp_path / "essai.csv")))
+    assert area.session_file is None
+    assert "Canal 1" not in plot.plot_items
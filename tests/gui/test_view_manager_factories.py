@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de la construction paresseuse des vues du ViewManager
+"""
+
+import pytest
+from PySide6.QtWidgets import QLabel, QStackedWidget
+
+from hrneowave.gui.view_manager import ViewManager
+from hrneowave.gui.views import NAVIGATION_ORDER, VIEWS_CONFIG
+
+
+@pytest.fixture
+def manager(qtbot):
+    stack = QStackedWidget()
+    qtbot.addWidget(stack)
+    return ViewManager(stack)
+
+
+def _factory(calls, name):
+    def build():
+        calls.append(name)
+        return QLabel(name)
+    return build
+
+
+class TestViewFactories:
+    """Tests de register_view_factory"""
+
+    def test_built_on_first_navigation(self, manager):
+        """Test construction unique à la première navigation, durée relevée"""
+        calls = []
+        manager.register_view_factory('analysis', _factory(calls, 'analysis'), prefetch=False)
+        assert manager.has_view('analysis')
+        assert not manager.is_view_built('analysis')
+        assert calls == []
+
+        assert manager.switch_to_view('analysis')
+        assert manager.switch_to_view('analysis')
+        assert calls == ['analysis']
+        assert manager.stacked_widget.currentWidget().text() == 'analysis'
+        assert manager.build_times['analysis'] >= 0
+
+    def test_idle_prefetch(self, manager, qtbot):
+        """Test préchargement dans l'ordre d'enregistrement sans changer de vue"""
+        calls = []
+        manager.register_view('welcome', QLabel('welcome'))
+        manager.switch_to_view('welcome')
+        for name in ('dashboard', 'calibration', 'acquisition'):
+            manager.register_view_factory(name, _factory(calls, name))
+        manager.register_view_factory('export', _factory(calls, 'export'), prefetch=False)
+
+        manager.start_prefetch(delay_ms=0)
+        qtbot.waitUntil(lambda: not manager._prefetch_timer.isActive() and len(calls) == 3, timeout=2000)
+        assert calls == ['dashboard', 'calibration', 'acquisition']
+        assert manager.get_current_view() == 'welcome'
+        assert not manager.is_view_built('export')
+
+    def test_failing_factory(self, manager):
+        """Test erreur de construction signalée sans exception, fabrique conservée"""
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("vue cassée")
+            return QLabel('report')
+
+        manager.register_view_factory('report', flaky, prefetch=False)
+        assert not manager.switch_to_view('report')
+        assert manager.has_view('report') and not manager.is_view_built('report')
+
+        assert manager.switch_to_view('report')
+        assert manager.is_view_built('report') and len(attempts) == 2
+        assert 'report' not in manager.view_factories
+
+
+@pytest.mark.parametrize("name", [name for name in NAVIGATION_ORDER if VIEWS_CONFIG[name].get('loader')])
+def test_prefetched_views_build(qtbot, name):
+    """Test chaque vue préchargée par la fenêtre principale se construit et s'affiche"""
+    widget = VIEWS_CONFIG[name]['loader'](parent=None)
+    qtbot.addWidget(widget)
+    widget.resize(1200, 800)
+    widget.show()
+    qtbot.wait(10)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du graphe d'étapes d'analyse mémoïsées
+"""
+
+import numpy as np
+import pytest
+
+from hrneowave.core.analysis_graph import AnalysisGraph, Stage
+from hrneowave.core.result_cache import AnalysisResultCache
+from hrneowave.headless import AnalysisOptions, analyze_session, build_session_graph
+from hrneowave.core.wave_analysis import welch_psd, welch_segments
+
+FS = 20.0
+
+
+def _signals(n=8192, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(n) / FS
+    return np.vstack([
+        0.05 * np.sin(2 * np.pi * 0.6 * t) + 0.004 * rng.standard_normal(n),
+        0.03 * np.sin(2 * np.pi * 0.6 * t + 1.0) + 0.01 * np.sin(2 * np.pi * 4.0 * t),
+    ])
+
+
+@pytest.fixture
+def session(tmp_path):
+    path = tmp_path / "essai.csv"
+    rows = "\n".join(f"{float(a)!r},{float(b)!r}" for a, b in _signals().T)
+    path.write_text("WP0,WP1\n" + rows + "\n", encoding='utf-8')
+    return path
+
+
+def test_welch_matches_scipy():
+    """Test DSP par segments identique à scipy.signal.welch"""
+    from scipy.signal import welch
+
+    data = _signals(5000)
+    for nperseg in (512, 257):
+        freqs, psd = welch_psd(welch_segments(data, nperseg), FS)
+        expected_freqs, expected = welch(data, fs=FS, nperseg=nperseg, detrend='constant', axis=-1)
+        np.testing.assert_allclose(freqs, expected_freqs)
+        np.testing.assert_allclose(psd, expected, rtol=1e-10, atol=1e-18)
+
+
+class TestAnalysisGraph:
+    """Tests de AnalysisGraph"""
+
+    def test_parameter_change_recomputes_downstream(self, session):
+        """Test seules les étapes en aval d'un paramètre modifié sont recalculées"""
+        graph = build_session_graph(AnalysisOptions(sample_rate=FS))
+        graph.set_params(source=str(session))
+        rows = graph.compute('report')
+        assert sorted(graph.last_run) == sorted(graph.stages)
+        expected = analyze_session(_signals(), FS, ['WP0', 'WP1'])
+        for row, reference in zip(rows, expected):
+            for key in ('mean', 'hm0', 'tp', 'h13', 'tz'):
+                assert row[key] == pytest.approx(reference[key], rel=1e-9)
+
+        assert graph.set_params(spectral_band=(0.3, 2.0)) == ['moments', 'report']
+        banded = graph.compute('report')
+        assert graph.last_run == ['moments', 'report']
+        assert banded[1]['hm0'] < rows[1]['hm0']  # composante à 4 Hz exclue
+        assert banded[1]['h13'] == rows[1]['h13']
+
+        graph.set_params(filter_type='lowpass', cutoff=2.0)
+        graph.compute('report')
+        assert graph.last_run == ['filter', 'segment', 'psd', 'moments', 'wave_by_wave', 'reflection', 'report']
+
+        # Retour aux paramètres précédents : résultats encore en mémoire
+        graph.set_params(filter_type=None, cutoff=None)
+        assert graph.compute('report') is banded
+        assert graph.last_run == []
+
+    def test_store_skips_unchanged_stages(self, session, tmp_path):
+        """Test retraitement : étapes inchangées relues du store, données non relues"""
+        store = AnalysisResultCache(tmp_path / "cache", version="test")
+        options = AnalysisOptions(sample_rate=FS)
+        first = build_session_graph(options, store)
+        first.set_params(source=str(session))
+        rows = first.compute('report')
+
+        again = build_session_graph(options, store)
+        again.set_params(source=str(session))
+        np.testing.assert_equal(again.compute('report'), rows)
+        assert again.last_run == []
+
+        resegmented = build_session_graph(AnalysisOptions(sample_rate=FS, segment_length=512), store)
+        resegmented.set_params(source=str(session))
+        resegmented.compute('report')
+        assert resegmented.last_run == ['load', 'detrend', 'filter', 'segment', 'psd', 'moments', 'report']
+        assert resegmented.stats['store_hits'] == 3  # statistiques, vagues, réflexion
+        store.close()
+
+    def test_graph_definition_errors(self):
+        """Test entrées et paramètres inconnus refusés"""
+        graph = AnalysisGraph([Stage('a', lambda x: x * 2, params=('x',))], params={'x': 2})
+        assert graph.compute('a') == 4
+        with pytest.raises(ValueError):
+            graph.add_stage(Stage('b', lambda a: a, inputs=('inconnue',)))
+        with pytest.raises(ValueError):
+            graph.set_params(y=1)
+        with pytest.raises(KeyError):
+            graph.compute('b')
+
+    def test_none_result_and_copies(self):
+        """Test résultat None mémorisé et copie indépendante du résultat partagé"""
+        calls = []
+        graph = AnalysisGraph([
+            Stage('vide', lambda x: calls.append(x), params=('x',)),
+            Stage('table', lambda v, x: {'lignes': [x]}, inputs=('vide',), params=('x',)),
+        ], params={'x': 1})
+        assert graph.compute('vide') is None
+        assert graph.compute('vide') is None
+        assert len(calls) == 1 and graph.last_run == []
+        assert graph.cached('vide', default=False) is None
+
+        shared = graph.compute('table')
+        copied = graph.compute('table', copy=True)
+        copied['lignes'].append(2)
+        assert graph.compute('table') is shared and shared == {'lignes': [1]}
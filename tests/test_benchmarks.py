@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour la suite de benchmarks et la détection de régressions
+"""
+
+import pytest
+
+from hrneowave.benchmarks import (
+    compare_results, format_comparison, load_results, run_benchmarks, save_results
+)
+from hrneowave.config.optimization_config import PerformanceConfig
+
+
+def _results(**medians):
+    """Document de résultats minimal"""
+    return {
+        'scale': 1.0,
+        'results': {name: {'median_s': median, 'skipped': None} for name, median in medians.items()}
+    }
+
+
+class TestBenchmarks:
+    """Tests du runner de benchmarks"""
+
+    def test_run_selected_benchmarks(self, tmp_path):
+        """Test exécution d'un groupe, enregistrement JSON et informations machine"""
+        results = run_benchmarks(names=['buffer', 'fft_psd'], scale=0.05, max_iterations=3, min_time=0.0)
+        assert set(results['results']) == {'ring_write', 'ring_read', 'fft_psd'}
+        assert results['machine']['cpu_count']
+        for result in results['results'].values():
+            assert result['iterations'] == 3
+            assert result['throughput'] > 0
+
+        path = save_results(results, tmp_path / 'bench.json')
+        assert load_results(path)['results'].keys() == results['results'].keys()
+
+    def test_unknown_benchmark(self):
+        """Test nom de benchmark inconnu"""
+        with pytest.raises(ValueError):
+            run_benchmarks(names=['inexistant'])
+
+    def test_disabled_by_config(self):
+        """Test PerformanceConfig.enable_benchmarking respecté"""
+        with pytest.raises(RuntimeError):
+            run_benchmarks(performance_config=PerformanceConfig(enable_benchmarking=False))
+
+    def test_compare_flags_regressions(self):
+        """Test régression au-delà du seuil uniquement, benchmarks ignorés exclus"""
+        baseline = _results(fft_psd=1.0, export_hdf5=1.0, lttb_decimation=1.0)
+        current = _results(fft_psd=1.05, export_hdf5=1.5, ring_write=0.1)
+        current['results']['lttb_decimation'] = {'median_s': 0.0, 'skipped': 'indisponible'}
+
+        comparison = {entry['name']: entry for entry in compare_results(current, baseline, threshold=0.10)}
+        assert set(comparison) == {'fft_psd', 'export_hdf5', 'ring_write'}
+        assert not comparison['fft_psd']['regression']
+        assert comparison['export_hdf5']['regression']
+        assert comparison['export_hdf5']['ratio'] == pytest.approx(1.5)
+
+        # Benchmark sans référence : signalé, sans régression
+        assert comparison['ring_write']['missing'] and not comparison['ring_write']['regression']
+        assert comparison['ring_write']['ratio'] is None
+        report = format_comparison(list(comparison.values()), 0.10)
+        assert "1 régression(s)" in report
+        assert "absent(s) de la référence: ring_write" in report
+
+    def test_baseline_covers_suite(self):
+        """Test référence versionnée : une mesure pour chaque benchmark de la suite"""
+        from pathlib import Path
+        from hrneowave.benchmarks import BENCHMARKS, suite  # noqa: F401
+
+        baseline = load_results(Path(__file__).resolve().parents[1] / 'benchmarks' / 'baseline.json')
+        assert set(baseline['results']) == set(BENCHMARKS)
@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour la validation par blocs et les statistiques glissantes
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from hrneowave.core.data_validator import (
+    BlockValidationResult,
+    DataValidator,
+    RollingRegression,
+    RollingStatistics,
+    ValidationConfig,
+    ValidationLevel,
+    ValidationRule,
+    create_wave_probe_config
+)
+
+
+class TestRollingStatistics:
+    """Tests des moyenne/variance glissantes"""
+
+    def test_push_matches_numpy(self):
+        """Test ajout échantillon par échantillon"""
+        rng = np.random.default_rng(1)
+        data = 1000.0 + rng.standard_normal(500)
+        stats = RollingStatistics(50)
+        for value in data:
+            stats.push(value)
+        assert stats.mean == pytest.approx(data[-50:].mean())
+        assert stats.std == pytest.approx(data[-50:].std())
+
+    def test_push_block_matches_numpy(self):
+        """Test ajout par blocs de tailles variées (Chan)"""
+        rng = np.random.default_rng(2)
+        data = rng.standard_normal(1000) * 5 + 3
+        stats = RollingStatistics(64)
+        position = 0
+        for size in (10, 30, 1, 64, 200, 7, 50):
+            stats.push_block(data[position:position + size])
+            position += size
+            window = data[max(0, position - 64):position]
+            assert stats.count == len(window)
+            assert stats.mean == pytest.approx(window.mean())
+            assert stats.variance == pytest.approx(window.var())
+            assert np.array_equal(stats.values(), window)
+
+    def test_preceding_stats_skip_non_finite(self):
+        """Test fenêtre des seuls échantillons finis, comme push_block"""
+        rng = np.random.default_rng(9)
+        history, block = rng.standard_normal(30), rng.standard_normal(20)
+        block[[3, 11]] = np.nan
+        stats = RollingStatistics(25)
+        stats.push_block(history)
+        mean, std, n = stats.preceding_stats(block)
+        assert n[3] == 0 and n[11] == 0
+        finite = np.concatenate((history, block[np.isfinite(block)]))
+        # Échantillon 15 du bloc = 13e échantillon fini du bloc
+        window = finite[30 + 13 - 25:30 + 13]
+        assert mean[15] == pytest.approx(window.mean())
+        assert std[15] == pytest.approx(window.std())
+
+    def test_preceding_stats(self):
+        """Test statistiques de la fenêtre précédant chaque échantillon"""
+        rng = np.random.default_rng(3)
+        history, block = rng.standard_normal(30), rng.standard_normal(20)
+        stats = RollingStatistics(25)
+        stats.push_block(history)
+        mean, std, n = stats.preceding_stats(block)
+        data = np.concatenate((history, block))
+        for j in range(len(block)):
+            window = data[30 + j - 25:30 + j]
+            assert n[j] == 25
+            assert mean[j] == pytest.approx(window.mean())
+            assert std[j] == pytest.approx(window.std())
+
+
+class TestValidateBlock:
+    """Tests de la validation vectorisée par blocs"""
+
+    @pytest.fixture
+    def validator(self):
+        validator = DataValidator(sampling_rate=100.0)
+        validator.add_channel(ValidationConfig(
+            channel=0, min_value=-10.0, max_value=10.0,
+            max_rate_of_change=200.0, outlier_window_size=50,
+            saturation_threshold=0.95, saturation_duration=0.05
+        ))
+        return validator
+
+    def test_aggregated_range_violations(self, validator):
+        """Test un seul résultat par règle avec nombre et premier indice"""
+        block = np.zeros((1, 100))
+        block[0, [20, 40, 41]] = 15.0
+        results = validator.validate_block(block, t0=2.0)
+        range_results = [r for r in results if r.rule_type == ValidationRule.RANGE_CHECK]
+        assert len(range_results) == 1
+        result = range_results[0]
+        assert isinstance(result, BlockValidationResult)
+        assert result.count == 3
+        assert result.first_index == 20
+        assert result.first_time == pytest.approx(2.2)
+        assert result.value == 15.0
+
+    def test_rate_of_change_across_blocks(self, validator):
+        """Test taux de changement avec le dernier échantillon du bloc précédent"""
+        validator.validate_block(np.zeros((1, 10)), t0=0.0)
+        results = validator.validate_block(np.full((1, 10), 5.0), t0=0.1)
+        rate = [r for r in results if r.rule_type == ValidationRule.RATE_OF_CHANGE]
+        assert len(rate) == 1
+        assert rate[0].count == 1 and rate[0].first_index == 0
+
+    def test_saturation_run_spans_blocks(self, validator):
+        """Test durée de saturation reportée d'un bloc au suivant"""
+        assert not validator.validate_block(np.full((1, 4), 9.9), t0=0.0)
+        results = validator.validate_block(np.full((1, 4), 9.9), t0=0.04)
+        saturation = [r for r in results if r.rule_type == ValidationRule.SATURATION_CHECK]
+        assert len(saturation) == 1
+        # Série commencée à t=0 : la durée dépasse 0.05 s à partir de l'échantillon 6
+        assert saturation[0].first_index == 2
+        assert saturation[0].count == 2
+
+    def test_outlier_against_running_window(self, validator):
+        """Test outlier détecté par rapport à la fenêtre glissante"""
+        rng = np.random.default_rng(4)
+        validator.validate_block(rng.standard_normal((1, 100)) * 0.1, t0=0.0)
+        block = rng.standard_normal((1, 100)) * 0.1
+        block[0, 37] = 3.0
+        results = validator.validate_block(block, t0=1.0)
+        outliers = [r for r in results if r.rule_type == ValidationRule.STATISTICAL_OUTLIER]
+        assert len(outliers) == 1
+        assert outliers[0].first_index == 37
+        assert outliers[0].level == ValidationLevel.ERROR
+
+    def test_outlier_after_nan(self, validator):
+        """Test outlier détecté après un échantillon NaN dans le même bloc"""
+        rng = np.random.default_rng(8)
+        validator.validate_block(rng.standard_normal((1, 100)) * 0.1, t0=0.0)
+        block = rng.standard_normal((1, 100)) * 0.1
+        block[0, 10] = np.nan
+        block[0, 60] = 5.0
+        results = validator.validate_block(block, t0=1.0)
+        outliers = [r for r in results if r.rule_type == ValidationRule.STATISTICAL_OUTLIER]
+        assert len(outliers) == 1
+        assert outliers[0].first_index == 60
+
+    def test_connectivity_gap_and_nan(self, validator):
+        """Test trou entre blocs et échantillons invalides"""
+        validator.channel_validators[0].config.connectivity_timeout = 0.5
+        validator.validate_block(np.zeros((1, 10)), t0=0.0)
+        block = np.zeros((1, 10))
+        block[0, 3] = np.nan
+        results = validator.validate_block(block, t0=5.0)
+        connectivity = [r for r in results if r.rule_type == ValidationRule.CONNECTIVITY_CHECK]
+        assert len(connectivity) == 2
+        assert connectivity[0].metadata['gap_duration'] == pytest.approx(4.9)
+        assert connectivity[1].first_index == 3
+
+    def test_statistics_and_clear(self, validator):
+        """Test compteurs par échantillon et remise à zéro"""
+        block = np.zeros((1, 50))
+        block[0, :5] = 20.0
+        validator.validate_block(block, t0=0.0)
+        stats = validator.get_channel_statistics(0)
+        assert stats['total_samples'] == 50
+        assert stats['error_count'] >= 5
+        validator.clear_history()
+        assert validator.get_channel_statistics(0)['total_samples'] == 0
+        assert validator.channel_validators[0].rolling_stats.count == 0
+
+    @pytest.mark.performance
+    def test_sixteen_channels_at_2khz(self):
+        """Test coût de toutes les règles : 16 canaux @ 2 kHz en quelques % d'un cœur"""
+        fs = 2000.0
+        validator = DataValidator(sampling_rate=fs)
+        for channel in range(16):
+            validator.add_channel(create_wave_probe_config(channel))
+        rng = np.random.default_rng(5)
+        blocks = [50 * rng.standard_normal((16, 200)) for _ in range(50)]
+
+        validator.validate_block(blocks[0], 0.0)
+        start = time.perf_counter()
+        for i, block in enumerate(blocks):
+            validator.validate_block(block, 0.1 * (i + 1))
+        elapsed = time.perf_counter() - start
+
+        # 50 blocs de 0.1 s = 5 s de données
+        assert elapsed / 5.0 < 0.05
+
+
+class TestDriftDetection:
+    """Tests de la régression glissante et de la détection de dérive"""
+
+    def test_rolling_regression_matches_polyfit(self):
+        """Test pente et r contre numpy, par points puis par blocs"""
+        rng = np.random.default_rng(6)
+        t = 1e4 + np.arange(3000) / 100.0
+        x = 0.3 * t + rng.standard_normal(len(t))
+        by_point, by_block = RollingRegression(500), RollingRegression(500)
+        for ti, xi in zip(t, x):
+            by_point.push(ti, xi)
+        for start in range(0, len(t), 70):
+            by_block.push_block(t[start:start + 70], x[start:start + 70])
+
+        slope, _ = np.polyfit(t[-500:], x[-500:], 1)
+        r_value = np.corrcoef(t[-500:], x[-500:])[0, 1]
+        for regression in (by_point, by_block):
+            assert regression.fit()[0] == pytest.approx(slope, rel=1e-9)
+            assert regression.fit()[1] == pytest.approx(r_value, rel=1e-9)
+
+    def test_short_window_alarm_only(self):
+        """Test alarme de la fenêtre courte sur une dérive récente"""
+        fs = 100.0
+        config = ValidationConfig(channel=0, max_drift_rate=1.0, drift_window_size=2000,
+                                  drift_short_window_size=200)
+        validator = DataValidator(sampling_rate=fs)
+        validator.add_channel(config)
+
+        steady = 0.01 * np.random.default_rng(7).standard_normal(1800)
+        validator.validate_block(steady[None, :], t0=0.0)
+        ramp = 5.0 * np.arange(200) / fs
+        results = validator.validate_block(ramp[None, :], t0=18.0)
+
+        drift = [r for r in results if r.rule_type == ValidationRule.DRIFT_DETECTION]
+        assert [r.metadata['window'] for r in drift] == ['short']
+        assert drift[0].metadata['drift_rate'] == pytest.approx(5.0)
+
+    def test_sample_path_uses_incremental_detector(self):
+        """Test détection par échantillon avec horodatages"""
+        config = ValidationConfig(channel=0, max_drift_rate=0.5, drift_window_size=100,
+                                  active_rules=[ValidationRule.DRIFT_DETECTION])
+        validator = DataValidator(sampling_rate=10.0)
+        validator.add_channel(config)
+        start = datetime(2026, 1, 1)
+        results = []
+        for i in range(150):
+            results = validator.validate_samples({0: 2.0 * i / 10.0}, start + timedelta(seconds=i / 10.0))
+        assert len(results) == 1
+        assert results[0].metadata['drift_rate'] == pytest.approx(2.0)
+
+
+class TestScheduledSpectralChecks:
+    """Tests du contrôle spectral planifié"""
+
+    @pytest.fixture
+    def validator(self):
+        fs = 100.0
+        validator = DataValidator(sampling_rate=fs)
+        for channel in range(3):
+            validator.add_channel(ValidationConfig(
+                channel=channel, spectral_analysis_enabled=True,
+                expected_frequency_range=(0.1, 5.0), active_rules=[]
+            ))
+        yield validator
+        validator.stop_spectral_worker()
+
+    @staticmethod
+    def _spectral(validator):
+        """Résultats spectraux diffusés par le thread spectral (après attente)"""
+        assert validator.wait_spectral_checks(timeout=5.0)
+        return [r for r in validator.global_results if r.rule_type == ValidationRule.SPECTRAL_ANALYSIS]
+
+    @staticmethod
+    def _block(fs, t0, n, frequencies):
+        t = t0 + np.arange(n) / fs
+        return np.stack([np.sin(2 * np.pi * f * t) for f in frequencies])
+
+    def test_runs_on_hop_with_batched_fft(self, validator):
+        """Test un contrôle toutes les spectral_interval secondes, canaux en lot"""
+        fs = validator.sampling_rate
+        validator.spectral_interval = 3.0
+        spectral, seen = [], 0
+        for i in range(12):
+            block = self._block(fs, i * 0.5, 50, (1.0, 20.0, 2.0))
+            results = validator.validate_block(block, t0=i * 0.5)
+            assert not [r for r in results if r.rule_type == ValidationRule.SPECTRAL_ANALYSIS]
+            published = self._spectral(validator)
+            spectral.append([r.channel for r in published[seen:]])
+            seen = len(published)
+        # 600 échantillons à 100 Hz : contrôles après 300 et 600 échantillons
+        assert [i for i, channels in enumerate(spectral) if channels] == [5, 11]
+        assert spectral[5] == [1]
+
+    def test_sample_path_has_no_inline_fft(self, validator, monkeypatch):
+        """Test contrôle spectral exécuté par le thread spectral, jamais sur le chemin par échantillon"""
+        calls = []
+        run = validator.run_spectral_checks
+        monkeypatch.setattr(validator, 'run_spectral_checks',
+                            lambda **kw: calls.append(threading.current_thread()) or run(**kw))
+        for i in range(450):
+            validator.validate_samples({0: np.sin(i / 10.0)})
+            if i in (250, 449):
+                assert validator.wait_spectral_checks(timeout=5.0)
+        assert len(calls) == 2
+        assert threading.main_thread() not in calls
+
+    def test_results_reach_callbacks(self, validator):
+        """Test résultats spectraux transmis aux callbacks depuis le thread spectral"""
+        fs = validator.sampling_rate
+        received = []
+        validator.add_result_callback(lambda result: received.append((result.channel, threading.current_thread())))
+        validator.validate_block(self._block(fs, 0.0, 200, (1.0, 20.0, 20.0)), t0=0.0)
+        assert self._spectral(validator) == []
+        validator.validate_block(self._block(fs, 2.0, 200, (1.0, 20.0, 20.0)), t0=2.0)
+        assert [r.channel for r in self._spectral(validator)] == [1, 2]
+        assert [channel for channel, _ in received] == [1, 2]
+        assert all(thread is not threading.main_thread() for _, thread in received)
+
+        validator.stop_spectral_worker()
+        assert validator.wait_spectral_checks(timeout=1.0)
+
+    def test_reuses_submitted_spectrum(self, validator, monkeypatch):
+        """Test réutilisation du spectre d'affichage au lieu d'une nouvelle FFT"""
+        fs = validator.sampling_rate
+        validator.validate_block(self._block(fs, 0.0, 150, (1.0, 1.0, 1.0)), t0=0.0)
+
+        def no_fft(*args, **kwargs):
+            raise AssertionError("FFT recalculée")
+
+        monkeypatch.setattr(np.fft, 'rfft', no_fft)
+        freqs = np.fft.fftfreq(512, 1.0 / fs)
+        power = np.zeros((3, 512))
+        power[:, 160] = 1.0  # 31 Hz : hors bande pour tous les canaux
+        assert validator.submit_spectrum(freqs, power)
+        validator.validate_block(self._block(fs, 1.5, 50, (1.0, 1.0, 1.0)), t0=1.5)
+        assert [r.channel for r in self._spectral(validator)] == [0, 1, 2]
+
+    def test_offset_signal_same_verdict_on_both_paths(self, validator):
+        """Test sinus 1 Hz avec offset : FFT par lot et spectre soumis concordent"""
+        fs = validator.sampling_rate
+        for v in validator.channel_validators.values():
+            v.config.expected_frequency_range = (0.3, 2.0)
+        t = np.arange(512) / fs
+        signal = 5.0 + np.sin(2 * np.pi * 1.0 * t)
+        block = np.tile(signal, (3, 1))
+
+        validator.validate_block(block, t0=0.0)
+        batched = validator.run_spectral_checks()
+
+        validator.submit_spectrum(np.fft.fftfreq(512, 1.0 / fs), np.abs(np.fft.fft(block)) ** 2)
+        submitted = validator.run_spectral_checks()
+        assert batched == [] and submitted == []
+
+    def test_mismatched_resolution_not_reused(self, validator):
+        """Test spectre d'un bloc court ignoré"""
+        freqs = np.fft.fftfreq(10, 1.0 / validator.sampling_rate)
+        assert not validator.submit_spectrum(freqs, np.ones((3, 10)))
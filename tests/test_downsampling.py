@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour le moteur de down-sampling des graphiques CHNeoWave
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from hrneowave.gui.components.graph_manager import (
+    DownsamplingEngine,
+    GraphConfiguration,
+    LiveCurveRing
+)
+
+
+def _reference_lttb(x, y, n_out):
+    """LTTB séquentiel de référence (boucle sur les buckets)"""
+    selected = [0]
+    bucket_size = (len(x) - 2) / (n_out - 2)
+    a = 0
+    for i in range(1, n_out - 1):
+        start = int(np.floor((i - 1) * bucket_size) + 1)
+        end = min(int(np.floor(i * bucket_size) + 1), len(x))
+        next_start = int(np.floor(i * bucket_size) + 1)
+        next_end = min(int(np.floor((i + 1) * bucket_size) + 1), len(x))
+        avg_x = np.mean(x[next_start:next_end])
+        avg_y = np.mean(y[next_start:next_end])
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected.append(a)
+    selected.append(len(x) - 1)
+    return np.array(selected)
+
+
+@pytest.fixture
+def signal():
+    """Signal de houle bruité avec un pic isolé"""
+    rng = np.random.default_rng(42)
+    x = np.linspace(0, 100, 200_003)
+    y = np.sin(x) + 0.1 * rng.standard_normal(len(x))
+    y[123_457] = 25.0
+    return x, y
+
+
+class TestMinMaxDownsample:
+    """Tests pour le décimateur min/max par pixel"""
+
+    def test_output_size(self, signal):
+        """Test taille de sortie"""
+        x, y = signal
+        x_out, y_out = DownsamplingEngine.minmax_downsample(x, y, 2000)
+        assert len(x_out) == 2000
+        assert len(y_out) == 2000
+
+    def test_no_peak_lost(self, signal):
+        """Test conservation des extrêmes de chaque bin"""
+        x, y = signal
+        _, y_out = DownsamplingEngine.minmax_downsample(x, y, 2000)
+        assert y_out.max() == y.max()
+        assert y_out.min() == y.min()
+
+    def test_time_order_preserved(self, signal):
+        """Test ordre temporel des points retenus"""
+        x, y = signal
+        x_out, _ = DownsamplingEngine.minmax_downsample(x, y, 2000)
+        assert np.all(np.diff(x_out) >= 0)
+
+    def test_small_input_unchanged(self):
+        """Test données déjà plus petites que la cible"""
+        x = np.arange(10.0)
+        x_out, y_out = DownsamplingEngine.minmax_downsample(x, x, 100)
+        assert x_out is x
+        assert y_out is x
+
+
+class TestLTTBDownsample:
+    """Tests pour le LTTB vectorisé"""
+
+    def test_output_size_and_endpoints(self, signal):
+        """Test taille de sortie et extrémités conservées"""
+        x, y = signal
+        x_out, y_out = DownsamplingEngine.lttb_downsample(x, y, 2000)
+        assert len(x_out) == 2000
+        assert x_out[0] == x[0]
+        assert x_out[-1] == x[-1]
+        assert np.all(np.diff(x_out) > 0)
+
+    def test_keeps_isolated_peak(self, signal):
+        """Test conservation d'un pic isolé"""
+        x, y = signal
+        _, y_out = DownsamplingEngine.lttb_downsample(x, y, 2000)
+        assert y_out.max() == y.max()
+
+    def test_close_to_sequential_lttb(self):
+        """Test erreur de reconstruction proche du LTTB séquentiel"""
+        x = np.linspace(0, 20, 20_000)
+        y = np.sin(3 * x) + np.sin(7.1 * x)
+        x_out, y_out = DownsamplingEngine.lttb_downsample(x, y, 500)
+        reference = _reference_lttb(x, y, 500)
+        error = np.abs(np.interp(x, x_out, y_out) - y).mean()
+        reference_error = np.abs(np.interp(x, x[reference], y[reference]) - y).mean()
+        assert error < 1.2 * reference_error
+
+    def test_tiny_output_falls_back_to_uniform(self, signal):
+        """Test repli uniforme pour moins de 3 points"""
+        x, y = signal
+        x_out, _ = DownsamplingEngine.lttb_downsample(x, y, 2)
+        assert len(x_out) == 2
+
+    @pytest.mark.performance
+    def test_one_million_points_under_10ms(self):
+        """Test performance 1 M -> 2 k points"""
+        x = np.linspace(0, 1000, 1_000_000)
+        y = np.sin(x)
+        for method in ("lttb", "minmax"):
+            DownsamplingEngine.downsample(x, y, 2000, method)
+            start = time.perf_counter()
+            DownsamplingEngine.downsample(x, y, 2000, method)
+            assert time.perf_counter() - start < 0.010
+
+
+class TestAutomaticSelection:
+    """Tests pour le choix automatique du décimateur"""
+
+    def test_auto_uses_minmax_with_pixel_width(self):
+        """Test choix min/max quand la largeur est connue"""
+        assert DownsamplingEngine.select_method("auto", 800) == "minmax"
+        assert DownsamplingEngine.select_method("auto", 0) == "lttb"
+        assert DownsamplingEngine.select_method("peak", 800) == "peak"
+
+    def test_target_points_from_pixel_width(self):
+        """Test nombre de points cible selon la largeur"""
+        config = GraphConfiguration()
+        assert DownsamplingEngine.target_points(config, 800) == 1600
+        assert DownsamplingEngine.target_points(config, 100_000) == config.max_points
+        assert DownsamplingEngine.target_points(config) == config.downsample_threshold
+
+
+class TestLiveCurveRing:
+    """Tests pour l'anneau des courbes temps réel"""
+
+    def test_window_sizing(self):
+        """Test dimensionnement d'après la fenêtre et la largeur en pixels"""
+        ring = LiveCurveRing.for_window(20_000, 800)
+        assert ring.decimation == 25
+        assert ring.capacity == 1600
+
+        small = LiveCurveRing.for_window(500, 800)
+        assert small.decimation == 1
+        assert small.capacity == 500
+
+    def test_view_is_contiguous_and_ordered(self):
+        """Test vue sans copie, dans l'ordre, après plusieurs tours d'anneau"""
+        ring = LiveCurveRing(10)
+        ring.append(np.arange(7.0), np.arange(7.0))
+        ring.append(np.arange(7.0, 25.0), np.arange(7.0, 25.0))
+        x, y = ring.view()
+        assert np.array_equal(x, np.arange(15.0, 25.0))
+        assert np.shares_memory(x, ring._x)
+
+    def test_tail_only_decimation(self):
+        """Test décimation par blocs avec reliquat conservé entre les ajouts"""
+        fs = 2000.0
+        t = np.arange(40_000) / fs
+        y = np.sin(2 * np.pi * 0.5 * t)
+        y[30_001] = 5.0
+
+        ring = LiveCurveRing.for_window(20_000, 800)
+        for start in range(0, len(t), 64):
+            ring.append(t[start:start + 64], y[start:start + 64])
+
+        x_view, y_view = ring.view()
+        assert len(x_view) == ring.capacity
+        assert np.all(np.diff(x_view) >= 0)
+        assert x_view[-1] <= t[-1]
+        assert y_view.max() == 5.0
+        assert ring.samples_appended == len(t)
+
+    def test_resized_keeps_current_window(self):
+        """Test redimensionnement : fenêtre courante conservée, pics compris"""
+        t = np.arange(20_000) / 2000.0
+        y = np.sin(2 * np.pi * 0.5 * t)
+        y[15_001] = 5.0
+        ring = LiveCurveRing.for_window(20_000, 800)
+        ring.append(t, y)
+
+        assert ring.resized(20_000, 800) is ring
+        narrow = ring.resized(20_000, 200)
+        assert (narrow.capacity, narrow.decimation) == (400, 100)
+        x_view, y_view = narrow.view()
+        assert len(x_view) == narrow.capacity
+        assert np.all(np.diff(x_view) >= 0)
+        assert y_view.max() == 5.0
+        assert narrow.samples_appended == len(t)
+
+    def test_length_mismatch(self):
+        """Test rejet de x et y de longueurs différentes"""
+        ring = LiveCurveRing(10)
+        with pytest.raises(ValueError):
+            ring.append(np.arange(3.0), np.arange(4.0))
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour la pyramide multi-résolution min/max des fichiers de session
+"""
+
+import tempfile
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+from hrneowave.utils.hdf_pyramid import MinMaxPyramid, build_pyramid
+from hrneowave.utils.hdf_writer import HDF5Writer
+
+
+@pytest.fixture
+def temp_dir():
+    """Répertoire temporaire pour les tests"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def raw_data():
+    """Données brutes (samples x channels) avec un pic isolé"""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((100_003, 3))
+    data[54_321, 1] = 42.0
+    return data
+
+
+class TestPyramidBuild:
+    """Tests de construction de la pyramide"""
+
+    def test_levels_match_brute_force(self, temp_dir, raw_data):
+        """Test min/max/moyenne de chaque niveau, bucket final partiel inclus"""
+        with h5py.File(temp_dir / 'session.h5', 'w') as f:
+            f['raw'] = raw_data
+            pyramid = MinMaxPyramid.build(f, '/raw', chunk_samples=1000)
+
+            assert pyramid.n_levels >= 3
+            for level in range(1, pyramid.n_levels + 1):
+                bucket = pyramid.bucket_size(level)
+                group = f[f'pyramid/raw/level_{level}']
+                starts = range(0, len(raw_data), bucket)
+                expected_min = np.array([raw_data[i:i + bucket].min(axis=0) for i in starts])
+                expected_mean = np.array([raw_data[i:i + bucket].mean(axis=0) for i in starts])
+                assert np.array_equal(group['min'][:], expected_min)
+                assert np.allclose(group['mean'][:], expected_mean)
+
+    def test_build_on_existing_file(self, temp_dir, raw_data):
+        """Test construction a posteriori sur un fichier de session"""
+        path = temp_dir / 'session.h5'
+        with h5py.File(path, 'w') as f:
+            f['raw'] = raw_data
+        assert build_pyramid(path) > 0
+        with h5py.File(path, 'r') as f:
+            assert MinMaxPyramid.exists(f)
+
+    def test_writer_hash_ignores_pyramid(self, temp_dir, raw_data):
+        """Test intégrité du fichier avec la pyramide en datasets annexes"""
+        path = temp_dir / 'session.h5'
+        with HDF5Writer(path) as writer:
+            writer.write_acquisition_data(raw_data, 2000.0, ['a', 'b', 'c'])
+
+        assert HDF5Writer.verify_file_integrity(path)
+        with h5py.File(path, 'r') as f:
+            assert MinMaxPyramid.exists(f, '/raw')
+
+
+class TestPyramidRead:
+    """Tests de lecture multi-résolution"""
+
+    @pytest.fixture
+    def pyramid_file(self, temp_dir, raw_data):
+        path = temp_dir / 'session.h5'
+        with h5py.File(path, 'w') as f:
+            f['raw'] = raw_data
+            MinMaxPyramid.build(f, '/raw')
+        with h5py.File(path, 'r') as f:
+            yield MinMaxPyramid(f, '/raw')
+
+    def test_level_selection(self, pyramid_file):
+        """Test choix du niveau selon la plage visible et les pixels"""
+        assert pyramid_file.select_level(0, 100_003, 1000) == 3
+        assert pyramid_file.select_level(0, 3000, 1000) == 0
+        assert pyramid_file.select_level(0, 4000, 1000) == 1
+
+    def test_read_bounded_by_pixels(self, pyramid_file, raw_data):
+        """Test nombre de points lus et conservation du pic"""
+        index, values = pyramid_file.read_envelope(0, len(raw_data), 800, channel=1)
+        assert len(values) <= 2 * 800
+        assert values.max() == raw_data[:, 1].max()
+        assert np.all(np.diff(index) >= 0)
+
+    def test_zoomed_read_uses_raw_data(self, pyramid_file, raw_data):
+        """Test lecture des données brutes à fort zoom"""
+        index, y_min, y_max, y_mean = pyramid_file.read(1000, 1500, 800, channel=0)
+        assert np.array_equal(index, np.arange(1000, 1500))
+        assert np.array_equal(y_min, raw_data[1000:1500, 0])
+
+    def test_empty_range(self, pyramid_file):
+        """Test plage vide"""
+        index, values = pyramid_file.read_envelope(500, 500, 800)
+        assert len(index) == 0
+        assert len(values) == 0
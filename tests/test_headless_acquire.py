@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour l'acquisition headless et l'enregistrement direct sur disque
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from hrneowave.headless import (
+    StreamingRecorder, load_calibration, parse_channels, run_headless_acquisition
+)
+
+h5py = pytest.importorskip("h5py")
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith('linux'), reason="Topologie testée sous Linux")
+
+
+class TestAcquisitionHelpers:
+    """Tests des utilitaires de l'acquisition headless"""
+
+    def test_parse_channels(self):
+        """Test plages et listes de canaux"""
+        assert parse_channels("0-3") == [0, 1, 2, 3]
+        assert parse_channels("0,2,5-6") == [0, 2, 5, 6]
+        for spec in ("", "3-1", "1,1", "-2"):
+            with pytest.raises(ValueError):
+                parse_channels(spec)
+
+    def test_load_calibration(self, tmp_path):
+        """Test pente/ordonnée et gain/offset, canaux absents en volts"""
+        path = tmp_path / "calibration.json"
+        path.write_text(json.dumps({'channels': [
+            {'channel': 0, 'slope': 2.0, 'intercept': 0.1},
+            {'channel': 3, 'gain': 0.5, 'offset': -0.2},
+        ]}), encoding='utf-8')
+        slopes, intercepts = load_calibration(path, [3, 0, 1])
+        assert slopes.tolist() == [0.5, 2.0, 1.0]
+        assert intercepts.tolist() == [-0.2, 0.1, 0.0]
+
+    def test_streaming_recorder_hdf5writer_format(self, tmp_path):
+        """Test ajout par blocs relu et vérifié par HDF5Writer"""
+        from hrneowave.utils.hdf_writer import HDF5Writer
+
+        path = tmp_path / "essai.h5"
+        blocks = [np.random.default_rng(i).standard_normal((3, 700)).astype(np.float32) for i in range(5)]
+        with StreamingRecorder(path, 3, 100.0, ['A', 'B', 'C'], {'backend': 'demo'}, chunk_samples=256) as recorder:
+            for block in blocks:
+                recorder.append(block)
+
+        result = HDF5Writer.read_acquisition_data(path)
+        assert np.array_equal(result['data'], np.concatenate(blocks, axis=1).T)
+        assert result['metadata']['fs'] == 100.0
+        assert result['metadata']['n_samples'] == 3500
+        assert HDF5Writer.verify_file_integrity(path)
+
+
+@linux_only
+def test_headless_acquisition_records_calibrated_stream(tmp_path):
+    """Test flux synthétique continu, calibré et limité à la durée demandée"""
+    from hrneowave.hardware.backends.synthetic import SyntheticSeaBackend
+
+    backend_config = {'realtime_factor': 4.0, 'record_samples': 4096, 'seed': 5}
+    reports = []
+    stats = run_headless_acquisition(
+        tmp_path / "essai.h5", backend='synthetic', sample_rate=200.0, channels=[0, 1],
+        duration=2.0, backend_config=backend_config,
+        calibration=(np.array([2.0, 1.0]), np.array([0.0, 0.5])),
+        block_duration=0.05, stats_interval=0.1, report=reports.append
+    )
+    assert stats.samples == 400
+    assert stats.lost_samples == 0
+    assert reports
+
+    reference = SyntheticSeaBackend(dict(backend_config, sample_rate=200.0, channels=2, num_samples=400))
+    reference.open()
+    expected = reference.read() * np.array([[2.0], [1.0]]) + np.array([[0.0], [0.5]])
+    with h5py.File(tmp_path / "essai.h5", 'r') as f:
+        assert f['raw'].shape == (400, 2)
+        assert np.allclose(f['raw'][:].T, expected, atol=1e-5)
+        assert f.attrs['backend'] == 'synthetic'
+
+
+@linux_only
+def test_acquire_command_without_qt(tmp_path):
+    """Test commande `chneowave acquire` sans import de Qt"""
+    src = Path(__file__).resolve().parents[1] / "src"
+    output = tmp_path / "run.h5"
+    code = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(src)!r})\n"
+        "from hrneowave.cli import run_cli\n"
+        "sys.argv = ['chneowave', 'acquire', '--backend', 'demo', '--fs', '200', '--channels', '0-3',\n"
+        f"            '--duration', '0.5', '--stats-interval', '0.2', '--out', {str(output)!r}]\n"
+        "try:\n"
+        "    run_cli()\n"
+        "except SystemExit as e:\n"
+        "    code = e.code\n"
+        "assert not [m for m in sys.modules if m.startswith(('PySide6', 'PyQt'))], 'Qt importé'\n"
+        "sys.exit(code)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=tmp_path, timeout=60)
+    with h5py.File(output, 'r') as f:
+        assert f['raw'].shape == (100, 4)
+
+
+def test_cli_backend_choices_match_manager():
+    """Test liste statique des backends de la CLI alignée sur le HardwareManager"""
+    from hrneowave.cli import ACQUIRE_BACKENDS
+    from hrneowave.hardware.manager import AVAILABLE_BACKENDS
+
+    assert sorted(ACQUIRE_BACKENDS) == sorted(AVAILABLE_BACKENDS)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour l'analyse par lots headless
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from hrneowave.headless import (
+    AnalysisOptions, RESULT_COLUMNS, analyze_file, analyze_session, collect_sessions, run_batch_analysis
+)
+
+h5py = pytest.importorskip("h5py")
+
+POSITIONS = [0.0, 0.25, 0.7]
+
+
+def _write_sea_state(path, hs=0.1, reflection=0.0, seed=0):
+    """Session HDF5 d'une mer JONSWAP synthétique, géométrie des sondes en métadonnées"""
+    from hrneowave.hardware.backends.synthetic import SyntheticSeaBackend
+    from hrneowave.utils.hdf_writer import HDF5Writer
+
+    backend = SyntheticSeaBackend({
+        'sample_rate': 50.0, 'channels': len(POSITIONS), 'num_samples': 2 ** 15,
+        'record_samples': 2 ** 15, 'hs': hs, 'tp': 1.5, 'water_depth': 0.5,
+        'probe_positions': POSITIONS, 'reflection_coefficient': reflection,
+        'realtime_factor': 0.0, 'seed': seed
+    })
+    backend.open()
+    data = backend.read()
+    with HDF5Writer(path) as writer:
+        writer.write_acquisition_data(
+            data.T, 50.0, [f"WP{i}" for i in range(len(POSITIONS))],
+            metadata={'probe_positions': POSITIONS, 'water_depth': 0.5}, build_pyramid=False
+        )
+    return path
+
+
+class TestSessionAnalysis:
+    """Tests des analyses d'une session"""
+
+    def test_wave_by_wave_regular_wave(self):
+        """Test houle régulière : H = 2a, Tz = T"""
+        t = np.arange(0, 100, 0.01)
+        rows = analyze_session(0.05 * np.sin(2 * np.pi * 0.5 * t + 0.3), 100.0, ['WP0'])
+        row = rows[0]
+        assert row['n_waves'] == 49
+        assert row['h13'] == pytest.approx(0.1, rel=1e-3)
+        assert row['hmax'] == pytest.approx(0.1, rel=1e-3)
+        assert row['tz'] == pytest.approx(2.0, rel=1e-3)
+        assert row['tp'] == pytest.approx(2.0, rel=0.05)
+        assert np.isnan(row['kr'])
+        assert set(row) == {name for name, _ in RESULT_COLUMNS}
+
+    def test_same_kernels_as_post_processor(self):
+        """Test statistiques et vagues identiques entre headless et PostProcessor"""
+        from hrneowave.core.post_processor import PostProcessor
+
+        t = np.arange(0, 60, 0.02)
+        signal = 0.04 * np.sin(2 * np.pi * 0.6 * t) + 0.01 * np.sin(2 * np.pi * 1.7 * t + 1.0)
+        row = analyze_session(signal, 50.0, ['WP0'], options=AnalysisOptions(detrend=None))[0]
+
+        processor = PostProcessor(cache=False)
+        processor.sample_rate = 50.0
+        processor.current_data = {'channels': {'WP0': signal}}
+        stats = processor._compute_basic_stats()['WP0']
+        goda = processor._compute_goda_metrics()['WP0']
+        for key in ('mean', 'std', 'min', 'max', 'rms', 'skewness', 'kurtosis'):
+            assert stats[key] == pytest.approx(row[key])
+        assert goda['n_waves'] == row['n_waves']
+        assert goda['Hs'] == pytest.approx(row['h13'])
+        assert goda['H_max'] == pytest.approx(row['hmax'])
+        assert goda['Tm'] == pytest.approx(row['tz'])
+
+    def test_invalid_samples_ignored(self):
+        """Test échantillons non finis comptés et ignorés"""
+        data = np.sin(np.linspace(0, 40 * np.pi, 4000))[None, :]
+        data[0, 100:110] = np.nan
+        row = analyze_session(data, 100.0, ['WP0'])[0]
+        assert row['n_invalid'] == 10
+        assert np.isfinite([row['mean'], row['std'], row['hm0']]).all()
+
+    def test_reflection_from_session_metadata(self, tmp_path):
+        """Test Hs et coefficient de réflexion d'une mer synthétique"""
+        path = _write_sea_state(tmp_path / "houle.h5", hs=0.1, reflection=0.4)
+        rows = analyze_file(path)
+        assert len(rows) == 3
+        assert rows[0]['kr'] == pytest.approx(0.4, abs=0.03)
+        assert rows[0]['hm0_incident'] == pytest.approx(0.1, rel=0.05)
+        assert rows[0]['sample_rate'] == 50.0
+
+    def test_csv_requires_sample_rate(self, tmp_path):
+        """Test CSV : fréquence fournie par les options"""
+        path = tmp_path / "session.csv"
+        values = np.sin(np.linspace(0, 20 * np.pi, 1000))
+        path.write_text("WP0\n" + "\n".join(repr(float(v)) for v in values) + "\n", encoding='utf-8')
+        with pytest.raises(ValueError):
+            analyze_file(path)
+        assert analyze_file(path, AnalysisOptions(sample_rate=10.0))[0]['n_samples'] == 1000
+
+
+class TestBatchAnalysis:
+    """Tests de l'analyse par lots"""
+
+    @pytest.fixture
+    def campaign(self, tmp_path):
+        directory = tmp_path / "campagne"
+        (directory / "jour2").mkdir(parents=True)
+        for i, sub in enumerate(['', '', 'jour2']):
+            _write_sea_state(directory / sub / f"essai_{i}.h5", seed=i)
+        (directory / "notes.txt").write_text("ignoré")
+        (directory / "corrompu.h5").write_bytes(b"pas un fichier hdf5")
+        return directory
+
+    def test_collect_sessions(self, campaign):
+        """Test répertoire récursif, motif glob, doublons"""
+        sessions = collect_sessions([str(campaign), str(campaign / "essai_*.h5")])
+        assert len(sessions) == 4
+        assert all(p.suffix == '.h5' for p in sessions)
+
+    @pytest.mark.parametrize("jobs, suffix", [(1, '.csv'), (2, '.h5')])
+    def test_batch_to_table(self, campaign, tmp_path, jobs, suffix):
+        """Test table unique, progression et sessions en échec"""
+        calls = []
+        output = tmp_path / f"resultats{suffix}"
+        summary = run_batch_analysis([str(campaign)], output, jobs=jobs,
+                                     progress=lambda *args: calls.append(args))
+        assert summary['sessions'] == 4
+        assert [Path(p).name for p in summary['failed']] == ['corrompu.h5']
+        assert summary['rows'] == 9
+        assert sorted(call[0] for call in calls) == [1, 2, 3, 4]
+
+        if suffix == '.h5':
+            with h5py.File(output, 'r') as f:
+                table = f['results'][:]
+                assert len(table) == 9
+                assert f['errors'].shape == (1, 2)
+                assert np.all(table['hm0'] > 0)
+        else:
+            lines = output.read_text(encoding='utf-8').splitlines()
+            assert len(lines) == 10
+            assert lines[0].split(',')[:2] == ['file', 'channel']
+
+    def test_batch_skips_unchanged_sessions(self, campaign, tmp_path):
+        """Test retraitement d'une campagne : sessions inchangées relues du cache"""
+        from hrneowave.core.result_cache import AnalysisResultCache
+
+        cache = AnalysisResultCache(tmp_path / "cache", version="test")
+        first = run_batch_analysis([str(campaign)], tmp_path / "r1.csv", jobs=1, cache=cache)
+        assert first['cached'] == 0
+
+        _write_sea_state(next(campaign.glob("essai_*.h5")), hs=0.2, seed=7)
+        second = run_batch_analysis([str(campaign)], tmp_path / "r2.csv", jobs=1, cache=cache)
+        assert second['cached'] == 2  # fichier modifié et fichier en échec réanalysés
+        assert second['rows'] == first['rows']
+        lines = (tmp_path / "r2.csv").read_text(encoding='utf-8').splitlines()
+        assert sorted(lines[1:]) != sorted((tmp_path / "r1.csv").read_text(encoding='utf-8').splitlines()[1:])
+
+        third = run_batch_analysis([str(campaign)], tmp_path / "r3.csv", jobs=1, cache=cache,
+                                   options=AnalysisOptions(segment_length=512))
+        assert third['cached'] == 0
+        cache.close()
+
+
+def test_analysis_does_not_import_qt(tmp_path):
+    """Test analyse complète sans importer Qt"""
+    path = _write_sea_state(tmp_path / "houle.h5")
+    src = Path(__file__).resolve().parents[1] / "src"
+    code = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(src)!r})\n"
+        "from hrneowave.headless import analyze_file\n"
+        f"analyze_file({str(path)!r})\n"
+        "assert not [m for m in sys.modules if m.startswith(('PySide6', 'PyQt'))], 'Qt importé'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
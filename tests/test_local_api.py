@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de l'API locale SQLite de la base d'instrumentation
+"""
+
+import sqlite3
+import sys
+import threading
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+# Scripts autonomes de la base d'instrumentation (imports entre modules voisins)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "base de donner" / "database_executable"))
+
+from benchmark_local_api import populate  # noqa: E402
+from create_local_database import create_local_database  # noqa: E402
+from local_api import LocalDatabaseAPI  # noqa: E402
+
+
+@pytest.fixture
+def api(tmp_path):
+    db_file = str(tmp_path / "inventaire.db")
+    with redirect_stdout(StringIO()):
+        create_local_database(db_file)
+        populate(db_file, 600)
+        api = LocalDatabaseAPI(db_file)
+    yield api
+    api.close()
+
+
+def _offset_pages(api, limit, service_id=None):
+    """Pages de référence par LIMIT/OFFSET (ancienne pagination)"""
+    query = "SELECT numero FROM equipements"
+    params = []
+    if service_id:
+        query += " WHERE service_id = ?"
+        params.append(service_id)
+    query += " ORDER BY numero LIMIT ? OFFSET ?"
+    conn = api.get_connection()
+    pages, offset = [], 0
+    while True:
+        page = [row[0] for row in conn.execute(query, params + [limit, offset])]
+        if not page:
+            return pages
+        pages.append(page)
+        offset += limit
+
+
+def _keyset_pages(api, limit, service_id=None):
+    pages, cursor = [], None
+    while True:
+        page = api.get_equipements_page(service_id, limit=limit, after=cursor)
+        if page["items"]:
+            pages.append([item["numero"] for item in page["items"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+class TestPagination:
+    """Tests de la pagination par clé"""
+
+    @pytest.mark.parametrize("limit", [7, 100])
+    def test_keyset_matches_offset(self, api, limit):
+        """Test pages identiques à LIMIT/OFFSET, avec et sans filtre de service"""
+        assert _keyset_pages(api, limit) == _offset_pages(api, limit)
+        service_id = api.get_services()[0]["id"]
+        assert _keyset_pages(api, limit, service_id) == _offset_pages(api, limit, service_id)
+
+    def test_last_page_boundary(self, api):
+        """Test total multiple de la taille de page : dernière page pleine puis page vide"""
+        total = len(api.get_equipements())
+        limit = next(size for size in range(10, total) if total % size == 0)
+        pages = _offset_pages(api, limit)
+        last_cursor = pages[-2][-1]
+
+        last = api.get_equipements_page(limit=limit, after=last_cursor)
+        assert [item["numero"] for item in last["items"]] == pages[-1]
+        assert last["next_cursor"] == pages[-1][-1]
+
+        after_last = api.get_equipements_page(limit=limit, after=last["next_cursor"])
+        assert after_last == {"items": [], "limit": limit, "next_cursor": None}
+
+        # Dernière page incomplète : pas de curseur suivant
+        partial = api.get_equipements_page(limit=limit + 1, after=last_cursor)
+        assert [item["numero"] for item in partial["items"]] == pages[-1]
+        assert partial["next_cursor"] is None
+
+
+class TestConnectionPool:
+    """Tests du pool de connexions par thread"""
+
+    def test_connections_reused_per_thread(self, api):
+        """Test connexion réutilisée dans un thread, distincte dans un autre"""
+        conn = api.get_connection()
+        api.get_dashboard_stats()
+        api.get_equipements_page(limit=10)
+        assert api.get_connection() is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        others = []
+        thread = threading.Thread(target=lambda: others.extend([api.get_connection(), api.get_connection()]))
+        thread.start()
+        thread.join()
+        assert others[0] is others[1] and others[0] is not conn
+        assert len(api._connections) == 2
+
+    def test_close_closes_pool(self, api):
+        """Test close : toutes les connexions fermées, nouvelle connexion ensuite"""
+        conn = api.get_connection()
+        api.close()
+        assert api._connections == []
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert api.get_connection() is not conn
+        assert api.get_equipement(1) is not None
+
+
+def _insert(conn, numero, description, marque_type="", n_inventaire=None):
+    with conn:
+        return conn.execute(
+            "INSERT INTO equipements (numero, description, marque_type, n_inventaire, etat) VALUES (?, ?, ?, ?, 'OK')",
+            (numero, description, marque_type, n_inventaire or f"INV-{numero}")
+        ).lastrowid
+
+
+class TestSearch:
+    """Tests de la recherche plein texte (FTS5)"""
+
+    def test_bm25_ranking(self, api):
+        """Test numéro pondéré avant description, description avant marque"""
+        assert api.fts_enabled
+        conn = api.get_connection()
+        _insert(conn, "EQ-900", "Centrale zephyr", "Marque")
+        _insert(conn, "ZEPHYR-1", "Centrale", "Marque")
+        _insert(conn, "EQ-901", "Centrale", "Zephyr 2000")
+
+        results = api.search_equipements("zephyr")
+        assert [r["numero"] for r in results] == ["ZEPHYR-1", "EQ-900", "EQ-901"]
+        scores = [r["search_score"] for r in results]
+        assert scores == sorted(scores, reverse=True) and scores[-1] > 0
+        assert len(api.search_equipements("zephyr", limit=2)) == 2
+
+    def test_accents_and_prefixes(self, api):
+        """Test accents et casse ignorés, chaque mot traité comme préfixe requis"""
+        conn = api.get_connection()
+        _insert(conn, "EQ-910", "Hydrophône de bassin à piston", "Édouard Marine")
+        _insert(conn, "EQ-911", "Hydrophône numérique", "Keysight")
+
+        def numeros(term):
+            return sorted(r["numero"] for r in api.search_equipements(term))
+
+        assert numeros("hydrophone") == ["EQ-910", "EQ-911"]
+        assert numeros("HYDRÔ") == ["EQ-910", "EQ-911"]
+        assert numeros("hydro bass") == ["EQ-910"]
+        assert numeros("edouard") == ["EQ-910"]
+        assert numeros("numer keys") == ["EQ-911"]
+        assert api.search_equipements("  -- ") == []
+
+    def test_index_follows_writes(self, api):
+        """Test index synchronisé par triggers après insertion, modification, suppression"""
+        conn = api.get_connection()
+        equipement_id = _insert(conn, "EQ-920", "Houlographe capacitif")
+        assert [r["id_equipement"] for r in api.search_equipements("houlographe")] == [equipement_id]
+
+        with conn:
+            conn.execute("UPDATE equipements SET description = 'Sonde résistive' WHERE id_equipement = ?",
+                         (equipement_id,))
+        assert api.search_equipements("houlographe") == []
+        assert [r["id_equipement"] for r in api.search_equipements("resistive")] == [equipement_id]
+
+        with conn:
+            conn.execute("DELETE FROM equipements WHERE id_equipement = ?", (equipement_id,))
+        assert api.search_equipements("resistive") == []
+        conn.execute("INSERT INTO equipements_fts(equipements_fts) VALUES ('integrity-check')")
+
+    def test_index_built_for_existing_database(self, api, tmp_path):
+        """Test index créé et alimenté à l'ouverture d'une base qui n'en avait pas"""
+        db_file = str(tmp_path / "ancienne.db")
+        with redirect_stdout(StringIO()):
+            create_local_database(db_file)
+            reopened = LocalDatabaseAPI(db_file)
+        try:
+            count = reopened.get_connection().execute("SELECT COUNT(*) FROM equipements").fetchone()[0]
+            indexed = reopened.get_connection().execute("SELECT COUNT(*) FROM equipements_fts").fetchone()[0]
+            assert indexed == count > 0
+        finally:
+            reopened.close()
+
+
+class TestDashboardSummaries:
+    """Tests des synthèses groupées du tableau de bord et de leur cache"""
+
+    @staticmethod
+    def _reference_stats(conn):
+        """Statistiques par requêtes séparées (ancien calcul)"""
+        def count(sql):
+            return conn.execute(sql).fetchone()[0]
+
+        return {
+            "total_equipements": count("SELECT COUNT(*) FROM equipements WHERE etat NOT IN ('REBUT', 'REFORME')"),
+            "equipements_ok": count("SELECT COUNT(*) FROM equipements WHERE etat = 'OK'"),
+            "equipements_panne": count("SELECT COUNT(*) FROM equipements WHERE etat = 'EN_PANNE'"),
+            "verifications_expirees": count(
+                "SELECT COUNT(*) FROM equipements WHERE prochaine_verification < date('now')"),
+            "interventions_mois": count(
+                "SELECT COUNT(*) FROM interventions WHERE date_intervention >= date('now', 'start of month')"),
+            "cout_maintenance_annee": float(count(
+                "SELECT COALESCE(SUM(cout), 0) FROM interventions "
+                "WHERE strftime('%Y', date_intervention) = strftime('%Y', 'now')")),
+            "projets_actifs": count("SELECT COUNT(*) FROM projets WHERE statut = 'ACTIF'"),
+            "licences_expire_bientot": count(
+                "SELECT COUNT(*) FROM licences WHERE date_expiration < date('now', '+60 days') AND statut = 'ACTIVE'"),
+        }
+
+    @staticmethod
+    def _reference_kpi(conn):
+        """KPI par service calculés en Python depuis les lignes brutes"""
+        today = conn.execute("SELECT date('now')").fetchone()[0]
+        rows = conn.execute("SELECT service_id, etat, prochaine_verification FROM equipements").fetchall()
+        kpis = {}
+        for service in conn.execute("SELECT id FROM services"):
+            actifs = [r for r in rows if r["service_id"] == service["id"] and r["etat"] not in ("REBUT", "REFORME")]
+            ok = sum(r["etat"] == "OK" for r in actifs)
+            kpis[service["id"]] = {
+                "total_equipements": len(actifs),
+                "equipements_ok": ok,
+                "equipements_panne": sum(r["etat"] == "EN_PANNE" for r in actifs),
+                "equipements_maintenance": sum(r["etat"] == "MAINTENANCE" for r in actifs),
+                "taux_disponibilite": round(ok / len(actifs) * 100, 2) if actifs else 0.0,
+                "verifications_expirees": sum((r["prochaine_verification"] or "9999") < today for r in actifs),
+            }
+        return kpis
+
+    def _check_against_reference(self, api):
+        conn = api.get_connection()
+        assert api.get_dashboard_stats() == pytest.approx(self._reference_stats(conn))
+        reference = self._reference_kpi(conn)
+        kpis = api.get_kpi_services()
+        assert [k["service"] for k in kpis] == sorted(k["service"] for k in kpis)
+        assert {k["service_id"]: {key: k[key] for key in reference[k["service_id"]]} for k in kpis} == reference
+        expected_alerts = conn.execute("""
+            SELECT COUNT(*) FROM equipements WHERE prochaine_verification < date('now', '+60 days')
+                AND etat NOT IN ('REBUT', 'REFORME')
+        """).fetchone()[0]
+        assert len(api.get_alertes_metrologie()) == expected_alerts
+
+    def test_grouped_queries_match_reference(self, api):
+        """Test requêtes groupées identiques au calcul de référence"""
+        self._check_against_reference(api)
+
+    def test_writes_invalidate_summaries(self, api):
+        """Test écriture d'un autre processus : triggers, synthèses recalculées"""
+        stats = api.get_dashboard_stats()
+        kpis = {k["service_id"]: k for k in api.get_kpi_services()}
+        alerts = len(api.get_alertes_metrologie())
+        assert api.get_connection().execute("SELECT COUNT(*) FROM dashboard_cache").fetchone()[0] == 3
+
+        other = sqlite3.connect(api.db_file)
+        with other:
+            service_id, = other.execute(
+                "SELECT service_id FROM equipements WHERE etat = 'OK' AND service_id IS NOT NULL LIMIT 1"
+            ).fetchone()
+            other.execute("""
+                UPDATE equipements SET etat = 'EN_PANNE', prochaine_verification = date('now', '-1 day')
+                WHERE id_equipement = (SELECT id_equipement FROM equipements
+                    WHERE etat = 'OK' AND service_id = ? AND prochaine_verification >= date('now', '+60 days')
+                    LIMIT 1)
+            """, (service_id,))
+        other.close()
+
+        changed = api.get_dashboard_stats()
+        assert changed["equipements_ok"] == stats["equipements_ok"] - 1
+        assert changed["equipements_panne"] == stats["equipements_panne"] + 1
+        assert changed["verifications_expirees"] == stats["verifications_expirees"] + 1
+        kpi = next(k for k in api.get_kpi_services() if k["service_id"] == service_id)
+        assert kpi["equipements_panne"] == kpis[service_id]["equipements_panne"] + 1
+        assert len(api.get_alertes_metrologie()) == alerts + 1
+        self._check_against_reference(api)
+
+        # Écriture sans effet sur les équipements : seules les stats sont invalidées
+        conn = api.get_connection()
+        with conn:
+            conn.execute("UPDATE licences SET statut = 'EXPIREE' WHERE statut = 'ACTIVE'")
+        cached = {row[0] for row in conn.execute("SELECT nom FROM dashboard_cache")}
+        assert cached == {"kpi_services", "alertes_metrologie"}
+        assert api.get_dashboard_stats()["licences_expire_bientot"] == 0
+
+    def test_results_are_copies(self, api):
+        """Test résultat modifié par l'appelant sans effet sur le cache"""
+        stats = api.get_dashboard_stats()
+        stats["total_equipements"] = -1
+        kpis = api.get_kpi_services()
+        kpis[0]["service"] = "modifié"
+        kpis.clear()
+        assert api.get_dashboard_stats()["total_equipements"] > 0
+        assert api.get_kpi_services()[0]["service"] != "modifié"
+
+    def test_read_only_database(self, api):
+        """Test base en lecture seule : synthèses calculées sans mise en cache"""
+        conn = api.get_connection()
+        conn.execute("PRAGMA query_only=ON")
+        with redirect_stdout(StringIO()):
+            stats = api.get_dashboard_stats()
+            assert api.get_dashboard_stats() == stats
+            assert api.get_kpi_services()
+        assert stats == pytest.approx(self._reference_stats(conn))
+        assert conn.execute("SELECT COUNT(*) FROM dashboard_cache").fetchone()[0] == 0
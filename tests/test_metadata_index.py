@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de l'index de recherche des métadonnées de session
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from hrneowave.core.metadata_index import MetadataIndex
+from hrneowave.core.metadata_manager import (
+    ExperimentType, MetadataManager, WaveType, create_sample_session_metadata
+)
+
+
+def _save(manager, name, hs, wave_type=WaveType.IRREGULAR, day=1, operator="Dr. Marine", **fields):
+    metadata = create_sample_session_metadata()
+    metadata.session_name = name
+    metadata.created_at = datetime(2025, 3, day, tzinfo=timezone.utc)
+    metadata.operator = operator
+    metadata.wave_conditions.significant_height = hs
+    metadata.wave_conditions.wave_type = wave_type
+    for key, value in fields.items():
+        setattr(metadata, key, value)
+    return manager.save_metadata(metadata, manager.base_path / f"{name}.json")
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = MetadataManager(tmp_path)
+    _save(manager, "houle_01", 0.05, day=1)
+    _save(manager, "houle_02", 0.12, day=5, operator="J. Dupont", tags=["bassin", "jonswap"])
+    _save(manager, "houle_03", 0.20, wave_type=WaveType.REGULAR, day=9,
+          experiment_type=ExperimentType.OFFSHORE_STRUCTURE)
+    return manager
+
+
+class TestMetadataIndex:
+    """Tests de MetadataIndex et de MetadataManager.search_sessions"""
+
+    def test_equality_range_and_text(self, manager):
+        """Test critères d'égalité, d'intervalle, de date et de texte"""
+        def names(**criteria):
+            return [m.session_name for m in manager.search_sessions(**criteria)]
+
+        assert names(wave_type="irregular") == ["houle_01", "houle_02"]
+        assert names(hs__gte=0.1, hs__lt=0.2) == ["houle_02"]
+        assert names(significant_height__gt=0.1) == ["houle_02", "houle_03"]
+        assert names(created_at__gte=datetime(2025, 3, 5, tzinfo=timezone.utc)) == ["houle_02", "houle_03"]
+        assert names(date__lt="2025-03-05") == ["houle_01"]
+        assert names(experiment_type=ExperimentType.OFFSHORE_STRUCTURE) == ["houle_03"]
+        assert names(experiment_type="wave_propagation") == ["houle_01", "houle_02"]
+        assert names(operator__contains="dupont") == ["houle_02"]
+        assert names(text="JONSWAP bassin") == ["houle_02"]
+        assert names(wave_type__in=["regular", "focused"]) == ["houle_03"]
+        # Attribut non indexé : comparé après chargement des sessions retenues
+        assert names(wave_type="irregular", validation_status="pending") == ["houle_01", "houle_02"]
+        with pytest.raises(ValueError):
+            manager.search_sessions(hs__environ=0.1)
+
+    def test_incremental_refresh(self, manager):
+        """Test seuls les fichiers nouveaux, modifiés ou supprimés sont traités"""
+        index = manager.index
+        assert index.refresh() == {'updated': 3, 'removed': 0, 'errors': 0}
+        assert index.refresh() == {'updated': 0, 'removed': 0, 'errors': 0}
+
+        path = manager.base_path / "houle_01.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["wave_conditions"]["significant_height"] = 0.3
+        path.write_text(json.dumps(data), encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        (manager.base_path / "houle_02.json").unlink()
+        (manager.base_path / "notes.json").write_text("{corrompu", encoding="utf-8")
+
+        assert index.refresh() == {'updated': 1, 'removed': 1, 'errors': 1}
+        assert [e["session_name"] for e in index.query(order_by="-hs")] == ["houle_01", "houle_03"]
+
+        # Un nouvel index sur le même répertoire reprend les entrées existantes
+        reopened = MetadataIndex(manager.base_path)
+        assert reopened.refresh()['updated'] == 0
+        assert len(reopened.query(limit=1)) == 1
+        reopened.close()
+
+    def test_summary_from_index(self, manager, tmp_path_factory):
+        """Test résumé exporté depuis l'index"""
+        output = tmp_path_factory.mktemp("export") / "resume.json"
+        assert manager.export_metadata_summary(output)
+        summary = json.loads(output.read_text(encoding="utf-8"))
+        assert [s["session_name"] for s in summary] == ["houle_01", "houle_02", "houle_03"]
+        assert summary[2]["experiment_type"] == "offshore_structure"
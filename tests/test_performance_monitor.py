@@ -34,6 +34,7 @@ with patch('psutil.cpu_percent', return_value=50.0), \
         Alert,
         AlertLevel,
         PerformanceMonitor,
+        LatencyHistogram,
         get_performance_monitor
     )
 
@@ -573,6 +574,111 @@ class TestPerformanceMonitor:
             # Vérifier que l'exception a été gérée
             mock_collect.assert_called()
 
+class TestPipelineInstrumentation:
+    """Tests pour les histogrammes de latence et les observations du pipeline"""
+    
+    def setup_method(self):
+        """Initialisation avant chaque test"""
+        self.patchers = [
+            patch('psutil.cpu_percent', return_value=50.0),
+            patch('threading.Thread')
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        self.monitor = PerformanceMonitor(collection_interval=0.1)
+        
+    def teardown_method(self):
+        """Nettoyage après chaque test"""
+        for patcher in self.patchers:
+            patcher.stop()
+    
+    def test_histogram_percentiles(self):
+        """Test percentiles à erreur relative bornée"""
+        histogram = LatencyHistogram("fft")
+        for i in range(1, 1001):
+            histogram.record(i * 1e-5)  # 10 µs .. 10 ms
+        
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(5e-3, rel=0.13)
+        assert histogram.percentile(99) == pytest.approx(9.9e-3, rel=0.13)
+        assert histogram.percentile(100) == pytest.approx(1e-2)
+        assert histogram.percentile(0) >= 1e-5
+        
+    def test_histogram_out_of_range(self):
+        """Test durées hors plage (sous 1 µs et au-delà de 100 s)"""
+        histogram = LatencyHistogram()
+        histogram.record(1e-8)
+        histogram.record(500.0)
+        assert histogram.percentile(0) <= LatencyHistogram.MIN_LATENCY
+        assert histogram.percentile(100) == 500.0
+        
+    def test_span_records_stage(self):
+        """Test mesure d'une étape par gestionnaire de contexte"""
+        for _ in range(3):
+            with self.monitor.span('fft', items=1024):
+                time.sleep(0.001)
+        
+        stats = self.monitor.get_stage_statistics()['fft']
+        assert stats['count'] == 3
+        assert stats['items'] == 3072
+        assert stats['p50_ms'] >= 1.0
+        assert stats['max_ms'] >= stats['p99_ms'] >= stats['p50_ms']
+        assert stats['throughput_per_s'] > 0
+        
+    def test_span_records_on_exception(self):
+        """Test enregistrement de la durée même si l'étape échoue"""
+        with pytest.raises(ValueError):
+            with self.monitor.span('disk_write'):
+                raise ValueError("échec d'écriture")
+        assert self.monitor.get_stage_statistics()['disk_write']['count'] == 1
+        
+    def test_summary_contains_pipeline(self):
+        """Test section pipeline du résumé de performance"""
+        self.monitor.metrics_history.append(PerformanceMetrics(cpu_percent=10.0))
+        self.monitor.record_latency('read', 0.002, items=100)
+        self.monitor.observe('buffer_fill', 0.25)
+        self.monitor.observe('buffer_fill', 0.75)
+        self.monitor.count('samples_acquired', 100)
+        
+        pipeline = self.monitor.get_performance_summary()['pipeline']
+        assert pipeline['stages']['read']['p99_ms'] == pytest.approx(2.0, rel=0.13)
+        assert pipeline['observations']['buffer_fill']['last'] == 0.75
+        assert pipeline['observations']['buffer_fill']['mean'] == pytest.approx(0.5)
+        assert pipeline['counters']['samples_acquired']['total'] == 100
+        
+    def test_pipeline_thresholds(self):
+        """Test alertes sur la latence p99 d'une étape et sur une valeur observée"""
+        self.monitor.thresholds = PerformanceThresholds(
+            stage_p99_warning_ms={'fft': 5.0},
+            stage_p99_critical_ms={'fft': 50.0},
+            observed_critical={'buffer_fill': 0.9}
+        )
+        self.monitor.record_latency('fft', 0.010)
+        self.monitor.record_latency('plot', 1.0)
+        self.monitor.observe('buffer_fill', 0.95)
+        
+        alerts = {alert.metric: alert for alert in self.monitor._check_pipeline_thresholds()}
+        assert set(alerts) == {'fft.p99_ms', 'buffer_fill'}
+        assert alerts['fft.p99_ms'].level == AlertLevel.WARNING
+        assert alerts['buffer_fill'].level == AlertLevel.CRITICAL
+        
+    def test_history_is_bounded(self):
+        """Test historique borné sans décalage de liste"""
+        monitor = PerformanceMonitor(max_history_size=5)
+        for i in range(12):
+            monitor.metrics_history.append(PerformanceMetrics(cpu_percent=float(i)))
+        history = monitor.get_metrics_history()
+        assert len(history) == 5
+        assert history[0].cpu_percent == 7.0
+        
+    def test_reset_instrumentation(self):
+        """Test remise à zéro de l'instrumentation"""
+        self.monitor.record_latency('validate', 0.001)
+        self.monitor.observe('queue_depth', 3)
+        self.monitor.reset_instrumentation()
+        assert self.monitor.get_stage_statistics() == {}
+        assert self.monitor.get_observations() == {}
+
 class TestPerformanceMonitorSingleton:
     """Tests pour le singleton PerformanceMonitor"""
     
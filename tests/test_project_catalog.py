@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du catalogue SQLite de l'espace de travail (ProjectManager)
+"""
+
+import json
+import sqlite3
+
+from hrneowave.core.project_manager import ProjectManager, SessionType
+from hrneowave.core.workspace_catalog import CATALOG_FILENAME
+
+
+def _workspace(tmp_path, sessions=2):
+    manager = ProjectManager(tmp_path)
+    project_id = manager.create_project("Canal houle", description="Essais 2025", author="labo")
+    manager.load_project(project_id)
+    for index in range(sessions):
+        manager.create_session(f"essai_{index}", SessionType.ACQUISITION, duration=60.0 * (index + 1))
+    return manager, project_id
+
+
+class TestWorkspaceCatalog:
+    """Tests du catalogue des projets et sessions"""
+
+    def test_catalog_tracks_changes(self, tmp_path):
+        """Test projets, sessions et statistiques lus dans le catalogue"""
+        manager, project_id = _workspace(tmp_path)
+        manager.update_project(status="completed")
+        manager.create_project("Bassin", description="")
+
+        projects = {project["name"]: project for project in manager.list_projects()}
+        assert set(projects) == {"Bassin", "Canal houle"}
+        assert projects["Canal houle"]["status"] == "completed"
+        assert [p["name"] for p in manager.catalog.list_projects(status="completed")] == ["Canal houle"]
+
+        sessions = manager.list_sessions(project_id)
+        assert [s["name"] for s in sessions] == ["essai_0", "essai_1"]
+        assert sessions[1]["duration"] == 120.0
+
+        data_file = manager.get_session_directory(sessions[0]["id"]) / "raw.h5"
+        data_file.write_bytes(b"\0" * 4096)
+        manager.register_files([data_file], session_id=sessions[0]["id"])
+        info = manager.get_workspace_info()
+        assert info["project_count"] == 2
+        assert info["session_count"] == 2
+        assert info["total_size_bytes"] > 4096
+
+        conn = sqlite3.connect(tmp_path / CATALOG_FILENAME)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"idx_projects_name", "idx_projects_modified", "idx_projects_status", "idx_sessions_type"} <= indexes
+        conn.close()
+
+    def test_size_includes_uncatalogued_files(self, tmp_path):
+        """Test fichiers d'acquisition et d'export écrits hors du gestionnaire comptés"""
+        manager, project_id = _workspace(tmp_path)
+        before = manager.get_workspace_info()["total_size_bytes"]
+
+        session_id = manager.list_sessions(project_id)[0]["id"]
+        (manager.get_session_directory(session_id) / "acquisition.h5").write_bytes(b"\0" * 8192)
+        (manager.get_project_directory(project_id) / "exports" / "rapport.csv").write_bytes(b"x" * 1000)
+        assert manager.get_workspace_info(refresh=False)["total_size_bytes"] == before
+        assert manager.get_workspace_info()["total_size_bytes"] == before + 9192
+
+        rows = manager.catalog._conn.execute(
+            "SELECT session_id FROM files WHERE path LIKE '%acquisition.h5'"
+        ).fetchall()
+        assert [row[0] for row in rows] == [session_id]
+
+        (manager.get_project_directory(project_id) / "exports" / "rapport.csv").unlink()
+        assert manager.get_workspace_info()["total_size_bytes"] == before + 8192
+
+    def test_delete_cascades(self, tmp_path):
+        """Test suppression d'un projet retirée du catalogue avec ses sessions"""
+        manager, project_id = _workspace(tmp_path)
+        assert manager.delete_project(project_id, confirm=True)
+        assert manager.list_projects() == []
+        assert manager.get_workspace_info()["session_count"] == 0
+        assert not manager.load_project(project_id)
+
+    def test_rescan_rebuilds_from_disk(self, tmp_path):
+        """Test catalogue supprimé puis reconstruit, migration de l'ancien index JSON"""
+        manager, project_id = _workspace(tmp_path, sessions=3)
+        expected = manager.get_workspace_info()
+        manager.catalog.close()
+        (tmp_path / CATALOG_FILENAME).unlink()
+
+        reopened = ProjectManager(tmp_path)
+        assert [p["id"] for p in reopened.list_projects()] == [project_id]
+        assert len(reopened.list_sessions(project_id)) == 3
+        assert reopened.get_workspace_info() == expected
+
+        # Projet créé hors catalogue (ancienne version) puis rescan
+        legacy_dir = tmp_path / "ancien"
+        legacy_dir.mkdir()
+        (legacy_dir / "project_metadata.json").write_text(json.dumps({
+            "id": "legacy", "name": "Ancien", "description": "", "created_at": "2020-01-01T00:00:00",
+            "modified_at": "2020-01-01T00:00:00", "status": "archived"
+        }), encoding="utf-8")
+        (tmp_path / "projects_index.json").write_text(json.dumps({
+            "legacy": {"name": "Ancien", "path": str(legacy_dir)}
+        }), encoding="utf-8")
+        counts = reopened.rescan_workspace()
+        assert counts["projects"] == 2 and counts["sessions"] == 3
+        assert reopened.get_project_directory("legacy") == legacy_dir
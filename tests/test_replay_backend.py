@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour le backend de rejeu de sessions
+"""
+
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from hrneowave.hardware.backends.replay import ReplayBackend, detect_format
+
+h5py = pytest.importorskip("h5py")
+
+
+@pytest.fixture
+def session_data():
+    """Session de 4 canaux x 1000 échantillons"""
+    rng = np.random.default_rng(3)
+    return rng.standard_normal((4, 1000))
+
+
+@pytest.fixture
+def hdf5_session(tmp_path, session_data):
+    """Session au format HDF5Writer"""
+    from hrneowave.utils.hdf_writer import HDF5Writer
+
+    path = tmp_path / "session.h5"
+    with HDF5Writer(path) as writer:
+        writer.write_acquisition_data(session_data.T, 200.0, [f"WP{i}" for i in range(4)],
+                                      build_pyramid=False)
+    return path
+
+
+def _replay(path, **overrides):
+    config = {'path': str(path), 'num_samples': 300, 'speed': 0.0}
+    config.update(overrides)
+    backend = ReplayBackend(config)
+    assert backend.open()
+    return backend
+
+
+def _read_all(backend):
+    blocks = []
+    while not backend.finished:
+        blocks.append(backend.read())
+    return np.concatenate(blocks, axis=1)
+
+
+class TestReplayBackend:
+    """Tests du backend de rejeu"""
+
+    def test_detect_format(self, tmp_path):
+        """Test format déduit de l'extension"""
+        assert detect_format(tmp_path / "a.hdf5") == 'hdf5'
+        assert detect_format(tmp_path / "a.TDMS") == 'tdms'
+        with pytest.raises(ValueError):
+            detect_format(tmp_path / "a.bin")
+
+    def test_missing_file(self, tmp_path):
+        """Test session introuvable"""
+        assert not ReplayBackend({'path': str(tmp_path / "absent.h5")}).open()
+
+    def test_hdf5_writer_session(self, hdf5_session, session_data):
+        """Test rejeu intégral par blocs, fréquence de la session prioritaire"""
+        backend = _replay(hdf5_session, sample_rate=32)
+        assert backend.sample_rate == 200.0
+        replayed = _read_all(backend)
+        assert np.allclose(replayed, session_data)
+        assert backend.read().shape == (4, 0)
+
+    def test_export_manager_session(self, tmp_path, session_data):
+        """Test rejeu du format HDF5 d'ExportManager"""
+        from hrneowave.core.export_manager import ExportManager, create_export_config
+
+        config = create_export_config('hdf5', str(tmp_path / "export.h5"))
+        config.session_info['sample_rate'] = 100.0
+        config.build_pyramid = False
+        assert ExportManager().export_session_data(session_data, config)
+
+        backend = _replay(tmp_path / "export.h5")
+        assert backend.sample_rate == 100.0
+        assert np.allclose(_read_all(backend), session_data)
+
+    def test_csv_session(self, tmp_path, session_data):
+        """Test rejeu CSV avec colonne d'horodatage, canaux sélectionnés"""
+        path = tmp_path / "session.csv"
+        lines = ["timestamp,WP0,WP1,WP2,WP3"]
+        lines += ["2024-01-01T00:00:00," + ",".join(repr(float(v)) for v in row) for row in session_data.T]
+        path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+        backend = _replay(path, channels=2, sample_rate=50.0)
+        assert backend.sample_rate == 50.0
+        assert np.allclose(_read_all(backend), session_data[:2])
+
+    def test_loop(self, hdf5_session, session_data):
+        """Test rejeu en boucle continu"""
+        backend = _replay(hdf5_session, num_samples=700, loop=True)
+        stream = np.concatenate([backend.read() for _ in range(3)], axis=1)
+        assert not backend.finished
+        assert np.allclose(stream[:, 1000:2000], session_data)
+
+    def test_speed(self, hdf5_session):
+        """Test vitesse x10 : 1000 échantillons à 200 Hz en 0,5 s"""
+        backend = _replay(hdf5_session, num_samples=100, speed=10.0)
+        backend.start()
+        start = time.perf_counter()
+        for _ in range(10):
+            backend.read()
+        elapsed = time.perf_counter() - start
+        backend.stop()
+        assert elapsed == pytest.approx(0.5, abs=0.2)
+        assert backend.get_status()['samples_emitted'] == 1000
+
+    def test_callback_thread(self, hdf5_session, session_data):
+        """Test diffusion par rappel jusqu'à la fin de la session"""
+        backend = _replay(hdf5_session)
+        received = []
+        backend.data_callback = received.append
+        backend.start()
+        deadline = time.time() + 5
+        while not backend.finished and time.time() < deadline:
+            time.sleep(0.01)
+        backend.stop()
+        assert np.allclose(np.concatenate(received, axis=1), session_data)
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="Topologie testée sous Linux")
+def test_replay_through_acquisition_process(hdf5_session, session_data):
+    """Test rejeu sans limite dans le processus d'acquisition : l'anneau reçoit la session"""
+    from hrneowave.core.circular_buffer import BufferConfig
+    from hrneowave.hardware.shared_ring import AcquisitionProcess, SharedRingBuffer
+
+    config = BufferConfig(n_channels=4, buffer_size=4096, sample_rate=200.0)
+    with AcquisitionProcess(config, backend='replay', backend_config={'path': str(hdf5_session), 'speed': 0.0},
+                            block_duration=0.5) as acq:
+        reader = SharedRingBuffer.attach(acq.ring_name)
+        try:
+            acq.start()
+            deadline = time.time() + 10
+            while reader.total_written < 1000 and time.time() < deadline:
+                time.sleep(0.02)
+            assert acq.stop()['total_written'] == 1000
+            assert np.allclose(reader.read_latest(1000), session_data)
+        finally:
+            reader.close()
+
+
+def test_replay_through_gui_pipeline(hdf5_session, session_data):
+    """Test session rejouée : calibration, validation par blocs puis traitement"""
+    controllers = pytest.importorskip("hrneowave.gui.controllers.acquisition_controller")
+    from hrneowave.core.data_validator import (
+        DataValidator, ValidationRule, create_wave_probe_config
+    )
+    from hrneowave.headless import analyze_session
+
+    calibration = [{'slope': 2.0, 'intercept': 0.5}] * 4
+    config = controllers.AcquisitionConfig(
+        mode=controllers.AcquisitionMode.REPLAY, sample_rate=32.0, n_channels=4, buffer_size=4096,
+        block_duration=0.5, calibration_params=calibration,
+        device_config={'path': str(hdf5_session), 'speed': 0.0}
+    )
+    controller = controllers.AcquisitionController(config)
+    if controller.signal_bus is None:
+        pytest.skip("Bus de signaux indisponible")
+
+    validator = DataValidator(200.0)
+    for channel in range(4):
+        validator.add_channel(create_wave_probe_config(channel, measurement_range=(-5.0, 5.0)))
+    blocks, results = [], []
+
+    def on_block(block):
+        data = np.array(block.data)
+        blocks.append(data)
+        results.extend(validator.validate_block(data, block.start_sample / block.sample_rate, block.sample_rate))
+
+    subscription = controller.signal_bus.subscribe_data_blocks(on_block)
+    try:
+        assert controller.start()
+        assert controller.config.sample_rate == 200.0  # fréquence de la session
+        deadline = time.time() + 10
+        while controller._samples_count < 1000 and time.time() < deadline:
+            time.sleep(0.01)
+        controller.stop()
+    finally:
+        controller.signal_bus.unsubscribe_data_blocks(subscription)
+
+    calibrated = session_data * 2.0 + 0.5
+    replayed = np.concatenate(blocks, axis=1)
+    np.testing.assert_allclose(replayed, calibrated, rtol=1e-5, atol=1e-6)  # anneau en float32
+
+    # Validation : dépassements de la plage de mesure détectés sur la session
+    expected_out_of_range = {channel for channel in range(4) if (np.abs(calibrated[channel]) > 5.0).any()}
+    flagged = {r.channel for r in results if r.rule_type == ValidationRule.RANGE_CHECK}
+    assert expected_out_of_range and flagged == expected_out_of_range
+
+    # Traitement : mêmes résultats que l'analyse de la session calibrée
+    names = [f"WP{i}" for i in range(4)]
+    rows = analyze_session(replayed.astype(float), 200.0, names)
+    reference = analyze_session(calibrated, 200.0, names)
+    for row, expected in zip(rows, reference):
+        assert row['hm0'] == pytest.approx(expected['hm0'], rel=1e-4)
+        assert row['std'] == pytest.approx(expected['std'], rel=1e-4)
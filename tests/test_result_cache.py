@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du cache des résultats d'analyse
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from hrneowave.core.result_cache import AnalysisResultCache, decode_result, encode_result
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AnalysisResultCache(tmp_path / "cache", version="test")
+    yield cache
+    cache.close()
+
+
+def _session_file(path, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(2048) / 32.0
+    data = {
+        'metadata': {'sample_rate': 32.0},
+        'time': t.tolist(),
+        'channels': {'probe_1': (0.05 * np.sin(2 * np.pi * 0.8 * t) + 0.002 * rng.standard_normal(t.size)).tolist()},
+    }
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+class TestAnalysisResultCache:
+    """Tests de AnalysisResultCache"""
+
+    def test_encode_roundtrip(self):
+        """Test structure, tableaux, listes de flottants et scalaires numpy restitués"""
+        value = {
+            'stats': {'mean': np.float64(0.5), 'n': np.int64(3), 'label': 'sonde', 'nan': float('nan')},
+            'spectrum': np.linspace(0.0, 1.0, 64),
+            'frequencies': [float(x) for x in range(32)],
+            'short': [1.0, 2.0],
+        }
+        decoded = decode_result(encode_result(value))
+        assert decoded['stats']['mean'] == 0.5 and decoded['stats']['n'] == 3
+        assert np.isnan(decoded['stats']['nan'])
+        np.testing.assert_array_equal(decoded['spectrum'], value['spectrum'])
+        assert decoded['frequencies'] == value['frequencies'] and isinstance(decoded['frequencies'], list)
+        assert decoded['short'] == [1.0, 2.0]
+
+    def test_content_addressed_keys(self, cache, tmp_path):
+        """Test clé indépendante du chemin, dépendante du contenu, de la config et de la version"""
+        first = _session_file(tmp_path / "a.json")
+        copy = tmp_path / "b.json"
+        copy.write_bytes(first.read_bytes())
+        digest = cache.file_digest(first)
+        assert cache.file_digest(copy) == digest
+        assert cache.file_digest(_session_file(tmp_path / "c.json", seed=1)) != digest
+
+        key = cache.make_key('test', digest, {'window': 1024}, 1)
+        assert key == cache.make_key('test', digest, {'window': 1024}, 1)
+        assert key != cache.make_key('test', digest, {'window': 512}, 1)
+        assert key != cache.make_key('test', digest, {'window': 1024}, 2)
+        assert cache.get(key) is None
+        cache.put(key, {'hs': 0.1})
+        assert cache.get(key) == {'hs': 0.1}
+        assert cache.stats['hits'] == 1 and cache.stats['misses'] == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """Test suppression des entrées les moins récemment lues au-delà de la taille maximale"""
+        payload = np.random.default_rng(0).standard_normal(4000)
+        size = len(encode_result(payload))
+        cache = AnalysisResultCache(tmp_path / "lru", max_bytes=int(size * 2.5), version="test")
+        cache.put('t:a', payload)
+        cache.put('t:b', payload)
+        assert cache.get('t:a') is not None  # 'b' devient la moins récente
+        cache.put('t:c', payload)
+        assert cache.get('t:b') is None
+        assert cache.get('t:a') is not None and cache.get('t:c') is not None
+        assert cache.stats['evictions'] == 1
+        assert cache.total_bytes() <= cache.max_bytes
+        cache.close()
+
+
+def test_post_processor_reuses_results(cache, tmp_path):
+    """Test session rouverte : résultats relus, réglage modifié : nouvelle analyse"""
+    from hrneowave.core.post_processor import PostProcessor
+
+    path = str(_session_file(tmp_path / "session.json"))
+    processor = PostProcessor(cache=cache)
+    assert processor.load_data_file(path) and processor.run_analysis()
+    computed = processor.current_analysis
+
+    reopened = PostProcessor(cache=cache)
+    assert reopened.load_data_file(path) and reopened.run_analysis()
+    assert cache.stats['hits'] == 1
+    assert reopened.current_analysis['goda_metrics'] == computed['goda_metrics']
+    assert reopened.current_analysis['spectral_analysis']['probe_1']['power_spectrum'] == \
+        computed['spectral_analysis']['probe_1']['power_spectrum']
+
+    reopened.config['analysis']['window_size'] = 512
+    assert reopened.run_analysis()
+    assert cache.stats['hits'] == 1
+    assert len(reopened.current_analysis['spectral_analysis']['probe_1']['frequencies']) == 256
+
+
+def test_post_worker_runs_analysis(cache, tmp_path, qtbot):
+    """Test PostWorker : fichier analysé dans un thread, résultat relu depuis le cache"""
+    from hrneowave.core.post_worker import PostWorker
+
+    path = str(_session_file(tmp_path / "session.json"))
+    results = []
+    for _ in range(2):
+        worker = PostWorker(path, {'sample_rate': 32.0}, cache=cache)
+        with qtbot.waitSignal(worker.analysisDone, timeout=10000) as blocker:
+            worker.start()
+        worker.wait()
+        results.append(blocker.args[0])
+
+    assert 'error' not in results[0]
+    assert set(results[0]) >= {'basic_stats', 'spectral_analysis', 'goda_metrics'}
+    assert cache.stats['hits'] == 1
+    assert results[1]['goda_metrics'] == results[0]['goda_metrics']
+
+    worker = PostWorker(str(tmp_path / "absent.json"), {}, cache=cache)
+    with qtbot.waitSignal(worker.analysisDone, timeout=10000) as blocker:
+        worker.start()
+    worker.wait()
+    assert 'error' in blocker.args[0]
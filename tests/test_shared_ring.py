@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour l'anneau en mémoire partagée et le processus d'acquisition headless
+"""
+
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from hrneowave.core.circular_buffer import BufferConfig
+from hrneowave.hardware.shared_ring import AcquisitionProcess, RingState, SharedRingBuffer
+
+
+@pytest.fixture
+def ring():
+    """Anneau partagé de 2 canaux x 16 échantillons"""
+    owner = SharedRingBuffer.create(BufferConfig(n_channels=2, buffer_size=16, sample_rate=100.0))
+    yield owner
+    owner.close()
+
+
+class TestSharedRingBuffer:
+    """Tests de l'anneau partagé dans un seul processus"""
+
+    def test_layout_matches_circular_buffer(self, ring):
+        """Test disposition (canaux x échantillons) et indices absolus"""
+        writer = SharedRingBuffer.attach(ring.name, writable=True)
+        try:
+            for start in range(0, 24, 4):
+                writer.write(np.tile(np.arange(start, start + 4, dtype=float), (2, 1)))
+            assert ring.total_written == 24
+            assert ring.buffer[0, 24 % 16 - 1] == 23.0
+            views = ring.get_views(12, 8)
+            assert len(views) == 2
+            assert np.array_equal(np.concatenate([v[0] for v in views]), np.arange(12.0, 20.0))
+        finally:
+            writer.close()
+
+    def test_reader_is_read_only(self, ring):
+        """Test lecteurs sans droit d'écriture"""
+        reader = SharedRingBuffer.attach(ring.name)
+        try:
+            assert not reader.buffer.flags.writeable
+            with pytest.raises(PermissionError):
+                reader.write(np.zeros((2, 4)))
+            with pytest.raises(PermissionError):
+                ring.write(np.zeros((2, 4)))
+        finally:
+            reader.close()
+
+    def test_read_since_counts_lost_samples(self, ring):
+        """Test lecture incrémentale et échantillons perdus par un consommateur lent"""
+        writer = SharedRingBuffer.attach(ring.name, writable=True)
+        try:
+            writer.write(np.tile(np.arange(10.0), (2, 1)))
+            data, cursor, lost = ring.read_since(0)
+            assert cursor == 10 and lost == 0
+            assert np.array_equal(data[1], np.arange(10.0))
+
+            writer.write(np.tile(np.arange(10.0, 40.0), (2, 1)))
+            data, cursor, lost = ring.read_since(cursor)
+            assert lost == 14
+            assert cursor == 40
+            assert np.array_equal(data[0], np.arange(24.0, 40.0))
+        finally:
+            writer.close()
+
+    def test_oversized_block_keeps_tail(self, ring):
+        """Test bloc plus grand que l'anneau"""
+        writer = SharedRingBuffer.attach(ring.name, writable=True)
+        try:
+            writer.write(np.tile(np.arange(20.0), (2, 1)))
+            assert ring.total_written == 20
+            assert np.array_equal(ring.read_latest(16)[0], np.arange(4.0, 20.0))
+        finally:
+            writer.close()
+
+    def test_independent_reader_does_not_unlink(self, ring):
+        """Test lecteur dans un interpréteur indépendant : le segment survit à sa sortie"""
+        code = (
+            "from hrneowave.hardware.shared_ring import SharedRingBuffer\n"
+            f"reader = SharedRingBuffer.attach({ring.name!r})\n"
+            "print(reader.n_channels)\n"
+            "reader.close()\n"
+        )
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, timeout=60)
+        assert output.returncode == 0, output.stderr
+        assert output.stdout.strip() == '2'
+        assert 'leaked' not in output.stderr
+
+        again = SharedRingBuffer.attach(ring.name)
+        again.close()
+
+    def test_wrong_channel_count(self, ring):
+        """Test rejet d'un bloc au mauvais nombre de canaux"""
+        writer = SharedRingBuffer.attach(ring.name, writable=True)
+        try:
+            with pytest.raises(ValueError):
+                writer.write(np.zeros((3, 4)))
+        finally:
+            writer.close()
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="Topologie testée sous Linux")
+class TestAcquisitionProcess:
+    """Tests du processus d'acquisition headless avec le backend de démonstration"""
+
+    def test_demo_backend_streams_into_ring(self):
+        """Test démarrage, flux continu, reconfiguration et arrêt"""
+        config = BufferConfig(n_channels=4, buffer_size=4096, sample_rate=1000.0)
+        with AcquisitionProcess(config, backend_config={'noise_level': 0.0}, block_duration=0.05) as acq:
+            reader = SharedRingBuffer.attach(acq.ring_name)
+            try:
+                assert reader.state == RingState.IDLE
+                acq.start()
+                deadline = time.monotonic() + 10.0
+                while reader.total_written < 500 and time.monotonic() < deadline:
+                    time.sleep(0.02)
+
+                assert reader.state == RingState.RUNNING
+                data = reader.read_latest(500)
+                assert data.shape == (4, 500)
+                assert np.abs(data).max() <= 1.0 + 1e-6
+
+                with pytest.raises(RuntimeError):
+                    acq.configure(sample_rate=500.0)
+
+                stopped = acq.stop()['total_written']
+                time.sleep(0.1)
+                assert reader.total_written == stopped
+                assert reader.state == RingState.STOPPED
+
+                assert acq.configure(sample_rate=500.0)['sample_rate'] == 500.0
+                assert reader.sample_rate == 500.0
+                status = acq.status()
+                assert status['running'] is False
+                assert status['headless'] is True
+            finally:
+                reader.close()
+        assert not acq.is_alive()
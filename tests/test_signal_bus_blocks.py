@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour le flux de DataBlocks du bus de signaux CHNeoWave
+"""
+
+import numpy as np
+import pytest
+
+from hrneowave.core.circular_buffer import BufferConfig, ThreadSafeCircularBuffer
+from hrneowave.core.signal_bus import (
+    BlockSummary,
+    BlockSubscription,
+    DataBlock,
+    SignalBus
+)
+
+
+def _make_block(sequence_id, start_sample, n_samples=10, n_channels=2, fs=100.0):
+    data = np.arange(start_sample, start_sample + n_samples, dtype=float)
+    data = np.tile(data, (n_channels, 1))
+    return DataBlock(
+        data=data,
+        timestamp=start_sample / fs,
+        sample_rate=fs,
+        n_channels=n_channels,
+        sequence_id=sequence_id,
+        start_sample=start_sample
+    )
+
+
+class TestRingViews:
+    """Tests des vues en lecture seule sur l'anneau"""
+
+    @pytest.fixture
+    def ring(self):
+        config = BufferConfig(n_channels=2, buffer_size=16, enable_overflow_detection=False)
+        return ThreadSafeCircularBuffer(config)
+
+    def test_single_view_without_copy(self, ring):
+        """Test vue contiguë sans copie et non modifiable"""
+        ring.write(np.arange(20.0).reshape(2, 10))
+        views = ring.get_views(2, 5)
+        assert len(views) == 1
+        assert np.shares_memory(views[0], ring.buffer)
+        assert not views[0].flags.writeable
+        assert np.array_equal(views[0][0], np.arange(2.0, 7.0))
+
+    def test_wrapped_interval_gives_two_views(self, ring):
+        """Test intervalle franchissant la fin de l'anneau"""
+        for start in range(0, 24, 4):
+            ring.write(np.tile(np.arange(start, start + 4, dtype=float), (2, 1)))
+        views = ring.get_views(12, 8)
+        assert len(views) == 2
+        assert np.array_equal(np.concatenate([v[0] for v in views]), np.arange(12.0, 20.0))
+
+    def test_overwritten_interval_rejected(self, ring):
+        """Test intervalle déjà réécrit ou pas encore écrit"""
+        for _ in range(5):
+            ring.write(np.zeros((2, 8)))
+        with pytest.raises(ValueError):
+            ring.get_views(0, 4)
+        with pytest.raises(ValueError):
+            ring.get_views(38, 4)
+
+
+class TestBlockSubscription:
+    """Tests des abonnements au flux de blocs"""
+
+    def test_full_rate_subscriber_gets_every_block(self):
+        """Test livraison de chaque bloc à cadence nulle"""
+        received = []
+        subscription = BlockSubscription(received.append)
+        for i in range(5):
+            subscription.deliver(_make_block(i, 10 * i))
+        assert [b.sequence_id for b in received] == list(range(5))
+        assert subscription.gaps == 0
+        assert received[1].follows(received[0])
+
+    def test_gap_detection(self):
+        """Test détection d'un bloc manquant"""
+        subscription = BlockSubscription(lambda block: None)
+        subscription.deliver(_make_block(0, 0))
+        subscription.deliver(_make_block(2, 20))
+        assert subscription.gaps == 1
+
+    def test_summary_cadence(self):
+        """Test résumés agrégés toutes les `cadence` secondes de données"""
+        summaries = []
+        subscription = BlockSubscription(summaries.append, cadence=0.5)
+        for i in range(10):
+            subscription.deliver(_make_block(i, 10 * i))
+
+        assert len(summaries) == 2
+        first = summaries[0]
+        assert isinstance(first, BlockSummary)
+        assert first.n_samples == 50
+        assert first.first_sequence_id == 0
+        assert first.last_sequence_id == 4
+        assert np.allclose(first.minimum, 0.0)
+        assert np.allclose(first.maximum, 49.0)
+        assert np.allclose(first.mean, 24.5)
+        assert np.allclose(first.last, 49.0)
+
+
+class TestSignalBusPublish:
+    """Tests de publication sur le bus"""
+
+    def test_publish_dispatches_and_counts_gaps(self):
+        """Test distribution aux abonnés et comptage des trous de séquence"""
+        bus = SignalBus()
+        recorder, dashboard = [], []
+        bus.subscribe_data_blocks(recorder.append)
+        bus.subscribe_data_blocks(dashboard.append, cadence=0.2)
+
+        for i in (0, 1, 2, 4):
+            bus.publish_block(_make_block(i, 10 * i))
+
+        assert len(recorder) == 4
+        assert len(dashboard) == 2
+        assert bus.get_session_stats()['block_gaps'] == 1
+
+    def test_unsubscribe(self):
+        """Test désabonnement"""
+        bus = SignalBus()
+        received = []
+        subscription = bus.subscribe_data_blocks(received.append)
+        bus.unsubscribe_data_blocks(subscription)
+        bus.publish_block(_make_block(0, 0))
+        assert received == []
+
+    def test_failing_subscriber_does_not_block_others(self):
+        """Test isolement des erreurs d'un abonné"""
+        bus = SignalBus()
+        received = []
+
+        def failing(block):
+            raise RuntimeError("abonné en erreur")
+
+        bus.subscribe_data_blocks(failing)
+        bus.subscribe_data_blocks(received.append)
+        bus.publish_block(_make_block(0, 0))
+        assert len(received) == 1
+
+
+class TestControllerBlockState:
+    """Tests de l'état de publication du contrôleur d'acquisition"""
+
+    @pytest.fixture
+    def controller(self):
+        controllers = pytest.importorskip("hrneowave.gui.controllers.acquisition_controller")
+        if not controllers.UNIFIED_SIGNALS_AVAILABLE:
+            pytest.skip("Bus de signaux indisponible")
+        config = controllers.AcquisitionConfig(sample_rate=100.0, n_channels=2,
+                                               buffer_size=32, block_duration=1.0)
+        return controllers.AcquisitionController(config)
+
+    def test_block_size_clamped_to_ring(self, controller):
+        """Test bloc ramené à la taille de l'anneau"""
+        assert controller._block_size == 32
+
+    def test_clear_flushes_and_restarts_sequence(self, controller):
+        """Test vidage : échantillons en attente publiés, séquence redémarrée sans trou"""
+        received = []
+        subscription = controller.signal_bus.subscribe_data_blocks(received.append)
+        try:
+            controller._start_time = 0.0
+            controller.buffer.write(np.zeros((2, 10)))
+            controller._samples_count = 10
+            controller.clear()
+            assert sum(block.n_samples for block in received) == 10
+            assert controller._block_start == 0
+
+            controller.buffer.write(np.zeros((2, 5)))
+            controller._samples_count = 5
+            controller._publish_blocks()
+            assert received[-1].sequence_id == 0
+            assert received[-1].start_sample == 0
+            assert subscription.gaps == 0
+        finally:
+            controller.signal_bus.unsubscribe_data_blocks(subscription)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du chargement paresseux des paquets et du profil de démarrage
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import hrneowave
+import hrneowave.core
+import hrneowave.hardware
+from hrneowave.benchmarks.startup import (
+    DEFAULT_BUDGETS_MS, StartupProfile, ModuleImport, parse_importtime, profile_import
+)
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       900 |       1300 |     numpy._core
+import time:       400 |       1700 |   numpy
+import time:       300 |       2000 | hrneowave.headless
+import time:        50 |         50 | json
+"""
+
+
+def _loaded_after(statement):
+    """Modules lourds chargés par une instruction dans un interpréteur neuf"""
+    code = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(SRC)!r})\n"
+        f"{statement}\n"
+        "heavy = ('scipy', 'PySide6', 'PyQt6', 'yaml', 'hrneowave.core.optimized_goda_analyzer')\n"
+        "print(','.join(sorted(m for m in sys.modules if m.split('.')[0] in heavy or m in heavy)))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return [name for name in output.strip().split(',') if name]
+
+
+class TestLazyPackages:
+    """Tests des attributs chargés à la première utilisation (PEP 562)"""
+
+    @pytest.mark.parametrize("statement", [
+        "import hrneowave",
+        "import hrneowave.core, hrneowave.hardware, hrneowave.gui",
+        "import hrneowave.utils.hash_tools",
+        "import hrneowave.cli",
+        "import hrneowave.headless",
+    ])
+    def test_import_is_light(self, statement):
+        """Test aucun import de scipy, Qt ou yaml à l'import des paquets"""
+        assert _loaded_after(statement) == []
+
+    def test_attributes_resolved_on_access(self):
+        """Test symboles historiques toujours accessibles"""
+        assert hrneowave.core.create_circular_buffer.__module__ == "hrneowave.core.circular_buffer"
+        assert "demo" in hrneowave.hardware.AVAILABLE_BACKENDS
+        assert hrneowave.LabConfiguration.__name__ == "LabConfiguration"
+        assert "OptimizedGodaAnalyzer" in dir(hrneowave.core)
+
+    def test_unknown_attribute(self):
+        """Test AttributeError pour un nom inconnu"""
+        with pytest.raises(AttributeError):
+            hrneowave.core.inexistant
+        with pytest.raises(ImportError):
+            from hrneowave.hardware import inexistant  # noqa: F401
+
+
+class TestStartupProfile:
+    """Tests du profil -X importtime"""
+
+    def test_parse_importtime(self):
+        """Test lecture des temps, de la profondeur et regroupement par paquet"""
+        modules = parse_importtime(IMPORTTIME_OUTPUT)
+        assert [m.name for m in modules] == ["_io", "numpy._core", "numpy", "hrneowave.headless", "json"]
+        assert [m.depth for m in modules] == [1, 2, 1, 0, 0]
+
+        profile = StartupProfile("hrneowave.headless", modules, budget_ms=2.0)
+        assert profile.total_us == 2050
+        assert profile.by_package()[0] == ("numpy", 1300)
+        assert profile.top_modules(1) == [ModuleImport("numpy._core", 900, 1300, 2)]
+        assert profile.over_budget
+
+    def test_profile_import(self, monkeypatch):
+        """Test profil réel d'un point d'entrée et échec d'import signalé"""
+        monkeypatch.setenv("PYTHONPATH", os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")])))
+        profile = profile_import("hrneowave.cli", repeat=1, budget_ms=200.0)
+        assert profile.error is None
+        assert "hrneowave.cli" in [m.name for m in profile.modules]
+        assert profile.total_us > 0 and profile.interpreter_us > 0
+
+        failed = profile_import("hrneowave.inexistant", repeat=1, budget_ms=200.0)
+        assert failed.error and "ModuleNotFoundError" in failed.error
+        assert failed.over_budget
+
+    @pytest.mark.parametrize("target", sorted(DEFAULT_BUDGETS_MS))
+    def test_budget(self, target, monkeypatch):
+        """Test les points d'entrée budgétés tiennent leur budget d'import"""
+        monkeypatch.setenv("PYTHONPATH", os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")])))
+        profile = profile_import(target, repeat=3, budget_ms=DEFAULT_BUDGETS_MS[target])
+        assert profile.error is None
+        assert not profile.over_budget, f"{target}: {profile.total_ms:.1f} ms"
+
+    def test_cli_version_path(self, tmp_path):
+        """Test `chneowave --version` complet (import + run_cli) sans numpy et dans le budget"""
+        code = (
+            "import sys, time\n"
+            f"sys.path.insert(0, {str(SRC)!r})\n"
+            "start = time.perf_counter()\n"
+            "from hrneowave.cli import run_cli\n"
+            "sys.argv = ['chneowave', '--version']\n"
+            "try:\n"
+            "    run_cli()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "elapsed = (time.perf_counter() - start) * 1000\n"
+            "sys.stderr.write(f'{elapsed:.3f} {int(\"numpy\" in sys.modules)}\\n')\n"
+        )
+        runs = []
+        for _ in range(3):
+            completed = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, check=True,
+                                       capture_output=True, text=True)
+            assert "CHNeoWave" in completed.stdout
+            elapsed, numpy_loaded = completed.stderr.strip().splitlines()[-1].split()
+            runs.append(float(elapsed))
+            assert numpy_loaded == "0"
+        assert min(runs) < DEFAULT_BUDGETS_MS["hrneowave.cli"]
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour le backend synthétique JONSWAP
+"""
+
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from hrneowave.hardware.backends.synthetic import SyntheticSeaBackend, wave_numbers
+from hrneowave.hardware.manager import HardwareManager
+
+
+def _backend(**overrides):
+    config = {'sample_rate': 100.0, 'channels': 4, 'num_samples': 500,
+              'record_samples': 2 ** 14, 'realtime_factor': 0.0, 'seed': 7}
+    config.update(overrides)
+    backend = SyntheticSeaBackend(config)
+    assert backend.open()
+    return backend
+
+
+class TestSyntheticSeaBackend:
+    """Tests du backend synthétique"""
+
+    def test_registered_in_manager(self):
+        """Test sélection par le HardwareManager"""
+        manager = HardwareManager({'hardware': {'backend': 'synthetic', 'settings': {'channels': 2}}})
+        assert isinstance(manager.get_backend(), SyntheticSeaBackend)
+
+    def test_deterministic_seed(self):
+        """Test même graine, même houle ; graine différente, houle différente"""
+        a, b, c = _backend(), _backend(), _backend(seed=8)
+        first = a.read()
+        assert first.shape == (4, 500)
+        assert np.array_equal(first, b.read())
+        assert not np.allclose(first, c.read())
+
+    def test_significant_height(self):
+        """Test Hs = 4 sqrt(m0) sur l'enregistrement complet"""
+        backend = _backend(hs=0.12, channels=1, num_samples=2 ** 14)
+        eta = backend.read()[0]
+        assert 4 * eta.std() == pytest.approx(0.12, rel=0.02)
+
+    def test_spatial_phase_between_probes(self):
+        """Test déphasage -k dx entre sondes pour une houle incidente seule"""
+        backend = _backend(probe_positions=[0.0, 0.4], num_samples=2 ** 14)
+        record = backend.read()
+        spectra = np.fft.rfft(record, axis=1)
+        freqs = np.fft.rfftfreq(record.shape[1], 1 / 100.0)
+        peak = np.argmax(np.abs(spectra[0]))
+        expected = -wave_numbers(freqs[peak:peak + 1], 0.5)[0] * 0.4
+        measured = np.angle(spectra[1, peak] / spectra[0, peak])
+        assert np.angle(np.exp(1j * (measured - expected))) == pytest.approx(0.0, abs=1e-3)
+
+    def test_blocks_wrap_around_record(self):
+        """Test continuité des blocs à la fin de l'enregistrement périodique"""
+        backend = _backend(record_samples=1024, num_samples=700, channels=1)
+        stream = np.concatenate([backend.read()[0] for _ in range(3)])
+        assert np.allclose(stream[1024:1100], stream[:76], atol=1e-6)
+
+    def test_fault_injection(self):
+        """Test bruit, pertes de signal et saturation"""
+        backend = _backend(dropout_rate=1.0, dropout_duration=0.1, saturation_level=0.02, noise_level=0.001)
+        block = backend.read()
+        assert np.isnan(block).sum(axis=1).tolist() == [10, 10, 10, 10]
+        assert np.nanmax(np.abs(block)) <= 0.02
+
+    def test_faster_than_realtime(self):
+        """Test 32 canaux à 5 kHz : une minute de données en bien moins d'une minute"""
+        backend = _backend(sample_rate=5000.0, channels=32, num_samples=5000, record_samples=2 ** 16)
+        backend.start()
+        start = time.perf_counter()
+        for _ in range(60):
+            backend.read()
+        elapsed = time.perf_counter() - start
+        backend.stop()
+        assert elapsed < 6.0
+
+    def test_realtime_pacing(self):
+        """Test cadence temps réel x10"""
+        backend = _backend(realtime_factor=10.0, num_samples=50)
+        backend.start()
+        start = time.perf_counter()
+        for _ in range(10):
+            backend.read()
+        elapsed = time.perf_counter() - start
+        backend.stop()
+        assert elapsed == pytest.approx(0.5, abs=0.2)
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="Topologie testée sous Linux")
+def test_synthetic_backend_in_acquisition_process():
+    """Test backend synthétique non limité dans le processus d'acquisition"""
+    from hrneowave.core.circular_buffer import BufferConfig
+    from hrneowave.hardware.shared_ring import AcquisitionProcess, SharedRingBuffer
+
+    config = BufferConfig(n_channels=8, buffer_size=50000, sample_rate=1000.0)
+    backend_config = {'realtime_factor': 0.0, 'record_samples': 2 ** 14}
+    with AcquisitionProcess(config, backend='synthetic', backend_config=backend_config,
+                            block_duration=0.1) as acq:
+        reader = SharedRingBuffer.attach(acq.ring_name)
+        try:
+            acq.start()
+            time.sleep(0.5)
+            written = acq.stop()['total_written']
+            # Plus de 10 s de données en 0,5 s
+            assert written > 10 * 1000
+            assert np.isfinite(reader.read_latest(1000)).all()
+        finally:
+            reader.close()
+
+
+def test_synthetic_mode_in_gui_controller():
+    """Test mode synthétique du contrôleur d'acquisition de l'interface"""
+    controllers = pytest.importorskip("hrneowave.gui.controllers.acquisition_controller")
+
+    config = controllers.AcquisitionConfig(
+        mode=controllers.AcquisitionMode.SYNTHETIC, sample_rate=100.0, n_channels=4, buffer_size=4096,
+        device_config={'realtime_factor': 0.0, 'record_samples': 2 ** 12, 'seed': 7}
+    )
+    controller = controllers.AcquisitionController(config)
+    assert isinstance(controller._backend, controllers.BlockDAQBackend)
+    if controller.signal_bus is None:
+        pytest.skip("Bus de signaux indisponible")
+    blocks = []
+    # Les blocs sont des vues sur l'anneau : copie à la réception
+    subscription = controller.signal_bus.subscribe_data_blocks(lambda block: blocks.append(np.array(block.data)))
+    try:
+        assert controller.start()
+        deadline = time.time() + 5
+        while controller._samples_count < 1000 and time.time() < deadline:
+            time.sleep(0.01)
+        controller.stop()
+    finally:
+        controller.signal_bus.unsubscribe_data_blocks(subscription)
+
+    data = np.concatenate(blocks, axis=1)
+    expected = _backend(num_samples=data.shape[1], record_samples=2 ** 12).read()
+    assert data.shape[1] >= 1000
+    np.testing.assert_allclose(data, expected, rtol=1e-5, atol=1e-7)  # anneau en float32
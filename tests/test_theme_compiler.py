@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du compilateur de thèmes QSS et de son cache
+"""
+
+import os
+
+import pytest
+
+from hrneowave.gui.styles.theme_compiler import ThemeCompiler
+
+BASE_QSS = """
+QWidget {
+    --bg-primary: #0A1929;
+    --accent: #00ACC1;
+}
+QPushButton { background: var(--bg-primary); border: 1px solid var(--accent); padding: 8px; }
+"""
+COMPONENT_QSS = "QLabel { color: var(--accent); margin: var(--inconnue); }\n"
+
+
+@pytest.fixture
+def styles_dir(tmp_path):
+    directory = tmp_path / "styles"
+    directory.mkdir()
+    (directory / "base.qss").write_text(BASE_QSS, encoding="utf-8")
+    (directory / "components.qss").write_text(COMPONENT_QSS, encoding="utf-8")
+    return directory
+
+
+class TestThemeCompiler:
+    """Tests de ThemeCompiler"""
+
+    def test_compile_resolves_variables(self, styles_dir, tmp_path):
+        """Test variables remplacées, bloc de définition retiré, fichier optionnel absent ignoré"""
+        compiler = ThemeCompiler(styles_dir, cache_dir=tmp_path / "cache")
+        stylesheet = compiler.compile("maritime", ["base.qss", "absent.qss", "components.qss"])
+        assert "--bg-primary" not in stylesheet
+        assert "background: #0A1929" in stylesheet
+        assert "color: #00ACC1" in stylesheet
+        assert "var(--inconnue)" in stylesheet
+        assert compiler.compile("vide", ["absent.qss"]) == ""
+
+    def test_memory_and_disk_cache(self, styles_dir, tmp_path):
+        """Test compilation unique, relecture disque par une nouvelle instance"""
+        files = ["base.qss", "components.qss"]
+        compiler = ThemeCompiler(styles_dir, cache_dir=tmp_path / "cache", version="1.0")
+        first = compiler.compile("maritime", files)
+        assert compiler.compile("maritime", files) is first
+        assert compiler.stats == {'memory_hits': 1, 'disk_hits': 0, 'compilations': 1}
+
+        restarted = ThemeCompiler(styles_dir, cache_dir=tmp_path / "cache", version="1.0")
+        assert restarted.compile("maritime", files) == first
+        assert restarted.stats['disk_hits'] == 1
+
+        upgraded = ThemeCompiler(styles_dir, cache_dir=tmp_path / "cache", version="1.1")
+        upgraded.compile("maritime", files)
+        assert upgraded.stats['compilations'] == 1
+
+    def test_source_change_invalidates(self, styles_dir, tmp_path):
+        """Test fichier source modifié recompilé, ancienne entrée supprimée"""
+        cache_dir = tmp_path / "cache"
+        files = ["base.qss", "components.qss"]
+        ThemeCompiler(styles_dir, cache_dir=cache_dir).compile("maritime", files)
+
+        path = styles_dir / "components.qss"
+        path.write_text("QLabel { color: red; }\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        compiler = ThemeCompiler(styles_dir, cache_dir=cache_dir)
+        assert "color: red" in compiler.compile("maritime", files)
+        assert compiler.stats['compilations'] == 1
+        assert len(list(cache_dir.glob("maritime-96dpi-*.qss"))) == 1
+
+    def test_dpi_in_key_only(self, styles_dir, tmp_path):
+        """Test px inchangés (Qt applique l'échelle), entrée distincte par DPI"""
+        cache_dir = tmp_path / "cache"
+        compiler = ThemeCompiler(styles_dir, cache_dir=cache_dir)
+        normal = compiler.compile("maritime", ["base.qss"])
+        high_dpi = compiler.compile("maritime", ["base.qss"], dpi=144)
+        assert "padding: 8px" in high_dpi and "1px solid" in high_dpi
+        assert high_dpi == normal
+        assert compiler.stats['compilations'] == 2
+        assert len(list(cache_dir.glob("maritime-144dpi-*.qss"))) == 1
+
+
+def test_theme_manager_applies_once(qapp, tmp_path):
+    """Test bascule de thème : compilation unique par thème, feuille appliquée à l'application"""
+    from hrneowave.gui.styles.theme_manager import ThemeManager
+
+    manager = ThemeManager(qapp, cache_dir=tmp_path / "cache")
+    for theme in ("maritime_modern", "light", "maritime_modern", "maritime_modern"):
+        manager.apply_theme(theme)
+    assert manager.get_current_theme() == "maritime_modern"
+    assert manager.compiler.stats['compilations'] == 2
+    assert manager.compiler.stats['memory_hits'] == 2
+    assert qapp.styleSheet() == manager._load_stylesheet("maritime_modern")
+    qapp.setStyleSheet("")
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour le traçage des étapes et l'export Chrome trace
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from hrneowave.core.tracing import Tracer, get_tracer, trace_span
+
+
+@pytest.fixture
+def tracer():
+    """Traceur global activé puis remis à zéro"""
+    tracer = get_tracer()
+    tracer.clear()
+    tracer.enable()
+    yield tracer
+    tracer.disable()
+    tracer.clear()
+
+
+class TestTracer:
+    """Tests de l'anneau de traçage"""
+
+    def test_disabled_records_nothing(self):
+        """Test contexte vide et aucun enregistrement hors traçage"""
+        tracer = Tracer()
+        with tracer.span('fft'):
+            pass
+        tracer.record('read', 0, 10)
+        assert tracer.events() == []
+        assert tracer.span('fft') is tracer.span('plot')
+
+    def test_span_records_thread_and_times(self, tracer):
+        """Test événement (thread, étape, début, fin)"""
+        with trace_span('hdf5_write', n_samples=10):
+            time.sleep(0.001)
+        (tid, stage, start, end, args), = tracer.events()
+        assert tid == threading.get_ident()
+        assert stage == 'hdf5_write'
+        assert end - start >= 1_000_000
+        assert args == {'n_samples': 10}
+
+    def test_ring_is_bounded(self):
+        """Test écrasement des événements les plus anciens"""
+        tracer = Tracer(capacity=4)
+        tracer.enable()
+        for i in range(10):
+            tracer.record(f'stage{i}', i, i + 1)
+        assert [event[1] for event in tracer.events()] == ['stage6', 'stage7', 'stage8', 'stage9']
+
+    def test_chrome_trace_export(self, tracer, tmp_path):
+        """Test format Chrome trace : événements complets et noms de threads"""
+        def worker():
+            with trace_span('process_block'):
+                pass
+
+        thread = threading.Thread(target=worker, name='ProcessingWorker')
+        thread.start()
+        thread.join()
+        tracer.record_duration('fft', 0.002)
+
+        path = tracer.export_chrome_trace(tmp_path / 'trace.json')
+        trace = json.loads(path.read_text(encoding='utf-8'))
+
+        complete = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+        assert {e['name'] for e in complete} == {'process_block', 'fft'}
+        fft = next(e for e in complete if e['name'] == 'fft')
+        assert fft['dur'] == pytest.approx(2000.0, rel=0.01)
+        names = {e['args']['name'] for e in trace['traceEvents'] if e['name'] == 'thread_name'}
+        assert 'ProcessingWorker' in names
+
+    def test_performance_monitor_spans_are_traced(self, tracer):
+        """Test étapes du moniteur de performance reportées dans la trace"""
+        from unittest.mock import patch
+        with patch('threading.Thread'):
+            from hrneowave.core.performance_monitor import PerformanceMonitor
+            monitor = PerformanceMonitor()
+        with monitor.span('calibrate'):
+            pass
+        monitor.record_latency('validate', 0.001)
+        assert [event[1] for event in tracer.events()] == ['calibrate', 'validate']
+        assert monitor.get_stage_statistics()['calibrate']['count'] == 1
+
+    def test_disabled_overhead_is_negligible(self):
+        """Test coût d'un trace_span désactivé (ordre de la microseconde)"""
+        get_tracer().disable()
+        n = 100_000
+        start = time.perf_counter()
+        for _ in range(n):
+            with trace_span('read'):
+                pass
+        assert (time.perf_counter() - start) / n < 5e-6